@@ -29,8 +29,17 @@ Circuit and Pulse Compilation Functions
    schedule
    transpile
 
+Transpilation Cache
+===================
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   TranspileCache
+
 """
 
 from .assemble import assemble
 from .transpile import transpile
+from .transpile_cache import TranspileCache
 from .schedule import schedule
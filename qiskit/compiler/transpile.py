@@ -17,6 +17,7 @@ from qiskit.transpiler import Layout, CouplingMap
 from qiskit.tools.parallel import parallel_map
 from qiskit.transpiler.transpile_config import TranspileConfig
 from qiskit.transpiler.transpile_circuit import transpile_circuit
+from qiskit.transpiler.profiling import PassProfile
 from qiskit.pulse import Schedule
 from qiskit.circuit.quantumregister import Qubit
 from qiskit import user_config
@@ -29,7 +30,8 @@ def transpile(circuits,
               basis_gates=None, coupling_map=None, backend_properties=None,
               initial_layout=None, seed_transpiler=None,
               optimization_level=None,
-              pass_manager=None, callback=None, output_name=None):
+              pass_manager=None, callback=None, output_name=None, cache=None,
+              profile=None):
     """Transpile one or more circuits, according to some desired transpilation targets.
 
     All arguments may be given as either singleton or list. In case of list,
@@ -161,6 +163,20 @@ def transpile(circuits,
             A list with strings to identify the output circuits. The length of
             `list[str]` should be exactly the length of `circuits` parameter.
 
+        cache (TranspileCache):
+            If set, circuits are looked up in this cache before being
+            transpiled, and the transpiled circuits are stored in it. A
+            circuit that has the same structure, up to its unbound Parameter
+            objects, as one transpiled before with the same options gets a
+            copy of the earlier output. See
+            :class:`~qiskit.compiler.TranspileCache` for the details.
+
+        profile (PassProfile):
+            If set, the passes run on each circuit are profiled, in whichever
+            process the circuit is transpiled, and the statistics are added to
+            this :class:`~qiskit.transpiler.PassProfile`. Circuits found in the
+            ``cache`` are not run through any pass.
+
     Returns:
         QuantumCircuit or list[QuantumCircuit]: transpiled circuit(s).
 
@@ -200,29 +216,99 @@ def transpile(circuits,
                                   'in {} '.format(circuit.name) +
                                   'is greater than maximum ({}) '.format(max_qubits) +
                                   'in the coupling_map')
-    # Transpile circuits in parallel
-    circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_configs)))
+    # Take what is already in the cache
+    transpiled = [None] * len(circuits)
+    cache_keys = [(None, None)] * len(circuits)
+    if cache is not None:
+        for index, (circuit, transpile_config) in enumerate(zip(circuits, transpile_configs)):
+            # pylint: disable=protected-access
+            key, parameters = cache_keys[index] = cache._key(circuit, transpile_config)
+            if key is not None:
+                transpiled[index] = cache._get(key, parameters, transpile_config.output_name)
+    todo = [index for index, circuit in enumerate(transpiled) if circuit is None]
+
+    # Transpile circuits in parallel. The parts of the configs that are shared
+    # between circuits go to each worker once, the rest with each circuit.
+    if todo:
+        shared_configs, circuit_configs = _split_transpile_configs(
+            [transpile_configs[index] for index in todo])
+        results = parallel_map(_transpile_circuit,
+                               list(zip([circuits[index] for index in todo], circuit_configs)),
+                               task_args=(shared_configs,),
+                               task_kwargs={'profile': profile is not None})
+        if profile is not None:
+            for _, circuit_profile in results:
+                profile.merge(circuit_profile)
+            results = [result for result, _ in results]
+        for index, result in zip(todo, results):
+            transpiled[index] = result
+            key, parameters = cache_keys[index]
+            if key is not None:
+                cache._put(key, parameters, result)  # pylint: disable=protected-access
+    circuits = transpiled
 
     if len(circuits) == 1:
         return circuits[0]
     return circuits
 
 
+# Fields of TranspileConfig that are usually the same object for all the
+# circuits of a transpile() call, and can be large.
+_SHARED_CONFIG_FIELDS = ('basis_gates', 'coupling_map', 'backend_properties',
+                         'pass_manager', 'callback')
+
+
+def _split_transpile_configs(transpile_configs):
+    """Split transpile configs into the parts shared between circuits and the rest.
+
+    Args:
+        transpile_configs (list[TranspileConfig]): a config for each circuit.
+
+    Returns:
+        tuple: ``(shared_configs, circuit_configs)``, where ``shared_configs``
+        is a list of distinct dicts of the ``_SHARED_CONFIG_FIELDS`` and
+        ``circuit_configs`` holds, for each circuit, the index of its shared
+        dict and a dict of its other fields.
+    """
+    shared_configs = []
+    shared_index = {}
+    circuit_configs = []
+    for transpile_config in transpile_configs:
+        fields = dict(transpile_config.__dict__)
+        shared = {name: fields.pop(name, None) for name in _SHARED_CONFIG_FIELDS}
+        # The basis may be a separate but equal list for each circuit
+        key = tuple(tuple(value) if name == 'basis_gates' and value is not None else id(value)
+                    for name, value in shared.items())
+        if key not in shared_index:
+            shared_index[key] = len(shared_configs)
+            shared_configs.append(shared)
+        circuit_configs.append((shared_index[key], fields))
+    return shared_configs, circuit_configs
+
+
 # FIXME: This is a helper function because of parallel tools.
-def _transpile_circuit(circuit_config_tuple):
+def _transpile_circuit(circuit_config_tuple, shared_configs, profile=False):
     """Select a PassManager and run a single circuit through it.
 
     Args:
         circuit_config_tuple (tuple):
             circuit (QuantumCircuit): circuit to transpile
-            transpile_config (TranspileConfig): configuration dictating how to transpile
+            circuit_config (tuple): index in ``shared_configs`` and the other
+                fields of the TranspileConfig of the circuit
+        shared_configs (list[dict]): TranspileConfig fields shared between circuits
+        profile (bool): whether to profile the passes
 
     Returns:
-        QuantumCircuit: transpiled circuit
+        QuantumCircuit or tuple: transpiled circuit, and its PassProfile if
+        ``profile`` is True
     """
-    circuit, transpile_config = circuit_config_tuple
+    circuit, (shared_index, fields) = circuit_config_tuple
+    transpile_config = TranspileConfig(**shared_configs[shared_index], **fields)
+    if not profile:
+        return transpile_circuit(circuit, transpile_config)
 
-    return transpile_circuit(circuit, transpile_config)
+    transpile_config.profile = PassProfile()
+    return transpile_circuit(circuit, transpile_config), transpile_config.profile
 
 
 def _parse_transpile_args(circuits, backend,
@@ -309,7 +395,8 @@ def _parse_coupling_map(coupling_map, backend, num_circuits):
         coupling_map = [coupling_map] * num_circuits
     elif isinstance(coupling_map, list) and all(isinstance(i, list) and len(i) == 2
                                                 for i in coupling_map):
-        coupling_map = [coupling_map] * num_circuits
+        # Build a single CouplingMap shared by all the circuits
+        coupling_map = [CouplingMap(coupling_map)] * num_circuits
     coupling_map = [CouplingMap(cm) if isinstance(cm, list) else cm for cm in coupling_map]
     return coupling_map
 
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of transpiled circuits for :func:`~qiskit.compiler.transpile`."""
+
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+from qiskit.circuit import Gate, Instruction, Parameter, ParameterExpression
+from qiskit.converters import circuit_to_dag
+
+logger = logging.getLogger(__name__)
+
+
+class TranspileCache:
+    """Cache of transpiled circuits, used by passing it as the ``cache``
+    argument of :func:`~qiskit.compiler.transpile`.
+
+    Circuits are looked up by a hash of their DAG, in which unbound
+    :class:`~qiskit.circuit.Parameter` objects only count by their position,
+    and of the basis gates, coupling map, backend properties version, initial
+    layout, optimization level and seed of the transpilation. A circuit with
+    the same structure as one transpiled before, but with other Parameter
+    objects, gets a copy of the earlier output with its own Parameters.
+
+    The most recently used outputs are kept in memory. If a ``directory`` is
+    given, every output is also written there, so that the cache survives the
+    process and can be shared between processes.
+
+    Circuits transpiled with a custom ``pass_manager`` or a ``callback`` are
+    never cached. Register names are part of the key, and gates are compared
+    by class, name, parameters and, for plain Gate and Instruction objects,
+    definition.
+    """
+
+    def __init__(self, max_size=128, directory=None):
+        """Create an empty cache.
+
+        Args:
+            max_size (int): maximum number of transpiled circuits kept in memory.
+            directory (str): optional directory where transpiled circuits are
+                stored on disk. It is created if it does not exist.
+        """
+        self.max_size = max_size
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    @property
+    def stats(self):
+        """dict: the number of ``hits`` (of which ``disk_hits`` came from
+        the disk), of ``misses`` and the number of circuits in memory (``size``)."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'disk_hits': self.disk_hits, 'size': len(self._memory)}
+
+    def clear(self, disk=False):
+        """Empty the in-memory cache and reset the statistics.
+
+        Args:
+            disk (bool): also delete the circuits stored on disk.
+        """
+        self._memory.clear()
+        self.hits = self.misses = self.disk_hits = 0
+        if disk and self.directory is not None:
+            for filename in os.listdir(self.directory):
+                if filename.endswith('.pickle'):
+                    os.remove(os.path.join(self.directory, filename))
+
+    def _key(self, circuit, transpile_config):
+        """Return the cache key of transpiling ``circuit`` with ``transpile_config``.
+
+        Args:
+            circuit (QuantumCircuit): the circuit to transpile.
+            transpile_config (TranspileConfig): the configuration to transpile it with.
+
+        Returns:
+            tuple: a hex digest, or None if this transpilation cannot be
+            cached, and the number of each parameter of the circuit, as
+            returned by ``_parameter_order``.
+        """
+        if getattr(transpile_config, 'pass_manager', None) is not None or \
+                getattr(transpile_config, 'callback', None) is not None:
+            return None, None
+        dag = circuit_to_dag(circuit)
+        parameters = _parameter_order(dag)
+        signature = (_circuit_signature(circuit, dag, parameters),
+                     _target_signature(transpile_config))
+        return hashlib.sha256(repr(signature).encode()).hexdigest(), parameters
+
+    def _get(self, key, parameters, name):
+        """Return the cached output for ``key``, rebound to ``parameters``.
+
+        Args:
+            key (str): the key from :meth:`_key`.
+            parameters (OrderedDict): the numbered parameters of the circuit
+                being transpiled, from :meth:`_key`.
+            name (str): the name to give to the output circuit.
+
+        Returns:
+            QuantumCircuit or None: the transpiled circuit, or None on a miss.
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        elif self.directory is not None:
+            entry = self._read(key)
+            if entry is not None:
+                self.disk_hits += 1
+                self._remember(key, entry)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        stored_output, stored_parameters = entry
+        output = stored_output.copy()
+        output.name = name
+        _rebind_parameters(output, stored_parameters, parameters)
+        return output
+
+    def _put(self, key, parameters, output):
+        """Store ``output`` under ``key``.
+
+        Args:
+            key (str): the key from :meth:`_key`.
+            parameters (OrderedDict): the numbered parameters of the
+                transpiled circuit, from :meth:`_key`.
+            output (QuantumCircuit): the transpiled circuit.
+        """
+        entry = (output.copy(), list(parameters))
+        self._remember(key, entry)
+        if self.directory is not None:
+            self._write(key, entry)
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def _read(self, key):
+        try:
+            with open(self._path(key), 'rb') as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as error:  # pylint: disable=broad-except
+            logger.warning("Ignoring unreadable transpile cache entry %s: %s",
+                           self._path(key), error)
+            return None
+
+    def _write(self, key, entry):
+        # Write to a temporary file first so that readers never see a partial entry.
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+
+def _parameter_order(dag):
+    """Return the parameters of a circuit DAG in canonical order.
+
+    Parameters are numbered in the order they first appear in the topological
+    order of the DAG.
+
+    Returns:
+        OrderedDict: the number of each parameter, in that order.
+    """
+    order = OrderedDict()
+    for node in dag.topological_op_nodes():
+        for param in node.op.params:
+            if isinstance(param, ParameterExpression):
+                for parameter in sorted(param.parameters, key=lambda p: p.name):
+                    order.setdefault(parameter, len(order))
+    return order
+
+
+def _circuit_signature(circuit, dag, parameter_index):
+    """Return a hashable description of the circuit DAG.
+
+    Args:
+        circuit (QuantumCircuit): the circuit.
+        dag (DAGCircuit): the DAG of the circuit.
+        parameter_index (dict): the number of each Parameter of the circuit.
+
+    Returns:
+        tuple: the registers and the operations in topological order.
+    """
+    registers = tuple((type(reg).__name__, reg.name, reg.size)
+                      for reg in circuit.qregs + circuit.cregs)
+    operations = tuple(
+        (_instruction_signature(node.op, parameter_index),
+         tuple((bit.register.name, bit.index) for bit in node.qargs),
+         tuple((bit.register.name, bit.index) for bit in node.cargs),
+         None if node.condition is None else (node.condition[0].name, node.condition[1]))
+        for node in dag.topological_op_nodes())
+    return registers, operations
+
+
+def _instruction_signature(instruction, parameter_index):
+    """Return a hashable description of an instruction."""
+    signature = (type(instruction).__module__, type(instruction).__qualname__,
+                 instruction.name, instruction.num_qubits, instruction.num_clbits,
+                 tuple(_param_signature(param, parameter_index)
+                       for param in instruction.params))
+    # Plain gates and instructions are only described by their definition.
+    if type(instruction) in (Gate, Instruction):
+        definition = instruction.definition
+        if definition is not None:
+            signature += (tuple(
+                (_instruction_signature(inst, parameter_index),
+                 tuple((bit.register.name, bit.index) for bit in qargs),
+                 tuple((bit.register.name, bit.index) for bit in cargs))
+                for inst, qargs, cargs in definition),)
+    return signature
+
+
+def _param_signature(param, parameter_index):
+    """Return a hashable description of an instruction parameter."""
+    # Parameters only used inside definitions are not numbered, use their name.
+    if isinstance(param, Parameter):
+        return ('parameter', parameter_index.get(param, param.name))
+    if isinstance(param, ParameterExpression):
+        from sympy import Symbol
+        symbols = {symbol: Symbol('_p%s' % parameter_index.get(parameter, parameter.name))
+                   for parameter, symbol in param._parameter_symbols.items()}
+        return ('expression', str(param._symbol_expr.subs(symbols)))
+    if isinstance(param, np.ndarray):
+        array = np.ascontiguousarray(param)
+        return ('array', array.shape, array.dtype.str,
+                hashlib.sha256(array.tobytes()).hexdigest())
+    if isinstance(param, (list, tuple)):
+        return tuple(_param_signature(item, parameter_index) for item in param)
+    return repr(param)
+
+
+def _target_signature(transpile_config):
+    """Return a hashable description of what the circuit is transpiled for."""
+    coupling_map = transpile_config.coupling_map
+    if coupling_map is not None:
+        coupling_map = (tuple(coupling_map.physical_qubits),
+                        tuple(sorted(tuple(edge) for edge in coupling_map.get_edges())))
+
+    properties = transpile_config.backend_properties
+    if properties is not None:
+        properties = (properties.backend_name, properties.backend_version,
+                      str(properties.last_update_date))
+
+    layout = transpile_config.initial_layout
+    if layout is not None:
+        layout = tuple(sorted((bit.register.name, bit.index, physical)
+                              for bit, physical in layout.get_virtual_bits().items()))
+
+    basis_gates = transpile_config.basis_gates
+    if basis_gates is not None:
+        basis_gates = tuple(sorted(basis_gates))
+
+    return (basis_gates, coupling_map, properties, layout,
+            transpile_config.optimization_level, transpile_config.seed_transpiler)
+
+
+def _rebind_parameters(circuit, old_parameters, new_parameters):
+    """Replace the i-th of ``old_parameters`` by the i-th of ``new_parameters`` in place."""
+    mapping = {old: new for old, new in zip(old_parameters, new_parameters)
+               if old != new and old in circuit.parameters}
+    if not mapping:
+        return
+    # Go through placeholders so that swapping parameters, or giving a new
+    # parameter the name of an old one, does not mix them up.
+    placeholders = {old: Parameter('_cache_%s' % old._uuid.hex) for old in mapping}
+    circuit._substitute_parameters(placeholders)
+    circuit._substitute_parameters({placeholders[old]: new for old, new in mapping.items()})
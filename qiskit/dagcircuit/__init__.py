@@ -27,6 +27,7 @@ DAG Circuits
 
    DAGCircuit
    DAGNode
+   DAGLayer
 
 Exceptions
 ==========
@@ -38,4 +39,5 @@ Exceptions
 """
 from .dagcircuit import DAGCircuit
 from .dagnode import DAGNode
+from .daglayer import DAGLayer
 from .exceptions import DAGCircuitError
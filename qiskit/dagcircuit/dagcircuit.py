@@ -24,6 +24,7 @@ directly from the graph.
 """
 from collections import OrderedDict
 import copy
+import heapq
 import itertools
 import networkx as nx
 
@@ -32,6 +33,8 @@ from qiskit.circuit.classicalregister import ClassicalRegister, Clbit
 from qiskit.circuit.gate import Gate
 from .exceptions import DAGCircuitError
 from .dagnode import DAGNode
+from .daglayer import DAGLayer
+from .wiregraph import WireGraph
 
 
 class DAGCircuit:
@@ -61,17 +64,33 @@ class DAGCircuit:
         # Map from wire (Register,idx) to output nodes of the graph
         self.output_map = OrderedDict()
 
-        # Stores the max id of a node added to the DAG
-        self._max_node_id = 0
-
         # Directed multigraph whose nodes are inputs, outputs, or operations.
+        # Nodes are addressed by the integer DAGNode._node_id.
         # Operation nodes have equal in- and out-degrees and carry
         # additional data about the operation, including the argument order
         # and parameter values.
         # Input nodes have out-degree 1 and output nodes have in-degree 1.
         # Edges carry wire labels (reg,idx) and each operation has
         # corresponding in- and out-edges with the same wire labels.
-        self._multi_graph = nx.MultiDiGraph()
+        self._multi_graph = WireGraph()
+
+        # Cached lexicographical topological order of the node ids and the
+        # position of each node id in it. The order is repaired lazily: the
+        # methods that change edges only record the first position that may
+        # have changed and the nodes whose predecessors changed.
+        self._topological_order = None
+        self._topological_position = {}
+        self._topological_dirty_from = None
+        self._topological_touched = set()
+        self._topological_added = []
+        self._topological_keys = {}
+
+        # Cached length (in edges) of the longest path ending at each node
+        # id and the predecessor on that path, and the node ids whose labels
+        # must be recomputed.
+        self._node_depths = None
+        self._node_depth_parents = None
+        self._depth_dirty = set()
 
         # Map of qreg name to QuantumRegister object
         self.qregs = OrderedDict()
@@ -79,12 +98,24 @@ class DAGCircuit:
         # Map of creg name to ClassicalRegister object
         self.cregs = OrderedDict()
 
-        # TO REMOVE WHEN NODE IS HAVE BEEN REMOVED FULLY
-        self._id_to_node = {}
-
     def to_networkx(self):
-        """Returns a copy of the DAGCircuit in networkx format."""
-        return copy.deepcopy(self._multi_graph)
+        """Returns a copy of the DAGCircuit in networkx format.
+
+        Returns:
+            networkx.MultiDiGraph: a graph whose nodes are copies of the
+                DAGNodes of this circuit and whose edges carry the ``name``
+                and ``wire`` of the (qu)bit they represent.
+        """
+        return copy.deepcopy(self._networkx_graph())
+
+    def _networkx_graph(self):
+        """Build a networkx.MultiDiGraph sharing the DAGNodes of this circuit."""
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(self._multi_graph.nodes())
+        for src, dst, wire in self._multi_graph.edges():
+            graph.add_edge(self._multi_graph[src], self._multi_graph[dst],
+                           name="%s[%s]" % (wire.register.name, wire.index), wire=wire)
+        return graph
 
     def qubits(self):
         """Return a list of qubits (as a list of Qubit instances)."""
@@ -138,34 +169,18 @@ class DAGCircuit:
         """
         if wire not in self.wires:
             self.wires.append(wire)
-            self._max_node_id += 1
-            input_map_wire = self.input_map[wire] = self._max_node_id
-
-            self._max_node_id += 1
-            output_map_wire = self._max_node_id
 
             wire_name = "%s[%s]" % (wire.register.name, wire.index)
 
-            inp_node = DAGNode(data_dict={'type': 'in', 'name': wire_name, 'wire': wire},
-                               nid=input_map_wire)
-            outp_node = DAGNode(data_dict={'type': 'out', 'name': wire_name, 'wire': wire},
-                                nid=output_map_wire)
-            self._id_to_node[input_map_wire] = inp_node
-            self._id_to_node[output_map_wire] = outp_node
+            inp_node = self._add_node({'type': 'in', 'name': wire_name, 'wire': wire})
+            outp_node = self._add_node({'type': 'out', 'name': wire_name, 'wire': wire})
 
             self.input_map[wire] = inp_node
             self.output_map[wire] = outp_node
 
-            self._multi_graph.add_node(inp_node)
-            self._multi_graph.add_node(outp_node)
-
-            self._multi_graph.add_edge(inp_node,
-                                       outp_node)
-
-            self._multi_graph.adj[inp_node][outp_node][0]["name"] \
-                = "%s[%s]" % (wire.register.name, wire.index)
-            self._multi_graph.adj[inp_node][outp_node][0]["wire"] \
-                = wire
+            self._multi_graph.add_edge(inp_node._node_id, outp_node._node_id, wire)
+            # A new input node can be ready first, so drop the cached orders.
+            self._invalidate_caches()
         else:
             raise DAGCircuitError("duplicate wire %s" % (wire,))
 
@@ -212,6 +227,71 @@ class DAGCircuit:
         """
         return [] if cond is None else [cbit for cbit in cond[0]]
 
+    def _add_node(self, data_dict):
+        """Add a new node to the graph.
+
+        Args:
+            data_dict (dict): the properties of the node
+
+        Returns:
+            DAGNode: the new node
+        """
+        node = DAGNode(data_dict=data_dict, nid=self._multi_graph.next_id)
+        self._multi_graph.add_node(node)
+        if self._topological_order is not None:
+            self._topological_added.append(node._node_id)
+        if self._node_depths is not None:
+            self._depth_dirty.add(node._node_id)
+        return node
+
+    def _add_edge(self, src, dst, wire):
+        """Add the edge ``src -> dst`` on ``wire``, replacing the edges it displaces.
+
+        Args:
+            src (int): id of the source node
+            dst (int): id of the destination node
+            wire (Bit): the wire carried by the edge
+        """
+        graph = self._multi_graph
+        old_dst = graph.succ_map(src).get(wire)
+        graph.add_edge(src, dst, wire)
+
+        if self._topological_order is not None:
+            # Nothing before src in the cached order can move.
+            position = self._topological_position.get(src)
+            if position is not None and (self._topological_dirty_from is None
+                                         or position < self._topological_dirty_from):
+                self._topological_dirty_from = position + 1
+            self._topological_touched.add(dst)
+            if old_dst is not None:
+                self._topological_touched.add(old_dst)
+        if self._node_depths is not None:
+            self._depth_dirty.add(dst)
+            if old_dst is not None:
+                self._depth_dirty.add(old_dst)
+
+    def _remove_node(self, node_id):
+        """Remove a node and its edges from the graph.
+
+        The caller is expected to reconnect the wires of the node.
+        """
+        self._multi_graph.remove_node(node_id)
+        self._topological_keys.pop(node_id, None)
+        if self._node_depths is not None:
+            self._node_depths.pop(node_id, None)
+            self._node_depth_parents.pop(node_id, None)
+
+    def _invalidate_caches(self):
+        """Drop the cached topological order and longest path labels."""
+        self._topological_order = None
+        self._topological_position = {}
+        self._topological_dirty_from = None
+        self._topological_touched = set()
+        self._topological_added = []
+        self._node_depths = None
+        self._node_depth_parents = None
+        self._depth_dirty = set()
+
     def _add_op_node(self, op, qargs, cargs, condition=None):
         """Add a new operation node to the graph and assign properties.
 
@@ -220,6 +300,9 @@ class DAGCircuit:
             qargs (list[Qubit]): list of quantum wires to attach to.
             cargs (list[Clbit]): list of classical wires to attach to.
             condition (tuple or None): optional condition (ClassicalRegister, int)
+
+        Returns:
+            DAGNode: the new node
         """
         node_properties = {
             "type": "op",
@@ -231,10 +314,7 @@ class DAGCircuit:
         }
 
         # Add a new operation node to the graph
-        self._max_node_id += 1
-        new_node = DAGNode(data_dict=node_properties, nid=self._max_node_id)
-        self._multi_graph.add_node(new_node)
-        self._id_to_node[self._max_node_id] = new_node
+        return self._add_node(node_properties)
 
     def apply_operation_back(self, op, qargs=None, cargs=None, condition=None):
         """Apply an operation to the output of the circuit.
@@ -247,10 +327,6 @@ class DAGCircuit:
 
         Returns:
             DAGNode: the current max node
-
-        Raises:
-            DAGCircuitError: if a leaf node is connected to multiple outputs
-
         """
         qargs = qargs or []
         cargs = cargs or []
@@ -262,25 +338,18 @@ class DAGCircuit:
         self._check_bits(qargs, self.output_map)
         self._check_bits(all_cbits, self.output_map)
 
-        self._add_op_node(op, qargs, cargs, condition)
-
-        # Add new in-edges from predecessors of the output nodes to the
-        # operation node while deleting the old in-edges of the output nodes
-        # and adding new edges from the operation node to each output node
-        al = [qargs, all_cbits]
-        for q in itertools.chain(*al):
-            ie = list(self._multi_graph.predecessors(self.output_map[q]))
+        node = self._add_op_node(op, qargs, cargs, condition)
+        node_id = node._node_id
 
-            if len(ie) != 1:
-                raise DAGCircuitError("output node has multiple in-edges")
+        # Splice the operation node between each output node and its
+        # predecessor on the same wire
+        graph = self._multi_graph
+        for q in itertools.chain(qargs, all_cbits):
+            output_id = self.output_map[q]._node_id
+            self._add_edge(graph.predecessor(output_id, q), node_id, q)
+            self._add_edge(node_id, output_id, q)
 
-            self._multi_graph.add_edge(ie[0], self._id_to_node[self._max_node_id],
-                                       name="%s[%s]" % (q.register.name, q.index), wire=q)
-            self._multi_graph.remove_edge(ie[0], self.output_map[q])
-            self._multi_graph.add_edge(self._id_to_node[self._max_node_id], self.output_map[q],
-                                       name="%s[%s]" % (q.register.name, q.index), wire=q)
-
-        return self._id_to_node[self._max_node_id]
+        return node
 
     def apply_operation_front(self, op, qargs, cargs, condition=None):
         """Apply an operation to the input of the circuit.
@@ -293,9 +362,6 @@ class DAGCircuit:
 
         Returns:
             DAGNode: the current max node
-
-        Raises:
-            DAGCircuitError: if initial nodes connected to multiple out edges
         """
         all_cbits = self._bits_in_condition(condition)
         all_cbits.extend(cargs)
@@ -303,22 +369,18 @@ class DAGCircuit:
         self._check_condition(op.name, condition)
         self._check_bits(qargs, self.input_map)
         self._check_bits(all_cbits, self.input_map)
-        self._add_op_node(op, qargs, cargs, condition)
-        # Add new out-edges to successors of the input nodes from the
-        # operation node while deleting the old out-edges of the input nodes
-        # and adding new edges to the operation node from each input node
-        al = [qargs, all_cbits]
-        for q in itertools.chain(*al):
-            ie = list(self._multi_graph.successors(self.input_map[q]))
-            if len(ie) != 1:
-                raise DAGCircuitError("input node has multiple out-edges")
-            self._multi_graph.add_edge(self._id_to_node[self._max_node_id], ie[0],
-                                       name="%s[%s]" % (q.register.name, q.index), wire=q)
-            self._multi_graph.remove_edge(self.input_map[q], ie[0])
-            self._multi_graph.add_edge(self.input_map[q], self._id_to_node[self._max_node_id],
-                                       name="%s[%s]" % (q.register.name, q.index), wire=q)
-
-        return self._id_to_node[self._max_node_id]
+        node = self._add_op_node(op, qargs, cargs, condition)
+        node_id = node._node_id
+
+        # Splice the operation node between each input node and its
+        # successor on the same wire
+        graph = self._multi_graph
+        for q in dict.fromkeys(itertools.chain(qargs, all_cbits)):
+            input_id = self.input_map[q]._node_id
+            self._add_edge(node_id, graph.successor(input_id, q), q)
+            self._add_edge(input_id, node_id, q)
+
+        return node
 
     def _check_edgemap_registers(self, edge_map, keyregs, valregs, valreg=True):
         """Check that wiremap neither fragments nor leaves duplicate registers.
@@ -417,7 +479,7 @@ class DAGCircuit:
         return new_condition
 
     def extend_back(self, dag, edge_map=None):
-        """Add `dag` at the end of `self`, using `edge_map`.
+        """Add `dag` (a DAGCircuit or DAGLayer) at the end of `self`, using `edge_map`.
         """
         edge_map = edge_map or {}
         for qreg in dag.qregs.values():
@@ -440,7 +502,7 @@ class DAGCircuit:
         to a subset of output qubits of this circuit.
 
         Args:
-            input_circuit (DAGCircuit): circuit to append
+            input_circuit (DAGCircuit or DAGLayer): circuit to append
             edge_map (dict): map {Bit: Bit} from the output wires of
                 input_circuit to input wires of self. The key and value
                 can either be of type Qubit or Clbit depending on the
@@ -568,13 +630,13 @@ class DAGCircuit:
             Bit: Bit in idle wire.
         """
         for wire in self.wires:
-            nodes = self.nodes_on_wire(wire, only_ops=False)
-            if len([i for i in nodes]) == 2:
+            successor = self._multi_graph.successor(self.input_map[wire]._node_id, wire)
+            if successor == self.output_map[wire]._node_id:
                 yield wire
 
     def size(self):
         """Return the number of operations."""
-        return self._multi_graph.order() - 2 * len(self.wires)
+        return len(self._multi_graph) - 2 * len(self.wires)
 
     def depth(self):
         """Return the circuit depth.
@@ -583,10 +645,10 @@ class DAGCircuit:
         Raises:
             DAGCircuitError: if not a directed acyclic graph
         """
-        if not nx.is_directed_acyclic_graph(self._multi_graph):
-            raise DAGCircuitError("not a DAG")
-
-        depth = nx.dag_longest_path_length(self._multi_graph) - 1
+        lengths, _ = self._longest_path_labels()
+        # Every longest path ends at an output node.
+        depth = max((lengths[node._node_id] for node in self.output_map.values()),
+                    default=0) - 1
         return depth if depth != -1 else 0
 
     def width(self):
@@ -613,7 +675,7 @@ class DAGCircuit:
 
     def num_tensor_factors(self):
         """Compute how many components the circuit can decompose into."""
-        return nx.number_weakly_connected_components(self._multi_graph)
+        return self._multi_graph.num_weakly_connected_components()
 
     def _check_wires_list(self, wires, node):
         """Check that a list of wires is compatible with a node to be replaced.
@@ -649,14 +711,12 @@ class DAGCircuit:
 
         Returns:
             tuple(dict): tuple(predecessor_map, successor_map)
-                These map from wire (Register, int) to predecessor (successor)
-                nodes of n.
+                These map from wire (Register, int) to the ids of the
+                predecessor (successor) nodes of n.
         """
-
-        pred_map = {e[2]['wire']: e[0] for e in
-                    self._multi_graph.in_edges(nbunch=node, data=True)}
-        succ_map = {e[2]['wire']: e[1] for e in
-                    self._multi_graph.out_edges(nbunch=node, data=True)}
+        node_id = node._node_id
+        pred_map = dict(self._multi_graph.pred_map(node_id))
+        succ_map = dict(self._multi_graph.succ_map(node_id))
         return pred_map, succ_map
 
     def _full_pred_succ_maps(self, pred_map, succ_map, input_circuit,
@@ -664,7 +724,7 @@ class DAGCircuit:
         """Map all wires of the input circuit.
 
         Map all wires of the input circuit to predecessor and
-        successor nodes in self, keyed on wires in self.
+        successor node ids in self, keyed on wires in self.
 
         Args:
             pred_map (dict): comes from _make_pred_succ_maps
@@ -674,9 +734,6 @@ class DAGCircuit:
 
         Returns:
             tuple: full_pred_map, full_succ_map (dict, dict)
-
-        Raises:
-            DAGCircuitError: if more than one predecessor for output nodes
         """
         full_pred_map = {}
         full_succ_map = {}
@@ -689,19 +746,16 @@ class DAGCircuit:
             else:
                 # Otherwise, use the corresponding output nodes of self
                 # and compute the predecessor.
-                full_succ_map[w] = self.output_map[w]
-                full_pred_map[w] = self._multi_graph.predecessors(
-                    self.output_map[w])[0]
-                if len(list(self._multi_graph.predecessors(self.output_map[w]))) != 1:
-                    raise DAGCircuitError("too many predecessors for %s[%d] "
-                                          "output node" % (w.register, w.index))
+                output_id = self.output_map[w]._node_id
+                full_succ_map[w] = output_id
+                full_pred_map[w] = self._multi_graph.predecessor(output_id, w)
 
         return full_pred_map, full_succ_map
 
     def __eq__(self, other):
         # TODO this works but is a horrible way to do this
-        slf = copy.deepcopy(self._multi_graph)
-        oth = copy.deepcopy(other._multi_graph)
+        slf = self._networkx_graph()
+        oth = other._networkx_graph()
 
         for node in slf.nodes:
             slf.nodes[node]['node'] = node
@@ -711,6 +765,159 @@ class DAGCircuit:
         return nx.is_isomorphic(slf, oth,
                                 node_match=lambda x, y: DAGNode.semantic_eq(x['node'], y['node']))
 
+    def _topological_key(self, node_id):
+        """Return the sort key used to break ties in the topological order."""
+        key = self._topological_keys.get(node_id)
+        if key is None:
+            key = self._topological_keys[node_id] = str(self._multi_graph[node_id].qargs)
+        return key
+
+    def _topological_ids(self):
+        """Return the node ids in lexicographical topological order.
+
+        Among the nodes that are ready, the one with the smallest
+        ``(str(node.qargs), node id)`` comes first. The order is cached and,
+        after the DAG changes, only the part after the first position that
+        can have changed is recomputed. The recomputation stops as soon as it
+        lines up again with the cached order.
+
+        Returns:
+            list[int]: node ids in topological order. Do not modify it.
+
+        Raises:
+            DAGCircuitError: if not a directed acyclic graph
+        """
+        if self._topological_order is None:
+            self._topological_order = []
+            self._topological_position = {}
+            self._topological_dirty_from = 0
+            self._topological_touched = set()
+            self._topological_added = self._multi_graph.node_ids()
+        elif self._topological_dirty_from is None:
+            if self._topological_added:
+                self._topological_dirty_from = len(self._topological_order)
+            else:
+                return self._topological_order
+
+        graph = self._multi_graph
+        order = self._topological_order
+        position = self._topological_position
+        start = self._topological_dirty_from
+        old_suffix = order[start:]
+
+        # Nodes left to sort. Removed nodes are dropped and nodes added since
+        # the last update are appended.
+        suffix = [node_id for node_id in old_suffix if node_id in graph]
+        suffix.extend(node_id for node_id in self._topological_added if node_id in graph)
+        in_suffix = set(suffix)
+
+        indegree_map = {}
+        zero_indegree = []
+        for node_id in suffix:
+            degree = sum(1 for pred in graph.pred_map(node_id).values() if pred in in_suffix)
+            if degree:
+                indegree_map[node_id] = degree
+            else:
+                zero_indegree.append((self._topological_key(node_id), node_id))
+        heapq.heapify(zero_indegree)
+
+        # Once every changed node is placed and the nodes placed so far are
+        # exactly the nodes the old order had placed, the rest of the old
+        # order is still valid.
+        touched = {node_id for node_id in self._topological_touched if node_id in graph}
+        touched.update(node_id for node_id in self._topological_added if node_id in graph)
+        pending = len(touched)
+        unmatched = set()
+        old_index = 0
+
+        new_suffix = []
+        while zero_indegree:
+            _, node_id = heapq.heappop(zero_indegree)
+            new_suffix.append(node_id)
+            for child in graph.succ_map(node_id).values():
+                indegree_map[child] -= 1
+                if not indegree_map[child]:
+                    heapq.heappush(zero_indegree, (self._topological_key(child), child))
+                    del indegree_map[child]
+
+            if node_id in touched:
+                pending -= 1
+            if node_id in position:
+                unmatched.symmetric_difference_update((node_id,))
+                while old_index < len(old_suffix) and old_suffix[old_index] not in graph:
+                    old_index += 1
+                unmatched.symmetric_difference_update((old_suffix[old_index],))
+                old_index += 1
+            if not pending and not unmatched:
+                new_suffix.extend(node_id for node_id in old_suffix[old_index:]
+                                  if node_id in graph)
+                break
+
+        if len(new_suffix) != len(suffix):
+            raise DAGCircuitError("not a DAG")
+
+        for node_id in old_suffix:
+            if node_id not in graph:
+                del position[node_id]
+        del order[start:]
+        order.extend(new_suffix)
+        for index, node_id in enumerate(new_suffix, start):
+            position[node_id] = index
+
+        self._topological_dirty_from = None
+        self._topological_touched = set()
+        self._topological_added = []
+        return order
+
+    def _longest_path_labels(self):
+        """Return the longest path ending at every node.
+
+        The labels are cached. After the DAG changes, only the nodes whose
+        predecessors changed, and the descendants whose label changes as a
+        result, are recomputed.
+
+        Returns:
+            tuple(dict, dict): the length in edges of the longest path ending
+                at each node id, and the id of the predecessor on that path
+                (the node itself for nodes without predecessors).
+        """
+        order = self._topological_ids()
+        graph = self._multi_graph
+
+        if self._node_depths is None:
+            self._node_depths = {}
+            self._node_depth_parents = {}
+            self._depth_dirty = set(order)
+        if not self._depth_dirty:
+            return self._node_depths, self._node_depth_parents
+
+        lengths = self._node_depths
+        parents = self._node_depth_parents
+        position = self._topological_position
+        # Visit the nodes in topological order so that every node is
+        # recomputed once, after all of its predecessors.
+        queue = [(position[node_id], node_id) for node_id in self._depth_dirty
+                 if node_id in graph]
+        queued = {node_id for _, node_id in queue}
+        heapq.heapify(queue)
+        while queue:
+            _, node_id = heapq.heappop(queue)
+            queued.discard(node_id)
+            length, parent = 0, node_id
+            for pred_id in graph.pred_map(node_id).values():
+                if lengths[pred_id] + 1 > length:
+                    length, parent = lengths[pred_id] + 1, pred_id
+            parents[node_id] = parent
+            if lengths.get(node_id) != length:
+                lengths[node_id] = length
+                for child in graph.succ_map(node_id).values():
+                    if child not in queued:
+                        queued.add(child)
+                        heapq.heappush(queue, (position[child], child))
+
+        self._depth_dirty = set()
+        return lengths, parents
+
     def topological_nodes(self):
         """
         Yield nodes in topological order.
@@ -718,7 +925,9 @@ class DAGCircuit:
         Returns:
             generator(DAGNode): node in topological order
         """
-        return nx.lexicographical_topological_sort(self._multi_graph, key=lambda x: str(x.qargs))
+        graph = self._multi_graph
+        order = list(self._topological_ids())
+        return (graph[node_id] for node_id in order if node_id in graph)
 
     def topological_op_nodes(self):
         """
@@ -815,7 +1024,7 @@ class DAGCircuit:
                                           'on which it would be conditioned.')
 
         # Now that we know the connections, delete node
-        self._multi_graph.remove_node(node)
+        self._remove_node(node._node_id)
 
         # Iterate over nodes of input_circuit
         for sorted_node in input_dag.topological_op_nodes():
@@ -825,36 +1034,18 @@ class DAGCircuit:
                                sorted_node.qargs))
             m_cargs = list(map(lambda x: wire_map.get(x, x),
                                sorted_node.cargs))
-            self._add_op_node(sorted_node.op, m_qargs, m_cargs, condition)
+            new_id = self._add_op_node(sorted_node.op, m_qargs, m_cargs, condition)._node_id
             # Add edges from predecessor nodes to new node
             # and update predecessor nodes that change
             all_cbits = self._bits_in_condition(condition)
             all_cbits.extend(m_cargs)
-            al = [m_qargs, all_cbits]
-            for q in itertools.chain(*al):
-                self._multi_graph.add_edge(full_pred_map[q],
-                                           self._id_to_node[self._max_node_id],
-                                           name="%s[%s]" % (q.register.name, q.index),
-                                           wire=q)
-                full_pred_map[q] = self._id_to_node[self._max_node_id]
-
-        # Connect all predecessors and successors, and remove
-        # residual edges between input and output nodes
-        for w in full_pred_map:
-            self._multi_graph.add_edge(full_pred_map[w],
-                                       full_succ_map[w],
-                                       name="%s[%s]" % (w.register.name, w.index),
-                                       wire=w)
-            o_pred = list(self._multi_graph.predecessors(self.output_map[w]))
-            if len(o_pred) > 1:
-                if len(o_pred) != 2:
-                    raise DAGCircuitError("expected 2 predecessors here")
-
-                p = [x for x in o_pred if x != full_pred_map[w]]
-                if len(p) != 1:
-                    raise DAGCircuitError("expected 1 predecessor to pass filter")
+            for q in dict.fromkeys(itertools.chain(m_qargs, all_cbits)):
+                self._add_edge(full_pred_map[q], new_id, q)
+                full_pred_map[q] = new_id
 
-                self._multi_graph.remove_edge(p[0], self.output_map[w])
+        # Connect all predecessors and successors
+        for w in full_pred_map:
+            self._add_edge(full_pred_map[w], full_succ_map[w], w)
 
     def substitute_node(self, node, op, inplace=False):
         """Replace a DAGNode with a single instruction. qargs, cargs and
@@ -895,23 +1086,20 @@ class DAGCircuit:
             node.data_dict['name'] = op.name
             return node
 
-        self._max_node_id += 1
         new_data_dict = node.data_dict.copy()
         new_data_dict['op'] = op
         new_data_dict['name'] = op.name
-        new_node = DAGNode(new_data_dict, nid=self._max_node_id)
-
-        self._multi_graph.add_node(new_node)
-
-        in_edges = self._multi_graph.in_edges(node, data=True)
-        out_edges = self._multi_graph.out_edges(node, data=True)
+        new_node = self._add_node(new_data_dict)
 
-        self._multi_graph.add_edges_from(
-            [(src, new_node, data) for src, dest, data in in_edges])
-        self._multi_graph.add_edges_from(
-            [(new_node, dest, data) for src, dest, data in out_edges])
+        node_id = node._node_id
+        new_id = new_node._node_id
+        pred_map, succ_map = self._make_pred_succ_maps(node)
+        for wire, src in pred_map.items():
+            self._add_edge(src, new_id, wire)
+        for wire, dest in succ_map.items():
+            self._add_edge(new_id, dest, wire)
 
-        self._multi_graph.remove_node(node)
+        self._remove_node(node_id)
 
         return new_node
 
@@ -924,7 +1112,7 @@ class DAGCircuit:
         Returns:
             node: the node.
         """
-        return self._multi_graph.nodes[node_id]
+        return self._multi_graph[node_id]
 
     def nodes(self):
         """Iterator for node values.
@@ -932,17 +1120,35 @@ class DAGCircuit:
         Yield:
             node: the node.
         """
-        for node in self._multi_graph.nodes:
+        for node in self._multi_graph.nodes():
             yield node
 
     def edges(self, nodes=None):
-        """Iterator for node values.
+        """Iterator for edge values and source and dest node
+
+        This works by returning the output edges from the specified nodes. If
+        no nodes are specified all edges from the graph are returned.
+
+        Args:
+            nodes(DAGNode or list(DAGNode)): Either a list of nodes or a single
+                input node. If none is specified all edges are returned from
+                the graph.
 
         Yield:
-            node: the node.
+            edge: the edge in the same format as out_edges the tuple
+                (source node, destination node, edge data)
         """
-        for source_node, dest_node, edge_data in self._multi_graph.edges(nodes, data=True):
-            yield source_node, dest_node, edge_data
+        graph = self._multi_graph
+        if nodes is None:
+            node_ids = None
+        elif isinstance(nodes, DAGNode):
+            node_ids = [nodes._node_id]
+        else:
+            node_ids = [node._node_id for node in nodes]
+
+        for source_id, dest_id, wire in graph.edges(node_ids):
+            yield graph[source_id], graph[dest_id], {
+                'name': "%s[%s]" % (wire.register.name, wire.index), 'wire': wire}
 
     def op_nodes(self, op=None):
         """Get the list of "op" nodes in the dag.
@@ -998,45 +1204,67 @@ class DAGCircuit:
 
     def longest_path(self):
         """Returns the longest path in the dag as a list of DAGNodes."""
-        return nx.dag_longest_path(self._multi_graph)
+        lengths, parents = self._longest_path_labels()
+        if not self.output_map:
+            return []
+        graph = self._multi_graph
+        position = self._topological_position
+        node_id = min((node._node_id for node in self.output_map.values()),
+                      key=lambda x: (-lengths[x], position[x]))
+        path = [node_id]
+        while parents[node_id] != node_id:
+            node_id = parents[node_id]
+            path.append(node_id)
+        return [graph[node_id] for node_id in reversed(path)]
 
     def successors(self, node):
         """Returns iterator of the successors of a node as DAGNodes."""
-        return self._multi_graph.successors(node)
+        graph = self._multi_graph
+        return (graph[node_id] for node_id in graph.successors(node._node_id))
 
     def predecessors(self, node):
         """Returns iterator of the predecessors of a node as DAGNodes."""
-        return self._multi_graph.predecessors(node)
+        graph = self._multi_graph
+        return (graph[node_id] for node_id in graph.predecessors(node._node_id))
 
     def quantum_predecessors(self, node):
         """Returns iterator of the predecessors of a node that are
         connected by a quantum edge as DAGNodes."""
-        for predecessor in self.predecessors(node):
-            if isinstance(self._multi_graph.get_edge_data(predecessor, node, key=0)['wire'], Qubit):
-                yield predecessor
+        graph = self._multi_graph
+        pred_map = graph.pred_map(node._node_id)
+        quantum = {node_id for wire, node_id in pred_map.items() if isinstance(wire, Qubit)}
+        for node_id in graph.predecessors(node._node_id):
+            if node_id in quantum:
+                yield graph[node_id]
 
     def ancestors(self, node):
         """Returns set of the ancestors of a node as DAGNodes."""
-        return nx.ancestors(self._multi_graph, node)
+        graph = self._multi_graph
+        return {graph[node_id] for node_id in graph.ancestors(node._node_id)}
 
     def descendants(self, node):
         """Returns set of the descendants of a node as DAGNodes."""
-        return nx.descendants(self._multi_graph, node)
+        graph = self._multi_graph
+        return {graph[node_id] for node_id in graph.descendants(node._node_id)}
 
     def bfs_successors(self, node):
         """
         Returns an iterator of tuples of (DAGNode, [DAGNodes]) where the DAGNode is the current node
         and [DAGNode] is its successors in  BFS order.
         """
-        return nx.bfs_successors(self._multi_graph, node)
+        graph = self._multi_graph
+        for node_id, successor_ids in graph.bfs_successors(node._node_id):
+            yield graph[node_id], [graph[successor_id] for successor_id in successor_ids]
 
     def quantum_successors(self, node):
         """Returns iterator of the successors of a node that are
         connected by a quantum edge as DAGNodes."""
-        for successor in self.successors(node):
-            if isinstance(self._multi_graph.get_edge_data(
-                    node, successor, key=0)['wire'], Qubit):
-                yield successor
+        graph = self._multi_graph
+        succ_map = graph.succ_map(node._node_id)
+        quantum = {node_id for wire, node_id in succ_map.items() if isinstance(wire, Qubit)}
+        for node_id in graph.successors(node._node_id):
+            if node_id in quantum:
+                yield graph[node_id]
 
     def remove_op_node(self, node):
         """Remove an operation node n.
@@ -1050,15 +1278,14 @@ class DAGCircuit:
         pred_map, succ_map = self._make_pred_succ_maps(node)
 
         # remove from graph and map
-        self._multi_graph.remove_node(node)
+        self._remove_node(node._node_id)
 
         for w in pred_map.keys():
-            self._multi_graph.add_edge(pred_map[w], succ_map[w],
-                                       name="%s[%s]" % (w.register.name, w.index), wire=w)
+            self._add_edge(pred_map[w], succ_map[w], w)
 
     def remove_ancestors_of(self, node):
         """Remove all of the ancestor operation nodes of node."""
-        anc = nx.ancestors(self._multi_graph, node)
+        anc = self.ancestors(node)
         # TODO: probably better to do all at once using
         # multi_graph.remove_nodes_from; same for related functions ...
         for anc_node in anc:
@@ -1067,14 +1294,14 @@ class DAGCircuit:
 
     def remove_descendants_of(self, node):
         """Remove all of the descendant operation nodes of node."""
-        desc = nx.descendants(self._multi_graph, node)
+        desc = self.descendants(node)
         for desc_node in desc:
             if desc_node.type == "op":
                 self.remove_op_node(desc_node)
 
     def remove_nonancestors_of(self, node):
         """Remove all of the non-ancestors operation nodes of node."""
-        anc = nx.ancestors(self._multi_graph, node)
+        anc = self.ancestors(node)
         comp = list(set(self._multi_graph.nodes()) - set(anc))
         for n in comp:
             if n.type == "op":
@@ -1082,25 +1309,28 @@ class DAGCircuit:
 
     def remove_nondescendants_of(self, node):
         """Remove all of the non-descendants operation nodes of node."""
-        dec = nx.descendants(self._multi_graph, node)
+        dec = self.descendants(node)
         comp = list(set(self._multi_graph.nodes()) - set(dec))
         for n in comp:
             if n.type == "op":
                 self.remove_op_node(n)
 
     def layers(self):
-        """Yield a shallow view on a layer of this DAGCircuit for all d layers of this circuit.
+        """Yield a view on a layer of this DAGCircuit for all d layers of this circuit.
 
-        A layer is a circuit whose gates act on disjoint qubits, i.e.
+        A layer is a set of gates acting on disjoint qubits, i.e.
         a layer has depth 1. The total number of layers equals the
         circuit depth d. The layers are indexed from 0 to d-1 with the
         earliest layer at index 0. The layers are constructed using a
-        greedy algorithm. Each returned layer is a dict containing
-        {"graph": circuit graph, "partition": list of qubit lists}.
+        greedy algorithm. Each returned layer is a :class:`DAGLayer` view
+        on the op nodes of this DAG. It can be used as the dict
+        {"graph": circuit graph, "partition": list of qubit lists},
+        where the "graph" DAGCircuit is only built when it is looked up.
 
-        New but semantically equivalent DAGNodes will be included in the returned layers,
-        NOT the DAGNodes from the original DAG. The original vs new nodes can be compared using
-        DAGNode.semantic_eq(node1, node2)
+        The view contains the DAGNodes of the original DAG, ordered by node id.
+        The "graph" of a layer contains new but semantically equivalent
+        DAGNodes, which can be compared to the original ones using
+        DAGNode.semantic_eq(node1, node2).
 
         TODO: Gates that use the same cbits will end up in different
         layers as this is currently implemented. This may not be
@@ -1128,81 +1358,39 @@ class DAGCircuit:
             if not op_nodes:
                 return
 
-            # Construct a shallow copy of self
-            new_layer = DAGCircuit()
-            new_layer.name = self.name
-
-            # add in the registers - this adds the input/output nodes
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-
-            for node in op_nodes:
-                # this creates new DAGNodes in the new_layer
-                new_layer.apply_operation_back(node.op,
-                                               node.qargs,
-                                               node.cargs,
-                                               node.condition)
-
-            # The quantum registers that have an operation in this layer.
-            support_list = [
-                op_node.qargs
-                for op_node in new_layer.op_nodes()
-                if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}
-            ]
-
-            yield {"graph": new_layer, "partition": support_list}
+            yield DAGLayer(self, op_nodes)
 
     def serial_layers(self):
         """Yield a layer for all gates of this circuit.
 
-        A serial layer is a circuit with one gate. The layers have the
+        A serial layer is a view with one gate. The layers have the
         same structure as in layers().
         """
         for next_node in self.topological_op_nodes():
-            new_layer = DAGCircuit()
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
-            # Save the support of the operation we add to the layer
-            support_list = []
-            # Operation data
-            op = copy.copy(next_node.op)
-            qa = copy.copy(next_node.qargs)
-            ca = copy.copy(next_node.cargs)
-            co = copy.copy(next_node.condition)
-            _ = self._bits_in_condition(co)
-
-            # Add node to new_layer
-            new_layer.apply_operation_back(op, qa, ca, co)
-            # Add operation to partition
-            if next_node.name not in ["barrier",
-                                      "snapshot", "save", "load", "noise"]:
-                support_list.append(list(qa))
-            l_dict = {"graph": new_layer, "partition": support_list}
-            yield l_dict
+            yield DAGLayer(self, [next_node])
 
     def multigraph_layers(self):
         """Yield layers of the multigraph."""
-        predecessor_count = dict()  # Dict[node, predecessors not visited]
+        graph = self._multi_graph
+        predecessor_count = dict()  # Dict[node id, predecessors not visited]
         cur_layer = [node for node in self.input_map.values()]
         yield cur_layer
         next_layer = []
         while cur_layer:
             for node in cur_layer:
                 # Count multiedges with multiplicity.
-                for successor in self._multi_graph.successors(node):
-                    multiplicity = self._multi_graph.number_of_edges(node, successor)
+                multiplicities = {}
+                for successor in graph.succ_map(node._node_id).values():
+                    multiplicities[successor] = multiplicities.get(successor, 0) + 1
+                for successor, multiplicity in multiplicities.items():
                     if successor in predecessor_count:
                         predecessor_count[successor] -= multiplicity
                     else:
                         predecessor_count[successor] = \
-                            self._multi_graph.in_degree(successor) - multiplicity
+                            graph.in_degree(successor) - multiplicity
 
                     if predecessor_count[successor] == 0:
-                        next_layer.append(successor)
+                        next_layer.append(graph[successor])
                         del predecessor_count[successor]
 
             yield next_layer
@@ -1233,14 +1421,14 @@ class DAGCircuit:
                 if node.condition is None and not nodes_seen[node]:
                     group = [node]
                     nodes_seen[node] = True
-                    s = list(self._multi_graph.successors(node))
+                    s = list(self.successors(node))
                     while len(s) == 1 and \
                             s[0].type == "op" and \
                             (s[0].name in namelist or any([s[0].name.startswith(p) for p in prefixlist])) and \
                             s[0].condition is None:
                         group.append(s[0])
                         nodes_seen[s[0]] = True
-                        s = list(self._multi_graph.successors(s[0]))
+                        s = list(self.successors(s[0]))
                     if len(group) >= 1:
                         group_list.append(tuple(group))
         return set(group_list)
@@ -1265,19 +1453,16 @@ class DAGCircuit:
             raise DAGCircuitError('The given wire %s is not present in the circuit'
                                   % str(wire))
 
-        more_nodes = True
-        while more_nodes:
-            more_nodes = False
+        graph = self._multi_graph
+        node_id = current_node._node_id
+        while node_id is not None:
+            current_node = graph[node_id]
             # allow user to just get ops on the wire - not the input/output nodes
             if current_node.type == 'op' or not only_ops:
                 yield current_node
 
             # find the adjacent node that takes the wire being looked at as input
-            for node, edges in self._multi_graph.adj[current_node].items():
-                if any(wire == edge['wire'] for edge in edges.values()):
-                    current_node = node
-                    more_nodes = True
-                    break
+            node_id = graph.succ_map(node_id).get(wire)
 
     def count_ops(self):
         """Count the occurrences of operation names.
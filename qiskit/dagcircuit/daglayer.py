@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Lightweight view on a layer of a :class:`~qiskit.dagcircuit.DAGCircuit`.
+"""
+
+from collections.abc import Mapping
+import heapq
+
+from qiskit.circuit.gate import Gate
+
+# Operations that act on qubits but do not contribute to the layer partition.
+_DIRECTIVES = frozenset(["barrier", "snapshot", "save", "load", "noise"])
+
+
+class DAGLayer(Mapping):
+    """A read-only view on a set of op nodes of a DAGCircuit that act on disjoint wires.
+
+    This is what :meth:`DAGCircuit.layers` and :meth:`DAGCircuit.serial_layers`
+    yield. The view holds the op nodes of the parent DAG and their qubit
+    partition; it does not build a new circuit. It can be passed directly to
+    :meth:`DAGCircuit.compose_back` and :meth:`DAGCircuit.extend_back`.
+
+    For backwards compatibility the view also behaves like the dict
+    ``{"graph": DAGCircuit, "partition": list}`` that was returned before.
+    Looking up ``"graph"`` builds a standalone DAGCircuit for the layer (once)
+    with new DAGNodes, so it can be modified without touching the parent DAG.
+
+    The view shares the DAGNodes of the parent DAG and is only valid as long
+    as the parent DAG is not modified.
+    """
+
+    __slots__ = ('_dag', '_op_nodes', '_partition', '_graph', '_topological_op_nodes')
+
+    def __init__(self, dag, op_nodes):
+        """Create a view on ``op_nodes`` of ``dag``.
+
+        Args:
+            dag (DAGCircuit): the parent DAG.
+            op_nodes (list[DAGNode]): op nodes of ``dag`` acting on disjoint
+                wires, in the order they were added to ``dag``.
+        """
+        self._dag = dag
+        self._op_nodes = op_nodes
+        self._partition = None
+        self._graph = None
+        self._topological_op_nodes = None
+
+    def __getitem__(self, key):
+        if key == "partition":
+            return self.partition
+        if key == "graph":
+            if self._graph is None:
+                self._graph = self.to_dag()
+            return self._graph
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(("graph", "partition"))
+
+    def __len__(self):
+        return 2
+
+    def __repr__(self):
+        return "<DAGLayer of %s: %s>" % (self._dag.name,
+                                         [node.name for node in self._op_nodes])
+
+    @property
+    def partition(self):
+        """list[list[Qubit]]: the qubits of each operation in the layer, skipping directives."""
+        if self._partition is None:
+            self._partition = [node.qargs for node in self._op_nodes
+                               if node.name not in _DIRECTIVES]
+        return self._partition
+
+    @property
+    def name(self):
+        """str: the name of the parent DAG."""
+        return self._dag.name
+
+    @property
+    def qregs(self):
+        """dict: the quantum registers of the parent DAG."""
+        return self._dag.qregs
+
+    @property
+    def cregs(self):
+        """dict: the classical registers of the parent DAG."""
+        return self._dag.cregs
+
+    @property
+    def wires(self):
+        """list: the wires of the parent DAG."""
+        return self._dag.wires
+
+    @property
+    def input_map(self):
+        """dict: the input nodes of the parent DAG, keyed by wire."""
+        return self._dag.input_map
+
+    @property
+    def output_map(self):
+        """dict: the output nodes of the parent DAG, keyed by wire."""
+        return self._dag.output_map
+
+    def qubits(self):
+        """Return a list of qubits (as a list of Qubit instances)."""
+        return self._dag.qubits()
+
+    def clbits(self):
+        """Return a list of classical bits (as a list of Clbit instances)."""
+        return self._dag.clbits()
+
+    def size(self):
+        """Return the number of operations."""
+        return len(self._op_nodes)
+
+    def depth(self):
+        """Return the circuit depth, 1 unless the layer is empty."""
+        return 1 if self._op_nodes else 0
+
+    def nodes(self):
+        """Iterator for the input, op and output nodes of the layer."""
+        yield from self._dag.input_map.values()
+        yield from self._op_nodes
+        yield from self._dag.output_map.values()
+
+    def topological_nodes(self):
+        """Yield the nodes of the layer in a topological order.
+
+        Input nodes come first, then the op nodes in the order of
+        :meth:`topological_op_nodes`, then the output nodes.
+        """
+        yield from self._dag.input_map.values()
+        yield from self.topological_op_nodes()
+        yield from self._dag.output_map.values()
+
+    def topological_op_nodes(self):
+        """Yield the op nodes of the layer in a topological order.
+
+        The order is the one :meth:`DAGCircuit.topological_op_nodes` gives on
+        the DAG built by :meth:`to_dag`, so that the view and the graph are
+        interchangeable for order-dependent callers.
+        """
+        if self._topological_op_nodes is None:
+            self._topological_op_nodes = self._lexicographical_op_order()
+        return iter(self._topological_op_nodes)
+
+    def _lexicographical_op_order(self):
+        """Replay the lexicographical topological sort of the DAG built by to_dag().
+
+        That DAG has an input and an output node per wire, added in wire
+        order, followed by the op nodes. Every op node sits between the input
+        and the output nodes of its own wires, so the sort only has to track
+        how many input nodes each op is still waiting for.
+        """
+        wires = self._dag.clbits() + self._dag.qubits()
+        wire_index = {wire: index for index, wire in enumerate(wires)}
+        num_wires = len(wires)
+
+        op_of_wire = {}
+        wires_of_op = []
+        waiting = []
+        for index, node in enumerate(self._op_nodes):
+            op_wires = set(node.qargs).union(node.cargs)
+            if node.condition is not None:
+                op_wires.update(node.condition[0])
+            wires_of_op.append(op_wires)
+            waiting.append(len(op_wires))
+            for wire in op_wires:
+                op_of_wire[wire] = index
+
+        # Heap entries are (sort key, node id in to_dag(), wire or op index),
+        # with the same (str(qargs), node id) ordering as DAGCircuit.
+        # Input and output nodes have no qargs.
+        heap = [("[]", 2 * index + 1, wire) for index, wire in enumerate(wires)]
+        heapq.heapify(heap)
+        order = []
+        while heap:
+            _, node_id, item = heapq.heappop(heap)
+            if node_id > 2 * num_wires:
+                order.append(self._op_nodes[item])
+                for wire in wires_of_op[item]:
+                    heapq.heappush(heap, ("[]", 2 * wire_index[wire] + 2, wire))
+            elif node_id % 2:
+                index = op_of_wire.get(item)
+                if index is None:
+                    heapq.heappush(heap, ("[]", node_id + 1, item))
+                else:
+                    waiting[index] -= 1
+                    if not waiting[index]:
+                        heapq.heappush(heap, (str(self._op_nodes[index].qargs),
+                                              2 * num_wires + 1 + index, index))
+        return order
+
+    def op_nodes(self, op=None):
+        """Get the list of "op" nodes in the layer.
+
+        Args:
+            op (Type): Instruction subclass op nodes to return. if op=None, return
+                all op nodes.
+        Returns:
+            list[DAGNode]: the list of op nodes, in the order they were added
+            to the parent DAG.
+        """
+        if op is None:
+            return list(self._op_nodes)
+        return [node for node in self._op_nodes if isinstance(node.op, op)]
+
+    def gate_nodes(self):
+        """Get the list of gate nodes in the layer."""
+        return self.op_nodes(Gate)
+
+    def twoQ_gates(self):
+        """Get list of 2-qubit gates. Ignore snapshot, barriers, and the like."""
+        return [node for node in self.gate_nodes() if len(node.qargs) == 2]
+
+    def serial_layers(self):
+        """Yield a view with a single op node for every op node of the layer.
+
+        The views come in the order of :meth:`topological_op_nodes`.
+        """
+        for node in self.topological_op_nodes():
+            yield DAGLayer(self._dag, [node])
+
+    def to_dag(self):
+        """Build a standalone DAGCircuit containing the operations of this layer.
+
+        Returns:
+            DAGCircuit: a new DAG with the registers of the parent DAG and
+            new (semantically equivalent) DAGNodes for the layer operations.
+        """
+        from .dagcircuit import DAGCircuit  # pylint: disable=cyclic-import
+
+        new_layer = DAGCircuit()
+        new_layer.name = self._dag.name
+        for creg in self._dag.cregs.values():
+            new_layer.add_creg(creg)
+        for qreg in self._dag.qregs.values():
+            new_layer.add_qreg(qreg)
+        for node in self._op_nodes:
+            new_layer.apply_operation_back(node.op, node.qargs, node.cargs, node.condition)
+        return new_layer
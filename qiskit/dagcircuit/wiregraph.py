@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Compact graph storage used as the backend of :class:`~qiskit.dagcircuit.DAGCircuit`.
+
+In a circuit DAG every edge is labelled by a wire, and a node has at most
+one incoming and one outgoing edge per wire. The graph therefore does not
+need a general multigraph: each node keeps a ``{wire: predecessor id}`` and
+a ``{wire: successor id}`` map, stored in flat lists indexed by integer node
+id. Following a wire, replacing an edge or removing a node only touches the
+nodes on the affected wires.
+"""
+
+
+class WireGraph:
+    """Directed multigraph with integer node ids and wire-labelled edges.
+
+    Node ids are assigned in increasing order starting from 1 and are never
+    reused, so the id order is also the insertion order. Removed nodes leave
+    an empty slot behind.
+    """
+
+    def __init__(self):
+        # Slot 0 is never used so that node ids start at 1.
+        self._nodes = [None]
+        self._pred = [None]
+        self._succ = [None]
+        self._num_nodes = 0
+        self._num_edges = 0
+
+    def __len__(self):
+        return self._num_nodes
+
+    def __getitem__(self, nid):
+        return self._nodes[nid]
+
+    def __contains__(self, nid):
+        return 0 < nid < len(self._nodes) and self._nodes[nid] is not None
+
+    @property
+    def next_id(self):
+        """The id that will be given to the next node added."""
+        return len(self._nodes)
+
+    def add_node(self, node):
+        """Add a node payload to the graph.
+
+        Args:
+            node (object): data stored at the node.
+
+        Returns:
+            int: the id of the new node.
+        """
+        nid = len(self._nodes)
+        self._nodes.append(node)
+        self._pred.append({})
+        self._succ.append({})
+        self._num_nodes += 1
+        return nid
+
+    def remove_node(self, nid):
+        """Remove a node and all of its incident edges."""
+        for wire, src in self._pred[nid].items():
+            del self._succ[src][wire]
+        for wire, dst in self._succ[nid].items():
+            del self._pred[dst][wire]
+        self._num_edges -= len(self._pred[nid]) + len(self._succ[nid])
+        self._nodes[nid] = None
+        self._pred[nid] = None
+        self._succ[nid] = None
+        self._num_nodes -= 1
+
+    def add_edge(self, src, dst, wire):
+        """Add the edge ``src -> dst`` on ``wire``.
+
+        An existing edge leaving ``src`` or entering ``dst`` on the same wire
+        is replaced.
+        """
+        succ = self._succ[src]
+        old_dst = succ.pop(wire, None)
+        if old_dst is not None:
+            del self._pred[old_dst][wire]
+            self._num_edges -= 1
+        pred = self._pred[dst]
+        old_src = pred.pop(wire, None)
+        if old_src is not None:
+            del self._succ[old_src][wire]
+            self._num_edges -= 1
+        succ[wire] = dst
+        pred[wire] = src
+        self._num_edges += 1
+
+    def remove_edge(self, src, wire):
+        """Remove the edge leaving ``src`` on ``wire``."""
+        dst = self._succ[src].pop(wire)
+        del self._pred[dst][wire]
+        self._num_edges -= 1
+
+    def node_ids(self):
+        """Return the ids of all nodes, in insertion order."""
+        return [nid for nid, node in enumerate(self._nodes) if node is not None]
+
+    def nodes(self):
+        """Return the payloads of all nodes, in insertion order."""
+        return [node for node in self._nodes if node is not None]
+
+    def num_edges(self):
+        """Return the number of edges."""
+        return self._num_edges
+
+    def pred_map(self, nid):
+        """Return the ``{wire: predecessor id}`` map of a node. Do not modify it."""
+        return self._pred[nid]
+
+    def succ_map(self, nid):
+        """Return the ``{wire: successor id}`` map of a node. Do not modify it."""
+        return self._succ[nid]
+
+    def predecessor(self, nid, wire):
+        """Return the id of the predecessor of a node on ``wire``."""
+        return self._pred[nid][wire]
+
+    def successor(self, nid, wire):
+        """Return the id of the successor of a node on ``wire``."""
+        return self._succ[nid][wire]
+
+    def predecessors(self, nid):
+        """Return the ids of the distinct predecessors of a node."""
+        return list(dict.fromkeys(self._pred[nid].values()))
+
+    def successors(self, nid):
+        """Return the ids of the distinct successors of a node."""
+        return list(dict.fromkeys(self._succ[nid].values()))
+
+    def in_degree(self, nid):
+        """Return the number of edges entering a node."""
+        return len(self._pred[nid])
+
+    def out_degree(self, nid):
+        """Return the number of edges leaving a node."""
+        return len(self._succ[nid])
+
+    def in_edges(self, nid):
+        """Return the edges entering a node as ``(src, dst, wire)`` tuples."""
+        return [(src, nid, wire) for wire, src in self._pred[nid].items()]
+
+    def out_edges(self, nid):
+        """Return the edges leaving a node as ``(src, dst, wire)`` tuples."""
+        return [(nid, dst, wire) for wire, dst in self._succ[nid].items()]
+
+    def edges(self, nids=None):
+        """Return ``(src, dst, wire)`` tuples for the edges leaving ``nids``.
+
+        Args:
+            nids (iterable[int] or None): the source nodes. All nodes if None.
+
+        Returns:
+            list[tuple]: the edges.
+        """
+        if nids is None:
+            nids = self.node_ids()
+        return [(nid, dst, wire) for nid in nids for wire, dst in self._succ[nid].items()]
+
+    def has_edge(self, src, dst):
+        """Return True if there is at least one edge ``src -> dst``."""
+        return dst in self._succ[src].values()
+
+    def ancestors(self, nid):
+        """Return the set of ids of the nodes that have a path to ``nid``."""
+        return self._reachable(nid, self._pred)
+
+    def descendants(self, nid):
+        """Return the set of ids of the nodes reachable from ``nid``."""
+        return self._reachable(nid, self._succ)
+
+    @staticmethod
+    def _reachable(nid, adjacency):
+        seen = set()
+        stack = [nid]
+        while stack:
+            for other in adjacency[stack.pop()].values():
+                if other not in seen:
+                    seen.add(other)
+                    stack.append(other)
+        return seen
+
+    def bfs_successors(self, nid):
+        """Yield ``(node id, [successor ids])`` pairs in breadth-first order from ``nid``."""
+        visited = {nid}
+        queue = [nid]
+        for parent in queue:
+            children = []
+            for child in self.successors(parent):
+                if child not in visited:
+                    visited.add(child)
+                    children.append(child)
+            if children or parent == nid:
+                queue.extend(children)
+                yield parent, children
+
+    def num_weakly_connected_components(self):
+        """Return the number of weakly connected components."""
+        parent = list(range(len(self._nodes)))
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        components = self._num_nodes
+        for src, succ in enumerate(self._succ):
+            if succ is None:
+                continue
+            for dst in succ.values():
+                root_src, root_dst = find(src), find(dst)
+                if root_src != root_dst:
+                    parent[root_dst] = root_src
+                    components -= 1
+        return components
@@ -70,6 +70,8 @@ Simulator Extensions
    :toctree: ../stubs/
 
    Snapshot
+   SnapshotExpectationValue
+   SnapshotProbabilities
 
 Initialization
 ==============
@@ -83,4 +85,4 @@ Initialization
 from qiskit.extensions.quantum_initializer.initializer import Initialize
 from .standard import *
 from .unitary import UnitaryGate
-from .simulator import Snapshot
+from .simulator import Snapshot, SnapshotExpectationValue, SnapshotProbabilities
@@ -15,3 +15,5 @@
 """Instructions usable by simulator backends."""
 
 from .snapshot import Snapshot
+from .snapshot_expectation_value import SnapshotExpectationValue
+from .snapshot_probabilities import SnapshotProbabilities
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Simulator command to snapshot the expectation value of a Pauli operator.
+"""
+
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.extensions.exceptions import ExtensionError
+from qiskit.quantum_info.operators.pauli import Pauli
+from .snapshot import Snapshot
+
+
+class SnapshotExpectationValue(Snapshot):
+    """Snapshot instruction for the expectation value of a sum of Paulis."""
+
+    def __init__(self, label, op):
+        """Create a Pauli expectation value snapshot instruction.
+
+        Args:
+            label (str): the snapshot label for result data.
+            op (Pauli or list): a :class:`~qiskit.quantum_info.Pauli`, or a
+                list of ``(coeff, pauli)`` pairs where ``pauli`` is a
+                :class:`~qiskit.quantum_info.Pauli` or its label, on the
+                qubits of the snapshot.
+
+        Raises:
+            ExtensionError: if the operator is invalid.
+        """
+        params = self._format_pauli_op(op)
+        super().__init__(label, snapshot_type='expectation_value_pauli',
+                         num_qubits=len(params[0][1]), params=params)
+
+    @staticmethod
+    def _format_pauli_op(op):
+        """Return an operator as a list of ``[coeff, label]`` pairs."""
+        if isinstance(op, Pauli):
+            op = [(1, op)]
+        if not op:
+            raise ExtensionError('The operator of an expectation value snapshot is empty.')
+        params = []
+        for coeff, pauli in op:
+            label = pauli.to_label() if isinstance(pauli, Pauli) else pauli
+            if not isinstance(label, str) or not label or set(label) - set('IXYZ'):
+                raise ExtensionError('Invalid Pauli "{}" in expectation value '
+                                     'snapshot.'.format(pauli))
+            if params and len(label) != len(params[0][1]):
+                raise ExtensionError('The Paulis of an expectation value snapshot '
+                                     'must act on the same number of qubits.')
+            params.append([complex(coeff), label])
+        return params
+
+    @property
+    def params(self):
+        """return the ``[coeff, label]`` pairs of the Paulis"""
+        return self._params
+
+    @params.setter
+    def params(self, params):
+        # The pairs are not instruction parameters of a supported type
+        self._params = [[complex(coeff), str(label)] for coeff, label in params]
+
+
+def snapshot_expectation_value(self, label, op, qubits):
+    """Take a snapshot of the expectation value of a sum of Paulis.
+
+    Args:
+        label (str): a snapshot label to report the result.
+        op (Pauli or list): a :class:`~qiskit.quantum_info.Pauli`, or a list
+            of ``(coeff, pauli)`` pairs, the last character of the label of
+            each Pauli acting on the first qubit of ``qubits``.
+        qubits (list): the qubits the Paulis act on.
+
+    Returns:
+        QuantumCircuit: with attached command
+
+    Raises:
+        ExtensionError: malformed command
+    """
+    return self.append(SnapshotExpectationValue(label, op), qubits)
+
+
+# Add to QuantumCircuit class
+QuantumCircuit.snapshot_expectation_value = snapshot_expectation_value
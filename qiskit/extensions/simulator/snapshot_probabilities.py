@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Simulator command to snapshot the outcome probabilities of some qubits.
+"""
+
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from .snapshot import Snapshot
+
+
+class SnapshotProbabilities(Snapshot):
+    """Snapshot instruction for the measurement outcome probabilities of qubits."""
+
+    def __init__(self, label, num_qubits):
+        """Create a probabilities snapshot instruction.
+
+        Args:
+            label (str): the snapshot label for result data.
+            num_qubits (int): the number of qubits measured.
+        """
+        super().__init__(label, snapshot_type='probabilities', num_qubits=num_qubits)
+
+
+def snapshot_probabilities(self, label, qubits):
+    """Take a snapshot of the measurement outcome probabilities of qubits.
+
+    The first qubit is the least significant bit of the outcomes.
+
+    Args:
+        label (str): a snapshot label to report the result.
+        qubits (list): the qubits measured.
+
+    Returns:
+        QuantumCircuit: with attached command
+    """
+    return self.append(SnapshotProbabilities(label, len(qubits)), qubits)
+
+
+# Add to QuantumCircuit class
+QuantumCircuit.snapshot_probabilities = snapshot_probabilities
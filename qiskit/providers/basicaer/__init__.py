@@ -54,6 +54,7 @@ Job Class
    :toctree: ../stubs/
 
    BasicAerJob
+   BasicAerJobQueue
 
 Exceptions
 ==========
@@ -65,7 +66,7 @@ Exceptions
 """
 
 from .basicaerprovider import BasicAerProvider
-from .basicaerjob import BasicAerJob
+from .basicaerjob import BasicAerJob, BasicAerJobQueue
 from .qasm_simulator import QasmSimulatorPy
 from .statevector_simulator import StatevectorSimulatorPy
 from .unitary_simulator import UnitarySimulatorPy
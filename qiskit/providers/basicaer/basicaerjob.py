@@ -15,11 +15,15 @@
 """This module implements the job class used by Basic Aer Provider."""
 
 from concurrent import futures
+import copy
+import datetime
 import sys
 import functools
+import threading
 
 from qiskit.providers import BaseJob, JobStatus, JobError
 from qiskit.qobj import validate_qobj_against_schema
+from qiskit.util import local_hardware_info
 
 
 def requires_submit(func):
@@ -41,38 +45,196 @@ def requires_submit(func):
     return _wrapper
 
 
+class BasicAerJobQueue:
+    """A pool of workers running Basic Aer jobs, with a bounded queue.
+
+    Jobs are run by a pool of threads or of processes. Threads avoid
+    copying the qobj and the backend to another process, which is most of
+    the time taken by small experiments, while the numpy kernels of the
+    simulators run in parallel since they release the GIL. Processes also
+    run the Python parts of the simulators in parallel.
+
+    When ``max_queue_size`` jobs are already waiting for a worker, submitting
+    another one blocks until one of them starts running.
+    """
+
+    def __init__(self, executor=None, max_workers=None, max_queue_size=None):
+        """Create a job queue.
+
+        Args:
+            executor (str): ``'thread'`` or ``'process'``. Defaults to threads
+                on macOS and Windows and to processes elsewhere.
+            max_workers (int): the number of jobs run at the same time.
+                Defaults to the number of CPUs.
+            max_queue_size (int): the number of jobs waiting for a worker
+                before submitting jobs blocks. Unbounded if None.
+
+        Raises:
+            JobError: if an argument is invalid.
+        """
+        if executor is None:
+            executor = 'thread' if sys.platform in ['darwin', 'win32'] else 'process'
+        if executor not in ('thread', 'process'):
+            raise JobError('Invalid executor "{}", expected "thread" or '
+                           '"process".'.format(executor))
+        if max_workers is not None and max_workers < 1:
+            raise JobError('max_workers must be at least 1.')
+        if max_queue_size is not None and max_queue_size < 0:
+            raise JobError('max_queue_size must not be negative.')
+        self.executor = executor
+        self.max_workers = max_workers or local_hardware_info()['cpus']
+        self.max_queue_size = max_queue_size
+        # The pool is only started by the first job
+        self._pool = None
+        self._lock = threading.Lock()
+        self._slots = None
+        if max_queue_size is not None:
+            self._slots = threading.BoundedSemaphore(self.max_workers + max_queue_size)
+        # The futures of the jobs which may still be waiting, in submission order
+        self._waiting = []
+
+    def submit(self, fn, *args, timeout=None):
+        """Submit a job to the queue.
+
+        Args:
+            fn (callable): the function running the job.
+            *args: the arguments of ``fn``.
+            timeout (float): number of seconds to wait for a place in the
+                queue if it is full. Waits as long as needed if None.
+
+        Returns:
+            concurrent.futures.Future: the future of the job.
+
+        Raises:
+            JobError: if the queue stayed full for ``timeout`` seconds.
+        """
+        if self._slots is not None:
+            acquired = self._slots.acquire(timeout=timeout) if timeout is not None \
+                else self._slots.acquire()
+            if not acquired:
+                raise JobError('The job queue is full.')
+        try:
+            with self._lock:
+                if self._pool is None:
+                    if self.executor == 'thread':
+                        self._pool = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._pool = futures.ProcessPoolExecutor(max_workers=self.max_workers)
+                future = self._pool.submit(fn, *args)
+                self._waiting.append(future)
+        except BaseException:
+            # The job never entered the queue
+            if self._slots is not None:
+                self._slots.release()
+            raise
+        # Forget the futures of finished jobs, which hold their results
+        future.add_done_callback(self._remove)
+        if self._slots is not None:
+            future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _remove(self, future):
+        """Remove the future of a finished job from the waiting jobs."""
+        with self._lock:
+            if future in self._waiting:
+                self._waiting.remove(future)
+
+    def position(self, future):
+        """Return the position of a job in the queue.
+
+        Args:
+            future (concurrent.futures.Future): the future of the job.
+
+        Returns:
+            int or None: the number of jobs which will start running before
+            it, or None if it is not waiting. A process pool hands one more
+            job than it has workers to its processes in advance, these jobs
+            are counted as running.
+        """
+        with self._lock:
+            self._waiting = [waiting for waiting in self._waiting
+                             if not (waiting.running() or waiting.done())]
+            if future in self._waiting:
+                return self._waiting.index(future)
+        return None
+
+    def shutdown(self, wait=True):
+        """Stop the workers once the submitted jobs are done.
+
+        Args:
+            wait (bool): whether to wait for the jobs to be done.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        # The lock is released while waiting, since the jobs which finish
+        # take it to leave the waiting jobs
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
 class BasicAerJob(BaseJob):
     """BasicAerJob class.
 
     Attributes:
-        _executor (futures.Executor): executor to handle asynchronous jobs
+        _default_queue (BasicAerJobQueue): queue running the jobs of
+            backends which are not given one by their provider.
     """
 
-    if sys.platform in ['darwin', 'win32']:
-        _executor = futures.ThreadPoolExecutor()
-    else:
-        _executor = futures.ProcessPoolExecutor()
+    _default_queue = BasicAerJobQueue()
 
     def __init__(self, backend, job_id, fn, qobj):
         super().__init__(backend, job_id)
         self._fn = fn
         self._qobj = qobj
         self._future = None
+        self._queue = None
+        self._time_per_step = {}
 
-    def submit(self):
+    def submit(self, timeout=None):
         """Submit the job to the backend for execution.
 
+        Args:
+            timeout (float): number of seconds to wait for a place in the job
+                queue if it is full. Waits as long as needed if None.
+
         Raises:
             QobjValidationError: if the JSON serialization of the Qobj passed
             during construction does not validate against the Qobj schema.
 
-            JobError: if trying to re-submit the job.
+            JobError: if trying to re-submit the job, or if the job queue
+            stayed full for ``timeout`` seconds.
         """
+        # pylint: disable=arguments-differ
         if self._future is not None:
             raise JobError("We have already submitted the job!")
 
         validate_qobj_against_schema(self._qobj)
-        self._future = self._executor.submit(self._fn, self._job_id, self._qobj)
+        provider = self._backend.provider() if hasattr(self._backend, 'provider') else None
+        self._queue = getattr(provider, 'job_queue', None) or self._default_queue
+        fn = self._fn
+        if self._queue.executor == 'thread' and getattr(fn, '__self__', None) is self._backend:
+            # The simulators keep the state of a run in their attributes, so
+            # each thread runs the job on its own copy of the backend, like
+            # each process does.
+            backend = copy.deepcopy(self._backend, {id(provider): provider})
+            fn = getattr(backend, fn.__name__)
+        self._time_per_step['QUEUED'] = datetime.datetime.now()
+        self._future = self._queue.submit(fn, self._job_id, self._qobj, timeout=timeout)
+        self._future.add_done_callback(self._record_end)
+
+    def _record_end(self, future):
+        """Record the time a job ended, and when it started running if it
+        returned a result."""
+        end = datetime.datetime.now()
+        if future.cancelled():
+            self._time_per_step['CANCELLED'] = end
+        elif future.exception() is not None:
+            self._time_per_step['ERROR'] = end
+        else:
+            time_taken = getattr(future.result(), 'time_taken', None)
+            if time_taken is not None:
+                self._time_per_step['RUNNING'] = end - datetime.timedelta(seconds=time_taken)
+            self._time_per_step['DONE'] = end
 
     @requires_submit
     def result(self, timeout=None):
@@ -117,14 +279,35 @@ class BasicAerJob(BaseJob):
         elif self._future.done():
             _status = JobStatus.DONE if self._future.exception() is None else JobStatus.ERROR
         else:
-            # Note: There is an undocumented Future state: PENDING, that seems to show up when
-            # the job is enqueued, waiting for someone to pick it up. We need to deal with this
-            # state but there's no public API for it, so we are assuming that if the job is not
-            # in any of the previous states, is PENDING, ergo INITIALIZING for us.
-            _status = JobStatus.INITIALIZING
+            # Note: There is an undocumented Future state: PENDING, that shows up when
+            # the job is enqueued, waiting for a worker to pick it up.
+            _status = JobStatus.QUEUED
 
         return _status
 
+    @requires_submit
+    def queue_position(self):
+        """Return the position of the job in the queue of its provider.
+
+        Returns:
+            int or None: the number of jobs which will start running before
+            this one, or None if it is not waiting for a worker.
+        """
+        return self._queue.position(self._future)
+
+    @requires_submit
+    def time_per_step(self):
+        """Return the times at which the job went through its steps.
+
+        Returns:
+            dict: the :class:`datetime.datetime` at which the job was
+            ``'QUEUED'``, and once it is over at which it was ``'DONE'``,
+            ``'CANCELLED'`` or ended in ``'ERROR'``. Jobs which are done also
+            have the time they started ``'RUNNING'``, from the time taken by
+            the backend.
+        """
+        return dict(self._time_per_step)
+
     def backend(self):
         """Return the instance of the backend used for this job."""
         return self._backend
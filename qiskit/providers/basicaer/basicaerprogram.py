@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Compiled programs for the BasicAer simulators.
+
+A qobj experiment is lowered once into a list of operations whose matrices,
+index strings and classical masks are resolved in advance, so that running
+each shot only applies them. Consecutive unconditional gates acting on at
+most ``max_fused_qubits`` qubits are fused into a single dense unitary.
+"""
+
+import operator
+
+import numpy as np
+
+from .exceptions import BasicAerError
+from .basicaertools import single_gate_matrix
+from .basicaertools import cx_gate_matrix
+
+# Instructions which do nothing to the state of the simulator.
+_NO_OPS = ('id', 'u0', 'barrier')
+
+_RELATIONS = {'==': operator.eq, '!=': operator.ne,
+              '<': operator.lt, '<=': operator.le,
+              '>': operator.gt, '>=': operator.ge}
+
+
+class Condition:
+    """The condition of a conditional operation.
+
+    The operation is applied if ``(bits & mask) >> shift == value``, where
+    ``bits`` is the classical register or the classical memory.
+    """
+
+    __slots__ = ('register', 'mask', 'shift', 'value')
+
+    def __init__(self, register, mask, shift, value):
+        self.register = register
+        self.mask = mask
+        self.shift = shift
+        self.value = value
+
+    @classmethod
+    def from_operation(cls, operation):
+        """Return the condition of a qobj instruction, or None if it has none."""
+        conditional = getattr(operation, 'conditional', None)
+        if conditional is None:
+            return None
+        # A single bit of the register, as set by bfunc instructions.
+        if isinstance(conditional, int):
+            return cls(True, 1 << conditional, conditional, 1)
+        # A value of the masked bits of the memory.
+        mask = int(conditional.mask, 16)
+        if mask == 0:
+            return None
+        shift = (mask & -mask).bit_length() - 1
+        return cls(False, mask, shift, int(conditional.val, 16))
+
+    def holds(self, memory, register):
+        """Return whether the condition holds for the given classical state.
+
+        Args:
+            memory (int or np.ndarray): the classical memory, or an array of
+                the classical memory of several shots.
+            register (int or np.ndarray): the classical register, or an array
+                of the classical register of several shots.
+
+        Returns:
+            bool or np.ndarray: True if the operation should be applied, for
+            each shot if arrays were given.
+        """
+        bits = register if self.register else memory
+        return (bits & self.mask) >> self.shift == self.value
+
+
+class GateOp:
+    """A unitary acting on some qubits of the statevector."""
+
+    __slots__ = ('qubits', 'matrix', 'condition', '_matrix', '_shape', '_axes')
+
+    def __init__(self, matrix, qubits, number_of_qubits, condition=None):
+        """Prepare a unitary for application.
+
+        Args:
+            matrix (np.ndarray): the ``2**k x 2**k`` matrix of the unitary.
+            qubits (list[int]): the ``k`` qubits it acts on, the first one
+                being the least significant in the matrix.
+            number_of_qubits (int): the number of qubits of the statevector.
+            condition (Condition): the condition of the operation, if any.
+        """
+        self.qubits = list(qubits)
+        self.matrix = np.asarray(matrix, dtype=complex)
+        self.condition = condition
+        num_qubits = len(self.qubits)
+        low = min(self.qubits)
+        if sorted(self.qubits) == list(range(low, low + num_qubits)):
+            # Gates on neighbouring qubits are a matrix product on the middle
+            # axis, or the last axis for the lowest qubits.
+            self._matrix = _expand_matrix(self.matrix, self.qubits, sorted(self.qubits))
+            if low == 0:
+                self._matrix = self._matrix.T
+                self._shape = (2 ** (number_of_qubits - num_qubits), 2 ** num_qubits)
+            else:
+                self._shape = (2 ** (number_of_qubits - low - num_qubits), 2 ** num_qubits,
+                               2 ** low)
+            self._axes = None
+        else:
+            # Other gates are a matrix product on their qubit axes moved last,
+            # the most significant qubit of the matrix first.
+            self._matrix = self.matrix.T
+            self._shape = tuple(number_of_qubits * [2])
+            self._axes = [number_of_qubits - 1 - qubit for qubit in reversed(self.qubits)]
+
+    def apply(self, statevector):
+        """Return the statevector after the unitary.
+
+        Args:
+            statevector (np.ndarray): a flat statevector, or an array of
+                flat statevectors along its last axis.
+
+        Returns:
+            np.ndarray: the new statevector, of the same shape.
+        """
+        leading = statevector.shape[:-1]
+        tensor = statevector.reshape(leading + self._shape)
+        if self._axes is None:
+            if len(self._shape) == 2:
+                return np.matmul(tensor, self._matrix).reshape(statevector.shape)
+            return np.matmul(self._matrix, tensor).reshape(statevector.shape)
+        axes = [len(leading) + axis for axis in self._axes]
+        last = list(range(tensor.ndim - len(axes), tensor.ndim))
+        tensor = np.moveaxis(tensor, axes, last)
+        shape = tensor.shape
+        tensor = np.matmul(tensor.reshape(shape[:-len(axes)] + (-1,)), self._matrix)
+        tensor = np.moveaxis(tensor.reshape(shape), last, axes)
+        return np.ascontiguousarray(tensor).reshape(statevector.shape)
+
+    def apply_in_place(self, statevector, chunk_size):
+        """Apply the unitary to a flat statevector in place, a chunk at a time.
+
+        Each chunk holds the amplitudes where the qubits which are neither
+        acted on nor among the lowest ones have fixed values, so that only
+        ``chunk_size`` amplitudes are copied at once. This is meant for
+        statevectors backed by a ``numpy.memmap``.
+
+        Args:
+            statevector (np.ndarray): a flat statevector, updated in place.
+            chunk_size (int): the number of amplitudes updated together, a
+                power of two.
+        """
+        number_of_qubits = len(statevector).bit_length() - 1
+        chunk_qubits = max(len(self.qubits), chunk_size.bit_length() - 1)
+        if chunk_qubits >= number_of_qubits:
+            statevector[:] = self.apply(statevector)
+            return
+        others = [qubit for qubit in range(number_of_qubits) if qubit not in self.qubits]
+        free = sorted(self.qubits + others[:chunk_qubits - len(self.qubits)])
+        fixed = others[chunk_qubits - len(self.qubits):]
+        chunk_op = GateOp(self.matrix, [free.index(qubit) for qubit in self.qubits],
+                          chunk_qubits)
+        tensor = statevector.reshape(number_of_qubits * [2])
+        for index in range(2 ** len(fixed)):
+            key = number_of_qubits * [slice(None)]
+            for position, qubit in enumerate(fixed):
+                key[number_of_qubits - 1 - qubit] = (index >> position) & 1
+            chunk = tensor[tuple(key)]
+            chunk[...] = chunk_op.apply(chunk.reshape(-1)).reshape(chunk.shape)
+
+
+class MeasureOp:
+    """A measurement of a qubit into a memory bit and optional register bit."""
+
+    __slots__ = ('qubit', 'cmembit', 'cregbit', 'condition')
+    # The name of the qobj instruction
+    name = 'measure'
+
+    def __init__(self, qubit, cmembit, cregbit=None, condition=None):
+        self.qubit = qubit
+        self.cmembit = cmembit
+        self.cregbit = cregbit
+        self.condition = condition
+
+
+class ResetOp:
+    """A reset of a qubit to the zero state."""
+
+    __slots__ = ('qubit', 'condition')
+    # The name of the qobj instruction
+    name = 'reset'
+
+    def __init__(self, qubit, condition=None):
+        self.qubit = qubit
+        self.condition = condition
+
+
+class SnapshotOp:
+    """A snapshot of the expectation value of a sum of Paulis, or of the
+    outcome probabilities of some qubits."""
+
+    __slots__ = ('label', 'snapshot_type', 'qubits', 'terms', 'condition')
+    # The name of the qobj instruction
+    name = 'snapshot'
+
+    def __init__(self, label, snapshot_type, qubits, params=None):
+        """Prepare a snapshot.
+
+        Args:
+            label (str): the label of the snapshot in the result.
+            snapshot_type (str): ``'expectation_value_pauli'`` or ``'probabilities'``.
+            qubits (list[int]): the qubits of the snapshot.
+            params (list): the ``[coeff, label]`` pairs of the Paulis of an
+                expectation value snapshot, the last character of a label
+                acting on the first qubit.
+        """
+        self.label = label
+        self.snapshot_type = snapshot_type
+        self.qubits = list(qubits)
+        self.condition = None
+        # Each Pauli as its coefficient times the phase of its Y factors, and
+        # the masks of the basis states it flips and of the ones it negates
+        self.terms = []
+        for coeff, pauli in params or []:
+            if isinstance(coeff, (list, tuple)):
+                coeff = complex(*coeff)
+            x_mask, z_mask = 0, 0
+            for qubit, char in zip(self.qubits, reversed(pauli)):
+                if char in 'XY':
+                    x_mask |= 1 << qubit
+                if char in 'ZY':
+                    z_mask |= 1 << qubit
+            self.terms.append((coeff * 1j ** pauli.count('Y'), x_mask, z_mask))
+
+    def expectation_values(self, statevector, chunk_size=None):
+        """Return the expectation value of the sum of Paulis in statevectors.
+
+        A Pauli maps ``|i>`` to ``|i ^ x_mask>``, up to a sign given by the
+        parity of ``i & z_mask`` and a phase, so its expectation value is a
+        sum over the amplitudes and the ones at their flipped indices.
+
+        Args:
+            statevector (np.ndarray): an array of flat statevectors along its
+                last axis.
+            chunk_size (int): the number of amplitudes read together, a power
+                of two. All of them by default.
+
+        Returns:
+            np.ndarray: the expectation value in each statevector.
+        """
+        size = statevector.shape[-1]
+        chunk_size = min(size, chunk_size or size)
+        offsets = np.arange(chunk_size)
+        values = np.zeros(statevector.shape[:-1], dtype=complex)
+        for coeff, x_mask, z_mask in self.terms:
+            for start in range(0, size, chunk_size):
+                chunk = statevector[..., start:start + chunk_size]
+                flipped_start = start ^ (x_mask & -chunk_size)
+                flipped = statevector[..., flipped_start:flipped_start + chunk_size]
+                if x_mask & (chunk_size - 1):
+                    flipped = flipped[..., offsets ^ (x_mask & (chunk_size - 1))]
+                signs = 1 - 2 * _parity((start + offsets) & z_mask)
+                values += coeff * np.sum(np.conj(flipped) * signs * chunk, axis=-1)
+        return values
+
+
+class BfuncOp:
+    """A boolean function of the classical register, stored in a register bit
+    and optional memory bit."""
+
+    __slots__ = ('mask', 'value', 'relation', 'cregbit', 'cmembit', 'condition')
+    # The name of the qobj instruction
+    name = 'bfunc'
+
+    def __init__(self, mask, value, relation, cregbit, cmembit=None, condition=None):
+        if relation not in _RELATIONS:
+            raise BasicAerError('Invalid boolean function relation.')
+        self.mask = mask
+        self.value = value
+        self.relation = _RELATIONS[relation]
+        self.cregbit = cregbit
+        self.cmembit = cmembit
+        self.condition = condition
+
+    def evaluate(self, register):
+        """Return the value of the function for a classical register value,
+        or for each value of an array of them."""
+        return self.relation(register & self.mask, self.value)
+
+
+def compile_experiment(instructions, number_of_qubits, max_fused_qubits=2,
+                       backend_name='qasm_simulator'):
+    """Lower the instructions of a qobj experiment to a program.
+
+    Args:
+        instructions (list[QobjInstruction]): the instructions of the experiment.
+        number_of_qubits (int): the number of qubits of the experiment.
+        max_fused_qubits (int): consecutive unconditional gates are fused as
+            long as they act on at most this many qubits together. Set it to
+            0 to disable fusion.
+        backend_name (str): the name of the backend, for error messages.
+
+    Returns:
+        list: the operations of the program, instances of :class:`GateOp`,
+        :class:`MeasureOp`, :class:`ResetOp`, :class:`SnapshotOp` and
+        :class:`BfuncOp`.
+
+    Raises:
+        BasicAerError: if an instruction is not supported.
+    """
+    program = []
+    # The gate being fused, as a list of qubits and a matrix on them.
+    block_qubits, block_matrix = None, None
+
+    for operation in instructions:
+        name = operation.name
+        if name in _NO_OPS:
+            continue
+        condition = Condition.from_operation(operation)
+
+        if name in ('U', 'u1', 'u2', 'u3', 'CX', 'cx', 'unitary'):
+            qubits = list(operation.qubits)
+            if name == 'unitary':
+                matrix = np.array(operation.params[0], dtype=complex)
+            elif name in ('CX', 'cx'):
+                matrix = cx_gate_matrix()
+            else:
+                matrix = single_gate_matrix(name, getattr(operation, 'params', None))
+
+            if condition is None and len(qubits) <= max_fused_qubits:
+                if block_qubits is not None:
+                    union = block_qubits + [qubit for qubit in qubits
+                                            if qubit not in block_qubits]
+                    if len(union) <= max_fused_qubits:
+                        block_matrix = np.dot(_expand_matrix(matrix, qubits, union),
+                                              _expand_matrix(block_matrix, block_qubits, union))
+                        block_qubits = union
+                        continue
+                    program.append(GateOp(block_matrix, block_qubits, number_of_qubits))
+                block_qubits, block_matrix = qubits, matrix
+                continue
+            if block_qubits is not None:
+                program.append(GateOp(block_matrix, block_qubits, number_of_qubits))
+                block_qubits, block_matrix = None, None
+            program.append(GateOp(matrix, qubits, number_of_qubits, condition))
+            continue
+
+        if block_qubits is not None:
+            program.append(GateOp(block_matrix, block_qubits, number_of_qubits))
+            block_qubits, block_matrix = None, None
+
+        if name == 'measure':
+            cregbit = operation.register[0] if hasattr(operation, 'register') else None
+            program.append(MeasureOp(operation.qubits[0], operation.memory[0],
+                                     cregbit, condition))
+        elif name == 'reset':
+            program.append(ResetOp(operation.qubits[0], condition))
+        elif name == 'snapshot':
+            snapshot_type = getattr(operation, 'snapshot_type', 'statevector')
+            if snapshot_type not in ('expectation_value_pauli', 'probabilities'):
+                err_msg = '{0} does not support "{1}" snapshots'
+                raise BasicAerError(err_msg.format(backend_name, snapshot_type))
+            program.append(SnapshotOp(operation.label, snapshot_type, operation.qubits,
+                                      getattr(operation, 'params', None)))
+        elif name == 'bfunc':
+            cmembit = operation.memory if hasattr(operation, 'memory') else None
+            program.append(BfuncOp(int(operation.mask, 16), int(operation.val, 16),
+                                   operation.relation, operation.register, cmembit,
+                                   condition))
+        else:
+            err_msg = '{0} encountered unrecognized operation "{1}"'
+            raise BasicAerError(err_msg.format(backend_name, name))
+
+    if block_qubits is not None:
+        program.append(GateOp(block_matrix, block_qubits, number_of_qubits))
+    return program
+
+
+def classical_width(program):
+    """Return the number of classical bits, memory or register, used by a program."""
+    width = 0
+    for operation in program:
+        if operation.condition is not None:
+            width = max(width, operation.condition.mask.bit_length())
+        if isinstance(operation, MeasureOp):
+            width = max(width, operation.cmembit + 1, (operation.cregbit or 0) + 1)
+        elif isinstance(operation, BfuncOp):
+            width = max(width, operation.mask.bit_length(), operation.cregbit + 1,
+                        (operation.cmembit or 0) + 1)
+    return width
+
+
+def _parity(values):
+    """Return the parity of the number of set bits of each of an array of integers."""
+    for shift in (32, 16, 8, 4, 2, 1):
+        values = values ^ (values >> shift)
+    return values & 1
+
+
+def _expand_matrix(matrix, qubits, all_qubits):
+    """Return the matrix of a gate on ``qubits`` as a matrix on ``all_qubits``.
+
+    Both lists are ordered from the least significant qubit of the matrix,
+    and ``qubits`` must be a subset of ``all_qubits``.
+    """
+    if qubits == all_qubits:
+        return matrix
+    num_qubits = len(all_qubits)
+    # The identity on the other qubits, which are more significant than ``qubits``.
+    order = qubits + [qubit for qubit in all_qubits if qubit not in qubits]
+    full = np.kron(np.eye(2 ** (num_qubits - len(qubits))), matrix)
+    # Tensor axes go from the most significant qubit to the least significant.
+    axes = [num_qubits - 1 - order.index(qubit) for qubit in reversed(all_qubits)]
+    tensor = np.reshape(full, 2 * num_qubits * [2])
+    tensor = np.transpose(tensor, axes + [num_qubits + axis for axis in axes])
+    return np.reshape(tensor, (2 ** num_qubits, 2 ** num_qubits))
@@ -23,6 +23,7 @@ from qiskit.providers import BaseProvider
 from qiskit.providers.exceptions import QiskitBackendNotFoundError
 from qiskit.providers.providerutils import resolve_backend_name, filter_backends
 
+from .basicaerjob import BasicAerJobQueue
 from .qasm_simulator import QasmSimulatorPy
 from .statevector_simulator import StatevectorSimulatorPy
 from .unitary_simulator import UnitarySimulatorPy
@@ -38,13 +39,58 @@ SIMULATORS = [
 
 
 class BasicAerProvider(BaseProvider):
-    """Provider for Basic Aer backends."""
+    """Provider for Basic Aer backends.
+
+    The jobs of its backends are run by a pool of workers, which can be
+    configured with :meth:`set_executor`, for example::
+
+        from qiskit import BasicAer
+
+        BasicAer.set_executor('thread', max_workers=4, max_queue_size=16)
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(args, kwargs)
 
         # Populate the list of Basic Aer backends.
         self._backends = self._verify_backends()
+        self._job_queue = None
+
+    @property
+    def job_queue(self):
+        """BasicAerJobQueue: the queue running the jobs of the backends, or
+        None if they use the default one."""
+        return self._job_queue
+
+    def __getstate__(self):
+        # The backends are copied to the processes running their jobs, while
+        # the job queue stays in this one.
+        state = self.__dict__.copy()
+        state['_job_queue'] = None
+        return state
+
+    def set_executor(self, executor=None, max_workers=None, max_queue_size=None):
+        """Set how the jobs of the backends are run.
+
+        Jobs submitted before keep running on the previous workers.
+
+        Args:
+            executor (str): ``'thread'`` to run jobs in a pool of threads, or
+                ``'process'`` to run them in a pool of processes. Defaults to
+                threads on macOS and Windows and to processes elsewhere.
+            max_workers (int): the number of jobs run at the same time.
+                Defaults to the number of CPUs.
+            max_queue_size (int): the number of jobs which may wait for a
+                worker. Submitting another job blocks until one of them starts
+                running. Unbounded if None.
+
+        Raises:
+            JobError: if an argument is invalid.
+        """
+        previous = self._job_queue
+        self._job_queue = BasicAerJobQueue(executor, max_workers, max_queue_size)
+        if previous is not None:
+            previous.shutdown(wait=False)
 
     def get_backend(self, name=None, **kwargs):
         backends = self._backends.values()
@@ -33,20 +33,21 @@ field, which is a result of measurements for each shot.
 import uuid
 import time
 import logging
+import multiprocessing
+import tempfile
 
 from math import log2
-from collections import Counter
 import numpy as np
 
 from qiskit.util import local_hardware_info
+from qiskit.tools.parallel import parallel_map, shutdown_parallel_pool
 from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.result import Result
 from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from .exceptions import BasicAerError
-from .basicaertools import single_gate_matrix
-from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_vecmul_index
+from .basicaerprogram import compile_experiment, classical_width, GateOp, MeasureOp, ResetOp, \
+    SnapshotOp
 
 logger = logging.getLogger(__name__)
 
@@ -106,9 +107,19 @@ class QasmSimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_statevector": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "memmap_dir": None,
+        "max_parallel_experiments": 1,
+        "final_statevector": True
     }
 
+    # Memory in bytes of the statevectors of the shots which are run together
+    BATCH_MEMORY = 2 ** 22
+
+    # Memory in bytes of the chunks of a memory-mapped statevector which are
+    # processed together
+    CHUNK_MEMORY = 2 ** 24
+
     # Class level variable to return the final state at the end of simulation
     # This should be set to True for the statevector simulator
     SHOW_FINAL_STATE = False
@@ -129,48 +140,56 @@ class QasmSimulatorPy(BaseBackend):
         self._memory = False
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._memmap_dir = self.DEFAULT_OPTIONS["memmap_dir"]
+        self._max_parallel_experiments = self.DEFAULT_OPTIONS["max_parallel_experiments"]
+        self._final_statevector = self.DEFAULT_OPTIONS["final_statevector"]
+        self._snapshots = {}
         self._qobj_config = None
         # TEMP
         self._sample_measure = False
 
-    def _add_unitary(self, gate, qubits):
-        """Apply an N-qubit unitary matrix.
+    def _qubit_view(self, statevector, qubit):
+        """Return a view of a batch of statevectors with the given qubit as the third axis."""
+        return statevector.reshape(len(statevector), 2 ** (self._number_of_qubits - 1 - qubit),
+                                   2, 2 ** qubit)
 
-        Args:
-            gate (matrix_like): an N-qubit unitary matrix
-            qubits (list): the list of N-qubits.
-        """
-        # Get the number of qubits
-        num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
-        # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex),
-                                 num_qubits * [2, 2])
-        # Apply matrix multiplication
-        self._statevector = np.einsum(indexes, gate_tensor, self._statevector,
-                                      dtype=complex, casting='no')
-
-    def _get_measure_outcome(self, qubit):
+    def _get_measure_outcome(self, statevector, qubit):
         """Simulate the outcome of measurement of a qubit.
 
         Args:
+            statevector (np.ndarray): the batch of statevectors to measure,
+                one per row.
             qubit (int): the qubit to measure
 
         Return:
-            tuple: pair (outcome, probability) where outcome is '0' or '1' and
-            probability is the probability of the returned outcome.
+            tuple: pair (outcomes, probabilities) of arrays where each outcome
+            is 0 or 1 and each probability is the probability of the outcome
+            in its row.
+        """
+        random_numbers = self._local_random.rand(len(statevector))
+        probabilities = np.sum(np.abs(self._qubit_view(statevector, qubit)) ** 2, axis=(1, 3))
+        outcomes = (random_numbers >= probabilities[:, 0]).astype(int)
+        return outcomes, probabilities[np.arange(len(outcomes)), outcomes]
+
+    def _store_classical_bits(self, outcomes, cmembit=None, cregbit=None, rows=None):
+        """Store an outcome in a classical memory and register bit of each shot.
+
+        Args:
+            outcomes (np.ndarray): the 0 or 1 outcome of each shot in ``rows``.
+            cmembit (int, optional): the classical memory bit to store them in.
+            cregbit (int, optional): the classical register bit to store them in.
+            rows (np.ndarray, optional): the shots to update, all if None.
         """
-        # Axis for numpy.sum to compute probabilities
-        axis = list(range(self._number_of_qubits))
-        axis.remove(self._number_of_qubits - 1 - qubit)
-        probabilities = np.sum(np.abs(self._statevector) ** 2, axis=tuple(axis))
-        # Compute einsum index string for 1-qubit matrix multiplication
-        random_number = self._local_random.rand()
-        if random_number < probabilities[0]:
-            return '0', probabilities[0]
-        # Else outcome was '1'
-        return '1', probabilities[1]
+        rows = slice(None) if rows is None else rows
+        outcomes = outcomes.astype(self._classical_memory.dtype)
+        if cmembit is not None:
+            membit = 1 << cmembit
+            self._classical_memory[rows] = \
+                (self._classical_memory[rows] & (~membit)) | (outcomes << cmembit)
+        if cregbit is not None:
+            regbit = 1 << cregbit
+            self._classical_register[rows] = \
+                (self._classical_register[rows] & (~regbit)) | (outcomes << cregbit)
 
     def _add_sample_measure(self, measure_params, num_samples):
         """Generate memory samples from current statevector.
@@ -181,87 +200,230 @@ class QasmSimulatorPy(BaseBackend):
             num_samples (int): The number of memory samples to generate.
 
         Returns:
-            list: A list of memory values in hex format.
+            np.ndarray: the classical memory value of each sample.
         """
         # Get unique qubits that are actually measured and sort in
         # ascending order
         measured_qubits = sorted(list({qubit for qubit, cmembit in measure_params}))
         num_measured = len(measured_qubits)
-        # We use the axis kwarg for numpy.sum to compute probabilities
-        # this sums over all non-measured qubits to return a vector
-        # of measure probabilities for the measured qubits
-        axis = list(range(self._number_of_qubits))
-        for qubit in reversed(measured_qubits):
-            # Remove from largest qubit to smallest so list position is correct
-            # with respect to position from end of the list
-            axis.remove(self._number_of_qubits - 1 - qubit)
-        probabilities = np.reshape(np.sum(np.abs(self._statevector) ** 2,
-                                          axis=tuple(axis)),
-                                   2 ** num_measured)
+        probabilities = self._qubit_probabilities(measured_qubits)[0]
         # Generate samples on measured qubits as ints with qubit
         # position in the bit-string for each int given by the qubit
         # position in the sorted measured_qubits list
-        samples = self._local_random.choice(range(2 ** num_measured),
-                                            num_samples, p=probabilities)
-        # Convert the ints to bitstrings
-        memory = []
-        for sample in samples:
-            classical_memory = self._classical_memory
-            for qubit, cmembit in measure_params:
-                pos = measured_qubits.index(qubit)
-                qubit_outcome = int((sample & (1 << pos)) >> pos)
-                membit = 1 << cmembit
-                classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
-            value = bin(classical_memory)[2:]
-            memory.append(hex(int(value, 2)))
+        samples = self._local_random.choice(2 ** num_measured, num_samples, p=probabilities)
+        # Set the measured bits of the classical memory of each sample
+        memory = np.full(num_samples, self._classical_memory[0],
+                         dtype=self._classical_memory.dtype)
+        for qubit, cmembit in measure_params:
+            pos = measured_qubits.index(qubit)
+            qubit_outcomes = ((samples >> pos) & 1).astype(memory.dtype)
+            membit = 1 << cmembit
+            memory = (memory & (~membit)) | (qubit_outcomes << cmembit)
         return memory
 
-    def _add_qasm_measure(self, qubit, cmembit, cregbit=None):
+    def _qubit_probabilities(self, qubits):
+        """Return the outcome probabilities of qubits in each statevector of the batch.
+
+        Args:
+            qubits (list[int]): the measured qubits, the first one being the
+                least significant bit of the outcomes.
+
+        Returns:
+            np.ndarray: the probability of each of the ``2**len(qubits)``
+            outcomes, one row per statevector.
+        """
+        if self._memmap_dir is not None:
+            return self._memmap_probabilities(qubits)[np.newaxis]
+        num_qubits = self._number_of_qubits
+        batch = len(self._statevector)
+        tensor = np.reshape(self._statevector, (batch,) + num_qubits * (2,))
+        # Sum over the axes of the other qubits, after the batch axis and
+        # from the most significant qubit
+        others = tuple(num_qubits - qubit for qubit in range(num_qubits) if qubit not in qubits)
+        probabilities = np.sum(np.abs(tensor) ** 2, axis=others)
+        # Order the remaining axes from the last qubit to the first one
+        remaining = sorted(qubits, reverse=True)
+        axes = [0] + [1 + remaining.index(qubit) for qubit in reversed(qubits)]
+        probabilities = np.transpose(probabilities, axes)
+        return np.reshape(probabilities, (batch, 2 ** len(qubits)))
+
+    def _add_snapshot(self, operation):
+        """Record a snapshot of each statevector of the batch.
+
+        The values of the shots are averaged for each classical memory value.
+
+        Args:
+            operation (SnapshotOp): the snapshot to take.
+        """
+        if operation.snapshot_type == 'probabilities':
+            values = self._qubit_probabilities(operation.qubits)
+        else:
+            chunk_size = self._chunk_size() if self._memmap_dir is not None else None
+            values = operation.expectation_values(self._statevector, chunk_size)
+        memory_values, inverse = np.unique(self._classical_memory, return_inverse=True)
+        sums = np.zeros((len(memory_values),) + values.shape[1:], dtype=values.dtype)
+        np.add.at(sums, inverse, values)
+        counts = np.bincount(inverse)
+        snapshot = self._snapshots.setdefault((operation.snapshot_type, operation.label), {})
+        for memory_value, value_sum, count in zip(memory_values.tolist(), sums, counts):
+            totals = snapshot.setdefault(memory_value, [0, 0])
+            totals[0] = totals[0] + value_sum
+            totals[1] += count
+
+    def _format_snapshots(self):
+        """Return the snapshots in result format.
+
+        Returns:
+            dict: the average expectation values, by label, in an
+            ``'expectation_value'`` dict, and the average probabilities of
+            the outcomes in hex format, by label, in a ``'probabilities'``
+            dict. Each entry is a list of dicts with the classical
+            ``'memory'`` of the shots at the snapshot and the ``'value'``.
+        """
+        snapshots = {}
+        for (snapshot_type, label), snapshot in self._snapshots.items():
+            entries = []
+            for memory_value, (value_sum, count) in snapshot.items():
+                value = value_sum / count
+                if snapshot_type == 'probabilities':
+                    outcomes = np.flatnonzero(value > self._chop_threshold)
+                    value = {hex(outcome): probability for outcome, probability
+                             in zip(outcomes.tolist(), value[outcomes].tolist())}
+                else:
+                    value = complex(value)
+                entries.append({'memory': hex(int(memory_value)), 'value': value})
+            key = 'probabilities' if snapshot_type == 'probabilities' else 'expectation_value'
+            snapshots.setdefault(key, {})[label] = entries
+        return snapshots
+
+    def _format_memory(self, memory):
+        """Return the counts and optionally the memory of classical memory values.
+
+        Args:
+            memory (np.ndarray): the classical memory value of each shot.
+
+        Returns:
+            tuple: the counts of each value in hex format, and a list of the
+            values in hex format if memory was requested, otherwise None.
+        """
+        values, inverse, counts = np.unique(memory, return_inverse=True, return_counts=True)
+        # Only the distinct values are converted to hex
+        hex_values = [hex(int(value)) for value in values]
+        hex_counts = dict(zip(hex_values, counts.tolist()))
+        if not self._memory:
+            return hex_counts, None
+        return hex_counts, np.array(hex_values)[inverse].tolist()
+
+    def _add_qasm_measure(self, qubit, cmembit, cregbit=None, rows=None):
         """Apply a measure instruction to a qubit.
 
         Args:
             qubit (int): qubit is the qubit measured.
             cmembit (int): is the classical memory bit to store outcome in.
             cregbit (int, optional): is the classical register bit to store outcome in.
+            rows (np.ndarray, optional): the shots to measure, all if None.
         """
+        if self._memmap_dir is not None:
+            self._add_memmap_measure(qubit, cmembit, cregbit)
+            return
+        statevector = self._statevector if rows is None else self._statevector[rows]
         # get measure outcome
-        outcome, probability = self._get_measure_outcome(qubit)
-        # update classical state
-        membit = 1 << cmembit
-        self._classical_memory = (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
-
-        if cregbit is not None:
-            regbit = 1 << cregbit
-            self._classical_register = \
-                (self._classical_register & (~regbit)) | (int(outcome) << cregbit)
-
-        # update quantum state
-        if outcome == '0':
-            update_diag = [[1 / np.sqrt(probability), 0], [0, 0]]
-        else:
-            update_diag = [[0, 0], [0, 1 / np.sqrt(probability)]]
+        outcomes, probabilities = self._get_measure_outcome(statevector, qubit)
         # update classical state
-        self._add_unitary(update_diag, [qubit])
-
-    def _add_qasm_reset(self, qubit):
+        self._store_classical_bits(outcomes, cmembit, cregbit, rows)
+        # update quantum state in place, projecting on the outcome
+        view = self._qubit_view(statevector, qubit)
+        scale = 1 / np.sqrt(probabilities)
+        view[:, :, 0, :] *= np.where(outcomes == 0, scale, 0)[:, np.newaxis, np.newaxis]
+        view[:, :, 1, :] *= np.where(outcomes == 1, scale, 0)[:, np.newaxis, np.newaxis]
+        if rows is not None:
+            self._statevector[rows] = statevector
+
+    def _add_qasm_reset(self, qubit, rows=None):
         """Apply a reset instruction to a qubit.
 
         Args:
             qubit (int): the qubit being rest
+            rows (np.ndarray, optional): the shots to reset, all if None.
 
         This is done by doing a simulating a measurement
         outcome and projecting onto the outcome state while
         renormalizing.
         """
+        if self._memmap_dir is not None:
+            self._add_memmap_measure(qubit, reset=True)
+            return
+        statevector = self._statevector if rows is None else self._statevector[rows]
         # get measure outcome
-        outcome, probability = self._get_measure_outcome(qubit)
-        # update quantum state
-        if outcome == '0':
-            update = [[1 / np.sqrt(probability), 0], [0, 0]]
-            self._add_unitary(update, [qubit])
-        else:
-            update = [[0, 1 / np.sqrt(probability)], [0, 0]]
-            self._add_unitary(update, [qubit])
+        outcomes, probabilities = self._get_measure_outcome(statevector, qubit)
+        # update quantum state in place, moving the outcome to |0>
+        view = self._qubit_view(statevector, qubit)
+        scale = (1 / np.sqrt(probabilities))[:, np.newaxis, np.newaxis]
+        view[:, :, 0, :] = np.where(outcomes[:, np.newaxis, np.newaxis] == 1,
+                                    view[:, :, 1, :], view[:, :, 0, :]) * scale
+        view[:, :, 1, :] = 0
+        if rows is not None:
+            self._statevector[rows] = statevector
+
+    def _chunk_size(self):
+        """Return the number of amplitudes of a memory-mapped statevector
+        processed together, a power of two."""
+        return 1 << max(0, (self.CHUNK_MEMORY // 16).bit_length() - 1)
+
+    def _memmap_probabilities(self, qubits):
+        """Return the outcome probabilities of qubits of a memory-mapped statevector.
+
+        The probabilities are accumulated over chunks of the statevector, so
+        that it is never loaded in memory as a whole.
+
+        Args:
+            qubits (list[int]): the measured qubits, the first one being the
+                least significant bit of the outcomes.
+
+        Returns:
+            np.ndarray: the probability of each of the ``2**len(qubits)`` outcomes.
+        """
+        statevector = self._statevector[0]
+        chunk_size = min(len(statevector), self._chunk_size())
+        # The outcome of each amplitude of a chunk, less the bits of its offset
+        offsets = np.arange(chunk_size)
+        chunk_outcomes = np.zeros(chunk_size, dtype=int)
+        for position, qubit in enumerate(qubits):
+            chunk_outcomes |= ((offsets >> qubit) & 1) << position
+        probabilities = np.zeros(2 ** len(qubits))
+        for start in range(0, len(statevector), chunk_size):
+            offset_outcome = sum(((start >> qubit) & 1) << position
+                                 for position, qubit in enumerate(qubits))
+            probabilities += np.bincount(
+                chunk_outcomes + offset_outcome,
+                weights=np.abs(statevector[start:start + chunk_size]) ** 2,
+                minlength=len(probabilities))
+        return probabilities
+
+    def _add_memmap_measure(self, qubit, cmembit=None, cregbit=None, reset=False):
+        """Apply a measure or reset instruction to a memory-mapped statevector.
+
+        Args:
+            qubit (int): the qubit measured or reset.
+            cmembit (int, optional): the classical memory bit to store the outcome in.
+            cregbit (int, optional): the classical register bit to store the outcome in.
+            reset (bool): if True, reset the qubit to |0> instead of storing the outcome.
+        """
+        probabilities = self._memmap_probabilities([qubit])
+        outcome = int(self._local_random.rand() >= probabilities[0])
+        if not reset:
+            self._store_classical_bits(np.array([outcome]), cmembit, cregbit)
+        # Project on the outcome in place, a chunk at a time
+        statevector = self._statevector[0]
+        chunk_size = min(len(statevector), self._chunk_size())
+        factors = np.zeros(2)
+        factors[outcome] = 1 / np.sqrt(probabilities[outcome])
+        chunk_bits = (np.arange(chunk_size) >> qubit) & 1
+        for start in range(0, len(statevector), chunk_size):
+            statevector[start:start + chunk_size] *= factors[chunk_bits | ((start >> qubit) & 1)]
+        if reset and outcome == 1:
+            GateOp([[0, 1], [1, 0]], [qubit], self._number_of_qubits).apply_in_place(
+                statevector, chunk_size)
 
     def _validate_initial_statevector(self):
         """Validate an initial statevector"""
@@ -280,6 +442,9 @@ class QasmSimulatorPy(BaseBackend):
         # Reset default options
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._memmap_dir = self.DEFAULT_OPTIONS["memmap_dir"]
+        self._max_parallel_experiments = self.DEFAULT_OPTIONS["max_parallel_experiments"]
+        self._final_statevector = self.DEFAULT_OPTIONS["final_statevector"]
         if backend_options is None:
             backend_options = {}
 
@@ -303,9 +468,40 @@ class QasmSimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for a directory to memory-map the statevector in
+        if 'memmap_dir' in backend_options:
+            self._memmap_dir = backend_options['memmap_dir']
+        elif hasattr(qobj_config, 'memmap_dir'):
+            self._memmap_dir = qobj_config.memmap_dir
+        # Check for the number of experiments to run in parallel
+        if 'max_parallel_experiments' in backend_options:
+            self._max_parallel_experiments = backend_options['max_parallel_experiments']
+        elif hasattr(qobj_config, 'max_parallel_experiments'):
+            self._max_parallel_experiments = qobj_config.max_parallel_experiments
+        if self._max_parallel_experiments < 0:
+            raise BasicAerError('max_parallel_experiments must not be negative: ' +
+                                '{}'.format(self._max_parallel_experiments))
+        if self._max_parallel_experiments == 0:
+            self._max_parallel_experiments = local_hardware_info()['cpus']
+        # Check whether the final statevector is returned
+        if 'final_statevector' in backend_options:
+            self._final_statevector = backend_options['final_statevector']
+        elif hasattr(qobj_config, 'final_statevector'):
+            self._final_statevector = qobj_config.final_statevector
 
     def _initialize_statevector(self):
         """Set the initial statevector for simulation"""
+        if self._memmap_dir is not None:
+            # Back a batch of one statevector with a new scratch file, which is
+            # removed once the statevector is no longer referenced
+            with tempfile.TemporaryFile(dir=self._memmap_dir) as scratch:
+                self._statevector = np.memmap(scratch, dtype=complex, mode='w+',
+                                              shape=(1, 2 ** self._number_of_qubits))
+            if self._initial_statevector is None:
+                self._statevector[0, 0] = 1
+            else:
+                self._statevector[0] = self._initial_statevector
+            return
         if self._initial_statevector is None:
             # Set to default state of all qubits in |0>
             self._statevector = np.zeros(2 ** self._number_of_qubits,
@@ -313,17 +509,17 @@ class QasmSimulatorPy(BaseBackend):
             self._statevector[0] = 1
         else:
             self._statevector = self._initial_statevector.copy()
-        # Reshape to rank-N tensor
-        self._statevector = np.reshape(self._statevector,
-                                       self._number_of_qubits * [2])
 
     def _get_statevector(self):
         """Return the current statevector in JSON Result spec format"""
-        vec = np.reshape(self._statevector, 2 ** self._number_of_qubits)
-        # Expand complex numbers
-        vec = np.stack([vec.real, vec.imag], axis=1)
-        # Truncate small values
-        vec[abs(vec) < self._chop_threshold] = 0.0
+        # Expand complex numbers, viewing the real and imaginary parts of the
+        # statevector, which may be memory-mapped, as two columns
+        vec = self._statevector[-1].view(float).reshape(2 ** self._number_of_qubits, 2)
+        # Truncate small values in place, a chunk at a time
+        chunk_size = self._chunk_size()
+        for start in range(0, len(vec), chunk_size):
+            chunk = vec[start:start + chunk_size]
+            chunk[abs(chunk) < self._chop_threshold] = 0.0
         return vec
 
     def _validate_measure_sampling(self, experiment):
@@ -379,12 +575,27 @@ class QasmSimulatorPy(BaseBackend):
         Additional Information:
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
+                * "memmap_dir": str
+                * "max_parallel_experiments": int
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
             zero state. This size of this vector must be correct for the number
             of qubits in all experiments in the qobj.
 
+            The "memmap_dir" option specifies a directory in which to store the
+            statevector in a temporary memory-mapped file instead of in memory.
+            Gates, measurements and resets then update it a chunk at a time,
+            and shots are run one at a time. The number of qubits is not
+            limited by the memory of the machine in this mode.
+
+            The "max_parallel_experiments" option specifies the number of
+            experiments of the qobj which may run in parallel, in worker
+            processes. It is 1 by default, and 0 uses all the CPUs. Each
+            experiment is seeded with the seed of the qobj plus its index,
+            unless it has its own seed, so that the results do not depend on
+            this option.
+
             Example::
 
                 backend_options = {
@@ -414,8 +625,26 @@ class QasmSimulatorPy(BaseBackend):
         self._memory = getattr(qobj.config, 'memory', False)
         self._qobj_config = qobj.config
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        # Derive the seed of each experiment from the seed of the qobj, so
+        # that the results do not depend on where the experiments are run
+        if hasattr(self._qobj_config, 'seed_simulator'):
+            seed_simulator = self._qobj_config.seed_simulator
+        else:
+            # For compatibility on Windows force dyte to be int32
+            # and set the maximum value to be (2 ** 31) - 1
+            seed_simulator = int(np.random.randint(2147483647, dtype='int32'))
+        # The derived seeds wrap around the range accepted by RandomState.seed
+        experiments = [(experiment, getattr(experiment.config, 'seed_simulator',
+                                            (seed_simulator + index) % 2 ** 32))
+                       for index, experiment in enumerate(qobj.experiments)]
+        if self._max_parallel_experiments > 1:
+            result_list = parallel_map(_run_experiment, experiments, task_args=(self,),
+                                       num_processes=self._max_parallel_experiments)
+            # A process running jobs waits for the processes it started before exiting
+            if multiprocessing.current_process().name != 'MainProcess':
+                shutdown_parallel_pool()
+        else:
+            result_list = [_run_experiment(experiment, self) for experiment in experiments]
         end = time.time()
         result = {'backend_name': self.name(),
                   'backend_version': self._configuration.backend_version,
@@ -429,11 +658,13 @@ class QasmSimulatorPy(BaseBackend):
 
         return Result.from_dict(result)
 
-    def run_experiment(self, experiment):
+    def run_experiment(self, experiment, seed_simulator=None):
         """Run an experiment (circuit) and return a single experiment result.
 
         Args:
             experiment (QobjExperiment): experiment from qobj experiments list
+            seed_simulator (int): the seed of the simulation. By default the
+                seed of the experiment, or else of the qobj, or else a random one.
 
         Returns:
              dict: A result dictionary which looks something like::
@@ -461,23 +692,25 @@ class QasmSimulatorPy(BaseBackend):
         self._classical_memory = 0
         self._classical_register = 0
         self._sample_measure = False
+        self._snapshots = {}
         # Validate the dimension of initial statevector if set
         self._validate_initial_statevector()
-        # Get the seed looking in circuit, qobj, and then random.
-        if hasattr(experiment.config, 'seed_simulator'):
-            seed_simulator = experiment.config.seed_simulator
-        elif hasattr(self._qobj_config, 'seed_simulator'):
-            seed_simulator = self._qobj_config.seed_simulator
-        else:
-            # For compatibility on Windows force dyte to be int32
-            # and set the maximum value to be (2 ** 31) - 1
-            seed_simulator = np.random.randint(2147483647, dtype='int32')
+        # Unless it is given, get the seed looking in circuit, qobj, and then random.
+        if seed_simulator is None:
+            if hasattr(experiment.config, 'seed_simulator'):
+                seed_simulator = experiment.config.seed_simulator
+            elif hasattr(self._qobj_config, 'seed_simulator'):
+                seed_simulator = self._qobj_config.seed_simulator
+            else:
+                # For compatibility on Windows force dyte to be int32
+                # and set the maximum value to be (2 ** 31) - 1
+                seed_simulator = np.random.randint(2147483647, dtype='int32')
 
         self._local_random.seed(seed=seed_simulator)
         # Check if measure sampling is supported for current circuit
         self._validate_measure_sampling(experiment)
 
-        # List of final counts for all shots
+        # Classical memory values of the batches of shots
         memory = []
         # Check if we can sample measurements, if so we only perform 1 shot
         # and sample all outcomes from the final state vector
@@ -488,126 +721,108 @@ class QasmSimulatorPy(BaseBackend):
             measure_sample_ops = []
         else:
             shots = self._shots
-        for _ in range(shots):
+        # Resolve the instructions once, so that each shot only applies them
+        program = compile_experiment(experiment.instructions, self._number_of_qubits,
+                                     backend_name=self.name())
+        # Use Python integers for the classical state if it does not fit in int64
+        classical_dtype = np.int64 if classical_width(program) < 63 else object
+        prefix = 0
+        if self._memmap_dir is None:
+            # The unconditional gates before the first other operation are the
+            # same for every shot, apply them once
+            while prefix < len(program) and isinstance(program[prefix], GateOp) \
+                    and program[prefix].condition is None:
+                prefix += 1
             self._initialize_statevector()
+            for operation in program[:prefix]:
+                self._statevector = operation.apply(self._statevector)
+            initial_statevector = self._statevector
+            # Run the shots in batches, evolving a statevector per shot together
+            batch_size = max(1, min(shots,
+                                    self.BATCH_MEMORY // (16 * 2 ** self._number_of_qubits)))
+        else:
+            # A memory-mapped statevector is evolved in place, one shot at a time
+            batch_size = 1
+            chunk_size = self._chunk_size()
+
+        for first_shot in range(0, shots, batch_size):
+            batch = min(batch_size, shots - first_shot)
+            if self._memmap_dir is None:
+                self._statevector = np.repeat(initial_statevector[np.newaxis], batch, axis=0)
+            else:
+                self._initialize_statevector()
             # Initialize classical memory to all 0
-            self._classical_memory = 0
-            self._classical_register = 0
-            for operation in experiment.instructions:
-                conditional = getattr(operation, 'conditional', None)
-                if isinstance(conditional, int):
-                    conditional_bit_set = (self._classical_register >> conditional) & 1
-                    if not conditional_bit_set:
-                        continue
-                elif conditional is not None:
-                    mask = int(operation.conditional.mask, 16)
-                    if mask > 0:
-                        value = self._classical_memory & mask
-                        while (mask & 0x1) == 0:
-                            mask >>= 1
-                            value >>= 1
-                        if value != int(operation.conditional.val, 16):
+            self._classical_memory = np.zeros(batch, dtype=classical_dtype)
+            self._classical_register = np.zeros(batch, dtype=classical_dtype)
+            for operation in program[prefix:]:
+                # Only apply conditional operations to the shots where they hold
+                rows = None
+                if operation.condition is not None:
+                    holds = operation.condition.holds(self._classical_memory,
+                                                      self._classical_register)
+                    if not holds.all():
+                        rows = np.flatnonzero(holds)
+                        if not rows.size:
                             continue
 
-                # Check if single  gate
-                if operation.name == 'unitary':
-                    qubits = operation.qubits
-                    gate = operation.params[0]
-                    self._add_unitary(gate, qubits)
-                elif operation.name in ('U', 'u1', 'u2', 'u3'):
-                    params = getattr(operation, 'params', None)
-                    qubit = operation.qubits[0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary(gate, [qubit])
-                # Check if CX gate
-                elif operation.name in ('id', 'u0'):
-                    pass
-                elif operation.name in ('CX', 'cx'):
-                    qubit0 = operation.qubits[0]
-                    qubit1 = operation.qubits[1]
-                    gate = cx_gate_matrix()
-                    self._add_unitary(gate, [qubit0, qubit1])
-                # Check if reset
-                elif operation.name == 'reset':
-                    qubit = operation.qubits[0]
-                    self._add_qasm_reset(qubit)
-                # Check if barrier
-                elif operation.name == 'barrier':
-                    pass
-                # Check if measure
-                elif operation.name == 'measure':
-                    qubit = operation.qubits[0]
-                    cmembit = operation.memory[0]
-                    cregbit = operation.register[0] if hasattr(operation, 'register') else None
-
+                if isinstance(operation, GateOp):
+                    if self._memmap_dir is not None:
+                        operation.apply_in_place(self._statevector[0], chunk_size)
+                    elif rows is None:
+                        self._statevector = operation.apply(self._statevector)
+                    else:
+                        self._statevector[rows] = operation.apply(self._statevector[rows])
+                elif isinstance(operation, MeasureOp):
                     if self._sample_measure:
                         # If sampling measurements record the qubit and cmembit
                         # for this measurement for later sampling
-                        measure_sample_ops.append((qubit, cmembit))
+                        measure_sample_ops.append((operation.qubit, operation.cmembit))
                     else:
                         # If not sampling perform measurement as normal
-                        self._add_qasm_measure(qubit, cmembit, cregbit)
-                elif operation.name == 'bfunc':
-                    mask = int(operation.mask, 16)
-                    relation = operation.relation
-                    val = int(operation.val, 16)
-
-                    cregbit = operation.register
-                    cmembit = operation.memory if hasattr(operation, 'memory') else None
-
-                    compared = (self._classical_register & mask) - val
-
-                    if relation == '==':
-                        outcome = (compared == 0)
-                    elif relation == '!=':
-                        outcome = (compared != 0)
-                    elif relation == '<':
-                        outcome = (compared < 0)
-                    elif relation == '<=':
-                        outcome = (compared <= 0)
-                    elif relation == '>':
-                        outcome = (compared > 0)
-                    elif relation == '>=':
-                        outcome = (compared >= 0)
-                    else:
-                        raise BasicAerError('Invalid boolean function relation.')
-
-                    # Store outcome in register and optionally memory slot
-                    regbit = 1 << cregbit
-                    self._classical_register = \
-                        (self._classical_register & (~regbit)) | (int(outcome) << cregbit)
-                    if cmembit is not None:
-                        membit = 1 << cmembit
-                        self._classical_memory = \
-                            (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
+                        self._add_qasm_measure(operation.qubit, operation.cmembit,
+                                               operation.cregbit, rows)
+                elif isinstance(operation, ResetOp):
+                    self._add_qasm_reset(operation.qubit, rows)
+                elif isinstance(operation, SnapshotOp):
+                    self._add_snapshot(operation)
                 else:
-                    backend = self.name()
-                    err_msg = '{0} encountered unrecognized operation "{1}"'
-                    raise BasicAerError(err_msg.format(backend, operation.name))
+                    register = self._classical_register if rows is None \
+                        else self._classical_register[rows]
+                    # Store outcome in register and optionally memory slot
+                    self._store_classical_bits(operation.evaluate(register), operation.cmembit,
+                                               operation.cregbit, rows)
 
             # Add final creg data to memory list
             if self._number_of_cmembits > 0:
                 if self._sample_measure:
                     # If sampling we generate all shot samples from the final statevector
-                    memory = self._add_sample_measure(measure_sample_ops, self._shots)
+                    memory.append(self._add_sample_measure(measure_sample_ops, self._shots))
                 else:
-                    # Turn classical_memory (int) into bit string and pad zero for unused cmembits
-                    outcome = bin(self._classical_memory)[2:]
-                    memory.append(hex(int(outcome, 2)))
+                    memory.append(self._classical_memory)
 
         # Add data
-        data = {'counts': dict(Counter(memory))}
+        counts, memory = self._format_memory(np.concatenate(memory)) if memory else ({}, [])
+        data = {'counts': counts}
         # Optionally add memory list
         if self._memory:
             data['memory'] = memory
+        if self._snapshots:
+            data['snapshots'] = self._format_snapshots()
         # Optionally add final statevector
         if self.SHOW_FINAL_STATE:
-            data['statevector'] = self._get_statevector()
+            if self._final_statevector:
+                data['statevector'] = self._get_statevector()
             # Remove empty counts and memory for statevector simulator
             if not data['counts']:
                 data.pop('counts')
             if 'memory' in data and not data['memory']:
                 data.pop('memory')
+        # Release the state of the run, which may be sent to other processes
+        # along with the backend
+        self._statevector = 0
+        self._classical_memory = 0
+        self._classical_register = 0
+        self._snapshots = {}
         end = time.time()
         return {'name': experiment.header.name,
                 'seed_simulator': seed_simulator,
@@ -622,7 +837,8 @@ class QasmSimulatorPy(BaseBackend):
         """Semantic validations of the qobj which cannot be done via schemas."""
         n_qubits = qobj.config.n_qubits
         max_qubits = self.configuration().n_qubits
-        if n_qubits > max_qubits:
+        # The number of qubits of memory-mapped statevectors is only limited by disk space
+        if n_qubits > max_qubits and self._memmap_dir is None:
             raise BasicAerError('Number of qubits {} '.format(n_qubits) +
                                 'is greater than maximum ({}) '.format(max_qubits) +
                                 'for "{}".'.format(self.name()))
@@ -634,3 +850,9 @@ class QasmSimulatorPy(BaseBackend):
             elif 'measure' not in [op.name for op in experiment.instructions]:
                 logger.warning('No measurements in circuit "%s", '
                                'classical register will remain all zeros.', name)
+
+
+def _run_experiment(experiment_and_seed, backend):
+    """Run an experiment with its seed on a backend, for ``parallel_map``."""
+    experiment, seed_simulator = experiment_and_seed
+    return backend.run_experiment(experiment, seed_simulator)
@@ -111,6 +111,9 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
                 * "chop_threshold": double
+                * "memmap_dir": str
+                * "max_parallel_experiments": int
+                * "final_statevector": bool
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
@@ -121,6 +124,24 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             setting small values to zero in the output statevector. The default
             value is 1e-15.
 
+            The "memmap_dir" option specifies a directory in which to store the
+            statevector in a temporary memory-mapped file instead of in memory.
+            Gates update it a chunk at a time and the returned statevector is a
+            view of that file, so the number of qubits is not limited by the
+            memory of the machine.
+
+            The "max_parallel_experiments" option specifies the number of
+            experiments of the qobj which may run in parallel, in worker
+            processes. It is 1 by default, and 0 uses all the CPUs. Each
+            experiment is seeded with the seed of the qobj plus its index,
+            unless it has its own seed, so that the results do not depend on
+            this option.
+
+            The "final_statevector" option specifies whether to return the
+            final statevector. It is True by default. Circuits which only need
+            expectation-value or probability snapshots of a large state can set
+            it to False to return only these values.
+
             Example::
 
                 backend_options = {
@@ -139,7 +160,8 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
         """
         n_qubits = qobj.config.n_qubits
         max_qubits = self.configuration().n_qubits
-        if n_qubits > max_qubits:
+        # The number of qubits of memory-mapped statevectors is only limited by disk space
+        if n_qubits > max_qubits and self._memmap_dir is None:
             raise BasicAerError('Number of qubits {} '.format(n_qubits) +
                                 'is greater than maximum ({}) '.format(max_qubits) +
                                 'for "{}".'.format(self.name()))
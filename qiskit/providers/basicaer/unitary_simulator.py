@@ -31,6 +31,7 @@ circuit's unitary matrix.
 import logging
 import uuid
 import time
+from concurrent.futures import ThreadPoolExecutor
 from math import log2, sqrt
 import numpy as np
 from qiskit.util import local_hardware_info
@@ -39,9 +40,7 @@ from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from qiskit.result import Result
 from .exceptions import BasicAerError
-from .basicaertools import single_gate_matrix
-from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_matmul_index
+from .basicaerprogram import compile_experiment, GateOp
 
 logger = logging.getLogger(__name__)
 
@@ -105,9 +104,13 @@ class UnitarySimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_unitary": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "max_parallel_threads": None
     }
 
+    # Memory in bytes of the columns of the unitary evolved together
+    CHUNK_MEMORY = 2 ** 22
+
     def __init__(self, configuration=None, provider=None):
         super().__init__(configuration=(
             configuration or QasmBackendConfiguration.from_dict(self.DEFAULT_CONFIGURATION)),
@@ -118,24 +121,23 @@ class UnitarySimulatorPy(BaseBackend):
         self._number_of_qubits = 0
         self._initial_unitary = None
         self._chop_threshold = 1e-15
+        self._max_parallel_threads = None
 
-    def _add_unitary(self, gate, qubits):
-        """Apply an N-qubit unitary matrix.
+    def _evolve_columns(self, program, columns):
+        """Apply a program to some columns of the unitary, in place.
 
         Args:
-            gate (matrix_like): an N-qubit unitary matrix
-            qubits (list): the list of N-qubits.
+            program (list[GateOp]): the gates of the experiment.
+            columns (slice): the columns of the unitary to evolve.
         """
-        # Get the number of qubits
-        num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_matmul_index(qubits, self._number_of_qubits)
-        # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex),
-                                 num_qubits * [2, 2])
-        # Apply matrix multiplication
-        self._unitary = np.einsum(indexes, gate_tensor, self._unitary,
-                                  dtype=complex, casting='no')
+        # Each column of the unitary evolves as a statevector
+        block = self._unitary[columns]
+        for operation in program:
+            block = operation.apply(block)
+        # Truncate small values of the real and imaginary parts
+        parts = block.view(float)
+        parts[abs(parts) < self._chop_threshold] = 0.0
+        self._unitary[columns] = block
 
     def _validate_initial_unitary(self):
         """Validate an initial unitary matrix"""
@@ -185,28 +187,32 @@ class UnitarySimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for a custom number of threads
+        self._max_parallel_threads = self.DEFAULT_OPTIONS["max_parallel_threads"]
+        if 'max_parallel_threads' in backend_options:
+            self._max_parallel_threads = backend_options['max_parallel_threads']
+        elif hasattr(qobj_config, 'max_parallel_threads'):
+            self._max_parallel_threads = qobj_config.max_parallel_threads
+        if not self._max_parallel_threads:
+            self._max_parallel_threads = local_hardware_info()['cpus']
 
     def _initialize_unitary(self):
         """Set the initial unitary for simulation"""
         self._validate_initial_unitary()
+        # The unitary is stored transposed, with each column as a row
         if self._initial_unitary is None:
             # Set to identity matrix
             self._unitary = np.eye(2 ** self._number_of_qubits,
                                    dtype=complex)
         else:
-            self._unitary = self._initial_unitary.copy()
-        # Reshape to rank-N tensor
-        self._unitary = np.reshape(self._unitary,
-                                   self._number_of_qubits * [2, 2])
+            self._unitary = np.ascontiguousarray(self._initial_unitary.T)
 
     def _get_unitary(self):
         """Return the current unitary in JSON Result spec format"""
-        unitary = np.reshape(self._unitary, 2 * [2 ** self._number_of_qubits])
-        # Expand complex numbers
-        unitary = np.stack((unitary.real, unitary.imag), axis=-1)
-        # Truncate small values
-        unitary[abs(unitary) < self._chop_threshold] = 0.0
-        return unitary
+        # Expand complex numbers, as a view of the stored transposed unitary
+        dimension = len(self._unitary)
+        unitary = self._unitary.view(float).reshape(dimension, dimension, 2)
+        return np.transpose(unitary, (1, 0, 2))
 
     def run(self, qobj, backend_options=None):
         """Run qobj asynchronously.
@@ -223,6 +229,7 @@ class UnitarySimulatorPy(BaseBackend):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_unitary": matrix_like
                 * "chop_threshold": double
+                * "max_parallel_threads": int
 
             The "initial_unitary" option specifies a custom initial unitary
             matrix for the simulator to be used instead of the identity
@@ -233,6 +240,10 @@ class UnitarySimulatorPy(BaseBackend):
             setting small values to zero in the output unitary. The default
             value is 1e-15.
 
+            The "max_parallel_threads" option specifies the number of threads
+            evolving the columns of the unitary in parallel. The default is
+            the number of CPUs.
+
             Example::
 
                 backend_options = {
@@ -240,7 +251,8 @@ class UnitarySimulatorPy(BaseBackend):
                                                  [0, 0, 0, 1],
                                                  [0, 0, 1, 0],
                                                  [0, 1, 0, 0]])
-                    "chop_threshold": 1e-15
+                    "chop_threshold": 1e-15,
+                    "max_parallel_threads": 4
                 }
         """
         self._set_options(qobj_config=qobj.config,
@@ -312,32 +324,24 @@ class UnitarySimulatorPy(BaseBackend):
         self._validate_initial_unitary()
         self._initialize_unitary()
 
-        for operation in experiment.instructions:
-            if operation.name == 'unitary':
-                qubits = operation.qubits
-                gate = operation.params[0]
-                self._add_unitary(gate, qubits)
-            # Check if single  gate
-            elif operation.name in ('U', 'u1', 'u2', 'u3'):
-                params = getattr(operation, 'params', None)
-                qubit = operation.qubits[0]
-                gate = single_gate_matrix(operation.name, params)
-                self._add_unitary(gate, [qubit])
-            elif operation.name in ('id', 'u0'):
-                pass
-            # Check if CX gate
-            elif operation.name in ('CX', 'cx'):
-                qubit0 = operation.qubits[0]
-                qubit1 = operation.qubits[1]
-                gate = cx_gate_matrix()
-                self._add_unitary(gate, [qubit0, qubit1])
-            # Check if barrier
-            elif operation.name == 'barrier':
-                pass
-            else:
-                backend = self.name()
+        program = compile_experiment(experiment.instructions, self._number_of_qubits,
+                                     backend_name=self.name())
+        for operation in program:
+            if not isinstance(operation, GateOp):
                 err_msg = '{0} encountered unrecognized operation "{1}"'
-                raise BasicAerError(err_msg.format(backend, operation.name))
+                raise BasicAerError(err_msg.format(self.name(), operation.name))
+
+        # The columns are evolved in independent chunks, in parallel
+        dimension = 2 ** self._number_of_qubits
+        chunk_size = max(1, self.CHUNK_MEMORY // (16 * dimension))
+        chunks = [slice(first, first + chunk_size) for first in range(0, dimension, chunk_size)]
+        num_threads = min(self._max_parallel_threads, len(chunks))
+        if num_threads > 1:
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                list(executor.map(lambda chunk: self._evolve_columns(program, chunk), chunks))
+        else:
+            for chunk in chunks:
+                self._evolve_columns(program, chunk)
         # Add final state to data
         data = {'unitary': self._get_unitary()}
         end = time.time()
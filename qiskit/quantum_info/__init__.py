@@ -28,6 +28,8 @@ Operators
    Operator
    Pauli
    pauli_group
+   PauliTable
+   SparsePauliOp
 
 States
 ======
@@ -37,6 +39,8 @@ States
 
    Statevector
    DensityMatrix
+   StatevectorBatch
+   DensityMatrixBatch
 
 Channels
 ========
@@ -50,6 +54,7 @@ Channels
    Stinespring
    Chi
    PTM
+   CompositeChannel
 
 Measures
 ========
@@ -91,9 +96,11 @@ Synthesis
 
 from .operators.operator import Operator
 from .operators.pauli import Pauli, pauli_group
-from .operators.channel import Choi, SuperOp, Kraus, Stinespring, Chi, PTM
+from .operators.symplectic import PauliTable, SparsePauliOp
+from .operators.channel import (Choi, SuperOp, Kraus, Stinespring, Chi, PTM,
+                                CompositeChannel)
 from .operators.measures import process_fidelity
-from .states import Statevector, DensityMatrix
+from .states import Statevector, DensityMatrix, StatevectorBatch, DensityMatrixBatch
 from .states.states import basis_state, projector, purity
 from .states.measures import state_fidelity
 from .random import random_unitary, random_state, random_density_matrix
@@ -16,4 +16,5 @@
 
 from .operator import Operator
 from .pauli import Pauli, pauli_group
-from .channel import Choi, SuperOp, Kraus, Stinespring, Chi, PTM
+from .symplectic import PauliTable, SparsePauliOp
+from .channel import Choi, SuperOp, Kraus, Stinespring, Chi, PTM, CompositeChannel
@@ -28,3 +28,4 @@ from .kraus import Kraus
 from .stinespring import Stinespring
 from .ptm import PTM
 from .chi import Chi
+from .composite import CompositeChannel
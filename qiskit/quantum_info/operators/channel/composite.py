@@ -0,0 +1,668 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Composite representation of a Quantum Channel.
+
+
+A composite channel records the compositions, tensor products and linear
+combinations of other channels and operators as an expression tree, and
+only evaluates them when a matrix of the whole channel is needed:
+
+    E = E_k ∘ ... ∘ E_2 ∘ E_1
+
+where each E_i acts on a subset of the subsystems and is either a channel,
+an operator, or a linear combination of composite channels. Tensor products
+are recorded as compositions of channels acting on disjoint subsystems.
+"""
+
+from numbers import Number
+
+import numpy as np
+
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.instruction import Instruction
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.base_operator import BaseOperator
+from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
+from qiskit.quantum_info.operators.channel.superop import SuperOp
+from qiskit.quantum_info.operators.channel.kraus import Kraus
+from qiskit.quantum_info.operators.channel.stinespring import Stinespring
+from qiskit.quantum_info.operators.channel.transformations import _to_kraus
+
+
+class CompositeChannel(QuantumChannel):
+    """Quantum channel evaluated lazily from compositions of channels.
+
+    The ``compose``, ``tensor``, ``expand``, ``add``, ``subtract`` and
+    ``multiply`` methods return a new composite channel without computing
+    any matrix. The channel is evaluated when it is converted to another
+    representation or its :attr:`data` is accessed:
+
+    * if the product of the numbers of Kraus matrices of its operators and
+      channels is less than ``input_dim * output_dim``, the Kraus matrices
+      are multiplied together on the subsystems they act on;
+    * otherwise the channels acting on disjoint sets of subsystems are
+      composed separately, and their superoperators are tensored together.
+
+    Evolving a state by the channel applies each channel of the composition
+    to the state in turn, through its Kraus matrices when there are few of
+    them, without evaluating the channel.
+    """
+
+    def __init__(self, data, input_dims=None, output_dims=None):
+        """Initialize a composite quantum channel.
+
+        Args:
+            data (QuantumCircuit or
+                  Instruction or
+                  BaseOperator or
+                  matrix): the channel or operator. A matrix is
+                           interpreted as a unitary matrix.
+            input_dims (tuple): the input subsystem dimensions.
+                                [Default: None]
+            output_dims (tuple): the output subsystem dimensions.
+                                 [Default: None]
+
+        Raises:
+            QiskitError: if input data cannot be initialized as a
+            composite channel.
+        """
+        if isinstance(data, CompositeChannel):
+            node = data._data
+        else:
+            if isinstance(data, (QuantumCircuit, Instruction)):
+                # Circuits with only unitary instructions are kept as an
+                # Operator, otherwise they are simulated as a SuperOp
+                try:
+                    data = Operator(data)
+                except QiskitError:
+                    data = SuperOp(data)
+            elif not isinstance(data, BaseOperator):
+                # We use the QuantumChannel init transform to initialize
+                # other objects into a QuantumChannel or Operator object.
+                data = self._init_transformer(data)
+            node = ('channel', data)
+        leaf = node[1] if node[0] == 'channel' else None
+        if input_dims is None:
+            input_dims = data.input_dims()
+        if output_dims is None:
+            output_dims = data.output_dims()
+        input_dims = self._automatic_dims(input_dims, data._input_dim)
+        output_dims = self._automatic_dims(output_dims, data._output_dim)
+        if input_dims != data.input_dims() or output_dims != data.output_dims():
+            if leaf is None:
+                raise QiskitError('Cannot reshape a composition of channels.')
+            leaf = leaf.copy()._reshape(input_dims, output_dims)
+            node = ('channel', leaf)
+        super().__init__('Composite', node, input_dims, output_dims)
+        self._evaluated = None
+        self._superop = None
+
+    @classmethod
+    def _from_node(cls, node, input_dims, output_dims):
+        """Return a composite channel from a node of the expression tree."""
+        ret = cls.__new__(cls)
+        super(CompositeChannel, ret).__init__('Composite', node, input_dims, output_dims)
+        ret._evaluated = None
+        ret._superop = None
+        return ret
+
+    @property
+    def data(self):
+        """Return the superoperator matrix of the channel.
+
+        The channel is evaluated on the first access, and the matrix is
+        kept for later accesses.
+        """
+        if self._superop is None:
+            self._superop = SuperOp(self._evaluate())
+        return self._superop.data
+
+    def __repr__(self):
+        return 'CompositeChannel({}, input_dims={}, output_dims={})'.format(
+            self._label(), self._input_dims, self._output_dims)
+
+    def copy(self):
+        """Make a copy of current operator."""
+        return self._from_node(self._data, self.input_dims(), self.output_dims())
+
+    def is_cptp(self, atol=None, rtol=None):
+        """Return True if completely-positive trace-preserving (CPTP).
+
+        A composition of CPTP channels is CPTP, so the channel is only
+        evaluated if one of the channels of the composition is not CPTP.
+        """
+        if all(_is_cptp(node, atol, rtol) for node, _ in self._steps()):
+            return True
+        return self._evaluate().is_cptp(atol=atol, rtol=rtol)
+
+    def is_tp(self, atol=None, rtol=None):
+        """Test if a channel is trace-preserving (TP)"""
+        return self._evaluate().is_tp(atol=atol, rtol=rtol)
+
+    def is_cp(self, atol=None, rtol=None):
+        """Test if Choi-matrix is completely-positive (CP)"""
+        return self._evaluate().is_cp(atol=atol, rtol=rtol)
+
+    def to_operator(self):
+        """Try to convert channel to a unitary representation Operator."""
+        return self._evaluate().to_operator()
+
+    def to_instruction(self):
+        """Convert to a Kraus or UnitaryGate circuit instruction.
+
+        Returns:
+            Instruction: A kraus instruction for the channel.
+
+        Raises:
+            QiskitError: if input data is not an N-qubit CPTP quantum channel.
+        """
+        return self._evaluate().to_instruction()
+
+    def conjugate(self):
+        """Return the conjugate of the QuantumChannel."""
+        kind, operands = self._data
+        if kind == 'channel':
+            node = (kind, operands.conjugate())
+        elif kind == 'sum':
+            node = (kind, tuple((np.conj(coeff), term.conjugate())
+                                for coeff, term in operands))
+        else:
+            node = (kind, tuple((step.conjugate(), qargs) for step, qargs in operands))
+        return self._from_node(node, self.input_dims(), self.output_dims())
+
+    def transpose(self):
+        """Return the transpose of the QuantumChannel."""
+        kind, operands = self._data
+        if kind == 'channel':
+            node = (kind, operands.transpose())
+        elif kind == 'sum':
+            node = (kind, tuple((coeff, term.transpose()) for coeff, term in operands))
+        else:
+            # The transpose of a composition is the reverse composition
+            # of the transposes
+            node = (kind, tuple((step.transpose(), qargs)
+                                for step, qargs in reversed(operands)))
+        return self._from_node(node, self.output_dims(), self.input_dims())
+
+    def compose(self, other, qargs=None, front=False):
+        """Return the composition channel self∘other.
+
+        Args:
+            other (QuantumChannel): a quantum channel.
+            qargs (list): a list of subsystem positions to compose other on.
+            front (bool): If False compose in standard order other(self(input))
+                          otherwise compose in reverse order self(other(input))
+                          [default: False]
+
+        Returns:
+            CompositeChannel: The unevaluated composition channel.
+
+        Raises:
+            QiskitError: if other cannot be converted to a channel, or
+            has incompatible dimensions.
+        """
+        if not isinstance(other, CompositeChannel):
+            other = CompositeChannel(other)
+        # Check dimensions are compatible
+        if front and self.input_dims(qargs=qargs) != other.output_dims():
+            raise QiskitError(
+                'output_dims of other must match subsystem input_dims')
+        if not front and self.output_dims(qargs=qargs) != other.input_dims():
+            raise QiskitError(
+                'input_dims of other must match subsystem output_dims')
+        if qargs is not None and len(other.input_dims()) != len(other.output_dims()):
+            raise QiskitError(
+                'other must have as many input as output subsystems to be composed on qargs')
+
+        input_dims = list(self.input_dims())
+        output_dims = list(self.output_dims())
+        if front:
+            # Composition A(B(input))
+            if qargs is None:
+                input_dims = other.input_dims()
+            else:
+                for pos, qubit in enumerate(qargs):
+                    input_dims[qubit] = other._input_dims[pos]
+            steps = other._mapped_steps(qargs) + self._steps()
+        else:
+            # Composition B(A(input))
+            if qargs is None:
+                output_dims = other.output_dims()
+            else:
+                for pos, qubit in enumerate(qargs):
+                    output_dims[qubit] = other._output_dims[pos]
+            steps = self._steps() + other._mapped_steps(qargs)
+        return self._from_node(('compose', tuple(steps)), input_dims, output_dims)
+
+    def tensor(self, other):
+        """Return the tensor product channel self ⊗ other.
+
+        Args:
+            other (QuantumChannel): a quantum channel.
+
+        Returns:
+            CompositeChannel: the unevaluated tensor product channel.
+
+        Raises:
+            QiskitError: if other cannot be converted to a channel.
+        """
+        return self._tensor_product(other, reverse=False)
+
+    def expand(self, other):
+        """Return the tensor product channel other ⊗ self.
+
+        Args:
+            other (QuantumChannel): a quantum channel.
+
+        Returns:
+            CompositeChannel: the unevaluated tensor product channel.
+
+        Raises:
+            QiskitError: if other cannot be converted to a channel.
+        """
+        return self._tensor_product(other, reverse=True)
+
+    def add(self, other):
+        """Return the QuantumChannel self + other.
+
+        Args:
+            other (QuantumChannel): a quantum channel.
+
+        Returns:
+            CompositeChannel: the unevaluated linear addition self + other.
+
+        Raises:
+            QiskitError: if other cannot be converted to a channel or
+            has incompatible dimensions.
+        """
+        if not isinstance(other, CompositeChannel):
+            other = CompositeChannel(other)
+        if self.dim != other.dim:
+            raise QiskitError("other QuantumChannel dimensions are not equal")
+        return self._from_node(('sum', self._terms() + other._terms()),
+                               self.input_dims(), self.output_dims())
+
+    def subtract(self, other):
+        """Return the QuantumChannel self - other.
+
+        Args:
+            other (QuantumChannel): a quantum channel.
+
+        Returns:
+            CompositeChannel: the unevaluated linear subtraction self - other.
+
+        Raises:
+            QiskitError: if other cannot be converted to a channel or
+            has incompatible dimensions.
+        """
+        if not isinstance(other, CompositeChannel):
+            other = CompositeChannel(other)
+        return self.add(other.multiply(-1))
+
+    def multiply(self, other):
+        """Return the QuantumChannel other * self.
+
+        Args:
+            other (complex): a complex number.
+
+        Returns:
+            CompositeChannel: the unevaluated scalar multiplication other * self.
+
+        Raises:
+            QiskitError: if other is not a valid scalar.
+        """
+        if not isinstance(other, Number):
+            raise QiskitError("other is not a number")
+        terms = tuple((other * coeff, term) for coeff, term in self._terms())
+        return self._from_node(('sum', terms), self.input_dims(), self.output_dims())
+
+    def _evolve(self, state, qargs=None):
+        """Evolve a quantum state by the quantum channel.
+
+        Each channel of the composition is applied to the state in turn,
+        so the channel is not evaluated.
+
+        Args:
+            state (DensityMatrix or Statevector): The input state.
+            qargs (list): a list of quantum state subsystem positions to apply
+                           the quantum channel on.
+
+        Returns:
+            DensityMatrix: the output quantum state as a density matrix.
+
+        Raises:
+            QiskitError: if the quantum channel dimension does not match the
+            specified quantum state subsystem dimensions.
+        """
+        # Prevent cyclic imports by importing DensityMatrix here
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.states.densitymatrix import DensityMatrix
+
+        if not isinstance(state, DensityMatrix):
+            state = DensityMatrix(state)
+        if qargs is None and state._dim != self._input_dim:
+            raise QiskitError(
+                "Operator input dimension is not equal to density matrix dimension."
+            )
+        if qargs is not None and state.dims(qargs) != self.input_dims():
+            raise QiskitError(
+                "Operator input dimensions are not equal to statevector subsystem dimensions."
+            )
+        kind, operands = self._data
+        if kind == 'channel':
+            return _evolve_channel(operands, state, qargs)
+        if kind == 'sum':
+            ret = None
+            for coeff, term in operands:
+                term_state = term._evolve(state, qargs).multiply(coeff)
+                ret = term_state if ret is None else ret.add(term_state)
+            return ret
+        for step, step_qargs in operands:
+            if qargs is not None:
+                step_qargs = qargs if step_qargs is None else [qargs[i] for i in step_qargs]
+            state = step._evolve(state, step_qargs)
+        return state
+
+    def _evaluate(self):
+        """Return the channel as a Kraus or SuperOp channel.
+
+        The Kraus representation is used if the channel has fewer Kraus
+        matrices than a minimal Kraus representation can have.
+        """
+        if self._evaluated is None:
+            num_kraus = self._num_kraus()
+            if num_kraus is not None and num_kraus < self._input_dim * self._output_dim:
+                kraus_l, kraus_r = self._kraus()
+                kraus = kraus_l if kraus_r is None else (kraus_l, kraus_r)
+                self._evaluated = Kraus(kraus, self.input_dims(), self.output_dims())
+            else:
+                self._evaluated = self._evaluate_superop()
+        return self._evaluated
+
+    def _evaluate_superop(self):
+        """Return the channel as a SuperOp channel."""
+        if self._superop is not None:
+            return self._superop
+        kind, operands = self._data
+        if kind == 'channel':
+            return SuperOp(operands)
+        if kind == 'sum':
+            ret = None
+            for coeff, term in operands:
+                term_superop = term._evaluate_superop().multiply(coeff)
+                ret = term_superop if ret is None else ret.add(term_superop)
+            return ret
+        components = self._components()
+        if len(components) == 1:
+            return self._compose_superops(operands)
+        # Channels acting on disjoint subsystems are evaluated separately
+        ret = None
+        contiguous = all(subsystems == list(range(subsystems[0], subsystems[-1] + 1))
+                         for subsystems, _ in components)
+        if not contiguous:
+            ret = SuperOp(np.eye(self._input_dim ** 2), self.input_dims(), self.input_dims())
+        for subsystems, steps in sorted(components):
+            input_dims = [self._input_dims[qubit] for qubit in subsystems]
+            output_dims = [self._output_dims[qubit] for qubit in subsystems]
+            if steps:
+                positions = {qubit: pos for pos, qubit in enumerate(subsystems)}
+                steps = [(step, [positions[qubit] for qubit in step_qargs])
+                         for step, step_qargs in steps]
+                component = self._from_node(('compose', tuple(steps)), input_dims, output_dims)
+                component = component._compose_superops(steps)
+            else:
+                component = SuperOp(np.eye(np.product(input_dims) ** 2), input_dims, input_dims)
+            if not contiguous:
+                ret = ret.compose(component, qargs=subsystems)
+            elif ret is None:
+                ret = component
+            else:
+                ret = ret.expand(component)
+        return ret
+
+    def _compose_superops(self, steps):
+        """Return the SuperOp of steps applied in turn to the subsystems."""
+        ret = None
+        for step, qargs in steps:
+            superop = step._evaluate_superop()
+            if ret is None and qargs is None:
+                ret = superop
+                continue
+            if ret is None:
+                ret = SuperOp(np.eye(self._input_dim ** 2), self.input_dims(), self.input_dims())
+            ret = ret.compose(superop, qargs=qargs)
+        return ret
+
+    def _components(self):
+        """Return the sets of subsystems connected by the composition.
+
+        Returns:
+            list[tuple]: pairs of a sorted list of subsystems and the steps
+            acting on them, which do not act on other subsystems.
+        """
+        num_subsystems = len(self._input_dims)
+        if any(qargs is None for _, qargs in self._data[1]):
+            return [(list(range(num_subsystems)), list(self._data[1]))]
+        # Union-find of the subsystems acted on by the same step
+        parents = list(range(num_subsystems))
+
+        def find(qubit):
+            while parents[qubit] != qubit:
+                qubit = parents[qubit]
+            return qubit
+
+        for _, qargs in self._data[1]:
+            for qubit in qargs[1:]:
+                parents[find(qubit)] = find(qargs[0])
+        components = {}
+        for qubit in range(num_subsystems):
+            components.setdefault(find(qubit), ([], []))[0].append(qubit)
+        for step, qargs in self._data[1]:
+            components[find(qargs[0])][1].append((step, qargs))
+        return list(components.values())
+
+    def _num_kraus(self):
+        """Return the number of Kraus matrices of the channel, or None if unknown."""
+        kind, operands = self._data
+        if kind == 'channel':
+            return _num_kraus(operands)
+        if kind == 'sum':
+            counts = [term._num_kraus() for _, term in operands]
+        else:
+            counts = [step._num_kraus() for step, _ in operands]
+        if None in counts:
+            return None
+        if kind == 'sum':
+            return sum(counts)
+        return int(np.product(counts))
+
+    def _kraus(self):
+        """Return the left and right Kraus matrices of the channel.
+
+        The right matrices are None if they are equal to the left ones.
+        """
+        kind, operands = self._data
+        if kind == 'channel':
+            return _kraus(operands)
+        if kind == 'sum':
+            kraus_l, kraus_r = [], []
+            general = False
+            for coeff, term in operands:
+                term_l, term_r = term._kraus()
+                if term_r is not None or not np.isreal(coeff) or np.real(coeff) < 0:
+                    general = True
+                    kraus_l += [coeff * mat for mat in term_l]
+                    kraus_r += term_l if term_r is None else term_r
+                else:
+                    val = np.sqrt(np.real(coeff))
+                    kraus_l += [val * mat for mat in term_l]
+                    kraus_r += [val * mat for mat in term_l]
+            return kraus_l, kraus_r if general else None
+        # Multiply the Kraus matrices of each step in turn
+        identity = Operator(np.eye(self._input_dim), self.input_dims(), self.input_dims())
+        kraus_l = [identity]
+        kraus_r = None
+        for step, qargs in operands:
+            step_l, step_r = step._kraus()
+            ops_l = [Operator(mat, step.input_dims(), step.output_dims()) for mat in step_l]
+            if kraus_r is not None or step_r is not None:
+                ops_r = ops_l if step_r is None else [
+                    Operator(mat, step.input_dims(), step.output_dims()) for mat in step_r]
+                kraus_r = [op.compose(step_op, qargs=qargs)
+                           for op in (kraus_l if kraus_r is None else kraus_r)
+                           for step_op in ops_r]
+            kraus_l = [op.compose(step_op, qargs=qargs) for op in kraus_l for step_op in ops_l]
+        return ([op.data for op in kraus_l],
+                None if kraus_r is None else [op.data for op in kraus_r])
+
+    def _steps(self):
+        """Return the (node, qargs) steps of the composition."""
+        if self._data[0] == 'compose':
+            return list(self._data[1])
+        return [(self, None)]
+
+    def _mapped_steps(self, qargs):
+        """Return the steps of the composition applied on qargs."""
+        if qargs is None:
+            return self._steps()
+        return [(step, list(qargs) if step_qargs is None else [qargs[i] for i in step_qargs])
+                for step, step_qargs in self._steps()]
+
+    def _terms(self):
+        """Return the (coefficient, node) terms of the linear combination."""
+        if self._data[0] == 'sum':
+            return self._data[1]
+        return ((1, self),)
+
+    def _tensor_product(self, other, reverse=False):
+        """Return the tensor product channel.
+
+        Args:
+            other (QuantumChannel): a quantum channel subclass.
+            reverse (bool): If False return self ⊗ other, if True return
+                            if True return (other ⊗ self) [Default: False]
+        Returns:
+            CompositeChannel: the unevaluated tensor product channel.
+
+        Raises:
+            QiskitError: if other cannot be converted to a channel.
+        """
+        if not isinstance(other, CompositeChannel):
+            other = CompositeChannel(other)
+        if reverse:
+            first, second = self, other
+        else:
+            first, second = other, self
+        if any(len(chan.input_dims()) != len(chan.output_dims()) for chan in (first, second)):
+            # The subsystems of the channels cannot be tracked by the
+            # composition, so the tensor product is evaluated.
+            return CompositeChannel(SuperOp(second).tensor(SuperOp(first)))
+        num_first = len(first.input_dims())
+        num_second = len(second.input_dims())
+        steps = first._mapped_steps(list(range(num_first))) + second._mapped_steps(
+            list(range(num_first, num_first + num_second)))
+        return self._from_node(('compose', tuple(steps)),
+                               first.input_dims() + second.input_dims(),
+                               first.output_dims() + second.output_dims())
+
+    def _label(self):
+        """Return a string of the expression tree."""
+        kind, operands = self._data
+        if kind == 'channel':
+            return operands.rep
+        if kind == 'sum':
+            return '(' + ' + '.join('{} * {}'.format(coeff, term._label())
+                                    for coeff, term in operands) + ')'
+        return ' -> '.join(step._label() if qargs is None else '{}{}'.format(step._label(), qargs)
+                           for step, qargs in operands)
+
+
+def _num_kraus(chan):
+    """Return the number of Kraus matrices of an operator or channel, or None
+    if it is not an Operator, Kraus or Stinespring channel."""
+    if isinstance(chan, Operator):
+        return 1
+    if isinstance(chan, Kraus):
+        return len(chan._data[0])
+    if isinstance(chan, Stinespring):
+        return len(chan._data[0]) // chan._output_dim
+    if isinstance(chan, CompositeChannel):
+        return chan._num_kraus()
+    return None
+
+
+def _kraus(chan):
+    """Return the left and right Kraus matrices of an operator or channel."""
+    if isinstance(chan, Operator):
+        return [chan.data], None
+    if isinstance(chan, CompositeChannel):
+        return chan._kraus()
+    return _to_kraus(chan.rep, chan._data, *chan.dim)
+
+
+def _kraus_matrices(chan):
+    """Return the Kraus matrices of a channel if they are cheap to compute.
+
+    Args:
+        chan (BaseOperator): an operator or quantum channel.
+
+    Returns:
+        tuple or None: the left and right Kraus matrices, the right ones
+        being None if they are equal to the left ones, or None if the
+        channel is not an Operator, Kraus, Stinespring or composite channel
+        with fewer Kraus matrices than its superoperator has rows.
+    """
+    num_kraus = _num_kraus(chan)
+    if num_kraus is None:
+        return None
+    if isinstance(chan, CompositeChannel):
+        if num_kraus >= chan._input_dim * chan._output_dim:
+            return None
+        kraus = chan._evaluate()
+        return kraus._data
+    return _kraus(chan)
+
+
+def _is_cptp(node, atol, rtol):
+    """Return True if a step of a composition is known to be CPTP."""
+    kind, operands = node._data
+    if kind != 'channel':
+        return False
+    if isinstance(operands, Operator):
+        return operands.is_unitary(atol=atol, rtol=rtol)
+    return operands.is_cptp(atol=atol, rtol=rtol)
+
+
+def _evolve_channel(chan, state, qargs):
+    """Evolve a density matrix by an operator or channel.
+
+    Channels with at most half as many Kraus matrices as their input
+    dimension are applied through their Kraus matrices.
+    """
+    if isinstance(chan, Operator):
+        return state.evolve(chan, qargs=qargs)
+    num_kraus = _num_kraus(chan)
+    if num_kraus is not None and 2 * num_kraus <= chan._input_dim:
+        kraus_l, kraus_r = _kraus(chan)
+        if kraus_r is None:
+            ret = None
+            for mat in kraus_l:
+                op = Operator(mat, chan.input_dims(), chan.output_dims())
+                op_state = state.evolve(op, qargs=qargs)
+                ret = op_state if ret is None else ret.add(op_state)
+            return ret
+    return chan._evolve(state, qargs=qargs)
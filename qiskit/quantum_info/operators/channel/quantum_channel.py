@@ -159,6 +159,10 @@ class QuantumChannel(BaseOperator):
         # If the input is already a QuantumChannel subclass it will return
         # the original object
         if isinstance(data, QuantumChannel):
+            if data.rep == 'Composite':
+                # Composite channels are evaluated in the cheapest of the
+                # Kraus and SuperOp representations
+                return data._evaluate()
             return data
         if hasattr(data, 'to_quantumchannel'):
             # If the data object is not a QuantumChannel it will give
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Cached gate matrices and fused evolution of tensors by instructions.
+
+Instructions are flattened to a list of ``(matrix, qargs)`` operations
+through their ``to_matrix`` method, or else their ``definition``. The
+matrices, and the flattened definitions of composite gates, are stored in
+a bounded cache shared by all the operators and states. Runs of operations
+acting on at most :data:`MAX_FUSED_QUBITS` qubits are then multiplied
+together, and the fused matrices are applied to a tensor in two buffers
+which are reused for the whole evolution.
+"""
+
+from collections import OrderedDict
+from numbers import Number
+
+import numpy as np
+
+from qiskit.circuit.instruction import Instruction
+from qiskit.circuit.gate import Gate
+from qiskit.circuit.controlledgate import ControlledGate
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.base_operator import BaseOperator
+
+# Maximum number of gate matrices and definitions in the cache
+MAX_CACHE_SIZE = 2048
+
+# Maximum number of qubits of a fused matrix
+MAX_FUSED_QUBITS = 4
+
+_CACHE = OrderedDict()
+
+# Instructions of these types get their matrix or definition from the
+# instance, so they cannot be cached by type and parameters
+_UNCACHED_TYPES = (Instruction, Gate, ControlledGate)
+
+
+def clear_cache():
+    """Remove all the gate matrices and definitions from the cache."""
+    _CACHE.clear()
+
+
+def instruction_matrix(obj):
+    """Return the matrix of an instruction if it defines one.
+
+    Args:
+        obj (Instruction): an instruction.
+
+    Returns:
+        np.ndarray or None: the read-only matrix of the instruction, or None
+        if it does not have a ``to_matrix`` method or it fails.
+
+    Raises:
+        QiskitError: if the input is not an instruction.
+    """
+    if not isinstance(obj, Instruction):
+        raise QiskitError('Input is not an instruction.')
+    key = _cache_key(obj)
+    if key is not None and ('matrix',) + key in _CACHE:
+        return _cache_get(('matrix',) + key)
+    mat = None
+    if hasattr(obj, 'to_matrix'):
+        # If instruction is a gate first we see if it has a
+        # `to_matrix` definition and if so use that.
+        try:
+            mat = np.array(obj.to_matrix(), dtype=complex)
+            mat.setflags(write=False)
+        except QiskitError:
+            pass
+    if key is not None:
+        _cache_set(('matrix',) + key, mat)
+    return mat
+
+
+def instruction_operations(obj, qargs=None, fuse=True):
+    """Return the operations applying an instruction.
+
+    Args:
+        obj (Instruction): an instruction.
+        qargs (list or None): the qubits the instruction acts on, or None
+            for the first ``obj.num_qubits`` qubits.
+        fuse (bool): if True, multiply together runs of operations acting
+            on at most :data:`MAX_FUSED_QUBITS` qubits [Default: True].
+
+    Returns:
+        list[tuple]: ``(matrix, qargs)`` pairs, in the order they apply.
+
+    Raises:
+        QiskitError: if the instruction or one of the instructions in its
+            definition has no matrix and no definition, or has classical
+            arguments.
+    """
+    operations = _relative_operations(obj, fuse)
+    if qargs is None:
+        return list(operations)
+    return [(mat, [qargs[qubit] for qubit in op_qargs]) for mat, op_qargs in operations]
+
+
+def fuse_operations(operations, max_qubits=None):
+    """Multiply together consecutive operations acting on few qubits.
+
+    Operations are added to the current block while the block acts on at
+    most ``max_qubits`` qubits. The matrix of the block acts on its qubits in
+    the order they were added, the first one being the least significant.
+
+    Args:
+        operations (list[tuple]): ``(matrix, qargs)`` pairs.
+        max_qubits (int or None): the maximum number of qubits of a fused
+            block [Default: :data:`MAX_FUSED_QUBITS`].
+
+    Returns:
+        list[tuple]: the ``(matrix, qargs)`` pairs of the blocks.
+    """
+    if max_qubits is None:
+        max_qubits = MAX_FUSED_QUBITS
+    blocks = []
+    block_mat = None
+    block_qargs = []
+    for mat, qargs in operations:
+        new_qubits = [qubit for qubit in qargs if qubit not in block_qargs]
+        if block_mat is None or len(block_qargs) + len(new_qubits) > max_qubits:
+            if block_mat is not None:
+                blocks.append((block_mat, block_qargs))
+            block_mat, block_qargs = mat, list(qargs)
+            continue
+        if new_qubits:
+            # The new qubits are the most significant ones of the block
+            block_mat = np.kron(np.eye(2 ** len(new_qubits)), block_mat)
+            block_qargs = block_qargs + new_qubits
+        num_qubits = len(block_qargs)
+        indices = [num_qubits - 1 - block_qargs.index(qubit) for qubit in qargs]
+        tensor = np.reshape(block_mat, 2 * num_qubits * [2])
+        tensor = BaseOperator._einsum_matmul(tensor, np.reshape(mat, 2 * len(qargs) * [2]),
+                                             indices)
+        block_mat = np.reshape(tensor, 2 * [2 ** num_qubits])
+    if block_mat is not None:
+        blocks.append((block_mat, block_qargs))
+    return blocks
+
+
+def evolve_tensor(data, shape, operations):
+    """Return a tensor evolved by a list of matrices.
+
+    The operations are applied with matrix products on the whole tensor,
+    written to one of two buffers of its size which are swapped after each
+    operation, so the evolution allocates the same memory for any number of
+    operations.
+
+    Args:
+        data (np.ndarray): the array to evolve. It is not modified.
+        shape (tuple): the tensor shape of the data.
+        operations (list[tuple]): ``(matrix, axes)`` pairs, where the matrix
+            acts on the tensor axes, the first one being its least
+            significant index.
+
+    Returns:
+        np.ndarray: the evolved array, in the shape of ``data``.
+
+    Raises:
+        QiskitError: if the dimension of an axis does not match a matrix.
+    """
+    current = np.array(data, dtype=complex).reshape(-1)
+    spare = np.empty_like(current)
+    # The axes of the tensor in the current memory order
+    order = list(range(len(shape)))
+    for mat, axes in operations:
+        front = list(reversed(axes))
+        dim = int(np.product([shape[axis] for axis in front]))
+        if mat.shape != (dim, dim):
+            raise QiskitError(
+                'Matrix dimensions are not equal to the tensor subsystem dimensions.')
+        if order[:len(front)] != front:
+            # Copy the tensor with the axes of the matrix first
+            new_order = front + [axis for axis in order if axis not in front]
+            source = current.reshape([shape[axis] for axis in order])
+            np.copyto(spare.reshape([shape[axis] for axis in new_order]),
+                      source.transpose([order.index(axis) for axis in new_order]))
+            current, spare = spare, current
+            order = new_order
+        np.matmul(mat, current.reshape(dim, -1), out=spare.reshape(dim, -1))
+        current, spare = spare, current
+    if order != sorted(order):
+        source = current.reshape([shape[axis] for axis in order])
+        np.copyto(spare.reshape(shape), source.transpose(np.argsort(order)))
+        current = spare
+    return current.reshape(np.shape(data))
+
+
+def _relative_operations(obj, fuse):
+    """Return the operations of an instruction on its own qubits."""
+    key = _cache_key(obj)
+    if key is not None:
+        key = ('operations', fuse) + key
+        if key in _CACHE:
+            return _cache_get(key)
+    mat = instruction_matrix(obj)
+    if mat is not None:
+        operations = [(mat, list(range(obj.num_qubits)))]
+    else:
+        # If the instruction doesn't have a matrix defined we use its
+        # circuit decomposition definition if it exists, otherwise we
+        # cannot apply this gate and raise an error.
+        if obj.definition is None:
+            raise QiskitError('Cannot apply Instruction: {}'.format(obj.name))
+        operations = []
+        for instr, qregs, cregs in obj.definition:
+            if cregs:
+                raise QiskitError(
+                    'Cannot apply instruction with classical registers: {}'.format(
+                        instr.name))
+            # Get the integer position of the flat register
+            operations += instruction_operations(instr, [tup.index for tup in qregs], fuse)
+        if fuse:
+            operations = fuse_operations(operations)
+            if len(operations) == 1 and operations[0][1] != list(range(obj.num_qubits)):
+                # Store the fused matrix of a small gate in the order of its qubits
+                mat, qargs = operations[0]
+                if len(qargs) == obj.num_qubits:
+                    operations = [_reorder(mat, qargs)]
+        for mat, _ in operations:
+            mat.setflags(write=False)
+    if key is not None:
+        _cache_set(key, operations)
+    return operations
+
+
+def _reorder(mat, qargs):
+    """Return the matrix of a permutation of all the qubits in their natural order."""
+    num_qubits = len(qargs)
+    tensor = np.reshape(mat, 2 * num_qubits * [2])
+    # Tensor axis num_qubits - 1 - j holds qargs[j], for the output and the input
+    axes = [num_qubits - 1 - qargs.index(num_qubits - 1 - axis) for axis in range(num_qubits)]
+    tensor = np.transpose(tensor, axes + [num_qubits + axis for axis in axes])
+    return np.reshape(tensor, 2 * [2 ** num_qubits]), list(range(num_qubits))
+
+
+def _cache_key(obj):
+    """Return the cache key of an instruction, or None if it cannot be cached."""
+    if type(obj) in _UNCACHED_TYPES:
+        return None
+    for param in obj.params:
+        if not isinstance(param, (Number, np.number)):
+            return None
+    return (type(obj), obj.name, obj.num_qubits, obj.num_clbits, tuple(obj.params))
+
+
+def _cache_get(key):
+    _CACHE.move_to_end(key)
+    return _CACHE[key]
+
+
+def _cache_set(key, value):
+    _CACHE[key] = value
+    while len(_CACHE) > MAX_CACHE_SIZE:
+        _CACHE.popitem(last=False)
@@ -23,6 +23,7 @@ import numpy as np
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators import Operator
 from qiskit.quantum_info.operators import SuperOp
+from qiskit.quantum_info.operators.channel.composite import _kraus_matrices
 
 
 def process_fidelity(channel1, channel2, require_cptp=True):
@@ -33,7 +34,10 @@ def process_fidelity(channel1, channel2, require_cptp=True):
         F_p(E1, E2) = Tr[S2^dagger.S1])/dim^2
 
     where S1 and S2 are the SuperOp matrices for channels E1 and E2,
-    and dim is the dimension of the input output statespace.
+    and dim is the dimension of the input output statespace. If both
+    channels are Operator, Kraus, Stinespring or CompositeChannel objects
+    with few Kraus matrices, the trace is computed from the Kraus matrices
+    without building the superoperators.
 
     Args:
         channel1 (QuantumChannel or matrix): a quantum channel or unitary matrix.
@@ -62,31 +66,70 @@ def process_fidelity(channel1, channel2, require_cptp=True):
         if require_cptp:
             is_cptp2 = channel2.is_unitary()
 
-    # Next we convert inputs SuperOp objects
+    # Next we convert inputs to their Kraus matrices if they are cheap
+    # to compute, or else to SuperOp objects.
     # This works for objects that also have a `to_operator` or `to_channel` method
-    s1 = SuperOp(channel1)
-    s2 = SuperOp(channel2)
+    kraus1 = _kraus_matrices(channel1)
+    kraus2 = _kraus_matrices(channel2)
+    if kraus1 is None or kraus2 is None:
+        channel1 = SuperOp(channel1)
+        channel2 = SuperOp(channel2)
 
     # Check inputs are CPTP
     if require_cptp:
-        # Only check SuperOp if we didn't already check unitary inputs
+        # Only check channels if we didn't already check unitary inputs
         if is_cptp1 is None:
-            is_cptp1 = s1.is_cptp()
+            is_cptp1 = _is_cptp(channel1)
         if not is_cptp1:
             raise QiskitError('channel1 is not CPTP')
         if is_cptp2 is None:
-            is_cptp2 = s2.is_cptp()
+            is_cptp2 = _is_cptp(channel2)
         if not is_cptp2:
             raise QiskitError('channel2 is not CPTP')
 
     # Check dimensions match
-    input_dim1, output_dim1 = s1.dim
-    input_dim2, output_dim2 = s2.dim
+    input_dim1, output_dim1 = channel1.dim
+    input_dim2, output_dim2 = channel2.dim
     if input_dim1 != output_dim1 or input_dim2 != output_dim2:
         raise QiskitError('Input channels must have same size input and output dimensions.')
     if input_dim1 != input_dim2:
         raise QiskitError('Input channels have different dimensions.')
 
     # Compute process fidelity
-    fidelity = np.trace(s1.compose(s2.adjoint()).data) / (input_dim1 ** 2)
+    if kraus1 is None or kraus2 is None:
+        # Tr[S2^dagger.S1] is the inner product of the matrices
+        fidelity = np.vdot(channel2.data, channel1.data) / (input_dim1 ** 2)
+    else:
+        fidelity = _kraus_trace(kraus1, kraus2) / (input_dim1 ** 2)
     return fidelity
+
+
+def _is_cptp(channel):
+    """Return True if an operator is unitary or a channel is CPTP."""
+    if isinstance(channel, Operator):
+        return channel.is_unitary()
+    return channel.is_cptp()
+
+
+def _kraus_trace(kraus1, kraus2):
+    """Return Tr[S2^dagger.S1] for the superoperators of two Kraus sets.
+
+    For channels of Kraus matrices (A_i, B_i) and (C_j, D_j) this is
+
+        sum_ij Tr[C_j^dagger.A_i] * conj(Tr[D_j^dagger.B_i])
+
+    which costs O(len(kraus1) * len(kraus2) * dim^2) operations.
+    """
+    def traces(left, right):
+        left = np.reshape(left, (len(left), -1))
+        right = np.reshape(right, (len(right), -1))
+        return np.dot(np.conj(right), left.T)
+
+    kraus1_l, kraus1_r = kraus1
+    kraus2_l, kraus2_r = kraus2
+    left = traces(kraus1_l, kraus2_l)
+    if kraus1_r is None and kraus2_r is None:
+        return np.sum(np.abs(left) ** 2)
+    right = traces(kraus1_l if kraus1_r is None else kraus1_r,
+                   kraus2_l if kraus2_r is None else kraus2_r)
+    return np.sum(left * np.conj(right))
@@ -27,6 +27,9 @@ from qiskit.extensions.standard import IdGate, XGate, YGate, ZGate, HGate, SGate
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.predicates import is_unitary_matrix, matrix_equal
 from qiskit.quantum_info.operators.base_operator import BaseOperator
+from qiskit.quantum_info.operators.evolution import (instruction_matrix,
+                                                     instruction_operations,
+                                                     evolve_tensor)
 
 
 class Operator(BaseOperator):
@@ -415,40 +418,13 @@ class Operator(BaseOperator):
     @classmethod
     def _instruction_to_matrix(cls, obj):
         """Return Operator for instruction if defined or None otherwise."""
-        if not isinstance(obj, Instruction):
-            raise QiskitError('Input is not an instruction.')
-        mat = None
-        if hasattr(obj, 'to_matrix'):
-            # If instruction is a gate first we see if it has a
-            # `to_matrix` definition and if so use that.
-            try:
-                mat = obj.to_matrix()
-            except QiskitError:
-                pass
-        return mat
+        return instruction_matrix(obj)
 
     def _append_instruction(self, obj, qargs=None):
         """Update the current Operator by apply an instruction."""
-        mat = self._instruction_to_matrix(obj)
-        if mat is not None:
-            # Perform the composition and inplace update the current state
-            # of the operator
-            op = self.compose(mat, qargs=qargs)
-            self._data = op.data
-        else:
-            # If the instruction doesn't have a matrix defined we use its
-            # circuit decomposition definition if it exists, otherwise we
-            # cannot compose this gate and raise an error.
-            if obj.definition is None:
-                raise QiskitError('Cannot apply Instruction: {}'.format(obj.name))
-            for instr, qregs, cregs in obj.definition:
-                if cregs:
-                    raise QiskitError(
-                        'Cannot apply instruction with classical registers: {}'.format(
-                            instr.name))
-                # Get the integer position of the flat register
-                if qargs is None:
-                    new_qargs = [tup.index for tup in qregs]
-                else:
-                    new_qargs = [qargs[tup.index] for tup in qregs]
-                self._append_instruction(instr, qargs=new_qargs)
+        # Apply the fused matrices of the instruction and of its definition
+        # to the output subsystems of the operator
+        num_indices = len(self.output_dims())
+        operations = [(mat, [num_indices - 1 - qubit for qubit in op_qargs])
+                      for mat, op_qargs in instruction_operations(obj, qargs)]
+        self._data = evolve_tensor(self._data, self._shape, operations)
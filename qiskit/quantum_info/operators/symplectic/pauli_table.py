@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Table of Pauli operators in packed symplectic form.
+"""
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.pauli import Pauli
+
+
+class PauliTable:
+    r"""Table of N-qubit Pauli operators in packed symplectic form.
+
+    Each row of the table is a Pauli operator
+    :math:`P = (-i)^{z \cdot x} Z^z X^x`, as for :class:`Pauli`, stored as the
+    bits of its ``z`` and ``x`` vectors packed in 64-bit words: the bit of
+    qubit ``q`` is bit ``q % 64`` of word ``q // 64``. Products, commutation
+    checks and counts are computed on whole words, so the operations of the
+    table cost O(size * num_qubits / 64) vectorized operations.
+
+    For example::
+
+        from qiskit.quantum_info import PauliTable
+
+        table = PauliTable(['XX', 'YZ', 'IZ'])
+        product, phases = table.dot('ZZ')
+        print(product.to_labels(), phases)
+        print(table.commutes('XX'))
+    """
+
+    def __init__(self, data):
+        """Initialize the table.
+
+        Args:
+            data (PauliTable or Pauli or str or list or np.ndarray): the
+                Pauli operators. It can be a table, a :class:`Pauli`, a
+                Pauli label, a list of Paulis or of labels, or a boolean
+                array of shape ``(size, 2 * num_qubits)`` whose first
+                ``num_qubits`` columns are the ``x`` vectors and last
+                ``num_qubits`` columns the ``z`` vectors.
+
+        Raises:
+            QiskitError: if the input data is not valid.
+        """
+        if isinstance(data, PauliTable):
+            z, x, num_qubits = data._z.copy(), data._x.copy(), data._num_qubits
+        elif isinstance(data, (Pauli, str)):
+            table = PauliTable([data])
+            z, x, num_qubits = table._z, table._x, table._num_qubits
+        elif isinstance(data, (list, tuple)):
+            if data and all(isinstance(pauli, Pauli) for pauli in data):
+                table = PauliTable.from_bool([pauli.z for pauli in data],
+                                             [pauli.x for pauli in data])
+            else:
+                table = PauliTable.from_labels([str(pauli) for pauli in data])
+            z, x, num_qubits = table._z, table._x, table._num_qubits
+        elif isinstance(data, np.ndarray):
+            if data.ndim != 2 or data.shape[1] % 2:
+                raise QiskitError('Symplectic array must have shape (size, 2 * num_qubits).')
+            num_qubits = data.shape[1] // 2
+            table = PauliTable.from_bool(data[:, num_qubits:], data[:, :num_qubits])
+            z, x = table._z, table._x
+        else:
+            raise QiskitError('Invalid input data for PauliTable.')
+        self._z = z
+        self._x = x
+        self._num_qubits = num_qubits
+
+    @classmethod
+    def from_bool(cls, z, x):
+        """Return the table of the Paulis with the given z and x vectors.
+
+        Args:
+            z (array_like): boolean array of shape ``(size, num_qubits)``.
+            x (array_like): boolean array of shape ``(size, num_qubits)``.
+
+        Returns:
+            PauliTable: the table.
+
+        Raises:
+            QiskitError: if the arrays do not have the same 2D shape.
+        """
+        z = np.asarray(z, dtype=bool)
+        x = np.asarray(x, dtype=bool)
+        if z.ndim != 2 or z.shape != x.shape:
+            raise QiskitError('z and x must be 2D boolean arrays of the same shape.')
+        return cls._from_words(_pack(z), _pack(x), z.shape[1])
+
+    @classmethod
+    def from_labels(cls, labels):
+        """Return the table of a list of Pauli labels.
+
+        Args:
+            labels (list[str]): labels of characters 'I', 'X', 'Y' and 'Z',
+                the last one being qubit 0.
+
+        Returns:
+            PauliTable: the table.
+
+        Raises:
+            QiskitError: if the labels have different lengths or invalid
+                characters.
+        """
+        labels = list(labels)
+        if not labels:
+            raise QiskitError('PauliTable must have at least one Pauli.')
+        num_qubits = len(labels[0])
+        if any(len(label) != num_qubits for label in labels):
+            raise QiskitError('Pauli labels must all have the same length.')
+        chars = np.frombuffer(''.join(labels).encode('ascii'), dtype=np.uint8)
+        chars = chars.reshape(len(labels), num_qubits)[:, ::-1]
+        if not np.all(np.isin(chars, _LABEL_CHARS)):
+            raise QiskitError("Pauli labels must only consist of 'I', 'X', 'Y' or 'Z'.")
+        z = (chars == ord('Z')) | (chars == ord('Y'))
+        x = (chars == ord('X')) | (chars == ord('Y'))
+        return cls.from_bool(z, x)
+
+    @classmethod
+    def _from_words(cls, z, x, num_qubits):
+        """Return a table of packed words without copying or checking them."""
+        table = cls.__new__(cls)
+        table._z = z
+        table._x = x
+        table._num_qubits = num_qubits
+        return table
+
+    @property
+    def num_qubits(self):
+        """int: the number of qubits of the Paulis."""
+        return self._num_qubits
+
+    @property
+    def size(self):
+        """int: the number of Paulis in the table."""
+        return self._z.shape[0]
+
+    @property
+    def z(self):
+        """np.ndarray: the boolean z vectors, of shape ``(size, num_qubits)``."""
+        return _unpack(self._z, self._num_qubits)
+
+    @property
+    def x(self):
+        """np.ndarray: the boolean x vectors, of shape ``(size, num_qubits)``."""
+        return _unpack(self._x, self._num_qubits)
+
+    @property
+    def array(self):
+        """np.ndarray: the boolean symplectic array ``[x, z]`` of the table."""
+        return np.hstack([self.x, self.z])
+
+    def __len__(self):
+        """Return the number of Paulis in the table."""
+        return self.size
+
+    def __getitem__(self, key):
+        """Return a Pauli of the table for an integer, or else a sub-table."""
+        if isinstance(key, (int, np.integer)):
+            return Pauli(_unpack(self._z[key], self._num_qubits),
+                         _unpack(self._x[key], self._num_qubits))
+        return PauliTable._from_words(self._z[key], self._x[key], self._num_qubits)
+
+    def __eq__(self, other):
+        """Return True if the tables have the same Paulis in the same order."""
+        if not isinstance(other, PauliTable):
+            return False
+        return (self._num_qubits == other._num_qubits and
+                np.array_equal(self._z, other._z) and np.array_equal(self._x, other._x))
+
+    def __repr__(self):
+        return 'PauliTable({})'.format(self.to_labels())
+
+    def to_labels(self):
+        """Return the labels of the Paulis.
+
+        Returns:
+            list[str]: the labels, the last character being qubit 0.
+        """
+        chars = _LABEL_TABLE[self.x.astype(np.uint8) + 2 * self.z.astype(np.uint8)]
+        chars = np.ascontiguousarray(chars[:, ::-1])
+        if not self._num_qubits:
+            return self.size * ['']
+        return [label.decode('ascii')
+                for label in chars.view('S{}'.format(self._num_qubits))[:, 0]]
+
+    def weights(self):
+        """Return the number of qubits each Pauli acts on non-trivially.
+
+        Returns:
+            np.ndarray: the integer weights.
+        """
+        return _popcount(self._z | self._x)
+
+    def dot(self, other):
+        r"""Return the products of the Paulis with those of another table.
+
+        The products are taken row by row, and a single Pauli multiplies all
+        the rows. The product of :math:`P_1 = (-i)^{z_1 \cdot x_1} Z^{z_1} X^{x_1}`
+        and :math:`P_2` is the phase times the Pauli of vectors
+        :math:`z_1 \oplus z_2` and :math:`x_1 \oplus x_2`.
+
+        Args:
+            other (PauliTable or Pauli or str): the right-hand Paulis.
+
+        Returns:
+            tuple(PauliTable, np.ndarray): the product Paulis and their
+            phases, 1, -1, 1j or -1j.
+
+        Raises:
+            QiskitError: if the tables do not have the same number of qubits,
+                or of Paulis.
+        """
+        other = self._other_table(other)
+        z = self._z ^ other._z
+        x = self._x ^ other._x
+        return PauliTable._from_words(z, x, self._num_qubits), _product_phases(self, other, z, x)
+
+    def commutes(self, other):
+        """Return whether the Paulis commute with other Paulis.
+
+        Args:
+            other (PauliTable or Pauli or str): a single Pauli, or a table of
+                Paulis.
+
+        Returns:
+            np.ndarray: for a single Pauli, a boolean array of shape
+            ``(size,)``. For a table, a boolean matrix of shape
+            ``(size, other.size)`` of whether each pair of Paulis commutes.
+
+        Raises:
+            QiskitError: if the Paulis do not have the same number of qubits.
+        """
+        other = PauliTable(other)
+        if other._num_qubits != self._num_qubits:
+            raise QiskitError('Paulis must have the same number of qubits.')
+        if other.size == 1:
+            return _commute(self._z, self._x, other._z, other._x)
+        return _commute(self._z[:, np.newaxis], self._x[:, np.newaxis],
+                        other._z[np.newaxis], other._x[np.newaxis])
+
+    def qubit_wise_commutes(self, other):
+        """Return whether the Paulis commute with other Paulis on every qubit.
+
+        Args:
+            other (PauliTable or Pauli or str): a single Pauli, or a table of
+                Paulis.
+
+        Returns:
+            np.ndarray: as for :meth:`commutes`.
+
+        Raises:
+            QiskitError: if the Paulis do not have the same number of qubits.
+        """
+        other = PauliTable(other)
+        if other._num_qubits != self._num_qubits:
+            raise QiskitError('Paulis must have the same number of qubits.')
+        if other.size == 1:
+            return _qubit_wise_commute(self._z, self._x, other._z, other._x)
+        return _qubit_wise_commute(self._z[:, np.newaxis], self._x[:, np.newaxis],
+                                   other._z[np.newaxis], other._x[np.newaxis])
+
+    def group_qubit_wise_commuting(self):
+        """Partition the table into sets of qubit-wise commuting Paulis.
+
+        The Paulis are assigned greedily, from the highest weight, to the
+        first set they commute with on every qubit. All the Paulis of a set
+        can be measured in the same single-qubit bases.
+
+        Returns:
+            list[np.ndarray]: the indices of the Paulis of each set.
+        """
+        order = np.argsort(-self.weights(), kind='stable')
+        num_words = self._z.shape[1]
+        group_z = np.zeros((0, num_words), dtype=np.uint64)
+        group_x = np.zeros((0, num_words), dtype=np.uint64)
+        groups = []
+        for index in order:
+            z, x = self._z[index], self._x[index]
+            # A set holds on each qubit the only non-identity Pauli of its members
+            fits = ~np.any(((group_z | group_x) & (z | x)) &
+                           ((group_z ^ z) | (group_x ^ x)), axis=1)
+            if np.any(fits):
+                group = np.argmax(fits)
+                group_z[group] |= z
+                group_x[group] |= x
+                groups[group].append(index)
+            else:
+                group_z = np.vstack([group_z, z])
+                group_x = np.vstack([group_x, x])
+                groups.append([index])
+        return [np.sort(group) for group in groups]
+
+    def _other_table(self, other):
+        """Return other as a table that can be multiplied with this one."""
+        other = PauliTable(other)
+        if other._num_qubits != self._num_qubits:
+            raise QiskitError('Paulis must have the same number of qubits.')
+        if other.size not in (1, self.size):
+            raise QiskitError('Tables must have the same size or a single Pauli.')
+        return other
+
+    def _int_vectors(self):
+        """Return the z and x vectors as integers, for at most 63 qubits."""
+        if self._num_qubits > 63:
+            raise QiskitError('Matrices are only defined for up to 63 qubits.')
+        if not self._num_qubits:
+            return np.zeros(self.size, dtype=np.int64), np.zeros(self.size, dtype=np.int64)
+        return self._z[:, 0].astype(np.int64), self._x[:, 0].astype(np.int64)
+
+
+# ASCII codes of the Pauli characters, indexed by x + 2 * z
+_LABEL_TABLE = np.frombuffer(b'IXZY', dtype=np.uint8)
+_LABEL_CHARS = np.frombuffer(b'IXYZ', dtype=np.uint8)
+
+# Powers of i
+_PHASES = np.array([1, 1j, -1, -1j])
+
+
+def _pack(bits):
+    """Pack a boolean array of shape (size, n) into (size, ceil(n / 64)) uint64 words."""
+    size, num_qubits = bits.shape
+    num_words = max(1, -(-num_qubits // 64))
+    padded = np.zeros((size, 64 * num_words), dtype=bool)
+    padded[:, :num_qubits] = bits
+    return np.packbits(padded, axis=1, bitorder='little').view('<u8').astype(np.uint64)
+
+
+def _unpack(words, num_qubits):
+    """Unpack uint64 words into a boolean array of num_qubits columns."""
+    words = np.ascontiguousarray(words, dtype='<u8')
+    bits = np.unpackbits(words.view(np.uint8), axis=-1, bitorder='little')
+    return bits[..., :num_qubits].astype(bool)
+
+
+def _popcount(words):
+    """Return the number of set bits of uint64 words, summed over the last axis."""
+    words = words - ((words >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    words = (words & np.uint64(0x3333333333333333)) + \
+        ((words >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    words = (words + (words >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    words = (words * np.uint64(0x0101010101010101)) >> np.uint64(56)
+    return np.sum(words, axis=-1, dtype=np.int64)
+
+
+def _commute(z1, x1, z2, x2):
+    """Return whether Paulis commute, from their packed vectors."""
+    return _popcount((x1 & z2) ^ (z1 & x2)) % 2 == 0
+
+
+def _qubit_wise_commute(z1, x1, z2, x2):
+    """Return whether Paulis commute on every qubit, from their packed vectors."""
+    return ~np.any((z1 | x1) & (z2 | x2) & ((z1 ^ z2) | (x1 ^ x2)), axis=-1)
+
+
+def _product_phases(table1, table2, z, x):
+    """Return the phases of the products of two tables with vectors z and x."""
+    # With P(z, x) = i^(z.x) X^x Z^z, the product is
+    # i^(z1.x1 + z2.x2 - z.x) (-1)^(z1.x2) P(z, x)
+    exponent = _popcount(table1._z & table1._x) + _popcount(table2._z & table2._x) \
+        + 2 * _popcount(table1._z & table2._x) - _popcount(z & x)
+    return _PHASES[exponent % 4]
@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Operator as a sum of Pauli operators.
+"""
+
+from numbers import Number
+
+import numpy as np
+from scipy import sparse
+
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.operators.symplectic.pauli_table import PauliTable, _popcount, _PHASES
+
+
+class SparsePauliOp:
+    """Operator as a linear combination of N-qubit Pauli operators.
+
+    The Paulis are held in a :class:`PauliTable` and their coefficients in
+    a complex array, so sums of many terms are multiplied, simplified and
+    evaluated with vectorized operations. For example::
+
+        from qiskit.quantum_info import SparsePauliOp, Statevector
+
+        hamiltonian = SparsePauliOp.from_list([('ZZ', 1), ('XI', 0.5), ('IX', 0.5)])
+        square = hamiltonian.dot(hamiltonian)
+        state = Statevector.from_label('+0')
+        print(hamiltonian.expectation_value(state))
+    """
+
+    def __init__(self, data, coeffs=None):
+        """Initialize the operator.
+
+        Args:
+            data (SparsePauliOp or PauliTable or Pauli or str or list): the
+                Paulis of the terms, as accepted by :class:`PauliTable`.
+            coeffs (array_like or None): the complex coefficients of the
+                terms [Default: all ones].
+
+        Raises:
+            QiskitError: if the number of coefficients is not the number of
+                Paulis.
+        """
+        if isinstance(data, SparsePauliOp):
+            table = data.table
+            if coeffs is None:
+                coeffs = data.coeffs
+        else:
+            table = PauliTable(data)
+        if coeffs is None:
+            coeffs = np.ones(table.size, dtype=complex)
+        coeffs = np.array(coeffs, dtype=complex).reshape(-1)
+        if coeffs.shape != (table.size,):
+            raise QiskitError('The number of coefficients must be the number of Paulis.')
+        self._table = table
+        self._coeffs = coeffs
+
+    @classmethod
+    def from_list(cls, obj):
+        """Return the operator of a list of (label, coefficient) pairs.
+
+        Args:
+            obj (list[tuple]): the Pauli labels and coefficients of the terms.
+
+        Returns:
+            SparsePauliOp: the operator.
+        """
+        labels, coeffs = zip(*obj)
+        return cls(PauliTable.from_labels(labels), coeffs)
+
+    @classmethod
+    def _from_table(cls, table, coeffs):
+        """Return an operator without copying or checking the table and coefficients."""
+        op = cls.__new__(cls)
+        op._table = table
+        op._coeffs = coeffs
+        return op
+
+    @property
+    def table(self):
+        """PauliTable: the Paulis of the terms."""
+        return self._table
+
+    @property
+    def coeffs(self):
+        """np.ndarray: the coefficients of the terms."""
+        return self._coeffs
+
+    @property
+    def num_qubits(self):
+        """int: the number of qubits of the operator."""
+        return self._table.num_qubits
+
+    @property
+    def size(self):
+        """int: the number of terms of the operator."""
+        return self._table.size
+
+    def __len__(self):
+        """Return the number of terms of the operator."""
+        return self.size
+
+    def __getitem__(self, key):
+        """Return the operator of some of the terms."""
+        if isinstance(key, (int, np.integer)):
+            key = [key]
+        return SparsePauliOp._from_table(self._table[key], self._coeffs[key])
+
+    def __eq__(self, other):
+        """Return True if the operators have the same terms in the same order."""
+        if not isinstance(other, SparsePauliOp):
+            return False
+        return self._table == other._table and np.allclose(self._coeffs, other._coeffs)
+
+    def __repr__(self):
+        return 'SparsePauliOp({}, coeffs={})'.format(
+            self._table.to_labels(), self._coeffs.tolist())
+
+    def to_list(self):
+        """Return the terms as a list of (label, coefficient) pairs."""
+        return list(zip(self._table.to_labels(), self._coeffs.tolist()))
+
+    def adjoint(self):
+        """Return the adjoint of the operator."""
+        return SparsePauliOp._from_table(self._table, self._coeffs.conj())
+
+    def dot(self, other):
+        """Return the operator product self * other.
+
+        All the pairs of terms are multiplied together, and the result is
+        simplified.
+
+        Args:
+            other (SparsePauliOp): an operator.
+
+        Returns:
+            SparsePauliOp: the product operator.
+
+        Raises:
+            QiskitError: if the operators do not have the same number of qubits.
+        """
+        other = SparsePauliOp(other)
+        if other.num_qubits != self.num_qubits:
+            raise QiskitError('Operators must have the same number of qubits.')
+        left = np.repeat(np.arange(self.size), other.size)
+        right = np.tile(np.arange(other.size), self.size)
+        table, phases = self._table[left].dot(other._table[right])
+        coeffs = phases * self._coeffs[left] * other._coeffs[right]
+        return SparsePauliOp._from_table(table, coeffs).simplify()
+
+    def compose(self, other):
+        """Return the operator product other * self.
+
+        Args:
+            other (SparsePauliOp): an operator.
+
+        Returns:
+            SparsePauliOp: the product operator.
+        """
+        return SparsePauliOp(other).dot(self)
+
+    def add(self, other):
+        """Return the operator self + other, without simplifying it.
+
+        Args:
+            other (SparsePauliOp): an operator.
+
+        Returns:
+            SparsePauliOp: the sum operator.
+
+        Raises:
+            QiskitError: if the operators do not have the same number of qubits.
+        """
+        other = SparsePauliOp(other)
+        if other.num_qubits != self.num_qubits:
+            raise QiskitError('Operators must have the same number of qubits.')
+        table = PauliTable._from_words(np.vstack([self._table._z, other._table._z]),
+                                       np.vstack([self._table._x, other._table._x]),
+                                       self.num_qubits)
+        return SparsePauliOp._from_table(table, np.hstack([self._coeffs, other._coeffs]))
+
+    def subtract(self, other):
+        """Return the operator self - other, without simplifying it."""
+        return self.add(SparsePauliOp(other).multiply(-1))
+
+    def multiply(self, other):
+        """Return the operator other * self.
+
+        Args:
+            other (complex): a complex number.
+
+        Returns:
+            SparsePauliOp: the scaled operator.
+
+        Raises:
+            QiskitError: if other is not a number.
+        """
+        if not isinstance(other, Number):
+            raise QiskitError("other is not a number")
+        return SparsePauliOp._from_table(self._table, other * self._coeffs)
+
+    def simplify(self, atol=1e-12):
+        """Return the operator with the terms of equal Paulis added together.
+
+        Args:
+            atol (float): terms whose coefficient is not larger than atol in
+                absolute value are removed [Default: 1e-12].
+
+        Returns:
+            SparsePauliOp: the simplified operator, with its Paulis sorted by
+            their packed vectors. An operator without any term left has a
+            single identity term of coefficient 0.
+        """
+        num_words = self._table._z.shape[1]
+        words, inverse = np.unique(np.hstack([self._table._z, self._table._x]), axis=0,
+                                   return_inverse=True)
+        coeffs = np.bincount(inverse, weights=self._coeffs.real, minlength=len(words)) + \
+            1j * np.bincount(inverse, weights=self._coeffs.imag, minlength=len(words))
+        keep = np.abs(coeffs) > atol
+        if not np.any(keep):
+            words = np.zeros((1, 2 * num_words), dtype=np.uint64)
+            coeffs = np.zeros(1, dtype=complex)
+            keep = [0]
+        table = PauliTable._from_words(np.ascontiguousarray(words[keep, :num_words]),
+                                       np.ascontiguousarray(words[keep, num_words:]),
+                                       self.num_qubits)
+        return SparsePauliOp._from_table(table, coeffs[keep])
+
+    def group_qubit_wise_commuting(self):
+        """Partition the terms into operators of qubit-wise commuting Paulis.
+
+        Returns:
+            list[SparsePauliOp]: the operators of the sets of terms found by
+            :meth:`PauliTable.group_qubit_wise_commuting`.
+        """
+        return [self[group] for group in self._table.group_qubit_wise_commuting()]
+
+    def to_spmatrix(self):
+        """Return the operator as a sparse matrix.
+
+        Returns:
+            scipy.sparse.csr_matrix: the matrix of the operator.
+
+        Raises:
+            QiskitError: if the operator acts on more than 63 qubits.
+        """
+        dim = 2 ** self.num_qubits
+        rows = np.arange(dim, dtype=np.int64)
+        data = []
+        columns = []
+        for x_vector, z_vectors, coeffs in self._terms_by_x():
+            # Row r of the Paulis with vector x has its entry in column r ^ x
+            data.append(_signed_sums(np.ones(dim), z_vectors, coeffs))
+            columns.append(rows ^ x_vector)
+        # Order the entries by row
+        data = np.transpose(data).reshape(-1)
+        columns = np.transpose(columns).reshape(-1)
+        indptr = np.arange(0, len(data) + 1, len(data) // dim)
+        matrix = sparse.csr_matrix((data, columns, indptr), shape=(dim, dim))
+        matrix.sort_indices()
+        return matrix
+
+    def to_matrix(self):
+        """Return the operator as a dense matrix."""
+        return self.to_spmatrix().toarray()
+
+    def to_operator(self):
+        """Convert to an Operator object."""
+        from qiskit.quantum_info.operators.operator import Operator
+        return Operator(self.to_matrix())
+
+    def expectation_value(self, state):
+        """Return the expectation value of the operator in a pure state.
+
+        The terms are grouped by their x vector: each group costs one
+        product of the statevector with its flipped amplitudes, and the
+        signs of the z vectors are summed with a fast Walsh-Hadamard
+        transform when the group has many terms.
+
+        Args:
+            state (Statevector or array_like): an N-qubit statevector.
+
+        Returns:
+            complex: the expectation value.
+
+        Raises:
+            QiskitError: if the state is not a statevector of the number of
+                qubits of the operator.
+        """
+        if hasattr(state, 'dims'):
+            if set(state.dims()) != {2} or len(state.dims()) != self.num_qubits:
+                raise QiskitError('State is not a statevector of {} qubits.'.format(
+                    self.num_qubits))
+            state = state.data
+        state = np.asarray(state, dtype=complex)
+        dim = 2 ** self.num_qubits
+        if state.shape != (dim,):
+            raise QiskitError('State is not a statevector of {} qubits.'.format(
+                self.num_qubits))
+        value = 0
+        for x_vector, z_vectors, coeffs in self._terms_by_x():
+            product = state.conj() * _flip_bits(state, x_vector, self.num_qubits)
+            value += np.sum(_signed_sums(product, z_vectors, coeffs, transpose=True))
+        return complex(value)
+
+    def _terms_by_x(self):
+        """Yield the x vector of each group of terms and their z vectors and coefficients.
+
+        The coefficients include the phases of the Paulis.
+        """
+        z_vectors, x_vectors = self._table._int_vectors()
+        phases = _PHASES[(-_popcount(self._table._z & self._table._x)) % 4]
+        coeffs = phases * self._coeffs
+        order = np.argsort(x_vectors, kind='stable')
+        x_sorted = x_vectors[order]
+        starts = np.flatnonzero(np.r_[True, x_sorted[1:] != x_sorted[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+        for start, end in zip(starts, ends):
+            terms = order[start:end]
+            yield int(x_sorted[start]), z_vectors[terms], coeffs[terms]
+
+    # Overloads
+    def __matmul__(self, other):
+        return self.compose(other)
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __sub__(self, other):
+        return self.subtract(other)
+
+    def __mul__(self, other):
+        return self.multiply(other)
+
+    def __rmul__(self, other):
+        return self.multiply(other)
+
+    def __neg__(self):
+        return self.multiply(-1)
+
+
+def _signed_sums(values, z_vectors, coeffs, transpose=False):
+    r"""Return the sums of values signed by the Z parts of Paulis.
+
+    For a vector of :math:`2^n` values and Paulis of vectors :math:`z_k`
+    and coefficients :math:`c_k`, return the vector of
+    :math:`\sum_k c_k (-1)^{r \cdot z_k}` over the indices :math:`r`,
+    times the values. With ``transpose``, return instead the vector of
+    :math:`c_k \sum_r (-1)^{r \cdot z_k} v_r`. Many terms are summed with a
+    fast Walsh-Hadamard transform.
+    """
+    dim = len(values)
+    num_qubits = dim.bit_length() - 1
+    if len(z_vectors) > num_qubits:
+        if transpose:
+            return coeffs * _walsh_hadamard(values)[z_vectors]
+        weights = np.zeros(dim, dtype=complex)
+        np.add.at(weights, z_vectors, coeffs)
+        return values * _walsh_hadamard(weights)
+    if transpose:
+        return np.array([coeff * np.dot(_z_signs(z_vector, num_qubits), values)
+                         for z_vector, coeff in zip(z_vectors, coeffs)])
+    signs = np.zeros(dim, dtype=complex)
+    for z_vector, coeff in zip(z_vectors, coeffs):
+        signs += coeff * _z_signs(z_vector, num_qubits)
+    return values * signs
+
+
+def _z_signs(z_vector, num_qubits):
+    r"""Return the signs :math:`(-1)^{r \cdot z}` over the indices :math:`r`."""
+    signs = np.empty(2 ** num_qubits)
+    signs[0] = 1
+    # The signs of the indices with highest set bit q are those of the
+    # lower indices, negated if bit q of z is set
+    for qubit in range(num_qubits):
+        size = 2 ** qubit
+        if (z_vector >> qubit) & 1:
+            np.negative(signs[:size], out=signs[size:2 * size])
+        else:
+            signs[size:2 * size] = signs[:size]
+    return signs
+
+
+def _flip_bits(values, x_vector, num_qubits):
+    """Return the values permuted by the flip of the set bits of their index."""
+    axes = [num_qubits - 1 - qubit for qubit in range(num_qubits) if (x_vector >> qubit) & 1]
+    return np.flip(np.reshape(values, num_qubits * (2,)), axes).reshape(-1)
+
+
+def _walsh_hadamard(values):
+    r"""Return :math:`\sum_r (-1)^{r \cdot z} v_r` for all the indices z."""
+    values = np.array(values, dtype=complex)
+    dim = len(values)
+    half = 1
+    while half < dim:
+        pairs = values.reshape(-1, 2, half)
+        first = pairs[:, 0].copy()
+        pairs[:, 0] += pairs[:, 1]
+        pairs[:, 1] = first - pairs[:, 1]
+        half *= 2
+    return values
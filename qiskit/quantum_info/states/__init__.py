@@ -16,5 +16,7 @@
 
 from .statevector import Statevector
 from .densitymatrix import DensityMatrix
+from .statevector_batch import StatevectorBatch
+from .densitymatrix_batch import DensityMatrixBatch
 from .states import basis_state, projector, purity
-from .counts import state_to_counts
+from .counts import state_to_counts, probabilities_to_counts
@@ -71,3 +71,36 @@ def state_to_counts(vec, eps=1e-15, density_matrix_diag=False):
             counts[format(kk, str_format)] = val
 
     return counts
+
+
+def probabilities_to_counts(probs, eps=1e-15):
+    """Converts the rows of an array of probabilities to counts.
+
+    The outcomes of all the rows are selected and formatted at once, so
+    this is faster than calling :func:`state_to_counts` on every row.
+
+    Parameters:
+        probs (ndarray): a ``(size, dim)`` array of probabilities.
+        eps (float): Optional tolerance.
+
+    Returns:
+        list[dict]: Counts of probabilities of every row.
+
+    Raises:
+        QiskitError: Invalid input array.
+    """
+    probs = np.asarray(probs)
+    qubit_dims = np.log2(probs.shape[1])
+    if qubit_dims % 1:
+        raise QiskitError("Input array is not a valid array of probabilities for qubits.")
+    str_format = '0{}b'.format(int(qubit_dims))
+    rows, outcomes = np.nonzero(probs > eps)
+    # Format each distinct outcome once
+    unique, inverse = np.unique(outcomes, return_inverse=True)
+    labels = [format(outcome, str_format) for outcome in unique.tolist()]
+    keys = [labels[index] for index in inverse.tolist()]
+    values = probs[rows, outcomes].tolist()
+    # Split the outcomes at the start of each row
+    bounds = np.searchsorted(rows, np.arange(probs.shape[0] + 1)).tolist()
+    return [dict(zip(keys[start:stop], values[start:stop]))
+            for start, stop in zip(bounds[:-1], bounds[1:])]
@@ -373,6 +373,19 @@ class DensityMatrix(QuantumState):
         vec._append_instruction(obj, qargs=qargs)
         return vec
 
+    def probabilities(self, qargs=None):
+        """Return the measurement probabilities of the state.
+
+        Args:
+            qargs (list or None): the subsystems to measure, the first one
+                being the least significant, or None for all of them.
+
+        Returns:
+            np.ndarray: the probabilities of the measurement outcomes.
+        """
+        probs = np.real(self.data.diagonal())
+        return self._subsystem_probabilities(probs, qargs)
+
     def to_counts(self):
         """Returns the density matrix as a counts dict
         of probabilities.
@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Batch of density matrices quantum state class.
+"""
+
+from numbers import Number
+
+import numpy as np
+
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.instruction import Instruction
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.states.quantum_state import QuantumState
+from qiskit.quantum_info.states.statevector import Statevector
+from qiskit.quantum_info.states.densitymatrix import DensityMatrix
+from qiskit.quantum_info.states.statevector_batch import StatevectorBatch
+from qiskit.quantum_info.states.counts import probabilities_to_counts
+from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.evolution import instruction_operations, evolve_tensor
+from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
+from qiskit.quantum_info.operators.channel.superop import SuperOp
+
+
+class DensityMatrixBatch(QuantumState):
+    """Batch of density matrices of the same subsystem dimensions.
+
+    The density matrices are stored in a ``(size, dim, dim)`` array, and the
+    evolution and measurement methods act on all of them with single array
+    operations. Indexing a batch with an integer returns a
+    :class:`DensityMatrix`, and with a slice or an array returns a batch.
+    """
+
+    def __init__(self, data, dims=None):
+        """Initialize a batch of density matrices.
+
+        Args:
+            data (DensityMatrixBatch or StatevectorBatch or DensityMatrix or
+                Statevector or list or np.ndarray): a batch, a single state, a
+                list of states or of matrices, or a ``(size, dim, dim)`` array
+                of matrices. Statevectors and ``(size, dim)`` arrays of vectors
+                are converted to their projectors.
+            dims (tuple or None): the subsystem dimensions of the states.
+
+        Raises:
+            QiskitError: if the input is not a batch of square matrices of the
+                same dimensions.
+        """
+        if isinstance(data, (DensityMatrixBatch, StatevectorBatch)):
+            mats = data.data
+            if dims is None:
+                dims = data.dims()
+        elif isinstance(data, (DensityMatrix, Statevector)):
+            if dims is None:
+                dims = data.dims()
+            mats = DensityMatrix(data).data[None]
+        elif isinstance(data, list) and data and isinstance(data[0], (DensityMatrix,
+                                                                      Statevector)):
+            if dims is None:
+                dims = data[0].dims()
+            if any(state.dims() != data[0].dims() for state in data):
+                raise QiskitError("States have different dimensions.")
+            mats = np.array([DensityMatrix(state).data for state in data])
+        elif isinstance(data, (list, np.ndarray)):
+            mats = np.array(data, dtype=complex)
+        else:
+            raise QiskitError("Invalid input data format for DensityMatrixBatch")
+        if mats.ndim == 2:
+            # Convert a batch of statevectors to their projectors
+            mats = np.einsum('bi,bj->bij', mats, np.conj(mats))
+        if mats.ndim != 3 or mats.shape[1] != mats.shape[2]:
+            raise QiskitError(
+                "Invalid DensityMatrixBatch input: not a batch of square matrices.")
+        subsystem_dims = self._automatic_dims(dims, mats.shape[1])
+        super().__init__('DensityMatrixBatch', mats, subsystem_dims)
+
+    def __len__(self):
+        return self._data.shape[0]
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return DensityMatrix(self._data[key], dims=self.dims())
+        return DensityMatrixBatch(self._data[key], dims=self.dims())
+
+    def __iter__(self):
+        for mat in self._data:
+            yield DensityMatrix(mat, dims=self.dims())
+
+    def is_valid(self, atol=None, rtol=None):
+        """Return True if all the states have trace 1 and are positive semidefinite."""
+        if atol is None:
+            atol = self._atol
+        if rtol is None:
+            rtol = self._rtol
+        # Check trace == 1
+        if not np.allclose(self.trace(), 1, rtol=rtol, atol=atol):
+            return False
+        # Check Hermitian
+        if not np.allclose(self.data, np.conj(np.transpose(self.data, (0, 2, 1))),
+                           rtol=rtol, atol=atol):
+            return False
+        # Check positive semidefinite
+        return bool(np.all(np.linalg.eigvalsh(self.data) >= -atol))
+
+    def to_operator(self):
+        """Return the list of operators of the density matrices."""
+        return [state.to_operator() for state in self]
+
+    def conjugate(self):
+        """Return the conjugate of the density matrices."""
+        return DensityMatrixBatch(np.conj(self.data), dims=self.dims())
+
+    def trace(self):
+        """Return the array of traces of the density matrices."""
+        return np.trace(self.data, axis1=1, axis2=2)
+
+    def purity(self):
+        """Return the array of purities of the states."""
+        return np.einsum('bij,bji->b', self.data, self.data)
+
+    def tensor(self, other):
+        """Return the tensor product states self ⊗ other.
+
+        Args:
+            other (DensityMatrixBatch or DensityMatrix): a batch of the same
+                size, or a state which is tensored with every state of the
+                batch.
+
+        Returns:
+            DensityMatrixBatch: the tensor product states self ⊗ other.
+
+        Raises:
+            QiskitError: if other is not a quantum state, or a batch of a
+            different size.
+        """
+        other = self._batch_operand(other)
+        dims = other.dims() + self.dims()
+        return DensityMatrixBatch(_kron(self._data, other._data), dims)
+
+    def expand(self, other):
+        """Return the tensor product states other ⊗ self.
+
+        Args:
+            other (DensityMatrixBatch or DensityMatrix): a batch of the same
+                size, or a state which is tensored with every state of the
+                batch.
+
+        Returns:
+            DensityMatrixBatch: the tensor product states other ⊗ self.
+
+        Raises:
+            QiskitError: if other is not a quantum state, or a batch of a
+            different size.
+        """
+        other = self._batch_operand(other)
+        dims = self.dims() + other.dims()
+        return DensityMatrixBatch(_kron(other._data, self._data), dims)
+
+    def add(self, other):
+        """Return the linear combinations self + other.
+
+        Args:
+            other (DensityMatrixBatch or DensityMatrix): a batch of the same
+                size, or a state which is added to every state of the batch.
+
+        Returns:
+            DensityMatrixBatch: the linear combinations self + other.
+
+        Raises:
+            QiskitError: if other is not a quantum state, or has
+            incompatible dimensions.
+        """
+        other = self._batch_operand(other)
+        if self.dim != other.dim:
+            raise QiskitError("other DensityMatrix has different dimensions.")
+        return DensityMatrixBatch(self.data + other.data, self.dims())
+
+    def subtract(self, other):
+        """Return the linear combinations self - other.
+
+        Args:
+            other (DensityMatrixBatch or DensityMatrix): a batch of the same
+                size, or a state which is subtracted from every state of the
+                batch.
+
+        Returns:
+            DensityMatrixBatch: the linear combinations self - other.
+
+        Raises:
+            QiskitError: if other is not a quantum state, or has
+            incompatible dimensions.
+        """
+        other = self._batch_operand(other)
+        if self.dim != other.dim:
+            raise QiskitError("other DensityMatrix has different dimensions.")
+        return DensityMatrixBatch(self.data - other.data, self.dims())
+
+    def multiply(self, other):
+        """Return the density matrices multiplied by a number.
+
+        Args:
+            other (complex): a complex number.
+
+        Returns:
+            DensityMatrixBatch: the density matrices multiplied by other.
+
+        Raises:
+            QiskitError: if other is not a valid complex number.
+        """
+        if not isinstance(other, Number):
+            raise QiskitError("other is not a number")
+        return DensityMatrixBatch(other * self.data, self.dims())
+
+    def evolve(self, other, qargs=None):
+        """Evolve all the states of the batch by the same operator or channel.
+
+        Args:
+            other (Operator or QuantumChannel
+                   or Instruction or Circuit): The operator to evolve by.
+            qargs (list): a list of subsystem positions to apply the operator
+                on.
+
+        Returns:
+            DensityMatrixBatch: the output states.
+
+        Raises:
+            QiskitError: if the operator dimension does not match the
+            specified subsystem dimensions.
+        """
+        # Evolution by a circuit or instruction
+        if isinstance(other, (QuantumCircuit, Instruction)):
+            return self._evolve_instruction(other, qargs=qargs)
+
+        # Evolution by a QuantumChannel
+        if hasattr(other, 'to_quantumchannel'):
+            other = other.to_quantumchannel()
+        if isinstance(other, QuantumChannel):
+            return self._evolve_superop(SuperOp(other), qargs=qargs)
+
+        # Unitary evolution by an Operator
+        return self._evolve_operator(other, qargs=qargs)
+
+    def probabilities(self, qargs=None):
+        """Return the measurement probabilities of every state.
+
+        Args:
+            qargs (list or None): the subsystems to measure, the first one
+                being the least significant, or None for all of them.
+
+        Returns:
+            np.ndarray: a ``(size, dim)`` array of the probabilities of the
+            measurement outcomes of each state.
+        """
+        probs = np.real(np.diagonal(self.data, axis1=1, axis2=2))
+        return self._subsystem_probabilities(probs, qargs)
+
+    def to_counts(self):
+        """Returns the density matrices as counts dicts of probabilities.
+
+        Returns:
+            list[dict]: the counts of probabilities of every state.
+        """
+        return probabilities_to_counts(self.probabilities(), self._atol)
+
+    @property
+    def _shape(self):
+        """Return the tensor shape of the batch"""
+        return (len(self),) + 2 * tuple(reversed(self.dims()))
+
+    def _batch_operand(self, other):
+        """Return other as a batch which broadcasts against self."""
+        if not isinstance(other, DensityMatrixBatch):
+            other = DensityMatrixBatch(DensityMatrix(other))
+        if len(other) not in (1, len(self)):
+            raise QiskitError("other DensityMatrixBatch has a different size.")
+        return other
+
+    def _evolve_operator(self, other, qargs=None):
+        """Evolve the density matrices by an operator"""
+        if not isinstance(other, Operator):
+            other = Operator(other)
+        if qargs is None:
+            # Evolution of all the matrices by broadcast matrix products
+            if self._dim != other._input_dim:
+                raise QiskitError(
+                    "Operator input dimension is not equal to density matrix dimension."
+                )
+            mats = np.matmul(np.matmul(other.data, self.data), other.adjoint().data)
+            return DensityMatrixBatch(mats, dims=other.output_dims())
+        if self.dims(qargs) != other.input_dims():
+            raise QiskitError(
+                "Operator input dimensions are not equal to statevector subsystem dimensions."
+            )
+        # The batch is the first index of the tensor so the contracted
+        # indices are shifted by one
+        num_indices = len(self.dims())
+        indices = [num_indices - 1 - qubit for qubit in qargs]
+        if other.input_dims() == other.output_dims():
+            # Matrix products on the row indices and the column indices
+            operations = [(other.data, [index + 1 for index in indices]),
+                          (np.conj(other.data),
+                           [index + 1 + num_indices for index in indices])]
+            data = evolve_tensor(self._data, self._shape, operations)
+            return DensityMatrixBatch(data, dims=self.dims())
+        tensor = np.reshape(self.data, self._shape)
+        mat = np.reshape(other.data, other._shape)
+        tensor = Operator._einsum_matmul(tensor, mat, indices, shift=1)
+        adj = other.adjoint()
+        mat_adj = np.reshape(adj.data, adj._shape)
+        tensor = Operator._einsum_matmul(tensor, mat_adj, indices, 1 + num_indices, True)
+        new_dims = list(self.dims())
+        for i, qubit in enumerate(qargs):
+            new_dims[qubit] = other._output_dims[i]
+        new_dim = np.product(new_dims)
+        return DensityMatrixBatch(np.reshape(tensor, (len(self), new_dim, new_dim)),
+                                  dims=new_dims)
+
+    def _evolve_superop(self, chan, qargs=None):
+        """Evolve the density matrices by a superoperator"""
+        if qargs is None:
+            if self._dim != chan._input_dim:
+                raise QiskitError(
+                    "Operator input dimension is not equal to density matrix dimension."
+                )
+            # The rows of the transposed matrices are the column-major
+            # vectorizations the SuperOp acts on
+            size = len(self)
+            vecs = np.reshape(np.transpose(self.data, (0, 2, 1)), (size, -1))
+            mats = np.reshape(np.dot(vecs, chan.data.T),
+                              (size, chan._output_dim, chan._output_dim))
+            return DensityMatrixBatch(np.transpose(mats, (0, 2, 1)), dims=chan.output_dims())
+        if self.dims(qargs) != chan.input_dims():
+            raise QiskitError(
+                "Operator input dimensions are not equal to statevector subsystem dimensions."
+            )
+        tensor = np.reshape(self.data, self._shape)
+        mat = np.reshape(chan.data, chan._shape)
+        num_indices = len(self.dims())
+        indices = [num_indices - 1 - qubit for qubit in qargs
+                   ] + [2 * num_indices - 1 - qubit for qubit in qargs]
+        tensor = Operator._einsum_matmul(tensor, mat, indices, shift=1)
+        new_dims = list(self.dims())
+        for i, qubit in enumerate(qargs):
+            new_dims[qubit] = chan._output_dims[i]
+        new_dim = np.product(new_dims)
+        return DensityMatrixBatch(np.reshape(tensor, (len(self), new_dim, new_dim)),
+                                  dims=new_dims)
+
+    def _evolve_instruction(self, obj, qargs=None):
+        """Return a new batch by applying an instruction."""
+        if isinstance(obj, QuantumCircuit):
+            obj = obj.to_instruction()
+        try:
+            operations = instruction_operations(obj, qargs)
+        except QiskitError:
+            # The instruction contains non-unitary instructions, which are
+            # applied one at a time as superoperators
+            return self._evolve_definition(obj, qargs)
+        # Apply the fused matrices to the row indices and their conjugates
+        # to the column indices, which follow the batch index of the tensor
+        num_indices = len(self.dims())
+        tensor_ops = []
+        for mat, op_qargs in operations:
+            tensor_ops.append((mat, [num_indices - qubit for qubit in op_qargs]))
+            tensor_ops.append((np.conj(mat), [2 * num_indices - qubit for qubit in op_qargs]))
+        return DensityMatrixBatch(evolve_tensor(self._data, self._shape, tensor_ops),
+                                  dims=self.dims())
+
+    def _evolve_definition(self, obj, qargs=None):
+        """Return a new batch by applying the instructions of a definition."""
+        mat = Operator._instruction_to_matrix(obj)
+        if mat is not None:
+            return self._evolve_operator(Operator(mat), qargs=qargs)
+        chan = SuperOp._instruction_to_superop(obj)
+        if chan is not None:
+            return self._evolve_superop(chan, qargs=qargs)
+        if obj.definition is None:
+            raise QiskitError('Cannot apply Instruction: {}'.format(obj.name))
+        batch = self
+        for instr, qregs, cregs in obj.definition:
+            if cregs:
+                raise QiskitError(
+                    'Cannot apply instruction with classical registers: {}'.format(
+                        instr.name))
+            # Get the integer position of the flat register
+            if qargs is None:
+                new_qargs = [tup.index for tup in qregs]
+            else:
+                new_qargs = [qargs[tup.index] for tup in qregs]
+            batch = batch._evolve_instruction(instr, qargs=new_qargs)
+        return batch
+
+
+def _kron(data1, data2):
+    """Return the Kronecker products of the matrices of two arrays."""
+    size = max(data1.shape[0], data2.shape[0])
+    dim = data1.shape[1] * data2.shape[1]
+    data = np.einsum('...ij,...kl->...ikjl', data1, data2)
+    return np.reshape(data, (size, dim, dim))
@@ -21,6 +21,9 @@ A collection of useful quantum information functions for states.
 import numpy as np
 import scipy.linalg as la
 
+from qiskit.quantum_info.states.statevector_batch import StatevectorBatch
+from qiskit.quantum_info.states.densitymatrix_batch import DensityMatrixBatch
+
 
 def state_fidelity(state1, state2):
     """Return the state fidelity between two quantum states.
@@ -38,13 +41,24 @@ def state_fidelity(state1, state2):
 
         F(|psi1>, |psi2>) = |<psi1|psi2>|^2
 
+    If either input is a :class:`~qiskit.quantum_info.StatevectorBatch` or a
+    :class:`~qiskit.quantum_info.DensityMatrixBatch` the fidelities of all
+    the pairs of states are computed together and returned as an array. A
+    single state is compared to every state of a batch.
+
     Args:
-        state1 (array_like): a quantum state vector or density matrix.
-        state2 (array_like): a quantum state vector or density matrix.
+        state1 (array_like or StatevectorBatch or DensityMatrixBatch): a
+            quantum state vector or density matrix, or a batch of them.
+        state2 (array_like or StatevectorBatch or DensityMatrixBatch): a
+            quantum state vector or density matrix, or a batch of them.
 
     Returns:
         array_like: The state fidelity F(state1, state2).
     """
+    if isinstance(state1, (StatevectorBatch, DensityMatrixBatch)) or isinstance(
+            state2, (StatevectorBatch, DensityMatrixBatch)):
+        return _batch_state_fidelity(state1, state2)
+
     # convert input to numpy arrays
     state1 = np.array(state1)
     state2 = np.array(state2)
@@ -65,6 +79,38 @@ def state_fidelity(state1, state2):
     return np.linalg.norm(s1sq.dot(s2sq), ord='nuc') ** 2
 
 
+def _batch_state_fidelity(state1, state2):
+    """Return the array of state fidelities of batches of states."""
+    data1 = _batch_data(state1)
+    data2 = _batch_data(state2)
+    vector1 = isinstance(state1, StatevectorBatch) or data1.ndim == 2
+    vector2 = isinstance(state2, StatevectorBatch) or data2.ndim == 2
+    if vector1 and vector2:
+        return np.abs(np.einsum('...i,...i->...', data2.conj(), data1)) ** 2
+    if vector1 or vector2:
+        vecs, mats = (data1, data2) if vector1 else (data2, data1)
+        return np.abs(np.einsum('...i,...ij,...j->...', vecs.conj(), mats, vecs))
+    s1sq = _batch_sqrtm(data1)
+    s2sq = _batch_sqrtm(data2)
+    # The nuclear norm is the sum of the singular values
+    return np.sum(np.linalg.svd(np.matmul(s1sq, s2sq), compute_uv=False), axis=-1) ** 2
+
+
+def _batch_data(state):
+    """Return the data of a batch, or of a state with a batch index of size 1."""
+    if isinstance(state, (StatevectorBatch, DensityMatrixBatch)):
+        return state.data
+    if hasattr(state, 'data'):
+        state = state.data
+    return np.array(state)[None]
+
+
+def _batch_sqrtm(mats):
+    """Apply the square root to the singular values of a batch of matrices."""
+    unitary1, singular_values, unitary2 = np.linalg.svd(mats)
+    return np.matmul(unitary1 * np.sqrt(singular_values)[..., None, :], unitary2)
+
+
 def _funm_svd(matrix, func):
     """Apply real scalar function to singular values of a matrix.
 
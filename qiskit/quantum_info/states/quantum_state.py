@@ -258,6 +258,35 @@ class QuantumState(ABC):
         """
         pass
 
+    def _subsystem_probabilities(self, probs, qargs=None):
+        """Return the marginal probabilities of subsystems.
+
+        Args:
+            probs (np.ndarray): the probabilities of all the outcomes in the
+                last axis, with any number of leading axes.
+            qargs (list or None): the subsystems to keep, the first one being
+                the least significant, or None for all of them.
+
+        Returns:
+            np.ndarray: the marginal probabilities in the last axis.
+        """
+        if qargs is None:
+            return probs
+        lead = probs.shape[:-1]
+        num_indices = len(self.dims())
+        offset = len(lead)
+        tensor = np.reshape(probs, lead + tuple(reversed(self.dims())))
+        # Tensor axes of the kept subsystems, most significant first
+        kept = [offset + num_indices - 1 - qubit for qubit in reversed(qargs)]
+        summed = tuple(axis for axis in range(offset, offset + num_indices)
+                       if axis not in kept)
+        tensor = np.sum(tensor, axis=summed)
+        # The kept axes remain in increasing order after the sum
+        remaining = sorted(kept)
+        tensor = np.transpose(
+            tensor, list(range(offset)) + [offset + remaining.index(axis) for axis in kept])
+        return np.reshape(tensor, lead + (-1,))
+
     @classmethod
     def _automatic_dims(cls, dims, size):
         """Check if input dimension corresponds to qubit subsystems."""
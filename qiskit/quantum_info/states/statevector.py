@@ -27,6 +27,7 @@ from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.states.quantum_state import QuantumState
 from qiskit.quantum_info.states.counts import state_to_counts
 from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.evolution import instruction_operations, evolve_tensor
 from qiskit.quantum_info.operators.predicates import matrix_equal
 
 
@@ -254,6 +255,19 @@ class Statevector(QuantumState):
         return matrix_equal(self.data, other.data, ignore_phase=True,
                             rtol=rtol, atol=atol)
 
+    def probabilities(self, qargs=None):
+        """Return the measurement probabilities of the state.
+
+        Args:
+            qargs (list or None): the subsystems to measure, the first one
+                being the least significant, or None for all of them.
+
+        Returns:
+            np.ndarray: the probabilities of the measurement outcomes.
+        """
+        probs = self.data.real ** 2 + self.data.imag ** 2
+        return self._subsystem_probabilities(probs, qargs)
+
     def to_counts(self):
         """Returns the statevector as a counts dict
         of probabilities.
@@ -356,28 +370,11 @@ class Statevector(QuantumState):
 
     def _append_instruction(self, obj, qargs=None):
         """Update the current Statevector by applying an instruction."""
-        mat = Operator._instruction_to_matrix(obj)
-        if mat is not None:
-            # Perform the composition and inplace update the current state
-            # of the operator
-            self._data = self.evolve(mat, qargs=qargs).data
-        else:
-            # If the instruction doesn't have a matrix defined we use its
-            # circuit decomposition definition if it exists, otherwise we
-            # cannot compose this gate and raise an error.
-            if obj.definition is None:
-                raise QiskitError('Cannot apply Instruction: {}'.format(obj.name))
-            for instr, qregs, cregs in obj.definition:
-                if cregs:
-                    raise QiskitError(
-                        'Cannot apply instruction with classical registers: {}'.format(
-                            instr.name))
-                # Get the integer position of the flat register
-                if qargs is None:
-                    new_qargs = [tup.index for tup in qregs]
-                else:
-                    new_qargs = [qargs[tup.index] for tup in qregs]
-                self._append_instruction(instr, qargs=new_qargs)
+        # Apply the fused matrices of the instruction and of its definition
+        num_indices = len(self.dims())
+        operations = [(mat, [num_indices - 1 - qubit for qubit in op_qargs])
+                      for mat, op_qargs in instruction_operations(obj, qargs)]
+        self._data = evolve_tensor(self._data, self._shape, operations)
 
     def _evolve_instruction(self, obj, qargs=None):
         """Return a new statevector by applying an instruction."""
@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Batch of statevectors quantum state class.
+"""
+
+from numbers import Number
+
+import numpy as np
+
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.instruction import Instruction
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info.states.quantum_state import QuantumState
+from qiskit.quantum_info.states.statevector import Statevector
+from qiskit.quantum_info.states.counts import probabilities_to_counts
+from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.evolution import instruction_operations, evolve_tensor
+
+
+class StatevectorBatch(QuantumState):
+    """Batch of statevectors of the same subsystem dimensions.
+
+    The statevectors are stored as the rows of a ``(size, dim)`` array, and
+    the evolution, comparison and measurement methods act on all of them
+    with single array operations. Indexing a batch with an integer returns a
+    :class:`Statevector`, and with a slice or an array returns a batch.
+    """
+
+    def __init__(self, data, dims=None):
+        """Initialize a batch of statevectors.
+
+        Args:
+            data (StatevectorBatch or Statevector or list or np.ndarray): a
+                batch, a single statevector, a list of statevectors or of
+                vectors, or a ``(size, dim)`` array of vectors.
+            dims (tuple or None): the subsystem dimensions of the states.
+
+        Raises:
+            QiskitError: if the input is not a batch of vectors of the same
+                dimensions.
+        """
+        if isinstance(data, StatevectorBatch):
+            # Shallow copy constructor
+            vecs = data.data
+            if dims is None:
+                dims = data.dims()
+        elif isinstance(data, Statevector):
+            vecs = np.reshape(data.data, (1, data.dim))
+            if dims is None:
+                dims = data.dims()
+        elif isinstance(data, list) and data and isinstance(data[0], Statevector):
+            if dims is None:
+                dims = data[0].dims()
+            if any(state.dims() != data[0].dims() for state in data):
+                raise QiskitError("Statevectors have different dimensions.")
+            vecs = np.array([state.data for state in data], dtype=complex)
+        elif isinstance(data, (list, np.ndarray)):
+            vecs = np.array(data, dtype=complex)
+        else:
+            raise QiskitError("Invalid input data format for StatevectorBatch")
+        if vecs.ndim != 2:
+            raise QiskitError("Invalid input: not a batch of vectors.")
+        subsystem_dims = self._automatic_dims(dims, vecs.shape[1])
+        super().__init__('StatevectorBatch', vecs, subsystem_dims)
+
+    def __len__(self):
+        return self._data.shape[0]
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return Statevector(self._data[key], dims=self.dims())
+        return StatevectorBatch(self._data[key], dims=self.dims())
+
+    def __iter__(self):
+        for vec in self._data:
+            yield Statevector(vec, dims=self.dims())
+
+    def is_valid(self, atol=None, rtol=None):
+        """Return True if all the statevectors have norm 1."""
+        if atol is None:
+            atol = self._atol
+        if rtol is None:
+            rtol = self._rtol
+        norms = np.linalg.norm(self.data, axis=1)
+        return np.allclose(norms, 1, rtol=rtol, atol=atol)
+
+    def to_operator(self):
+        """Return the list of rank-1 projector operators of the states."""
+        return [state.to_operator() for state in self]
+
+    def conjugate(self):
+        """Return the conjugate of the states."""
+        return StatevectorBatch(np.conj(self.data), dims=self.dims())
+
+    def trace(self):
+        """Return the array of traces of the states as density matrices."""
+        return np.sum(np.abs(self.data) ** 2, axis=1)
+
+    def purity(self):
+        """Return the array of purities of the states."""
+        return self.trace() ** 2
+
+    def tensor(self, other):
+        """Return the tensor product states self ⊗ other.
+
+        Args:
+            other (StatevectorBatch or Statevector): a batch of the same size,
+                or a state which is tensored with every state of the batch.
+
+        Returns:
+            StatevectorBatch: the tensor product states self ⊗ other.
+
+        Raises:
+            QiskitError: if other is not a quantum state, or a batch of a
+            different size.
+        """
+        other = self._batch_operand(other)
+        dims = other.dims() + self.dims()
+        return StatevectorBatch(_kron(self._data, other._data), dims)
+
+    def expand(self, other):
+        """Return the tensor product states other ⊗ self.
+
+        Args:
+            other (StatevectorBatch or Statevector): a batch of the same size,
+                or a state which is tensored with every state of the batch.
+
+        Returns:
+            StatevectorBatch: the tensor product states other ⊗ self.
+
+        Raises:
+            QiskitError: if other is not a quantum state, or a batch of a
+            different size.
+        """
+        other = self._batch_operand(other)
+        dims = self.dims() + other.dims()
+        return StatevectorBatch(_kron(other._data, self._data), dims)
+
+    def add(self, other):
+        """Return the linear combinations self + other.
+
+        Args:
+            other (StatevectorBatch or Statevector): a batch of the same size,
+                or a state which is added to every state of the batch.
+
+        Returns:
+            StatevectorBatch: the linear combinations self + other.
+
+        Raises:
+            QiskitError: if other is not a quantum state, or has
+            incompatible dimensions.
+        """
+        other = self._batch_operand(other)
+        if self.dim != other.dim:
+            raise QiskitError("other Statevector has different dimensions.")
+        return StatevectorBatch(self.data + other.data, self.dims())
+
+    def subtract(self, other):
+        """Return the linear combinations self - other.
+
+        Args:
+            other (StatevectorBatch or Statevector): a batch of the same size,
+                or a state which is subtracted from every state of the batch.
+
+        Returns:
+            StatevectorBatch: the linear combinations self - other.
+
+        Raises:
+            QiskitError: if other is not a quantum state, or has
+            incompatible dimensions.
+        """
+        other = self._batch_operand(other)
+        if self.dim != other.dim:
+            raise QiskitError("other Statevector has different dimensions.")
+        return StatevectorBatch(self.data - other.data, self.dims())
+
+    def multiply(self, other):
+        """Return the states multiplied by a number.
+
+        Args:
+            other (complex): a complex number.
+
+        Returns:
+            StatevectorBatch: the states multiplied by other.
+
+        Raises:
+            QiskitError: if other is not a valid complex number.
+        """
+        if not isinstance(other, Number):
+            raise QiskitError("other is not a number")
+        return StatevectorBatch(other * self.data, self.dims())
+
+    def evolve(self, other, qargs=None):
+        """Evolve all the states of the batch by the same operator.
+
+        Args:
+            other (Operator or QuantumCircuit or Instruction): The operator
+                to evolve by.
+            qargs (list): a list of subsystem positions to apply the operator
+                on.
+
+        Returns:
+            StatevectorBatch: the output states.
+
+        Raises:
+            QiskitError: if the operator dimension does not match the
+            specified subsystem dimensions.
+        """
+        # Evolution by a circuit or instruction
+        if isinstance(other, (QuantumCircuit, Instruction)):
+            return self._evolve_instruction(other, qargs=qargs)
+        # Evolution by an Operator
+        if not isinstance(other, Operator):
+            other = Operator(other)
+        if qargs is None:
+            # Evolution of all the vectors by a single matrix product
+            if self._dim != other._input_dim:
+                raise QiskitError(
+                    "Operator input dimension is not equal to statevector dimension."
+                )
+            return StatevectorBatch(np.dot(self.data, other.data.T),
+                                    dims=other.output_dims())
+        if self.dims(qargs) != other.input_dims():
+            raise QiskitError(
+                "Operator input dimensions are not equal to statevector subsystem dimensions."
+            )
+        # The batch is the first index of the tensor so the contracted
+        # indices are shifted by one
+        num_indices = len(self.dims())
+        indices = [num_indices - 1 - qubit for qubit in qargs]
+        if other.input_dims() == other.output_dims():
+            # A single matrix product on the whole batch
+            data = evolve_tensor(self._data, self._shape,
+                                 [(other.data, [index + 1 for index in indices])])
+            return StatevectorBatch(data, dims=self.dims())
+        tensor = np.reshape(self.data, self._shape)
+        mat = np.reshape(other.data, other._shape)
+        tensor = Operator._einsum_matmul(tensor, mat, indices, shift=1)
+        new_dims = list(self.dims())
+        for i, qubit in enumerate(qargs):
+            new_dims[qubit] = other._output_dims[i]
+        return StatevectorBatch(np.reshape(tensor, (len(self), np.product(new_dims))),
+                                dims=new_dims)
+
+    def equiv(self, other, rtol=None, atol=None):
+        """Return which statevectors are equivalent up to global phase.
+
+        Args:
+            other (StatevectorBatch or Statevector): a batch of the same size,
+                or a state which is compared to every state of the batch.
+            rtol (float): relative tolerance value for comparison.
+            atol (float): absolute tolerance value for comparison.
+
+        Returns:
+            np.ndarray: a boolean array which is True for the states that are
+            equivalent up to global phase.
+        """
+        try:
+            other = self._batch_operand(other)
+        except QiskitError:
+            return np.zeros(len(self), dtype=bool)
+        if self.dim != other.dim:
+            return np.zeros(len(self), dtype=bool)
+        if atol is None:
+            atol = self._atol
+        if rtol is None:
+            rtol = self._rtol
+        # Remove the phase of the first non-zero amplitude of every vector
+        # as in matrix_equal
+        vecs1 = _remove_phase(self.data, atol)
+        vecs2 = _remove_phase(other.data, atol)
+        return np.all(np.isclose(vecs1, vecs2, rtol=rtol, atol=atol), axis=1)
+
+    def probabilities(self, qargs=None):
+        """Return the measurement probabilities of every state.
+
+        Args:
+            qargs (list or None): the subsystems to measure, the first one
+                being the least significant, or None for all of them.
+
+        Returns:
+            np.ndarray: a ``(size, dim)`` array of the probabilities of the
+            measurement outcomes of each state.
+        """
+        probs = self.data.real ** 2 + self.data.imag ** 2
+        return self._subsystem_probabilities(probs, qargs)
+
+    def to_counts(self):
+        """Returns the statevectors as counts dicts of probabilities.
+
+        Returns:
+            list[dict]: the counts of probabilities of every state.
+        """
+        return probabilities_to_counts(self.probabilities(), self._atol)
+
+    @classmethod
+    def from_labels(cls, labels):
+        """Return the batch of tensor products of Pauli eigenstates of labels.
+
+        Args:
+            labels (list[str]): eigenstate ket labels 0,1,+,-,r,l of the
+                same length.
+
+        Returns:
+            StatevectorBatch: the states of the labels.
+
+        Raises:
+            QiskitError: if a label contains invalid characters, or the
+            labels have different lengths.
+        """
+        return StatevectorBatch([Statevector.from_label(label) for label in labels])
+
+    @property
+    def _shape(self):
+        """Return the tensor shape of the batch"""
+        return (len(self),) + tuple(reversed(self.dims()))
+
+    def _batch_operand(self, other):
+        """Return other as a batch which broadcasts against self."""
+        if not isinstance(other, StatevectorBatch):
+            other = StatevectorBatch(Statevector(other))
+        if len(other) not in (1, len(self)):
+            raise QiskitError("other StatevectorBatch has a different size.")
+        return other
+
+    def _evolve_instruction(self, obj, qargs=None):
+        """Return a new batch by applying an instruction."""
+        if isinstance(obj, QuantumCircuit):
+            obj = obj.to_instruction()
+        # The fused matrices of the instruction act on the state indices,
+        # which follow the batch index of the tensor
+        num_indices = len(self.dims())
+        operations = [(mat, [num_indices - qubit for qubit in op_qargs])
+                      for mat, op_qargs in instruction_operations(obj, qargs)]
+        return StatevectorBatch(evolve_tensor(self._data, self._shape, operations),
+                                dims=self.dims())
+
+
+def _kron(data1, data2):
+    """Return the Kronecker products of the rows of two arrays."""
+    size = max(data1.shape[0], data2.shape[0])
+    data = np.einsum('...i,...j->...ij', data1, data2)
+    return np.reshape(data, (size, -1))
+
+
+def _remove_phase(vecs, atol):
+    """Return vectors multiplied by the conjugate phase of their first non-zero entry."""
+    first = np.argmax(np.abs(vecs) > atol, axis=1)
+    phases = np.angle(vecs[np.arange(vecs.shape[0]), first])
+    return np.exp(-1j * phases)[:, None] * vecs
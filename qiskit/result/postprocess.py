@@ -14,6 +14,8 @@
 
 """Post-processing of raw result."""
 
+from itertools import chain
+
 import numpy as np
 
 from qiskit.exceptions import QiskitError
@@ -79,8 +81,12 @@ def format_counts_memory(shot_memory, header=None):
 def _list_to_complex_array(complex_list):
     """Convert nested list of shape (..., 2) to complex numpy array with shape (...)
 
+    The ``[re, im]`` pairs are reinterpreted as complex numbers with a view of
+    a float array, so a numpy array of shape (..., 2) is converted without any
+    Python loop or copy.
+
     Args:
-        complex_list (list): List to convert.
+        complex_list (list or np.ndarray): List to convert.
 
     Returns:
         np.ndarray: Complex numpy array
@@ -88,11 +94,42 @@ def _list_to_complex_array(complex_list):
     Raises:
         QiskitError: If inner most array of input nested list is not of length 2.
     """
-    arr = np.asarray(complex_list, dtype=np.complex_)
-    if not arr.shape[-1] == 2:
+    arr = _nested_list_to_array(complex_list)
+    if not arr.ndim or not arr.shape[-1] == 2:
         raise QiskitError('Inner most nested list is not of length 2.')
 
-    return arr[..., 0] + 1j*arr[..., 1]
+    if np.iscomplexobj(arr):
+        return arr[..., 0] + 1j*arr[..., 1]
+    arr = np.ascontiguousarray(arr, dtype=np.float_)
+    return arr.view(np.complex_)[..., 0]
+
+
+def _nested_list_to_array(data):
+    """Convert a nested list of real numbers to a numpy array.
+
+    The nested lists are flattened into a single float buffer, which is much
+    faster than letting numpy discover the nesting of large lists. Other
+    inputs, and lists which are ragged or hold other types, go through
+    ``np.asarray``.
+    """
+    if not isinstance(data, list):
+        return np.asarray(data)
+    shape = []
+    inner = data
+    while isinstance(inner, list) and inner:
+        shape.append(len(inner))
+        inner = inner[0]
+    flat = data
+    for _ in range(len(shape) - 1):
+        flat = chain.from_iterable(flat)
+    flat = iter(flat)
+    try:
+        arr = np.fromiter(flat, dtype=np.float_, count=int(np.prod(shape)))
+    except (TypeError, ValueError):
+        return np.asarray(data)
+    if next(flat, None) is not None:
+        return np.asarray(data)
+    return arr.reshape(shape)
 
 
 def format_level_0_memory(memory):
@@ -177,35 +214,39 @@ def format_statevector(vec, decimals=None):
     """Format statevector coming from the backend to present to the Qiskit user.
 
     Args:
-        vec (list): a list of [re, im] complex numbers.
+        vec (list or np.ndarray): a list of [re, im] complex numbers, or an
+            array of complex numbers.
         decimals (int): the number of decimals in the statevector.
             If None, no rounding is done.
 
     Returns:
         list[complex]: a list of python complex numbers.
     """
-    num_basis = len(vec)
-    vec_complex = np.zeros(num_basis, dtype=complex)
-    for i in range(num_basis):
-        vec_complex[i] = vec[i][0] + 1j * vec[i][1]
-    if decimals:
-        vec_complex = np.around(vec_complex, decimals=decimals)
-    return vec_complex
+    return _format_complex_array(vec, 1, decimals)
 
 
 def format_unitary(mat, decimals=None):
     """Format unitary coming from the backend to present to the Qiskit user.
 
     Args:
-        mat (list[list]): a list of list of [re, im] complex numbers
+        mat (list[list] or np.ndarray): a list of list of [re, im] complex
+            numbers, or a matrix of complex numbers.
         decimals (int): the number of decimals in the statevector.
             If None, no rounding is done.
 
     Returns:
         list[list[complex]]: a matrix of complex numbers
     """
-    num_basis = len(mat)
-    mat_complex = np.zeros((num_basis, num_basis), dtype=complex)
-    for i, vec in enumerate(mat):
-        mat_complex[i] = format_statevector(vec, decimals)
-    return mat_complex
+    return _format_complex_array(mat, 2, decimals)
+
+
+def _format_complex_array(data, ndim, decimals=None):
+    """Convert [re, im] pairs or complex numbers to a complex array of ndim dimensions."""
+    arr = _nested_list_to_array(data)
+    if arr.ndim == ndim and np.iscomplexobj(arr):
+        arr = arr.astype(np.complex_, copy=False)
+    else:
+        arr = _list_to_complex_array(arr)
+    if decimals:
+        arr = np.around(arr, decimals=decimals)
+    return arr
@@ -14,8 +14,8 @@
 
 """Utility functions for working with Results."""
 
-from functools import reduce
-from re import match
+import numpy as np
+
 from qiskit.validation.base import Obj
 from qiskit.exceptions import QiskitError
 
@@ -38,15 +38,21 @@ def marginal_counts(result, indices=None):
         QiskitError: in case of invalid indices to marginalize over.
     """
     from qiskit.result.result import Result
-    from qiskit.result.postprocess import _bin_to_hex
     if isinstance(result, Result):
-        for i, experiment_result in enumerate(result.results):
-            counts = result.get_counts(i)
-            new_counts = _marginalize(counts, indices)
-            new_counts_hex = {}
-            for k, v in new_counts.items():
-                new_counts_hex[_bin_to_hex(k)] = v
-            experiment_result.data.counts = Obj(**new_counts_hex)
+        if indices is None:
+            return result
+        for experiment_result in result.results:
+            # The counts keys are hexadecimal: marginalize them as integers
+            counts = experiment_result.data.counts.to_dict()
+            try:
+                num_clbits = experiment_result.header.memory_slots
+            except AttributeError:
+                num_clbits = max(int(key, 16) for key in counts).bit_length()
+            _check_indices(indices, num_clbits)
+            new_counts = _marginalize_int(((int(key, 16), val) for key, val in counts.items()),
+                                          indices, num_clbits)
+            experiment_result.data.counts = Obj(**{hex(key): val
+                                                   for key, val in new_counts.items()})
             experiment_result.header.memory_slots = len(indices)
     else:
         counts = result
@@ -76,37 +82,62 @@ def _marginalize(counts, indices=None):
             ret[key] = val
         return ret
 
+    _check_indices(indices, num_clbits)
+
+    # Parse the bitstrings once and marginalize them as integers
+    new_counts = _marginalize_int(((int(key.replace(' ', ''), 2), val)
+                                   for key, val in counts.items()),
+                                  indices, num_clbits)
+    key_format = '0{}b'.format(len(indices))
+    return {format(key, key_format): val for key, val in new_counts.items()}
+
+
+def _check_indices(indices, num_clbits):
     if not set(indices).issubset(set(range(num_clbits))):
         raise QiskitError('indices must be in range [0, {0}].'.format(num_clbits-1))
 
-    # Sort the indices to keep in decending order
-    # Since bitstrings have qubit-0 as least significant bit
-    indices = sorted(indices, reverse=True)
-
-    # Generate bitstring keys for indices to keep
-    meas_keys = count_keys(len(indices))
-
-    # Get regex match strings for suming outcomes of other qubits
-    rgx = []
-    for key in meas_keys:
-        def _helper(x, y):
-            if y in indices:
-                return key[indices.index(y)] + x
-            return '\\d' + x
-        rgx.append(reduce(_helper, range(num_clbits), ''))
-
-    # Build the return list
-    meas_counts = []
-    for m in rgx:
-        c = 0
-        for key, val in counts.items():
-            if match(m, key.replace(' ', '')):
-                c += val
-        meas_counts.append(c)
-
-    # Return as counts dict on desired indices only
-    ret = {}
-    for key, val in zip(meas_keys, meas_counts):
-        if val != 0:
-            ret[key] = val
-    return ret
+
+def _marginalize_int(counts, indices, num_clbits):
+    """Marginalize counts with integer keys over some bit positions.
+
+    Args:
+        counts (iterable): (key, value) pairs of integer outcomes and counts.
+        indices (list(int)): the bit positions to keep. The smallest one
+            becomes the least significant bit of the marginal outcomes.
+        num_clbits (int): the number of bits of the outcomes.
+
+    Returns:
+        dict[int:int]: the nonzero counts of the marginal outcomes, sorted
+        by outcome.
+    """
+    counts = list(counts)
+    if not counts:
+        return {}
+    keys, values = zip(*counts)
+    # Copy runs of consecutive bits with a single shift and mask
+    runs = []
+    position = 0
+    for index in sorted(indices):
+        if runs and runs[-1][0] + runs[-1][1] == index:
+            runs[-1][1] += 1
+        else:
+            runs.append([index, 1, position])
+        position += 1
+    if num_clbits < 63:
+        keys = np.fromiter(keys, dtype=np.int64, count=len(keys))
+        marginal_keys = _select_bits(keys, runs).tolist()
+    else:
+        marginal_keys = [_select_bits(key, runs) for key in keys]
+
+    new_counts = {}
+    for key, val in zip(marginal_keys, values):
+        new_counts[key] = new_counts.get(key, 0) + val
+    return {key: new_counts[key] for key in sorted(new_counts) if new_counts[key] != 0}
+
+
+def _select_bits(keys, runs):
+    """Gather runs of (start, length, position) bits of integer keys or arrays of keys."""
+    marginal_keys = keys & 0
+    for start, length, position in runs:
+        marginal_keys |= ((keys >> start) & ((1 << length) - 1)) << position
+    return marginal_keys
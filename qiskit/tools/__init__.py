@@ -26,6 +26,8 @@ Parallel Routines
    :toctree: ../stubs/
 
    parallel_map
+   configure_parallel_pool
+   shutdown_parallel_pool
 
 Monitoring
 ==========
@@ -57,7 +59,7 @@ Quantum Information
    is_pos_def
 """
 
-from .parallel import parallel_map
+from .parallel import parallel_map, configure_parallel_pool, shutdown_parallel_pool
 from .monitor import (job_monitor, backend_monitor, backend_overview)
 from .qi import (qft, partial_trace, vectorize, devectorize, choi_to_pauli,
                  chop, outer, entropy, shannon_entropy, concurrence,
@@ -48,11 +48,27 @@
 """
 Routines for running Python functions in parallel using process pools
 from the multiprocessing library.
+
+The worker processes are started the first time they are needed and are then
+kept alive and reused by later calls of :func:`parallel_map`, until
+:func:`shutdown_parallel_pool` is called or the interpreter exits.
+
+The task function and its extra arguments are sent to each worker only once.
+Workers keep them in a small registry keyed by a hash of their pickled
+content, and the chunks of values only carry that key.
 """
 
+import atexit
+from collections import OrderedDict
+import hashlib
+import importlib
+import math
 import os
+import pickle
 import platform
-from concurrent.futures import ProcessPoolExecutor
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 from qiskit.exceptions import QiskitError
 from qiskit.util import local_hardware_info
 from qiskit.tools.events.pubsub import Publisher
@@ -63,22 +79,200 @@ os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
 # Number of local physical cpus
 CPU_COUNT = local_hardware_info()['cpus']
 
+# Defaults set through configure_parallel_pool(). None means automatic.
+_OPTIONS = {'num_processes': None, 'chunksize': None}
+
+# The persistent worker pool, its number of processes and the pid of the
+# process that started it (a forked child must not use its parent's pool).
+_POOL = None
+_POOL_SIZE = 0
+_POOL_PID = None
+
+# Estimated wall time, in seconds, to start the pool and to send a chunk of
+# tasks to a worker and get the results back. The start cost is measured
+# every time a pool is started.
+_START_COST = 0.1
+_CHUNK_COST = 1e-3
+
+# Worker side: the (task, task_args, task_kwargs) installed in this worker,
+# by content hash, most recently used last.
+_WORKER_TASKS = OrderedDict()
+_WORKER_TASKS_SIZE = 8
+
+# Parent side: the pids of the workers known to hold each task, by content hash.
+_INSTALLED = OrderedDict()
+_INSTALLED_SIZE = 64
+
+
+def _worker_init(_=None):
+    """Prepare a worker: mark it as parallel and import qiskit before the first task."""
+    os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+    importlib.import_module('qiskit')
+    return os.getpid()
 
-def _task_wrapper(param):
-    (task, value, task_args, task_kwargs) = param
-    return task(value, *task_args, **task_kwargs)
+
+def _run_chunk(key, values, payload=None):
+    """Run the task registered under ``key`` on a chunk of values in a worker.
+
+    Args:
+        key (str): content hash of the task.
+        values (list): the values to run the task on.
+        payload (bytes): the pickled ``(task, task_args, task_kwargs)``, to
+            install the task if this worker does not hold it yet.
+
+    Returns:
+        tuple: the pid of the worker and the ``(result, wall time)`` of each
+        value, or None instead of the list if the task is not installed and
+        no payload was given.
+    """
+    os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+    job = _WORKER_TASKS.get(key)
+    if job is None:
+        if payload is None:
+            return os.getpid(), None
+        job = _WORKER_TASKS[key] = pickle.loads(payload)
+        if len(_WORKER_TASKS) > _WORKER_TASKS_SIZE:
+            _WORKER_TASKS.popitem(last=False)
+    else:
+        _WORKER_TASKS.move_to_end(key)
+
+    task, task_args, task_kwargs = job
+    results = []
+    for value in values:
+        start = time.perf_counter()
+        result = task(value, *task_args, **task_kwargs)
+        results.append((result, time.perf_counter() - start))
+    return os.getpid(), results
+
+
+def configure_parallel_pool(num_processes=None, chunksize=None):
+    """Set the defaults used by :func:`parallel_map`.
+
+    Args:
+        num_processes (int): Number of worker processes. ``None`` uses
+            ``CPU_COUNT``. A running pool of a different size is replaced
+            the next time it is used.
+        chunksize (int): Number of values sent to a worker at a time. ``None``
+            splits the values in about four chunks per worker.
+
+    Raises:
+        QiskitError: If an option is not a positive integer.
+    """
+    for name, value in (('num_processes', num_processes), ('chunksize', chunksize)):
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise QiskitError('%s must be a positive integer, not %s.' % (name, value))
+    _OPTIONS['num_processes'] = num_processes
+    _OPTIONS['chunksize'] = chunksize
+
+
+def shutdown_parallel_pool(wait=True):
+    """Shut down the worker processes kept alive by :func:`parallel_map`.
+
+    The next parallel call starts a new pool. This is also done automatically
+    when the interpreter exits.
+
+    Args:
+        wait (bool): Wait for the running tasks to finish and the workers to exit.
+    """
+    global _POOL, _POOL_SIZE  # pylint: disable=global-statement
+    pool, _POOL, _POOL_SIZE = _POOL, None, 0
+    _INSTALLED.clear()
+    if pool is not None and _POOL_PID == os.getpid():
+        pool.shutdown(wait=wait)
+
+
+atexit.register(shutdown_parallel_pool)
+
+
+def _get_pool(num_processes):
+    """Return the worker pool, starting it if it is not running with ``num_processes``."""
+    global _POOL, _POOL_SIZE, _POOL_PID, _START_COST  # pylint: disable=global-statement
+    if _POOL is not None and _POOL_PID == os.getpid() and _POOL_SIZE == num_processes:
+        return _POOL
+
+    shutdown_parallel_pool()
+    start = time.perf_counter()
+    pool = ProcessPoolExecutor(max_workers=num_processes)
+    # Start the workers and import qiskit in them up front.
+    list(pool.map(_worker_init, range(num_processes)))
+    _START_COST = time.perf_counter() - start
+    _POOL, _POOL_SIZE, _POOL_PID = pool, num_processes, os.getpid()
+    return pool
+
+
+def _pool_is_faster(task_time, num_tasks, num_processes, chunksize):
+    """Estimate whether the pool runs ``num_tasks`` tasks taking ``task_time`` each faster."""
+    num_chunks = math.ceil(num_tasks / chunksize)
+    pool_time = (task_time * math.ceil(num_tasks / num_processes)
+                 + _CHUNK_COST * math.ceil(num_chunks / num_processes))
+    if _POOL is None or _POOL_PID != os.getpid() or _POOL_SIZE != num_processes:
+        pool_time += _START_COST
+    return pool_time < task_time * num_tasks
+
+
+def _run_in_pool(task, values, task_args, task_kwargs, num_processes, chunksize, callback):
+    """Run ``task`` on ``values`` in the pool, calling ``callback(index, time)`` per task."""
+    pool = _get_pool(num_processes)
+    payload = pickle.dumps((task, task_args, task_kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+    key = hashlib.sha1(payload).hexdigest()
+    installed = _INSTALLED.pop(key, set())
+    _INSTALLED[key] = installed
+    if len(_INSTALLED) > _INSTALLED_SIZE:
+        _INSTALLED.popitem(last=False)
+
+    futures = {}
+
+    def _submit(start, with_payload):
+        future = pool.submit(_run_chunk, key, values[start:start + chunksize],
+                             payload if with_payload else None)
+        futures[future] = start
+
+    # Until every worker is known to hold the task, send it along with the
+    # first round of chunks. A worker that gets a chunk without it asks for it.
+    first_round = 0 if len(installed) >= num_processes else num_processes
+    for number, start in enumerate(range(0, len(values), chunksize)):
+        _submit(start, number < first_round)
+
+    results = [None] * len(values)
+    try:
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                start = futures.pop(future)
+                pid, chunk_results = future.result()
+                if chunk_results is None:
+                    _submit(start, True)
+                    continue
+                installed.add(pid)
+                for index, (result, elapsed) in enumerate(chunk_results, start):
+                    results[index] = result
+                    callback(index, elapsed)
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    return results
 
 
 def parallel_map(  # pylint: disable=dangerous-default-value
-        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT):
+        task, values, task_args=tuple(), task_kwargs={}, num_processes=None, chunksize=None):
     """
     Parallel execution of a mapping of `values` to the function `task`. This
     is functionally equivalent to::
 
         result = [task(value, *task_args, **task_kwargs) for value in values]
 
+    The values are sent in chunks to a pool of worker processes that is kept
+    alive between calls (see :func:`shutdown_parallel_pool`). ``task``,
+    ``task_args`` and ``task_kwargs`` are sent to each worker only once, even
+    across calls, as long as their pickled content is the same. The first value
+    is computed in the calling process; the remaining ones are only sent to
+    the pool if the time this took suggests that this is faster than
+    computing them here, including the cost of starting the pool.
+
     On Windows this function defaults to a serial implementation to avoid the
-    overhead from spawning processes in Windows.
+    overhead from spawning processes in Windows. Calls made from within a
+    worker are also serial.
 
     Args:
         task (func): Function that is to be called for each value in ``values``.
@@ -86,7 +280,11 @@ def parallel_map(  # pylint: disable=dangerous-default-value
                             function is to be evaluated.
         task_args (list): Optional additional arguments to the ``task`` function.
         task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
-        num_processes (int): Number of processes to spawn.
+        num_processes (int): Number of worker processes. Defaults to the value
+            set with :func:`configure_parallel_pool`, or ``CPU_COUNT``.
+        chunksize (int): Number of values sent to a worker at a time. Defaults
+            to the value set with :func:`configure_parallel_pool`, or about
+            four chunks per worker.
 
     Returns:
         result: The result list contains the value of
@@ -99,50 +297,69 @@ def parallel_map(  # pylint: disable=dangerous-default-value
     Events:
         terra.parallel.start: The collection of parallel tasks are about to start.
         terra.parallel.update: One of the parallel task has finished.
+        terra.parallel.task_done: One of the tasks has finished. The arguments are
+            the index of its value and its wall time in seconds.
         terra.parallel.finish: All the parallel tasks have finished.
     """
     if len(values) == 1:
         return [task(values[0], *task_args, **task_kwargs)]
 
+    values = list(values)
+    if num_processes is None:
+        num_processes = _OPTIONS['num_processes'] or CPU_COUNT
+    if chunksize is None:
+        chunksize = _OPTIONS['chunksize']
+
     Publisher().publish("terra.parallel.start", len(values))
     nfinished = [0]
 
-    def _callback(_):
+    def _callback(index, elapsed):
         nfinished[0] += 1
+        Publisher().publish("terra.parallel.task_done", index, elapsed)
         Publisher().publish("terra.parallel.done", nfinished[0])
 
-    # Run in parallel if not Win and not in parallel already
-    if platform.system() != 'Windows' and num_processes > 1 \
-       and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE':
-        os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
-        try:
-            results = []
-            with ProcessPoolExecutor(max_workers=num_processes) as executor:
-                param = map(lambda value: (task, value, task_args, task_kwargs), values)
-                future = executor.map(_task_wrapper, param)
+    def _run_here(index):
+        start = time.perf_counter()
+        result = task(values[index], *task_args, **task_kwargs)
+        elapsed = time.perf_counter() - start
+        _callback(index, elapsed)
+        return result, elapsed
 
-            results = list(future)
-            Publisher().publish("terra.parallel.done", len(results))
+    results = []
+    if values:
+        result, elapsed = _run_here(0)
+        results.append(result)
 
+    # Run the rest in parallel if not Win and not in parallel already, and
+    # if the first task took long enough for the pool to pay off.
+    remaining = values[1:]
+    chunksize = chunksize or math.ceil(len(remaining) / (4 * num_processes))
+    if remaining and platform.system() != 'Windows' and num_processes > 1 \
+            and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE' \
+            and _pool_is_faster(elapsed, len(remaining), num_processes, chunksize):
+        os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+        try:
+            results.extend(_run_in_pool(task, remaining, task_args, task_kwargs,
+                                        num_processes, chunksize,
+                                        lambda index, elapsed: _callback(index + 1, elapsed)))
         except (KeyboardInterrupt, Exception) as error:
+            os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
+            if isinstance(error, (KeyboardInterrupt, BrokenProcessPool)):
+                # The workers may be gone or still busy, start afresh next time.
+                shutdown_parallel_pool(wait=False)
             if isinstance(error, KeyboardInterrupt):
                 Publisher().publish("terra.parallel.finish")
-                os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
                 raise QiskitError('Keyboard interrupt in parallel_map.')
             # Otherwise just reset parallel flag and error
-            os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
             raise error
 
         Publisher().publish("terra.parallel.finish")
         os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
         return results
 
-    # Cannot do parallel on Windows , if another parallel_map is running in parallel,
-    # or len(values) == 1.
-    results = []
-    for _, value in enumerate(values):
-        result = task(value, *task_args, **task_kwargs)
-        results.append(result)
-        _callback(0)
+    # Cannot do parallel on Windows, if another parallel_map is running in parallel,
+    # or if the tasks are too short for the pool to pay off.
+    for index in range(1, len(values)):
+        results.append(_run_here(index)[0])
     Publisher().publish("terra.parallel.finish")
     return results
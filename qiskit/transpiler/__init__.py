@@ -36,6 +36,7 @@ Pass Managment
    PassManager
    PropertySet
    FlowController
+   PassProfile
 
 Layout and Topology
 ===================
@@ -68,6 +69,7 @@ Exceptions
 from .runningpassmanager import FlowController
 from .passmanager import PassManager
 from .propertyset import PropertySet
+from .profiling import PassProfile
 from .exceptions import TranspilerError, TranspilerAccessError
 from .fencedobjs import FencedDAGCircuit, FencedPropertySet
 from .basepasses import AnalysisPass, TransformationPass
@@ -46,8 +46,12 @@ class CouplingMap:
 
         # the coupling map graph
         self.graph = nx.DiGraph()
-        # a dict of dicts from node pairs to distances
+        # the undirected distance between each pair of physical qubits
         self._dist_matrix = None
+        # the predecessor of each physical qubit on a shortest path from another
+        self._predecessors = None
+        # whether the graph is connected, checked when the distances are used
+        self._is_connected = None
         # a sorted list of physical qubits (integers) in this coupling map
         self._qubit_list = None
         # a sorted list of physical qubits (integers) in this coupling map
@@ -85,6 +89,8 @@ class CouplingMap:
                 "The physical qubit %s is already in the coupling graph" % physical_qubit)
         self.graph.add_node(physical_qubit)
         self._dist_matrix = None  # invalidate
+        self._predecessors = None  # invalidate
+        self._is_connected = None  # invalidate
         self._qubit_list = None  # invalidate
 
     def add_edge(self, src, dst):
@@ -100,6 +106,8 @@ class CouplingMap:
             self.add_physical_qubit(dst)
         self.graph.add_edge(src, dst)
         self._dist_matrix = None  # invalidate
+        self._predecessors = None  # invalidate
+        self._is_connected = None  # invalidate
         self._is_symmetric = None  # invalidate
 
     def subgraph(self, nodelist):
@@ -132,22 +140,58 @@ class CouplingMap:
         except nx.exception.NetworkXException:
             return False
 
+    def __getstate__(self):
+        # The shortest paths are cheaper to recompute than to pickle for
+        # large devices, e.g. when sending coupling maps to parallel workers.
+        state = self.__dict__.copy()
+        state['_dist_matrix'] = None
+        state['_predecessors'] = None
+        return state
+
+    def _compute_shortest_paths(self):
+        """Compute the undirected distances and shortest paths between all pairs of nodes.
+
+        A breadth-first search is run from every node on the undirected
+        adjacency matrix of the graph. The distances are stored in
+        self._dist_matrix, with ``inf`` between disconnected nodes, and the
+        predecessor of node j on a shortest path from node i in
+        self._predecessors[i, j].
+        """
+        size = max(self.physical_qubits, default=-1) + 1
+        edges = np.array(self.get_edges(), dtype=int).reshape(-1, 2)
+        adjacency = sp.coo_matrix((np.ones(len(edges)), (edges[:, 0], edges[:, 1])),
+                                  shape=(size, size)).tocsr()
+        self._dist_matrix, self._predecessors = cs.shortest_path(
+            adjacency, directed=False, unweighted=True, return_predecessors=True)
+        # The arrays are handed out to every pass sharing this coupling map
+        self._dist_matrix.setflags(write=False)
+        self._predecessors.setflags(write=False)
+
     def _compute_distance_matrix(self):
         """Compute the full distance matrix on pairs of nodes.
 
-        The distance map self._dist_matrix is computed from the graph using
-        all_pairs_shortest_path_length.
+        Raises:
+            CouplingError: if the coupling graph is not connected.
         """
-        if not self.is_connected():
+        # The shortest paths may have been computed for a disconnected graph
+        # by shortest_undirected_path, so connectivity is checked separately
+        if self._is_connected is None:
+            self._is_connected = self.is_connected()
+        if not self._is_connected:
             raise CouplingError("coupling graph not connected")
-        lengths = nx.all_pairs_shortest_path_length(self.graph.to_undirected(as_view=True))
-        lengths = dict(lengths)
-        size = len(lengths)
-        cmap = np.zeros((size, size))
-        for idx in range(size):
-            cmap[idx, np.fromiter(lengths[idx].keys(), dtype=int)] = np.fromiter(
-                lengths[idx].values(), dtype=int)
-        self._dist_matrix = cmap
+        if self._dist_matrix is None:
+            self._compute_shortest_paths()
+
+    @property
+    def distance_matrix(self):
+        """numpy.ndarray: the undirected distance between each pair of physical
+        qubits, computed once and kept until the graph changes.
+
+        Raises:
+            CouplingError: if the coupling graph is not connected.
+        """
+        self._compute_distance_matrix()
+        return self._dist_matrix
 
     def distance(self, physical_qubit1, physical_qubit2):
         """Returns the undirected distance between physical_qubit1 and physical_qubit2.
@@ -160,15 +204,14 @@ class CouplingMap:
             int: The undirected distance
 
         Raises:
-            CouplingError: if the qubits do not exist in the CouplingMap
+            CouplingError: if the qubits do not exist in the CouplingMap, or
+                the coupling graph is not connected.
         """
-        if physical_qubit1 not in self.physical_qubits:
+        if physical_qubit1 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit1,))
-        if physical_qubit2 not in self.physical_qubits:
+        if physical_qubit2 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit2,))
-        if self._dist_matrix is None:
-            self._compute_distance_matrix()
-        return int(self._dist_matrix[physical_qubit1, physical_qubit2])
+        return int(self.distance_matrix[physical_qubit1, physical_qubit2])
 
     def shortest_undirected_path(self, physical_qubit1, physical_qubit2):
         """Returns the shortest undirected path between physical_qubit1 and physical_qubit2.
@@ -181,12 +224,20 @@ class CouplingMap:
         Raises:
             CouplingError: When there is no path between physical_qubit1, physical_qubit2.
         """
-        try:
-            return nx.shortest_path(self.graph.to_undirected(as_view=True), source=physical_qubit1,
-                                    target=physical_qubit2)
-        except nx.exception.NetworkXNoPath:
+        for physical_qubit in (physical_qubit1, physical_qubit2):
+            if physical_qubit not in self.graph:
+                raise CouplingError("%s not in coupling graph" % (physical_qubit,))
+        if self._predecessors is None:
+            self._compute_shortest_paths()
+        if np.isinf(self._dist_matrix[physical_qubit1, physical_qubit2]):
             raise CouplingError(
                 "Nodes %s and %s are not connected" % (str(physical_qubit1), str(physical_qubit2)))
+        # Walk the shortest path tree rooted at physical_qubit2.
+        next_hop = self._predecessors[physical_qubit2]
+        path = [physical_qubit1]
+        while path[-1] != physical_qubit2:
+            path.append(int(next_hop[path[-1]]))
+        return path
 
     @property
     def is_symmetric(self):
@@ -14,14 +14,44 @@
 
 """Analysis pass to find commutation relations between DAG nodes."""
 
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from numbers import Number
 import numpy as np
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.quantum_info.operators import Operator
+from qiskit.extensions.standard import (IdGate, XGate, YGate, ZGate, RXGate, RYGate, RZGate,
+                                        U1Gate, SGate, SdgGate, TGate, TdgGate, CnotGate,
+                                        CyGate, CzGate, CHGate, CrzGate, Cu1Gate, Cu3Gate,
+                                        ToffoliGate, FredkinGate, RZZGate, RXXGate)
 
 _CUTOFF_PRECISION = 1E-10
 
+# For each standard gate, the Pauli bases (if any) in which it is block diagonal
+# on each of its qubits. Two gates commute if, on every qubit they share, they
+# are block diagonal in a common basis: for example, a cx and an rz commute on
+# the control of the cx, and a cx and an rx commute on its target.
+_GATE_BASES = {
+    XGate: ('x',), RXGate: ('x',),
+    YGate: ('y',), RYGate: ('y',),
+    ZGate: ('z',), RZGate: ('z',), U1Gate: ('z',),
+    SGate: ('z',), SdgGate: ('z',), TGate: ('z',), TdgGate: ('z',),
+    CnotGate: ('z', 'x'), CyGate: ('z', 'y'), CzGate: ('z', 'z'),
+    CHGate: ('z', None), Cu3Gate: ('z', None),
+    CrzGate: ('z', 'z'), Cu1Gate: ('z', 'z'), RZZGate: ('z', 'z'), RXXGate: ('x', 'x'),
+    ToffoliGate: ('z', 'z', 'x'), FredkinGate: ('z', None, None),
+}
+
+# Instructions that never commute.
+_NON_COMMUTING = frozenset(["barrier", "snapshot", "measure", "reset", "copy"])
+
+# Results of the matrix check, by gate types, parameters and relative qubits.
+_COMMUTATION_CACHE = OrderedDict()
+_COMMUTATION_CACHE_SIZE = 10000
+
+# Only gates of the classes defined in this package are cached.
+_STANDARD_GATES_MODULE = 'qiskit.extensions.standard.'
+
 
 class CommutationAnalysis(AnalysisPass):
     """Analysis pass to find commutation relations between DAG nodes.
@@ -30,8 +60,9 @@ class CommutationAnalysis(AnalysisPass):
     the commutation relations on a given wire, all the gates on a wire
     are grouped into a set of gates that commute.
 
-    TODO: the current pass determines commutativity through matrix multiplication.
-    A rule-based analysis would be potentially faster, but more limited.
+    Commutation between standard gates is determined by rules. Other gates
+    are compared by matrix multiplication, and the result is cached by gate
+    type, parameters and relative qubits.
     """
 
     def __init__(self):
@@ -69,13 +100,13 @@ class CommutationAnalysis(AnalysisPass):
         for wire in dag.wires:
             wire_name = "{0}[{1}]".format(str(wire.register.name), str(wire.index))
 
+            current_comm_set = self.property_set['commutation_set'][wire_name]
             for current_gate in dag.nodes_on_wire(wire):
 
-                current_comm_set = self.property_set['commutation_set'][wire_name]
                 if not current_comm_set:
                     current_comm_set.append([current_gate])
 
-                if current_gate not in current_comm_set[-1]:
+                else:
                     prev_gate = current_comm_set[-1][-1]
                     does_commute = False
                     try:
@@ -93,12 +124,16 @@ class CommutationAnalysis(AnalysisPass):
 
 
 def _commute(node1, node2):
+    """Return whether two op nodes commute.
 
+    Directives, measurements, conditional and parameterized operations are
+    considered not to commute with anything. Otherwise, the rules of
+    ``_GATE_BASES`` are tried first and the operators are compared last.
+    """
     if node1.type != "op" or node2.type != "op":
         return False
 
-    if any([nd.name in {"barrier", "snapshot", "measure", "reset", "copy"}
-            for nd in [node1, node2]]):
+    if node1.name in _NON_COMMUTING or node2.name in _NON_COMMUTING:
         return False
 
     if node1.condition or node2.condition:
@@ -107,17 +142,84 @@ def _commute(node1, node2):
     if node1.op.is_parameterized() or node2.op.is_parameterized():
         return False
 
-    qarg = list(set(node1.qargs + node2.qargs))
-    qbit_num = len(qarg)
+    commute = _commute_by_rules(node1.op, node1.qargs, node2.op, node2.qargs)
+    if commute is not None:
+        return commute
+
+    # Number the qubits by first appearance, so the key does not depend on
+    # which qubits the gates act on.
+    qarg = list(OrderedDict.fromkeys(node1.qargs + node2.qargs))
+    qarg1 = tuple(qarg.index(q) for q in node1.qargs)
+    qarg2 = tuple(qarg.index(q) for q in node2.qargs)
+
+    key = _cache_key(node1.op, qarg1, node2.op, qarg2)
+    if key is None:
+        return _commute_by_matrix(node1.op, qarg1, node2.op, qarg2, len(qarg))
+
+    if_commute = _COMMUTATION_CACHE.get(key)
+    if if_commute is None:
+        if_commute = _commute_by_matrix(node1.op, qarg1, node2.op, qarg2, len(qarg))
+        _COMMUTATION_CACHE[key] = if_commute
+        if len(_COMMUTATION_CACHE) > _COMMUTATION_CACHE_SIZE:
+            _COMMUTATION_CACHE.popitem(last=False)
+    else:
+        _COMMUTATION_CACHE.move_to_end(key)
+    return if_commute
 
-    qarg1 = [qarg.index(q) for q in node1.qargs]
-    qarg2 = [qarg.index(q) for q in node2.qargs]
 
-    id_op = Operator(np.eye(2 ** qbit_num))
+def _commute_by_rules(op1, qargs1, op2, qargs2):
+    """Decide commutation from the gates and qubits alone.
 
-    op12 = id_op.compose(node1.op, qargs=qarg1).compose(node2.op, qargs=qarg2)
-    op21 = id_op.compose(node2.op, qargs=qarg2).compose(node1.op, qargs=qarg1)
+    Returns:
+        bool or None: True if the gates commute, None if the rules cannot tell.
+    """
+    shared = set(qargs1).intersection(qargs2)
+    if not shared:
+        return True
 
-    if_commute = (op12 == op21)
+    if isinstance(op1, IdGate) or isinstance(op2, IdGate):
+        return True
 
-    return if_commute
+    bases1 = _GATE_BASES.get(type(op1))
+    bases2 = _GATE_BASES.get(type(op2))
+    if bases1 is not None and bases2 is not None:
+        if all(bases1[qargs1.index(qubit)] is not None
+               and bases1[qargs1.index(qubit)] == bases2[qargs2.index(qubit)]
+               for qubit in shared):
+            return True
+
+    return None
+
+
+def _cache_key(op1, qarg1, op2, qarg2):
+    """Return the key of the commutation cache, or None if the result cannot be cached.
+
+    Gates are identified by type, name and parameters, so only the standard
+    gates, whose matrix is fixed by these, are cached. Other gates, such as
+    plain ``Gate`` and ``ControlledGate`` objects whose meaning is given by
+    their definition, and gates with non-numeric parameters are not cached.
+    """
+    key = []
+    for op, qarg in ((op1, qarg1), (op2, qarg2)):
+        if not type(op).__module__.startswith(_STANDARD_GATES_MODULE):
+            return None
+        params = []
+        for param in op.params:
+            if not isinstance(param, Number):
+                try:
+                    param = complex(param)
+                except TypeError:
+                    return None
+            params.append(param)
+        key.append((type(op), op.name, tuple(params), qarg))
+    return tuple(key)
+
+
+def _commute_by_matrix(op1, qarg1, op2, qarg2, qbit_num):
+    """Compare the products of two operations in both orders."""
+    id_op = Operator(np.eye(2 ** qbit_num))
+
+    op12 = id_op.compose(op1, qargs=list(qarg1)).compose(op2, qargs=list(qarg2))
+    op21 = id_op.compose(op2, qargs=list(qarg2)).compose(op1, qargs=list(qarg1))
+
+    return op12 == op21
@@ -63,8 +63,7 @@ class BasicSwap(TransformationPass):
         trivial_layout = Layout.generate_trivial_layout(canonical_register)
         current_layout = trivial_layout.copy()
 
-        for layer in dag.serial_layers():
-            subdag = layer['graph']
+        for subdag in dag.serial_layers():
 
             for gate in subdag.twoQ_gates():
                 physical_q0 = current_layout[gate.qargs[0]]
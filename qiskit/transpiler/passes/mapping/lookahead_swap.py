@@ -201,7 +201,7 @@ def _map_free_gates(layout, gates, coupling_map):
         # Gates without a partition (barrier, snapshot, save, load, noise) may
         # still have associated qubits. Look for them in the qargs.
         if not gate['partition']:
-            qubits = [n for n in gate['graph'].nodes() if n.type == 'op'][0].qargs
+            qubits = gate.op_nodes()[0].qargs
 
             if not qubits:
                 continue
@@ -271,7 +271,7 @@ def _copy_circuit_metadata(source_dag, coupling_map):
 
 def _transform_gate_for_layout(gate, layout):
     """Return op implementing a virtual gate on given layout."""
-    mapped_op_node = deepcopy([n for n in gate['graph'].nodes() if n.type == 'op'][0])
+    mapped_op_node = deepcopy(gate.op_nodes()[0])
 
     device_qreg = QuantumRegister(len(layout.get_physical_bits()), 'q')
     mapped_qargs = [device_qreg[layout[a]] for a in mapped_op_node.qargs]
@@ -26,6 +26,7 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.extensions.standard import SwapGate
 from qiskit.transpiler.layout import Layout
+from qiskit.tools.parallel import parallel_map
 # pylint: disable=no-name-in-module
 from .cython.stochastic_swap.utils import nlayout_from_layout
 # pylint: disable=no-name-in-module
@@ -48,9 +49,15 @@ class StochasticSwap(TransformationPass):
 
         2. We do not use the fact that the input state is zero to simplify
            the circuit.
+
+        3. With ``seed_trials`` > 1, the whole circuit is mapped once per seed
+           and the result with the fewest swaps (then the lowest depth) is
+           kept. The mappings run concurrently through
+           :func:`~qiskit.tools.parallel_map`, and the result only depends on
+           ``seed``.
     """
 
-    def __init__(self, coupling_map, trials=20, seed=None):
+    def __init__(self, coupling_map, trials=20, seed=None, seed_trials=1):
         """StochasticSwap initializer.
 
         The coupling map is a connected graph
@@ -62,11 +69,15 @@ class StochasticSwap(TransformationPass):
                 map.
             trials (int): maximum number of iterations to attempt
             seed (int): seed for random number generator
+            seed_trials (int): number of independent mappings of the whole
+                circuit, with ``seed`` and seeds derived from it. The first
+                mapping uses ``seed``, so ``seed_trials=1`` is the plain pass.
         """
         super().__init__()
         self.coupling_map = coupling_map
         self.trials = trials
         self.seed = seed
+        self.seed_trials = seed_trials
         self.qregs = None
         self.rng = None
         self.trivial_layout = None
@@ -97,12 +108,41 @@ class StochasticSwap(TransformationPass):
         self.qregs = dag.qregs
         if self.seed is None:
             self.seed = np.random.randint(0, np.iinfo(np.int32).max)
+        if self.seed_trials > 1:
+            return self._run_seed_trials(dag)
+
         self.rng = np.random.RandomState(self.seed)
         logger.debug("StochasticSwap RandomState seeded with seed=%s", self.seed)
 
         new_dag = self._mapper(dag, self.coupling_map, trials=self.trials)
         return new_dag
 
+    def _run_seed_trials(self, dag):
+        """Map ``dag`` with ``seed_trials`` seeds and return the best result.
+
+        The seeds after ``self.seed`` come from a RandomState seeded with it.
+        If the mapping with ``self.seed`` needs no swaps, it is returned
+        right away: whether a layer needs swaps does not depend on the seed,
+        so no other seed can do better.
+        """
+        seeds = [self.seed] + list(np.random.RandomState(self.seed).randint(
+            0, np.iinfo(np.int32).max, size=self.seed_trials - 1))
+        input_swaps = dag.count_ops().get('swap', 0)
+
+        first = _map_with_seed(self.seed, dag, self.coupling_map, self.trials)
+        if first.count_ops().get('swap', 0) == input_swaps:
+            logger.debug("StochasticSwap: no swaps needed, skipping the other seeds")
+            return first
+
+        results = [first] + parallel_map(_map_with_seed, seeds[1:],
+                                         task_args=(dag, self.coupling_map, self.trials))
+        scores = [(result.count_ops().get('swap', 0), result.depth(), index)
+                  for index, result in enumerate(results)]
+        best = min(scores)
+        logger.debug("StochasticSwap: best of %d seeds is seed=%s with %d swaps, depth %d",
+                     len(seeds), seeds[best[2]], best[0] - input_swaps, best[1])
+        return results[best[2]]
+
     def _layer_permutation(self, layer_partition, layout, qubit_subset,
                            coupling, trials):
         """Find a swap circuit that implements a permutation for this layer.
@@ -150,7 +190,7 @@ class StochasticSwap(TransformationPass):
             best_depth (int): depth returned from _layer_permutation
             best_circuit (DAGCircuit): swap circuit returned
             from _layer_permutation
-            layer_list (list): list of DAGCircuit objects for each layer,
+            layer_list (list): list of DAGLayer views for each layer,
             output of DAGCircuit layers() method
 
         Returns:
@@ -177,7 +217,7 @@ class StochasticSwap(TransformationPass):
         for bit in dagcircuit_output.clbits():
             edge_map[bit] = bit
         # Output this layer
-        dagcircuit_output.compose_back(layer_list[i]["graph"], edge_map)
+        dagcircuit_output.compose_back(layer_list[i], edge_map)
 
         return dagcircuit_output
 
@@ -245,7 +285,7 @@ class StochasticSwap(TransformationPass):
             if not success_flag:
                 logger.debug("mapper: failed, layer %d, "
                              "retrying sequentially", i)
-                serial_layerlist = list(layer["graph"].serial_layers())
+                serial_layerlist = list(layer.serial_layers())
 
                 # Go through each gate in the layer
                 for j, serial_layer in enumerate(serial_layerlist):
@@ -300,6 +340,11 @@ class StochasticSwap(TransformationPass):
         return dagcircuit_output
 
 
+def _map_with_seed(seed, dag, coupling_map, trials):
+    """Run StochasticSwap with ``seed`` on ``dag``, for ``parallel_map``."""
+    return StochasticSwap(coupling_map, trials=trials, seed=int(seed)).run(dag)
+
+
 def _layer_permutation(layer_partition, layout, qubit_subset,
                        coupling, trials, rng):
     """Find a swap circuit that implements a permutation for this layer.
@@ -363,7 +408,7 @@ def _layer_permutation(layer_partition, layout, qubit_subset,
     best_circuit = None  # initialize best swap circuit
     best_layout = None  # initialize best final layout
 
-    cdist2 = coupling._dist_matrix**2
+    cdist2 = coupling.distance_matrix**2
     # Scaling matrix
     scale = np.zeros((num_qubits, num_qubits))
 
@@ -381,7 +426,7 @@ def _layer_permutation(layer_partition, layout, qubit_subset,
         if qubit.register not in slice_circuit.qregs.values():
             slice_circuit.add_qreg(qubit.register)
     edges = np.asarray(coupling.get_edges(), dtype=np.int32).ravel()
-    cdist = coupling._dist_matrix
+    cdist = coupling.distance_matrix
     for trial in range(trials):
         logger.debug("layer_permutation: trial %s", trial)
         # This is one Trial --------------------------------------
@@ -113,7 +113,7 @@ class MergeAdjacentBarriers(TransformationPass):
         for next_barrier in barriers[1:]:
 
             # Ensure barriers are adjacent before checking if they are mergeable.
-            if dag._multi_graph.has_edge(end_of_barrier, next_barrier):
+            if next_barrier in dag.successors(end_of_barrier):
 
                 # Remove all barriers that have already been included in this new barrier from the
                 # set of ancestors/descendants as they will be removed from the new DAG when it is
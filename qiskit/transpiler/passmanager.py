@@ -22,12 +22,13 @@ from qiskit.circuit import QuantumCircuit
 from .basepasses import BasePass
 from .exceptions import TranspilerError
 from .runningpassmanager import RunningPassManager
+from .profiling import PassProfile
 
 
 class PassManager:
     """A PassManager schedules the passes"""
 
-    def __init__(self, passes=None, max_iteration=1000, callback=None):
+    def __init__(self, passes=None, max_iteration=1000, callback=None, profile=None):
         """Initialize an empty PassManager object (with no passes scheduled).
 
         Args:
@@ -63,12 +64,16 @@ class PassManager:
 
                     PassManager(callback=callback_func)
 
+            profile (PassProfile): if given, the passes run by this pass
+                manager are profiled and the statistics are added to it,
+                including for circuits run in other processes.
         """
         self._pass_sets = []
         if passes is not None:
             self.append(passes)
         self.max_iteration = max_iteration
         self.callback = callback
+        self.profile = profile
         self.property_set = None
 
     def append(self, passes, max_iteration=None, **flow_controller_conditions):
@@ -143,7 +148,8 @@ class PassManager:
     def __getitem__(self, index):
         max_iteration = self.max_iteration
         call_back = self.callback
-        new_passmanager = PassManager(max_iteration=max_iteration, callback=call_back)
+        new_passmanager = PassManager(max_iteration=max_iteration, callback=call_back,
+                                      profile=self.profile)
         _pass_sets = self._pass_sets[index]
         if isinstance(_pass_sets, dict):
             _pass_sets = [_pass_sets]
@@ -154,14 +160,16 @@ class PassManager:
         if isinstance(other, PassManager):
             max_iteration = self.max_iteration
             call_back = self.callback
-            new_passmanager = PassManager(max_iteration=max_iteration, callback=call_back)
+            new_passmanager = PassManager(max_iteration=max_iteration, callback=call_back,
+                                          profile=self.profile)
             new_passmanager._pass_sets = self._pass_sets + other._pass_sets
             return new_passmanager
         else:
             try:
                 max_iteration = self.max_iteration
                 call_back = self.callback
-                new_passmanager = PassManager(max_iteration=max_iteration, callback=call_back)
+                new_passmanager = PassManager(max_iteration=max_iteration, callback=call_back,
+                                              profile=self.profile)
                 new_passmanager._pass_sets += self._pass_sets
                 new_passmanager.append(other)
                 return new_passmanager
@@ -195,7 +203,8 @@ class PassManager:
             return self._run_several_circuits(circuits)
 
     def _create_running_passmanager(self):
-        running_passmanager = RunningPassManager(self.max_iteration, self.callback)
+        running_passmanager = RunningPassManager(self.max_iteration, self.callback,
+                                                 self.profile)
         for pass_set in self._pass_sets:
             running_passmanager.append(pass_set['passes'], **pass_set['flow_controllers'])
         return running_passmanager
@@ -203,9 +212,13 @@ class PassManager:
     @staticmethod
     def _in_parallel(circuit, pm_dill=None):
         """ Used by _run_several_circuits. """
-        running_passmanager = dill.loads(pm_dill)._create_running_passmanager()
-        result = running_passmanager.run(circuit)
-        return result
+        pass_manager = dill.loads(pm_dill)
+        if pass_manager.profile is None:
+            return pass_manager._create_running_passmanager().run(circuit)
+        # Profile into a new PassProfile, which is merged by the caller.
+        pass_manager.profile = PassProfile()
+        result = pass_manager._create_running_passmanager().run(circuit)
+        return result, pass_manager.profile
 
     def _run_several_circuits(self, circuits):
         """Run all the passes on each of the circuits in the circuits list
@@ -216,8 +229,15 @@ class PassManager:
         Returns:
             list[QuantumCircuit]: Transformed circuits.
         """
-        return parallel_map(PassManager._in_parallel, circuits,
-                            task_kwargs={'pm_dill': dill.dumps(self)})
+        # parallel_map sends the pickled pass manager to each worker only once
+        # and only the circuits with each chunk.
+        results = parallel_map(PassManager._in_parallel, circuits,
+                               task_kwargs={'pm_dill': dill.dumps(self)})
+        if self.profile is None:
+            return results
+        for _, profile in results:
+            self.profile.merge(profile)
+        return [result for result, _ in results]
 
     def _run_single_circuit(self, circuit):
         """Run all the passes on a QuantumCircuit
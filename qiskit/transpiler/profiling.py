@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Profile of the passes run by pass managers."""
+
+from collections import OrderedDict
+import json
+import os
+
+
+class PassProfile:
+    """Per-pass timings and statistics, aggregated over the circuits run by
+    pass managers.
+
+    A profile is filled by giving it to a :class:`~qiskit.transpiler.PassManager`
+    (``PassManager(profile=...)``) or to :func:`~qiskit.compiler.transpile`
+    (``transpile(..., profile=...)``). Circuits run in other processes are
+    profiled there and merged into it, so the same profile can collect the
+    statistics of several calls. For example::
+
+        from qiskit.compiler import transpile
+        from qiskit.transpiler import PassProfile
+
+        profile = PassProfile()
+        transpile(circuits, backend, profile=profile)
+        print(profile.table())
+
+    For every pass (by name) it counts the calls, their wall time and the
+    size and depth of the DAG before and after them. For every ``do_while``
+    loop, such as the ``FixedPoint`` loops of the preset pass managers, it
+    counts how many times the loop ran and how many iterations it took.
+    """
+
+    def __init__(self):
+        self.circuits = 0
+        self.time = 0.0
+        self._pids = set()
+        self._passes = OrderedDict()
+        self._loops = OrderedDict()
+
+    @property
+    def processes(self):
+        """int: the number of processes the circuits were run in."""
+        return len(self._pids)
+
+    @property
+    def passes(self):
+        """OrderedDict: statistics of each pass, by pass name, in the order
+        the passes first ran. Each entry is a dict with the number of
+        ``calls``, their total ``time``, the ``max_time`` of a call and the
+        total size and depth of the DAG before (``size_in``, ``depth_in``)
+        and after (``size_out``, ``depth_out``) the calls."""
+        return self._passes
+
+    @property
+    def loops(self):
+        """OrderedDict: statistics of each ``do_while`` loop, by the names of
+        the passes in the loop. Each entry is a dict with the number of
+        ``runs`` of the loop, the total number of ``iterations`` and the
+        ``max_iterations`` of a run."""
+        return self._loops
+
+    def merge(self, other):
+        """Add the statistics of another profile to this one.
+
+        Args:
+            other (PassProfile): the profile to add.
+
+        Returns:
+            PassProfile: this profile.
+        """
+        self.circuits += other.circuits
+        self.time += other.time
+        self._pids.update(other._pids)
+        for name, stats in other._passes.items():
+            mine = self._passes.setdefault(name, _empty_pass_stats())
+            for field, value in stats.items():
+                mine[field] = max(mine[field], value) if field == 'max_time' \
+                    else mine[field] + value
+        for name, stats in other._loops.items():
+            mine = self._loops.setdefault(name, _empty_loop_stats())
+            for field, value in stats.items():
+                mine[field] = max(mine[field], value) if field == 'max_iterations' \
+                    else mine[field] + value
+        return self
+
+    def to_dict(self):
+        """Return the profile as a dictionary of plain Python types.
+
+        Returns:
+            dict: the totals of the profile, a list of ``passes`` sorted by
+            decreasing total time and a list of ``loops``.
+        """
+        passes = [dict(name=name, **stats) for name, stats in self._passes.items()]
+        passes.sort(key=lambda stats: stats['time'], reverse=True)
+        loops = [dict(passes=list(name), **stats) for name, stats in self._loops.items()]
+        return {'circuits': self.circuits,
+                'processes': self.processes,
+                'time': self.time,
+                'passes': passes,
+                'loops': loops}
+
+    def to_json(self, **kwargs):
+        """Return the profile as a JSON string.
+
+        Args:
+            **kwargs: passed to :func:`json.dumps`, e.g. ``indent``.
+
+        Returns:
+            str: the JSON encoding of :meth:`to_dict`.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def table(self):
+        """Return the profile as a text table, slowest pass first.
+
+        Times are in milliseconds, sizes and depths are means over the calls.
+
+        Returns:
+            str: the table.
+        """
+        profile = self.to_dict()
+        lines = ['%d circuit(s) in %d process(es), %.1f ms in the pass managers'
+                 % (profile['circuits'], profile['processes'], 1000 * profile['time'])]
+
+        width = max([len(stats['name']) for stats in profile['passes']] + [4])
+        lines.append('%-*s %7s %10s %9s %9s %6s %15s %15s'
+                     % (width, 'Pass', 'Calls', 'Total ms', 'Mean ms', 'Max ms', '%',
+                        'Size in/out', 'Depth in/out'))
+        total_time = sum(stats['time'] for stats in profile['passes']) or 1.0
+        for stats in profile['passes']:
+            calls = stats['calls']
+            lines.append('%-*s %7d %10.2f %9.3f %9.3f %6.1f %15s %15s'
+                         % (width, stats['name'], calls, 1000 * stats['time'],
+                            1000 * stats['time'] / calls, 1000 * stats['max_time'],
+                            100 * stats['time'] / total_time,
+                            '%.1f/%.1f' % (stats['size_in'] / calls,
+                                           stats['size_out'] / calls),
+                            '%.1f/%.1f' % (stats['depth_in'] / calls,
+                                           stats['depth_out'] / calls)))
+
+        if profile['loops']:
+            lines.append('')
+            lines.append('%6s %10s %6s  %s' % ('Runs', 'Iterations', 'Max', 'Loop'))
+            for stats in profile['loops']:
+                lines.append('%6d %10d %6d  %s'
+                             % (stats['runs'], stats['iterations'], stats['max_iterations'],
+                                ', '.join(stats['passes'])))
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.table()
+
+    def _record_circuit(self, run_time):
+        self.circuits += 1
+        self.time += run_time
+        self._pids.add(os.getpid())
+
+    def _record_pass(self, name, run_time, dag_in, dag_out):
+        stats = self._passes.get(name)
+        if stats is None:
+            stats = self._passes[name] = _empty_pass_stats()
+        stats['calls'] += 1
+        stats['time'] += run_time
+        stats['max_time'] = max(stats['max_time'], run_time)
+        stats['size_in'] += dag_in[0]
+        stats['depth_in'] += dag_in[1]
+        stats['size_out'] += dag_out[0]
+        stats['depth_out'] += dag_out[1]
+
+    def _record_loop(self, names, iterations):
+        stats = self._loops.get(names)
+        if stats is None:
+            stats = self._loops[names] = _empty_loop_stats()
+        stats['runs'] += 1
+        stats['iterations'] += iterations
+        stats['max_iterations'] = max(stats['max_iterations'], iterations)
+
+
+def _empty_pass_stats():
+    return OrderedDict([('calls', 0), ('time', 0.0), ('max_time', 0.0),
+                        ('size_in', 0), ('size_out', 0), ('depth_in', 0), ('depth_out', 0)])
+
+
+def _empty_loop_stats():
+    return OrderedDict([('runs', 0), ('iterations', 0), ('max_iterations', 0)])
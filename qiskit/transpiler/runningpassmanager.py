@@ -32,7 +32,7 @@ logger = logging.getLogger(__name__)
 class RunningPassManager():
     """A RunningPassManager is a running pass manager."""
 
-    def __init__(self, max_iteration, callback):
+    def __init__(self, max_iteration, callback, profile=None):
         """Initialize an empty PassManager object (with no passes scheduled).
 
         Args:
@@ -66,8 +66,12 @@ class RunningPassManager():
 
                     PassManager(callback=callback_func)
 
+            profile (PassProfile): if given, the time of each pass, the size
+                and depth of the DAG around it and the iterations of the
+                ``do_while`` loops are recorded in it.
         """
         self.callback = callback
+        self.profile = profile
         # the pass manager's schedule of passes, including any control-flow.
         # Populated via PassManager.append().
         self.working_list = []
@@ -83,6 +87,9 @@ class RunningPassManager():
 
         # pass manager's overriding options for the passes it runs (for debugging)
         self.passmanager_options = {'max_iteration': max_iteration}
+        if profile is not None:
+            # The flow controllers report loop iterations through their options.
+            self.passmanager_options['profile'] = profile
 
         self.count = 0
 
@@ -129,6 +136,7 @@ class RunningPassManager():
         Returns:
             QuantumCircuit: Transformed circuit.
         """
+        start_time = time()
         name = circuit.name
         dag = circuit_to_dag(circuit)
         del circuit
@@ -140,6 +148,8 @@ class RunningPassManager():
         circuit = dag_to_circuit(dag)
         circuit.name = name
         circuit._layout = self.property_set['layout']
+        if self.profile is not None:
+            self.profile._record_circuit(time() - start_time)  # pylint: disable=protected-access
         return circuit
 
     def _do_pass(self, pass_, dag, options):
@@ -170,6 +180,8 @@ class RunningPassManager():
         return dag
 
     def _run_this_pass(self, pass_, dag):
+        if self.profile is not None:
+            dag_in = (dag.size(), dag.depth())
         if pass_.is_transformation_pass:
             pass_.property_set = self.fenced_property_set
             # Measure time if we have a callback or logging set
@@ -207,6 +219,9 @@ class RunningPassManager():
             self._log_pass(start_time, end_time, pass_.name())
         else:
             raise TranspilerError("I dont know how to handle this type of pass")
+        if self.profile is not None:
+            self.profile._record_pass(  # pylint: disable=protected-access
+                pass_.name(), run_time, dag_in, (dag.size(), dag.depth()))
         return dag
 
     def _log_pass(self, start_time, end_time, name):
@@ -323,11 +338,15 @@ class DoWhileController(FlowController):
         super().__init__(passes, options, **partial_controller)
 
     def __iter__(self):
-        for _ in range(self.max_iteration):
+        for iteration in range(1, self.max_iteration + 1):
             for pass_ in self.passes:
                 yield pass_
 
             if not self.do_while():
+                profile = self.options.get('profile')
+                if profile is not None:
+                    profile._record_loop(  # pylint: disable=protected-access
+                        _pass_names(self._passes), iteration)
                 return
 
         raise TranspilerError("Maximum iteration reached. max_iteration=%i" % self.max_iteration)
@@ -347,6 +366,17 @@ class ConditionalController(FlowController):
                 yield pass_
 
 
+def _pass_names(passes):
+    """Return the names of ``passes``, including those in nested flow controllers."""
+    names = ()
+    for pass_ in passes:
+        if isinstance(pass_, FlowController):
+            names += _pass_names(pass_._passes)
+        else:
+            names += (pass_.name(),)
+    return names
+
+
 # Default controllers
 FlowController.add_flow_controller('condition', ConditionalController)
 FlowController.add_flow_controller('do_while', DoWhileController)
@@ -76,7 +76,18 @@ def transpile_circuit(circuit, transpile_config):
     if getattr(transpile_config, 'callback', None):
         pass_manager.callback = transpile_config.callback
 
-    out_circuit = pass_manager.run(circuit)
+    # Profile this run only, without changing the profile of a pass manager
+    # given by the caller
+    profile = getattr(transpile_config, 'profile', None)
+    if profile is not None:
+        previous_profile = pass_manager.profile
+        pass_manager.profile = profile
+        try:
+            out_circuit = pass_manager.run(circuit)
+        finally:
+            pass_manager.profile = previous_profile
+    else:
+        out_circuit = pass_manager.run(circuit)
     out_circuit.name = transpile_config.output_name
 
     return out_circuit
@@ -153,7 +153,7 @@ def _sorted_nodes(dag_layer):
     """Convert DAG layer into list of nodes sorted by node_id
     qiskit-terra #2802
     """
-    dag_instructions = dag_layer['graph'].op_nodes()
+    dag_instructions = dag_layer.op_nodes()
     # sort into the order they were input
     dag_instructions.sort(key=lambda nd: nd._node_id)
     return dag_instructions
@@ -14,6 +14,7 @@
 
 """Test QASM simulator."""
 
+import tempfile
 import unittest
 
 import numpy as np
@@ -22,6 +23,8 @@ from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.compiler import transpile, assemble
 from qiskit.providers.basicaer import QasmSimulatorPy
+from qiskit.providers.basicaer.basicaerprogram import compile_experiment, GateOp
+from qiskit.quantum_info import Operator, random_unitary
 from qiskit.test import Path
 from qiskit.test import providers
 
@@ -255,6 +258,227 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
             counts = result.get_counts(0)
             self.assertEqual(counts, target_counts)
 
+    def test_reset_entangled(self):
+        """Test reset of an entangled qubit leaves the other qubit collapsed."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.reset(qr[0])
+        circuit.h(qr[0])
+        circuit.reset(qr[1])
+        circuit.measure(qr, cr)
+        result = execute(circuit, self.backend, shots=1000, seed_simulator=self.seed).result()
+        counts = result.get_counts()
+        self.assertEqual(set(counts), {'00', '01'})
+        self.assertDictAlmostEqual(counts, {'00': 500, '01': 500}, 80)
+
+    def test_batched_shots(self):
+        """Test shots run in several batches give all the shots, reproducibly."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[1]).c_if(cr, 1)
+        circuit.h(qr[2])
+        circuit.reset(qr[0])
+        circuit.measure(qr, cr)
+
+        backend = QasmSimulatorPy()
+        # Run the shots 16 at a time
+        backend.BATCH_MEMORY = 16 * 2 ** 3 * 16
+        shots = 1000
+        results = [execute(circuit, backend, shots=shots, memory=True,
+                           seed_simulator=self.seed).result() for _ in range(2)]
+        self.assertEqual(results[0].get_counts(), results[1].get_counts())
+        self.assertEqual(len(results[0].get_memory()), shots)
+        counts = results[0].get_counts()
+        self.assertEqual(set(counts), {'000', '010', '100', '110'})
+        self.assertDictAlmostEqual(counts, {key: shots / 4 for key in counts}, 0.1 * shots)
+
+    def test_wide_classical_memory(self):
+        """Test classical memory wider than 64 bits."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(70, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr[0])
+        circuit.measure(qr[0], cr[69])
+        circuit.reset(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.measure(qr[1], cr[1])
+        result = execute(circuit, self.backend, shots=10, seed_simulator=self.seed).result()
+        self.assertEqual(result.get_counts(), {'1' + 69 * '0': 10})
+
+    def test_sampled_memory_matches_counts(self):
+        """Test sampled memory, including a re-measured clbit, matches the counts."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.x(qr[2])
+        circuit.measure(qr[0], cr[0])
+        circuit.measure(qr[1], cr[1])
+        # Overwrite the first clbit, the last measurement wins
+        circuit.measure(qr[2], cr[0])
+
+        shots = 1000
+        result = execute(circuit, self.backend, shots=shots, memory=True,
+                         seed_simulator=self.seed).result()
+        counts = result.get_counts()
+        memory = result.get_memory()
+        self.assertEqual(set(counts), {'01', '11'})
+        self.assertEqual(len(memory), shots)
+        self.assertEqual(counts, {key: memory.count(key) for key in counts})
+
+    def test_memmap(self):
+        """Test shots on a memory-mapped statevector match shots run one at a time."""
+        qr = QuantumRegister(4, 'qr')
+        cr = ClassicalRegister(4, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr)
+        circuit.cx(qr[0], qr[3])
+        circuit.measure(qr[3], cr[3])
+        circuit.reset(qr[0])
+        circuit.x(qr[1]).c_if(cr, 8)
+        circuit.measure(qr, cr)
+        sampled = QuantumCircuit(qr, cr)
+        sampled.h(qr)
+        sampled.cx(qr[3], qr[0])
+        sampled.measure(qr, cr)
+
+        backend = QasmSimulatorPy()
+        backend.BATCH_MEMORY = 1
+        memmap_backend = QasmSimulatorPy()
+        # Update the statevector 2 amplitudes at a time
+        memmap_backend.CHUNK_MEMORY = 2 * 16
+        with tempfile.TemporaryDirectory() as directory:
+            for test_circuit in [circuit, sampled]:
+                expected = execute(test_circuit, backend, shots=100, memory=True,
+                                   seed_simulator=self.seed).result()
+                result = execute(test_circuit, memmap_backend, shots=100, memory=True,
+                                 seed_simulator=self.seed,
+                                 backend_options={'memmap_dir': directory}).result()
+                self.assertEqual(result.get_memory(), expected.get_memory())
+
+    def test_parallel_experiments(self):
+        """Test experiments run in parallel give the same results, in order."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuits = []
+        for index in range(6):
+            circuit = QuantumCircuit(qr, cr, name='circuit%d' % index)
+            circuit.ry(0.3 * index, qr[0])
+            circuit.cx(qr[0], qr[1])
+            circuit.measure(qr, cr)
+            circuits.append(circuit)
+        qobj = assemble(transpile(circuits, self.backend), shots=100, memory=True,
+                        seed_simulator=self.seed)
+
+        expected = self.backend.run(qobj).result()
+        result = self.backend.run(qobj,
+                                  backend_options={'max_parallel_experiments': 2}).result()
+        self.assertEqual([experiment.header.name for experiment in result.results],
+                         [circuit.name for circuit in circuits])
+        self.assertEqual([experiment.seed_simulator for experiment in result.results],
+                         [self.seed + index for index in range(6)])
+        for circuit in circuits:
+            self.assertEqual(result.get_memory(circuit), expected.get_memory(circuit))
+
+        # The seeds derived from the largest seed wrap around
+        qobj = assemble(transpile(circuits[:2], self.backend), shots=10,
+                        seed_simulator=2 ** 32 - 1)
+        result = self.backend.run(qobj).result()
+        self.assertEqual([experiment.seed_simulator for experiment in result.results],
+                         [2 ** 32 - 1, 0])
+
+    def test_snapshots(self):
+        """Test snapshots are averaged over the shots with the same memory."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.measure(qr[0], cr[0])
+        circuit.h(qr[1])
+        circuit.snapshot_expectation_value('zx', [(1, 'XZ'), (0.5, 'IZ')], qr)
+        circuit.snapshot_probabilities('probs', [qr[1], qr[0]])
+
+        result = execute(circuit, self.backend, shots=50, seed_simulator=self.seed).result()
+        snapshots = result.data(0)['snapshots']
+        values = {entry['memory']: entry['value']
+                  for entry in snapshots['expectation_value']['zx']}
+        self.assertEqual(sorted(values), ['0x0', '0x1'])
+        self.assertAlmostEqual(values['0x0'], 1.5)
+        self.assertAlmostEqual(values['0x1'], 0.5)
+        values = {entry['memory']: entry['value']
+                  for entry in snapshots['probabilities']['probs']}
+        self.assertEqual(sorted(values['0x0']), ['0x0', '0x1'])
+        self.assertAlmostEqual(values['0x0']['0x0'], 0.5)
+        self.assertAlmostEqual(values['0x1']['0x2'], 0.5)
+        self.assertAlmostEqual(values['0x1']['0x3'], 0.5)
+
+    def test_gate_fusion(self):
+        """Test fused gates give the same state as the unfused gates."""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u3(0.1, 0.2, 0.3, qr[0])
+        circuit.cx(qr[1], qr[0])
+        circuit.u2(0.4, 0.5, qr[1])
+        circuit.cx(qr[0], qr[1])
+        circuit.u1(0.6, qr[2])
+        circuit.unitary(random_unitary(4, seed=3), [qr[3], qr[2]])
+        circuit.cx(qr[2], qr[3])
+        circuit.u3(0.7, 0.8, 0.9, qr[3])
+        circuit.unitary(random_unitary(8, seed=4), [qr[1], qr[3], qr[0]])
+        circuit.cx(qr[3], qr[0])
+        circuit = transpile(circuit, self.backend)
+        instructions = assemble(circuit).experiments[0].instructions
+
+        fused = compile_experiment(instructions, 4)
+        unfused = compile_experiment(instructions, 4, max_fused_qubits=0)
+        self.assertEqual([op.qubits for op in fused],
+                         [[0, 1], [2, 3], [1, 3, 0], [3, 0]])
+        self.assertEqual(len(unfused), 10)
+
+        statevector = np.zeros(16, dtype=complex)
+        statevector[0] = 1
+        for program in [fused, unfused]:
+            state = statevector
+            for operation in program:
+                self.assertIsInstance(operation, GateOp)
+                state = operation.apply(state)
+            expected = Operator(circuit).data[:, 0]
+            self.assertTrue(np.allclose(state, expected))
+
+    def test_fusion_stops_at_non_unitary(self):
+        """Test gates are not fused across measure, reset and conditional gates."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.u2(0, np.pi, qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.measure(qr[0], cr[0])
+        circuit.u2(0, np.pi, qr[0])
+        circuit.u3(np.pi, 0, np.pi, qr[1]).c_if(cr, 1)
+        circuit.u2(0, np.pi, qr[0])
+        circuit.reset(qr[1])
+        circuit.u3(np.pi, 0, np.pi, qr[1])
+        circuit.measure(qr, cr)
+        instructions = assemble(circuit).experiments[0].instructions
+
+        program = compile_experiment(instructions, 2)
+        self.assertEqual([type(op).__name__ for op in program],
+                         ['GateOp', 'MeasureOp', 'GateOp', 'BfuncOp', 'GateOp', 'GateOp',
+                          'ResetOp', 'GateOp', 'MeasureOp', 'MeasureOp'])
+        self.assertIsNotNone(program[4].condition)
+
+        result = execute(circuit, self.backend, shots=200, seed_simulator=self.seed).result()
+        counts = result.get_counts()
+        self.assertEqual(set(counts), {'10', '11'})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -13,6 +13,7 @@
 # that they have been altered from the originals.
 """Test StateVectorSimulatorPy."""
 
+import tempfile
 import unittest
 
 import numpy as np
@@ -21,8 +22,10 @@ from qiskit.providers.basicaer import StatevectorSimulatorPy
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
 from qiskit import QuantumRegister, QuantumCircuit, execute
+from qiskit.providers.basicaer import BasicAerError
 from qiskit.quantum_info.random import random_unitary
-from qiskit.quantum_info import state_fidelity
+from qiskit.quantum_info import state_fidelity, Pauli, Operator
+from qiskit.extensions.simulator import Snapshot
 
 
 class StatevectorSimulatorTest(providers.BackendTestCase):
@@ -85,6 +88,74 @@ class StatevectorSimulatorTest(providers.BackendTestCase):
                 fidelity = state_fidelity(psi_target, psi_out)
                 self.assertGreater(fidelity, 0.999)
 
+    def test_memmap(self):
+        """Test a memory-mapped statevector evolved in chunks gives the same state."""
+        qr = QuantumRegister(5, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr)
+        circuit.cx(qr[0], qr[4])
+        circuit.unitary(random_unitary(4, seed=11), [qr[3], qr[1]])
+        circuit.unitary(random_unitary(8, seed=12), [qr[4], qr[2], qr[0]])
+        circuit.t(qr[3])
+        initial_statevector = np.zeros(2 ** 5, dtype=complex)
+        initial_statevector[[1, 30]] = [1 / np.sqrt(2), 1j / np.sqrt(2)]
+
+        backend = StatevectorSimulatorPy()
+        # Update the statevector 4 amplitudes at a time
+        backend.CHUNK_MEMORY = 4 * 16
+        with tempfile.TemporaryDirectory() as directory:
+            for options in [{}, {'initial_statevector': initial_statevector}]:
+                expected = execute(circuit, self.backend, backend_options=options).result()
+                options = dict(options, memmap_dir=directory)
+                result = execute(circuit, backend, backend_options=options).result()
+                self.assertTrue(np.allclose(result.get_statevector(0),
+                                            expected.get_statevector(0)))
+
+    def test_snapshots(self):
+        """Test expectation-value and probability snapshots of the statevector."""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.unitary(random_unitary(16, seed=21), qr)
+        terms = [(0.5, 'XZY'), (0.25j, Pauli.from_label('YYI')), (1, 'ZIX')]
+        circuit.snapshot_expectation_value('energy', terms, [qr[3], qr[0], qr[2]])
+        circuit.snapshot_probabilities('probs', [qr[2], qr[0]])
+        statevector = Operator(random_unitary(16, seed=21)).data[:, 0]
+
+        pauli_operator = 0
+        for coeff, pauli in terms:
+            label = pauli if isinstance(pauli, str) else pauli.to_label()
+            # The qubits 3, 0 and 2 go to the positions 0, 3 and 1 of the label
+            label = label[2] + label[0] + 'I' + label[1]
+            pauli_operator = pauli_operator + coeff * Pauli.from_label(label).to_matrix()
+        expected_value = np.vdot(statevector, pauli_operator @ statevector)
+        # Axis 1 is qubit 2 and axis 3 is qubit 0
+        probabilities = np.sum(np.abs(statevector.reshape(4 * [2])) ** 2, axis=(0, 2))
+        expected_probabilities = {hex(bit2 + 2 * bit0): probabilities[bit2, bit0]
+                                  for bit2 in range(2) for bit0 in range(2)}
+
+        backend = StatevectorSimulatorPy()
+        backend.CHUNK_MEMORY = 4 * 16
+        with tempfile.TemporaryDirectory() as directory:
+            for options in [{}, {'final_statevector': False}, {'memmap_dir': directory}]:
+                data = execute(circuit, backend, backend_options=options).result().data(0)
+                self.assertEqual('statevector' in data, options.get('final_statevector', True))
+                snapshots = data['snapshots']
+                value = snapshots['expectation_value']['energy']
+                self.assertEqual(len(value), 1)
+                self.assertEqual(value[0]['memory'], '0x0')
+                self.assertAlmostEqual(value[0]['value'], expected_value)
+                value = snapshots['probabilities']['probs'][0]['value']
+                self.assertEqual(sorted(value), sorted(expected_probabilities))
+                for outcome, probability in expected_probabilities.items():
+                    self.assertAlmostEqual(value[outcome], probability)
+
+    def test_unsupported_snapshot(self):
+        """Test the snapshot types the simulator does not support raise an error."""
+        circuit = QuantumCircuit(1)
+        circuit.append(Snapshot('state', snapshot_type='density_matrix', num_qubits=1), [0])
+        with self.assertRaises(BasicAerError):
+            execute(circuit, self.backend).result()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -20,12 +20,12 @@ import numpy as np
 
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
-from qiskit.providers.basicaer import UnitarySimulatorPy
+from qiskit.providers.basicaer import UnitarySimulatorPy, BasicAerError
 from qiskit.quantum_info.operators.predicates import matrix_equal
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
 from qiskit.quantum_info.random import random_unitary
-from qiskit.quantum_info import process_fidelity
+from qiskit.quantum_info import process_fidelity, Operator
 
 
 class BasicAerUnitarySimulatorPyTest(providers.BackendTestCase):
@@ -119,6 +119,38 @@ class BasicAerUnitarySimulatorPyTest(providers.BackendTestCase):
                 fidelity = process_fidelity(unitary_target, unitary_out)
                 self.assertGreater(fidelity, 0.999)
 
+    def test_chunked_threads(self):
+        """Test the unitary evolved in several chunks on several threads."""
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[3])
+        circuit.u3(0.1, 0.2, 0.3, qr[2])
+        circuit.cx(qr[2], qr[1])
+        circuit.unitary(random_unitary(8, seed=5), [qr[1], qr[3], qr[0]])
+        circuit.t(qr[1])
+        initial_unitary = random_unitary(16, seed=6).data
+
+        backend = UnitarySimulatorPy()
+        # Evolve the 16 columns 2 at a time
+        backend.CHUNK_MEMORY = 2 * 16 * 16
+        for threads in [1, 3]:
+            result = execute(circuit, backend,
+                             backend_options={'max_parallel_threads': threads,
+                                              'initial_unitary': initial_unitary}).result()
+            expected = Operator(circuit).data.dot(initial_unitary)
+            self.assertTrue(matrix_equal(result.get_unitary(circuit), expected))
+
+    def test_unsupported_operation(self):
+        """Test the name of an unsupported instruction is reported."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.snapshot_probabilities('probs', [qr[0]])
+        job = execute(circuit, UnitarySimulatorPy())
+        with self.assertRaisesRegex(BasicAerError, 'unrecognized operation "snapshot"'):
+            job.result()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the transpile cache."""
+
+import tempfile
+import unittest
+
+from qiskit.circuit import Parameter, QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import transpile, TranspileCache
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeMelbourne
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import Unroller
+
+
+def _ansatz(theta, phi, reverse=False):
+    """A small parameterized circuit. ``reverse`` adds the independent gates in another order."""
+    qr = QuantumRegister(3, 'q')
+    cr = ClassicalRegister(3, 'c')
+    circuit = QuantumCircuit(qr, cr)
+    single_qubit = [lambda: circuit.ry(theta, qr[0]), lambda: circuit.rz(2 * phi, qr[2])]
+    for add in reversed(single_qubit) if reverse else single_qubit:
+        add()
+    circuit.cx(qr[0], qr[1])
+    circuit.cx(qr[1], qr[2])
+    circuit.rx(theta + phi, qr[1])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Tests for transpile(..., cache=TranspileCache())."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = FakeMelbourne()
+        self.cache = TranspileCache()
+
+    def test_hit_returns_same_circuit(self):
+        """Transpiling the same circuit twice only runs the transpiler once."""
+        circuit = _ansatz(0.1, 0.2)
+        first = transpile(circuit, self.backend, seed_transpiler=1, cache=self.cache)
+        second = transpile(circuit, self.backend, seed_transpiler=1, cache=self.cache)
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.name, circuit.name)
+        self.assertEqual(self.cache.stats,
+                         {'hits': 1, 'misses': 1, 'disk_hits': 0, 'size': 1})
+
+    def test_parameters_are_rebound(self):
+        """A circuit with other Parameters gets the cached output with its own Parameters."""
+        theta, phi = Parameter('theta'), Parameter('phi')
+        alpha, beta = Parameter('alpha'), Parameter('beta')
+        first = transpile(_ansatz(theta, phi), self.backend, seed_transpiler=1,
+                          cache=self.cache)
+        second = transpile(_ansatz(alpha, beta), self.backend, seed_transpiler=1,
+                           cache=self.cache)
+
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(first.parameters, {theta, phi})
+        self.assertEqual(second.parameters, {alpha, beta})
+        self.assertEqual(first.bind_parameters({theta: 0.3, phi: 0.7}),
+                         second.bind_parameters({alpha: 0.3, beta: 0.7}))
+
+    def test_swapped_parameters(self):
+        """Parameters are matched by position, not by name."""
+        theta, phi = Parameter('theta'), Parameter('phi')
+        first = transpile(_ansatz(theta, phi), self.backend, seed_transpiler=1,
+                          cache=self.cache)
+        second = transpile(_ansatz(phi, theta), self.backend, seed_transpiler=1,
+                           cache=self.cache)
+
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(first.bind_parameters({theta: 0.3, phi: 0.7}),
+                         second.bind_parameters({phi: 0.3, theta: 0.7}))
+
+    def test_same_dag_different_order(self):
+        """Circuits with the same DAG share an entry."""
+        transpile(_ansatz(0.1, 0.2), self.backend, seed_transpiler=1, cache=self.cache)
+        transpile(_ansatz(0.1, 0.2, reverse=True), self.backend, seed_transpiler=1,
+                  cache=self.cache)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_options_are_part_of_the_key(self):
+        """Changing the circuit or an option of the transpilation is a miss."""
+        circuit = _ansatz(0.1, 0.2)
+        transpile(circuit, self.backend, seed_transpiler=1, cache=self.cache)
+        transpile(_ansatz(0.1, 0.3), self.backend, seed_transpiler=1, cache=self.cache)
+        transpile(circuit, self.backend, seed_transpiler=2, cache=self.cache)
+        transpile(circuit, self.backend, seed_transpiler=1, optimization_level=2,
+                  cache=self.cache)
+        transpile(circuit, self.backend, seed_transpiler=1, initial_layout=[3, 4, 5],
+                  cache=self.cache)
+        basis_gates = ['u1', 'u2', 'u3', 'cx']
+        transpile(circuit, basis_gates=basis_gates, seed_transpiler=1, cache=self.cache)
+        transpile(circuit, basis_gates=basis_gates, coupling_map=[[0, 1], [1, 2]],
+                  seed_transpiler=1, cache=self.cache)
+        self.assertEqual(self.cache.stats['hits'], 0)
+        self.assertEqual(self.cache.stats['misses'], 7)
+
+    def test_list_of_circuits(self):
+        """Only the circuits that miss are transpiled, and the order is kept."""
+        circuits = [_ansatz(0.1, 0.2), _ansatz(0.3, 0.4)]
+        transpile(circuits[0], self.backend, seed_transpiler=1, cache=self.cache)
+        out = transpile(circuits + [_ansatz(0.1, 0.2)], self.backend, seed_transpiler=1,
+                        output_name=['a', 'b', 'c'], cache=self.cache)
+        expected = transpile(circuits, self.backend, seed_transpiler=1)
+
+        self.assertEqual(self.cache.hits, 2)
+        self.assertEqual(out[:2], expected)
+        self.assertEqual([circuit.name for circuit in out], ['a', 'b', 'c'])
+
+    def test_output_is_a_copy(self):
+        """Changing a returned circuit does not change the cache."""
+        circuit = _ansatz(0.1, 0.2)
+        first = transpile(circuit, self.backend, seed_transpiler=1, cache=self.cache)
+        expected = first.copy()
+        first.x(0)
+        second = transpile(circuit, self.backend, seed_transpiler=1, cache=self.cache)
+        second.x(0)
+        third = transpile(circuit, self.backend, seed_transpiler=1, cache=self.cache)
+        self.assertEqual(third, expected)
+
+    def test_not_cached(self):
+        """Custom pass managers and callbacks are not cached."""
+        circuit = _ansatz(0.1, 0.2)
+        pass_manager = PassManager(Unroller(['u1', 'u2', 'u3', 'cx']))
+        for _ in range(2):
+            transpile(circuit, pass_manager=pass_manager, cache=self.cache)
+            transpile(circuit, self.backend, callback=lambda **kwargs: None, cache=self.cache)
+        self.assertEqual(self.cache.stats,
+                         {'hits': 0, 'misses': 0, 'disk_hits': 0, 'size': 0})
+
+    def test_lru_eviction(self):
+        """The least recently used circuit is dropped from memory."""
+        cache = TranspileCache(max_size=1)
+        first, second = _ansatz(0.1, 0.2), _ansatz(0.3, 0.4)
+        transpile(first, self.backend, seed_transpiler=1, cache=cache)
+        transpile(second, self.backend, seed_transpiler=1, cache=cache)
+        transpile(first, self.backend, seed_transpiler=1, cache=cache)
+        self.assertEqual(cache.stats, {'hits': 0, 'misses': 3, 'disk_hits': 0, 'size': 1})
+
+    def test_disk_tier(self):
+        """Circuits stored on disk are found by another cache."""
+        theta, phi = Parameter('theta'), Parameter('phi')
+        with tempfile.TemporaryDirectory() as directory:
+            first = transpile(_ansatz(theta, phi), self.backend, seed_transpiler=1,
+                              cache=TranspileCache(directory=directory))
+            cache = TranspileCache(directory=directory)
+            alpha, beta = Parameter('alpha'), Parameter('beta')
+            second = transpile(_ansatz(alpha, beta), self.backend, seed_transpiler=1,
+                               cache=cache)
+            self.assertEqual(cache.stats, {'hits': 1, 'misses': 0, 'disk_hits': 1, 'size': 1})
+            self.assertEqual(second.parameters, {alpha, beta})
+            self.assertEqual(first.bind_parameters({theta: 0.5, phi: 0.1}),
+                             second.bind_parameters({alpha: 0.5, beta: 0.1}))
+
+            cache.clear(disk=True)
+            transpile(_ansatz(alpha, beta), self.backend, seed_transpiler=1, cache=cache)
+            self.assertEqual(cache.stats, {'hits': 0, 'misses': 1, 'disk_hits': 0, 'size': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,6 +23,7 @@ from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.circuit import Parameter
 from qiskit.compiler import transpile
+from qiskit.compiler.transpile import _parse_transpile_args, _split_transpile_configs
 from qiskit.converters import circuit_to_dag
 from qiskit.dagcircuit.exceptions import DAGCircuitError
 from qiskit.extensions.standard import CnotGate
@@ -383,6 +384,33 @@ class TestTranspile(QiskitTestCase):
         circuits = transpile(circuits, backend)
         self.assertIsInstance(circuits[0], QuantumCircuit)
 
+    def test_shared_transpile_configs(self):
+        """The configuration shared by the circuits is split out once."""
+        backend = FakeMelbourne()
+        circuits = []
+        for _ in range(3):
+            qr = QuantumRegister(2)
+            circuit = QuantumCircuit(qr)
+            circuit.h(qr[0])
+            circuit.cx(qr[0], qr[1])
+            circuits.append(circuit)
+
+        transpile_configs = _parse_transpile_args(circuits, backend, None, None, None, None,
+                                                  [1, 2, 3], 1, None, None, None)
+        shared_configs, circuit_configs = _split_transpile_configs(transpile_configs)
+
+        self.assertEqual(len(shared_configs), 1)
+        self.assertIs(shared_configs[0]['coupling_map'], transpile_configs[0].coupling_map)
+        self.assertEqual([index for index, _ in circuit_configs], [0, 0, 0])
+        self.assertEqual([fields['seed_transpiler'] for _, fields in circuit_configs],
+                         [1, 2, 3])
+        self.assertNotIn('backend_properties', circuit_configs[0][1])
+
+        transpiled = transpile(circuits, backend, seed_transpiler=[1, 2, 3])
+        expected = [transpile(circuit, backend, seed_transpiler=seed)
+                    for circuit, seed in zip(circuits, [1, 2, 3])]
+        self.assertEqual(transpiled, expected)
+
     def test_wrong_initial_layout(self):
         """Test transpile with a bad initial layout.
         """
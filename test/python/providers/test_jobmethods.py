@@ -16,12 +16,16 @@
 
 """BasicAerJob creation and test suite."""
 
+import threading
 import uuid
 from contextlib import contextmanager
 from os import path
 import unittest
 
 from unittest.mock import patch
+from qiskit import QuantumCircuit, execute
+from qiskit.providers import JobError, JobStatus
+from qiskit.providers.basicaer import BasicAerProvider, BasicAerJobQueue
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeQobj, FakeRueschlikon
 
@@ -46,7 +50,7 @@ class TestSimulatorsJob(QiskitTestCase):
 
         self.assertEqual(executor.submit.call_count, taskcount)
         for index in range(taskcount):
-            _, callargs, _ = executor.submit.mock_calls[index]
+            callargs, _ = executor.submit.call_args_list[index]
             submitted_task = callargs[0]
             target_task = target_tasks[index]
             self.assertEqual(submitted_task, target_task)
@@ -76,6 +80,76 @@ class TestSimulatorsJob(QiskitTestCase):
                 call_count))
 
 
+class TestBasicAerJobQueue(QiskitTestCase):
+    """Test the queue running the jobs of the BasicAer provider."""
+
+    def test_queue_position_and_back_pressure(self):
+        """Jobs wait in order, and a full queue blocks submissions."""
+        queue = BasicAerJobQueue('thread', max_workers=1, max_queue_size=2)
+        release = threading.Event()
+        running = queue.submit(release.wait)
+        waiting = [queue.submit(lambda: None) for _ in range(2)]
+        self.assertEqual([queue.position(future) for future in waiting], [0, 1])
+        with self.assertRaises(JobError):
+            queue.submit(lambda: None, timeout=0.1)
+        release.set()
+        for future in [running] + waiting:
+            future.result()
+        self.assertIsNone(queue.position(running))
+        queue.submit(lambda: None, timeout=0.1).result()
+        queue.shutdown()
+
+    def test_finished_jobs_are_released(self):
+        """Finished jobs leave the queue without asking for their position."""
+        queue = BasicAerJobQueue('thread', max_workers=2)
+        for future in [queue.submit(lambda: None) for _ in range(5)]:
+            future.result()
+        # Waits for the callbacks of the finished jobs
+        queue.shutdown()
+        self.assertEqual(queue._waiting, [])
+
+    def test_failed_submission_releases_slot(self):
+        """A job which cannot be submitted does not keep its place in the queue."""
+        queue = BasicAerJobQueue('thread', max_workers=1, max_queue_size=0)
+        queue.submit(lambda: None).result()
+        with patch.object(queue._pool, 'submit', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                queue.submit(lambda: None)
+        queue.submit(lambda: None, timeout=1).result()
+        queue.shutdown()
+
+    def test_invalid_configuration(self):
+        """Unknown executors and invalid sizes are rejected."""
+        with self.assertRaises(JobError):
+            BasicAerJobQueue('cluster')
+        with self.assertRaises(JobError):
+            BasicAerJobQueue('thread', max_workers=0)
+
+    def test_provider_executor(self):
+        """Jobs of a provider run on its executor and report their steps."""
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure([0, 1], [0, 1])
+        expected = execute(circuit, BasicAerProvider().get_backend('qasm_simulator'),
+                           seed_simulator=42).result().get_counts()
+        for executor in ['thread', 'process']:
+            with self.subTest(executor=executor):
+                provider = BasicAerProvider()
+                provider.set_executor(executor, max_workers=2, max_queue_size=4)
+                self.assertEqual(provider.job_queue.executor, executor)
+                backend = provider.get_backend('qasm_simulator')
+                jobs = [execute(circuit, backend, seed_simulator=42) for _ in range(6)]
+                for job in jobs:
+                    self.assertEqual(job.result().get_counts(), expected)
+                    self.assertEqual(job.status(), JobStatus.DONE)
+                    self.assertIsNone(job.queue_position())
+                    steps = job.time_per_step()
+                    self.assertLessEqual(steps['QUEUED'], steps['DONE'])
+                    self.assertLessEqual(steps['RUNNING'], steps['DONE'])
+                provider.job_queue.shutdown()
+
+
 @contextmanager
 def mocked_executor():
     """Context that patches the derived executor classes to return the same
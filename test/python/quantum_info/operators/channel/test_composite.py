@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for CompositeChannel class."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import QiskitError
+from qiskit.quantum_info.states import DensityMatrix
+from qiskit.quantum_info.random import random_unitary, random_density_matrix
+from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.measures import process_fidelity
+from qiskit.quantum_info.operators.channel import (CompositeChannel, SuperOp, Choi,
+                                                   Kraus, Stinespring, PTM)
+from .channel_test_case import ChannelTestCase
+
+
+def depolarizing(prob, num_qubits=1):
+    """Return a depolarizing SuperOp."""
+    dim = 2 ** num_qubits
+    iden = np.eye(dim).ravel()
+    return SuperOp((1 - prob) * np.eye(dim ** 2) + prob * np.outer(iden, iden) / dim)
+
+
+def amplitude_damping(gamma):
+    """Return an amplitude damping Kraus channel."""
+    return Kraus([np.array([[1, 0], [0, np.sqrt(1 - gamma)]]),
+                  np.array([[0, np.sqrt(gamma)], [0, 0]])])
+
+
+class TestCompositeChannel(ChannelTestCase):
+    """Tests for CompositeChannel class."""
+
+    def setUp(self):
+        super().setUp()
+        self.unitaries = [random_unitary(2, seed=i) for i in range(3)]
+        self.unitary2 = random_unitary(4, seed=9)
+
+    def lazy_and_eager(self):
+        """Return a 3-qubit composite channel and its SuperOp."""
+        lazy = CompositeChannel(self.unitaries[0])
+        eager = SuperOp(self.unitaries[0])
+        for chan in [amplitude_damping(0.2), depolarizing(0.1)]:
+            lazy = lazy.tensor(chan)
+            eager = eager.tensor(chan)
+        for chan, qargs in [(self.unitary2, [0, 2]), (amplitude_damping(0.3), [1]),
+                            (PTM(depolarizing(0.2)), [2])]:
+            lazy = lazy.compose(chan, qargs=qargs)
+            eager = eager.compose(chan, qargs=qargs)
+        return lazy, eager
+
+    def test_lazy(self):
+        """Test operations record the expression instead of evaluating it."""
+        lazy, _ = self.lazy_and_eager()
+        self.assertEqual(lazy._data[0], 'compose')
+        self.assertIsNone(lazy._evaluated)
+        self.assertEqual(lazy.dim, (8, 8))
+        self.assertEqual((lazy + lazy)._data[0], 'sum')
+        self.assertIsNotNone(lazy.data)
+        self.assertIsNotNone(lazy._evaluated)
+
+    def test_compose_tensor(self):
+        """Test compose and tensor against SuperOp."""
+        lazy, eager = self.lazy_and_eager()
+        self.assertTrue(np.allclose(lazy.data, eager.data))
+        self.assertEqual(SuperOp(lazy), eager)
+        self.assertEqual(Choi(lazy), Choi(eager))
+        self.assertEqual(SuperOp(Kraus(lazy)), eager)
+
+    def test_compose_front_expand(self):
+        """Test front compose and expand against SuperOp."""
+        lazy = CompositeChannel(amplitude_damping(0.1)).expand(self.unitaries[1])
+        eager = SuperOp(amplitude_damping(0.1)).expand(self.unitaries[1])
+        lazy = lazy.compose(self.unitary2, front=True)
+        eager = eager.compose(self.unitary2, front=True)
+        lazy = lazy.compose(depolarizing(0.3), qargs=[0], front=True)
+        eager = eager.compose(depolarizing(0.3), qargs=[0], front=True)
+        self.assertEqual(SuperOp(lazy), eager)
+        self.assertRaises(QiskitError, lazy.compose, depolarizing(0.1))
+        self.assertRaises(QiskitError, lazy.compose, depolarizing(0.1, 2), qargs=[0])
+
+    def test_add(self):
+        """Test linear combinations against SuperOp."""
+        unitary = self.unitaries[2]
+        lazy = (0.3 * CompositeChannel(self.unitary2)
+                + 0.7 * CompositeChannel(amplitude_damping(0.2)).tensor(unitary)
+                - 0.1j * CompositeChannel(depolarizing(0.5, 2)))
+        eager = (0.3 * SuperOp(self.unitary2)
+                 + 0.7 * SuperOp(amplitude_damping(0.2)).tensor(unitary)
+                 - 0.1j * SuperOp(depolarizing(0.5, 2)))
+        self.assertEqual(SuperOp(lazy), eager)
+        self.assertFalse(lazy.is_cptp())
+        convex = (0.4 * CompositeChannel(self.unitary2)
+                  + 0.6 * CompositeChannel(amplitude_damping(0.2)).tensor(unitary))
+        self.assertEqual(SuperOp(convex), 0.4 * SuperOp(self.unitary2)
+                         + 0.6 * SuperOp(amplitude_damping(0.2)).tensor(unitary))
+        self.assertTrue(convex.is_cptp())
+
+    def test_adjoint_power(self):
+        """Test conjugate, transpose, adjoint and power against SuperOp."""
+        lazy, eager = self.lazy_and_eager()
+        self.assertEqual(SuperOp(lazy.conjugate()), eager.conjugate())
+        self.assertEqual(SuperOp(lazy.transpose()), eager.transpose())
+        self.assertEqual(SuperOp(lazy.adjoint()), eager.adjoint())
+        self.assertEqual(SuperOp(lazy.power(3)), eager.power(3))
+
+    def test_evolve(self):
+        """Test state evolution against SuperOp."""
+        lazy, eager = self.lazy_and_eager()
+        rho = DensityMatrix(random_density_matrix(8, seed=3))
+        self.assertEqual(rho.evolve(lazy), rho.evolve(eager))
+        rho = DensityMatrix(random_density_matrix(16, seed=4))
+        self.assertEqual(rho.evolve(lazy, qargs=[3, 0, 1]),
+                         rho.evolve(eager, qargs=[3, 0, 1]))
+
+    def test_evaluate_kraus(self):
+        """Test composites with few Kraus operators evaluate to Kraus."""
+        lazy = CompositeChannel(self.unitaries[0]).tensor(self.unitaries[1])
+        lazy = lazy.compose(self.unitary2)
+        self.assertIsInstance(lazy._evaluate(), Kraus)
+        target = self.unitaries[0].tensor(self.unitaries[1]).compose(self.unitary2)
+        self.assertEqual(lazy.to_operator(), target)
+        lazy, _ = self.lazy_and_eager()
+        self.assertIsInstance(lazy._evaluate(), SuperOp)
+
+    def test_process_fidelity(self):
+        """Test process fidelity of Kraus forms against SuperOp."""
+        lazy, eager = self.lazy_and_eager()
+        self.assertAlmostEqual(process_fidelity(lazy, Operator(np.eye(8))),
+                               process_fidelity(eager, np.eye(8)))
+        chan = amplitude_damping(0.3)
+        self.assertAlmostEqual(process_fidelity(chan, self.unitaries[0]),
+                               process_fidelity(SuperOp(chan), SuperOp(self.unitaries[0])))
+        self.assertAlmostEqual(process_fidelity(Stinespring(chan), self.unitaries[1]),
+                               process_fidelity(SuperOp(chan), SuperOp(self.unitaries[1])))
+        general = Kraus(([np.eye(2), np.diag([1, -1])], [np.eye(2), 1j * np.eye(2)]))
+        self.assertAlmostEqual(
+            process_fidelity(general, chan, require_cptp=False),
+            process_fidelity(SuperOp(general), SuperOp(chan), require_cptp=False))
+
+
+if __name__ == '__main__':
+    unittest.main()
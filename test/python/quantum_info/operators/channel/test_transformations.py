@@ -16,11 +16,13 @@
 
 """Tests for quantum channel representation transformations."""
 
+import itertools
 import unittest
 
 import numpy as np
 
 from qiskit import QiskitError
+from qiskit.quantum_info import Pauli, random_unitary
 from qiskit.quantum_info.states import DensityMatrix
 from qiskit.quantum_info.operators.predicates import matrix_equal
 from qiskit.quantum_info.operators.operator import Operator
@@ -654,6 +656,29 @@ class TestTransformations(ChannelTestCase):
             chan2 = PTM(chan1)
             self.assertEqual(chan1, chan2)
 
+    def test_multi_qubit_pauli_transforms(self):
+        """Test multi-qubit PTM and Chi transformations against their definitions."""
+        num_qubits = 3
+        dim = 2 ** num_qubits
+        # Pauli of index sum_q p_q 4^q, for p_q in I, X, Y, Z on qubit q
+        paulis = [Pauli.from_label(''.join(label)).to_matrix()
+                  for label in itertools.product('IXYZ', repeat=num_qubits)]
+        unitary = random_unitary(dim, seed=7).data
+        ptm = np.array([[np.trace(p1.dot(unitary).dot(p2).dot(unitary.conj().T)) / dim
+                         for p2 in paulis] for p1 in paulis])
+        coeffs = np.array([np.trace(p1.dot(unitary)) / dim for p1 in paulis])
+        chi = dim * np.outer(coeffs, coeffs.conj())
+        sop = SuperOp(Operator(unitary))
+        choi = Choi(Operator(unitary))
+        self.assertEqual(PTM(sop), PTM(ptm))
+        self.assertEqual(SuperOp(PTM(ptm)), sop)
+        self.assertEqual(Chi(choi), Chi(chi))
+        self.assertEqual(Choi(Chi(chi)), choi)
+        # Round trip of a non-physical map
+        mat = self.rand_matrix(4 ** num_qubits, 4 ** num_qubits)
+        self.assertEqual(SuperOp(PTM(SuperOp(mat))), SuperOp(mat))
+        self.assertEqual(Choi(Chi(Choi(mat))), Choi(mat))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the cached gate matrices and the fused evolution."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import QiskitError
+from qiskit import QuantumCircuit
+from qiskit.extensions.standard import HGate, U3Gate, Cu1Gate
+from qiskit.test import QiskitTestCase
+from qiskit.quantum_info import Operator, Statevector
+from qiskit.quantum_info.operators import evolution
+
+
+def random_circuit(num_qubits, num_gates, seed):
+    """Return a circuit of random one, two and three-qubit gates."""
+    rng = np.random.RandomState(seed)
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(num_gates):
+        qubits = [int(qubit) for qubit in rng.choice(num_qubits, 3, replace=False)]
+        gate = rng.randint(5)
+        if gate == 0:
+            circuit.u3(*rng.rand(3), qubits[0])
+        elif gate == 1:
+            circuit.cx(qubits[0], qubits[1])
+        elif gate == 2:
+            circuit.ccx(*qubits)
+        elif gate == 3:
+            circuit.cu1(rng.rand(), qubits[0], qubits[1])
+        else:
+            circuit.swap(qubits[0], qubits[1])
+    return circuit
+
+
+class TestEvolution(QiskitTestCase):
+    """Tests for the gate matrix cache and the fused evolution."""
+
+    def setUp(self):
+        super().setUp()
+        evolution.clear_cache()
+
+    def tearDown(self):
+        evolution.clear_cache()
+        super().tearDown()
+
+    def test_instruction_matrix_cache(self):
+        """Test gate matrices are cached by type and parameters."""
+        mat = evolution.instruction_matrix(U3Gate(0.1, 0.2, 0.3))
+        self.assertIs(evolution.instruction_matrix(U3Gate(0.1, 0.2, 0.3)), mat)
+        self.assertIsNot(evolution.instruction_matrix(U3Gate(0.1, 0.2, 0.4)), mat)
+        self.assertFalse(mat.flags.writeable)
+        np.testing.assert_allclose(mat, U3Gate(0.1, 0.2, 0.3).to_matrix())
+        self.assertIsNone(evolution.instruction_matrix(Cu1Gate(0.5)))
+        with self.assertRaises(QiskitError):
+            evolution.instruction_matrix('h')
+
+    def test_cache_size(self):
+        """Test the cache holds at most MAX_CACHE_SIZE entries."""
+        max_cache_size = evolution.MAX_CACHE_SIZE
+        evolution.MAX_CACHE_SIZE = 4
+        try:
+            for angle in range(10):
+                evolution.instruction_matrix(U3Gate(angle, 0, 0))
+            self.assertEqual(len(evolution._CACHE), 4)
+        finally:
+            evolution.MAX_CACHE_SIZE = max_cache_size
+
+    def test_fused_definition(self):
+        """Test the definition of a small composite gate is fused in one matrix."""
+        operations = evolution.instruction_operations(Cu1Gate(0.5), [4, 2])
+        self.assertEqual(len(operations), 1)
+        mat, qargs = operations[0]
+        self.assertEqual(qargs, [4, 2])
+        np.testing.assert_allclose(mat, np.diag([1, 1, 1, np.exp(0.5j)]), atol=1e-10)
+        self.assertIs(evolution.instruction_operations(Cu1Gate(0.5))[0][0], mat)
+
+    def test_custom_gates_not_cached(self):
+        """Test gates defined by their instance are not mixed up in the cache."""
+        first = QuantumCircuit(1, name='custom')
+        first.h(0)
+        second = QuantumCircuit(1, name='custom')
+        second.x(0)
+        circuit = QuantumCircuit(2)
+        circuit.append(first.to_gate(), [0])
+        circuit.append(second.to_gate(), [1])
+        expected = np.kron(Operator.from_label('X').data, HGate().to_matrix())
+        np.testing.assert_allclose(Operator(circuit).data, expected, atol=1e-10)
+
+    def test_fuse_operations(self):
+        """Test fused operations give the same operator as unfused operations."""
+        circuit = random_circuit(5, 40, seed=11).to_instruction()
+        unfused = evolution.instruction_operations(circuit, fuse=False)
+        for max_qubits in range(3, 6):
+            fused = evolution.fuse_operations(unfused, max_qubits)
+            self.assertLess(len(fused), len(unfused))
+            for _, qargs in fused:
+                self.assertLessEqual(len(qargs), max_qubits)
+            expected = np.eye(2 ** 5)
+            actual = np.eye(2 ** 5)
+            for operations, mat in [(unfused, expected), (fused, actual)]:
+                data = evolution.evolve_tensor(
+                    mat, 2 * 5 * (2,),
+                    [(op_mat, [4 - qubit for qubit in qargs]) for op_mat, qargs in operations])
+                mat[:] = data
+            np.testing.assert_allclose(actual, expected, atol=1e-10)
+
+    def test_operator_circuit(self):
+        """Test the operator of a circuit matches the product of its gates."""
+        circuit = random_circuit(4, 30, seed=12)
+        self.assertEqual(Operator(circuit), _reference_operator(circuit.to_instruction()))
+
+    def test_statevector_subsystems(self):
+        """Test evolving a statevector with qutrit subsystems by a circuit."""
+        circuit = random_circuit(3, 20, seed=13)
+        rng = np.random.RandomState(14)
+        vec = rng.rand(24) + 1j * rng.rand(24)
+        state = Statevector(vec / np.linalg.norm(vec), dims=(2, 3, 2, 2))
+        target = state.evolve(Operator(circuit), qargs=[0, 2, 3])
+        self.assertEqual(state.evolve(circuit, qargs=[0, 2, 3]), target)
+        with self.assertRaises(QiskitError):
+            state.evolve(circuit, qargs=[0, 1, 2])
+
+
+def _reference_operator(instr):
+    """Return the operator of an instruction composed one gate at a time."""
+    if hasattr(instr, 'to_matrix'):
+        try:
+            return Operator(instr.to_matrix())
+        except QiskitError:
+            pass
+    op = Operator(np.eye(2 ** instr.num_qubits))
+    for sub_instr, qargs, _ in instr.definition:
+        op = op.compose(_reference_operator(sub_instr), qargs=[qubit.index for qubit in qargs])
+    return op
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for PauliTable class."""
+
+import unittest
+
+import numpy as np
+
+from qiskit import QiskitError
+from qiskit.test import QiskitTestCase
+from qiskit.quantum_info import Pauli, PauliTable
+
+
+def random_labels(num_qubits, size, seed):
+    """Return random Pauli labels."""
+    rng = np.random.RandomState(seed)
+    return [''.join(rng.choice(list('IXYZ'), num_qubits)) for _ in range(size)]
+
+
+def pauli_matrix(label):
+    """Return the matrix of a Pauli label."""
+    return Pauli.from_label(label).to_matrix()
+
+
+class TestPauliTable(QiskitTestCase):
+    """Tests for PauliTable class."""
+
+    def test_init(self):
+        """Test initialization from labels, Paulis and arrays."""
+        labels = ['XYZI', 'IIIY', 'ZZXX']
+        table = PauliTable(labels)
+        self.assertEqual(table.num_qubits, 4)
+        self.assertEqual(table.size, 3)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.to_labels(), labels)
+        paulis = [Pauli.from_label(label) for label in labels]
+        self.assertEqual(PauliTable(paulis), table)
+        self.assertEqual(PauliTable(table.array), table)
+        self.assertEqual(PauliTable.from_bool(table.z, table.x), table)
+        self.assertEqual(PauliTable('XYZI'), table[[0]])
+        for pauli, label in zip(paulis, labels):
+            self.assertEqual(pauli.z.tolist(), table[labels.index(label)].z.tolist())
+            self.assertEqual(pauli.x.tolist(), table[labels.index(label)].x.tolist())
+
+    def test_init_invalid(self):
+        """Test initialization from invalid data raises."""
+        with self.assertRaises(QiskitError):
+            PauliTable(['XY', 'XYZ'])
+        with self.assertRaises(QiskitError):
+            PauliTable(['XA'])
+        with self.assertRaises(QiskitError):
+            PauliTable(np.zeros((2, 3), dtype=bool))
+        with self.assertRaises(QiskitError):
+            PauliTable(1)
+
+    def test_many_qubits(self):
+        """Test labels of more than 64 qubits round trip through the words."""
+        labels = random_labels(130, 5, seed=1)
+        table = PauliTable(labels)
+        self.assertEqual(table.to_labels(), labels)
+        self.assertEqual(table.weights().tolist(),
+                         [130 - label.count('I') for label in labels])
+
+    def test_dot(self):
+        """Test the products and phases of Paulis."""
+        left = random_labels(3, 50, seed=2)
+        right = random_labels(3, 50, seed=3)
+        table, phases = PauliTable(left).dot(PauliTable(right))
+        for label1, label2, label, phase in zip(left, right, table.to_labels(), phases):
+            np.testing.assert_allclose(phase * pauli_matrix(label),
+                                       pauli_matrix(label1).dot(pauli_matrix(label2)))
+            sgn_pauli, sgn_phase = Pauli.sgn_prod(Pauli.from_label(label1),
+                                                  Pauli.from_label(label2))
+            self.assertEqual(sgn_pauli.to_label(), label)
+            self.assertEqual(sgn_phase, phase)
+
+    def test_dot_single(self):
+        """Test a single Pauli multiplies every row."""
+        table, phases = PauliTable(['XI', 'YZ', 'ZY']).dot('YY')
+        self.assertEqual(table.to_labels(), ['ZY', 'IX', 'XI'])
+        np.testing.assert_allclose(phases, [1j, -1j, -1j])
+        with self.assertRaises(QiskitError):
+            PauliTable(['XI', 'YZ', 'ZY']).dot(PauliTable(['XX', 'YY']))
+        with self.assertRaises(QiskitError):
+            PauliTable(['XI', 'YZ', 'ZY']).dot('XXX')
+
+    def test_commutes(self):
+        """Test commutation of Paulis."""
+        labels = random_labels(70, 20, seed=4)
+        table = PauliTable(labels)
+        matrix = table.commutes(table)
+        self.assertEqual(matrix.shape, (20, 20))
+        np.testing.assert_array_equal(matrix, matrix.T)
+        self.assertTrue(np.all(np.diag(matrix)))
+        np.testing.assert_array_equal(table.commutes(labels[0]), matrix[:, 0])
+        small = random_labels(3, 20, seed=5)
+        for label, commutes in zip(small, PauliTable(small).commutes('XYZ')):
+            left = pauli_matrix(label).dot(pauli_matrix('XYZ'))
+            right = pauli_matrix('XYZ').dot(pauli_matrix(label))
+            self.assertEqual(np.allclose(left, right), commutes)
+
+    def test_qubit_wise_commutes(self):
+        """Test qubit-wise commutation of Paulis."""
+        table = PauliTable(['XIZ', 'XXI', 'YIZ', 'IIZ'])
+        np.testing.assert_array_equal(table.qubit_wise_commutes('XIZ'),
+                                      [True, True, False, True])
+        np.testing.assert_array_equal(table.commutes('XXX'), [False, True, True, False])
+
+    def test_group_qubit_wise_commuting(self):
+        """Test the groups partition the table in qubit-wise commuting sets."""
+        labels = random_labels(5, 60, seed=6)
+        table = PauliTable(labels)
+        groups = table.group_qubit_wise_commuting()
+        self.assertEqual(sorted(np.hstack(groups).tolist()), list(range(60)))
+        for group in groups:
+            self.assertTrue(np.all(table[group].qubit_wise_commutes(table[group])))
+        self.assertEqual(len(PauliTable(['ZZ', 'ZI', 'IZ', 'II']).group_qubit_wise_commuting()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for SparsePauliOp class."""
+
+import itertools
+import unittest
+
+import numpy as np
+
+from qiskit import QiskitError
+from qiskit.test import QiskitTestCase
+from qiskit.quantum_info import Pauli, SparsePauliOp, Statevector
+
+
+def random_op(num_qubits, size, seed):
+    """Return a random operator and its dense matrix."""
+    rng = np.random.RandomState(seed)
+    labels = [''.join(rng.choice(list('IXYZ'), num_qubits)) for _ in range(size)]
+    coeffs = rng.rand(size) + 1j * rng.rand(size)
+    mat = sum(coeff * Pauli.from_label(label).to_matrix()
+              for label, coeff in zip(labels, coeffs))
+    return SparsePauliOp(labels, coeffs), mat
+
+
+class TestSparsePauliOp(QiskitTestCase):
+    """Tests for SparsePauliOp class."""
+
+    def test_init(self):
+        """Test initialization."""
+        op = SparsePauliOp.from_list([('XI', 1), ('ZZ', 2j)])
+        self.assertEqual(op.num_qubits, 2)
+        self.assertEqual(op.size, 2)
+        self.assertEqual(op.to_list(), [('XI', 1), ('ZZ', 2j)])
+        self.assertEqual(SparsePauliOp(['XI', 'ZZ'], [1, 2j]), op)
+        np.testing.assert_allclose(SparsePauliOp('XY').coeffs, [1])
+        with self.assertRaises(QiskitError):
+            SparsePauliOp(['XI', 'ZZ'], [1, 2, 3])
+
+    def test_to_matrix(self):
+        """Test the sparse and dense matrices."""
+        op, mat = random_op(5, 40, seed=1)
+        np.testing.assert_allclose(op.to_matrix(), mat, atol=1e-10)
+        np.testing.assert_allclose(op.to_spmatrix().toarray(), mat, atol=1e-10)
+        np.testing.assert_allclose(op.to_operator().data, mat, atol=1e-10)
+
+    def test_to_matrix_diagonal(self):
+        """Test the matrix of many terms sharing their x vector."""
+        labels = [''.join(label) for label in itertools.product('IZ', repeat=4)]
+        labels += ['XZIX', 'XIIX', 'XZZX', 'XIZX', 'YZIY']
+        coeffs = np.arange(1, len(labels) + 1)
+        op = SparsePauliOp(labels, coeffs)
+        mat = sum(coeff * Pauli.from_label(label).to_matrix()
+                  for label, coeff in zip(labels, coeffs))
+        np.testing.assert_allclose(op.to_matrix(), mat, atol=1e-10)
+
+    def test_dot(self):
+        """Test operator products."""
+        op1, mat1 = random_op(3, 10, seed=2)
+        op2, mat2 = random_op(3, 12, seed=3)
+        np.testing.assert_allclose(op1.dot(op2).to_matrix(), mat1.dot(mat2), atol=1e-10)
+        np.testing.assert_allclose(op1.compose(op2).to_matrix(), mat2.dot(mat1), atol=1e-10)
+        np.testing.assert_allclose((op1 @ op2).to_matrix(), mat2.dot(mat1), atol=1e-10)
+        with self.assertRaises(QiskitError):
+            op1.dot(SparsePauliOp('XX'))
+
+    def test_arithmetic(self):
+        """Test sums and scalar products."""
+        op1, mat1 = random_op(3, 10, seed=4)
+        op2, mat2 = random_op(3, 6, seed=5)
+        self.assertEqual((op1 + op2).size, 16)
+        np.testing.assert_allclose((op1 + op2).to_matrix(), mat1 + mat2, atol=1e-10)
+        np.testing.assert_allclose((op1 - op2).to_matrix(), mat1 - mat2, atol=1e-10)
+        np.testing.assert_allclose((2j * op1).to_matrix(), 2j * mat1, atol=1e-10)
+        np.testing.assert_allclose((-op1).to_matrix(), -mat1, atol=1e-10)
+        np.testing.assert_allclose(op1.adjoint().to_matrix(), mat1.conj().T, atol=1e-10)
+        with self.assertRaises(QiskitError):
+            op1.multiply('a')
+
+    def test_simplify(self):
+        """Test equal Paulis are added together and zero terms removed."""
+        op = SparsePauliOp(['XZ', 'IY', 'XZ', 'ZZ', 'IY'], [1, 2, 3, 4, -2])
+        simple = op.simplify()
+        self.assertEqual(sorted(simple.to_list()), [('XZ', 4), ('ZZ', 4)])
+        np.testing.assert_allclose(simple.to_matrix(), op.to_matrix(), atol=1e-10)
+        zero = (op - op).simplify()
+        self.assertEqual(zero.to_list(), [('II', 0)])
+
+    def test_expectation_value(self):
+        """Test expectation values against the dense matrix."""
+        op, mat = random_op(6, 50, seed=6)
+        rng = np.random.RandomState(7)
+        vec = rng.rand(64) + 1j * rng.rand(64)
+        vec /= np.linalg.norm(vec)
+        expected = np.vdot(vec, mat.dot(vec))
+        self.assertAlmostEqual(op.expectation_value(vec), expected)
+        self.assertAlmostEqual(op.expectation_value(Statevector(vec)), expected)
+        with self.assertRaises(QiskitError):
+            op.expectation_value(Statevector(vec[:32]))
+
+    def test_group_qubit_wise_commuting(self):
+        """Test the groups sum to the operator."""
+        op, mat = random_op(4, 30, seed=8)
+        groups = op.group_qubit_wise_commuting()
+        self.assertEqual(sum(group.size for group in groups), 30)
+        np.testing.assert_allclose(sum(group.to_matrix() for group in groups), mat,
+                                   atol=1e-10)
+
+
+if __name__ == '__main__':
+    unittest.main()
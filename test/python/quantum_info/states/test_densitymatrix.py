@@ -340,6 +340,13 @@ class TestDensityMatrix(QiskitTestCase):
             state = DensityMatrix(rho)
             self.assertEqual(-state, DensityMatrix(-1 * rho))
 
+    def test_probabilities(self):
+        """Test probabilities method"""
+        state = DensityMatrix(np.diag([0.1, 0.2, 0.3, 0.4]))
+        assert_allclose(state.probabilities(), [0.1, 0.2, 0.3, 0.4])
+        assert_allclose(state.probabilities([0]), [0.4, 0.6])
+        assert_allclose(state.probabilities([1, 0]), [0.1, 0.3, 0.2, 0.4])
+
 
 if __name__ == '__main__':
     unittest.main()
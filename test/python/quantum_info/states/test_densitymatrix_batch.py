@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for DensityMatrixBatch quantum state class."""
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from qiskit.test import QiskitTestCase
+from qiskit import QiskitError
+from qiskit import QuantumCircuit
+
+from qiskit.quantum_info.random import random_unitary, random_state, random_density_matrix
+from qiskit.quantum_info.states import (Statevector, DensityMatrix, StatevectorBatch,
+                                        DensityMatrixBatch)
+from qiskit.quantum_info.operators.channel import Kraus, SuperOp
+from qiskit.quantum_info.states.measures import state_fidelity
+
+
+class TestDensityMatrixBatch(QiskitTestCase):
+    """Tests for DensityMatrixBatch class."""
+
+    def setUp(self):
+        super().setUp()
+        self.states = [DensityMatrix(random_density_matrix(8, seed=i)) for i in range(5)]
+        self.batch = DensityMatrixBatch(self.states)
+
+    def assertBatchEqual(self, batch, states):
+        """Assert the states of a batch are equal to a list of states."""
+        self.assertEqual(len(batch), len(states))
+        for state, target in zip(batch, states):
+            self.assertEqual(state, target)
+
+    def test_init(self):
+        """Test initialization, indexing and conversion of statevectors."""
+        self.assertEqual(len(self.batch), 5)
+        self.assertEqual(self.batch.dims(), (2, 2, 2))
+        self.assertEqual(self.batch[2], self.states[2])
+        self.assertBatchEqual(self.batch[1:3], self.states[1:3])
+        self.assertBatchEqual(DensityMatrixBatch(self.batch.data), self.states)
+        vecs = [Statevector(random_state(4, seed=i)) for i in range(3)]
+        targets = [DensityMatrix(vec) for vec in vecs]
+        self.assertBatchEqual(DensityMatrixBatch(vecs), targets)
+        self.assertBatchEqual(DensityMatrixBatch(StatevectorBatch(vecs)), targets)
+        self.assertBatchEqual(DensityMatrixBatch(vecs[0]), targets[:1])
+        self.assertRaises(QiskitError, DensityMatrixBatch, np.zeros((2, 4, 2)))
+
+    def test_evolve(self):
+        """Test evolve method for operators and channels."""
+        unitary = random_unitary(8, seed=10)
+        unitary2 = random_unitary(4, seed=11)
+        for other, qargs in [(unitary, None), (unitary2, [2, 0]), (SuperOp(unitary), None),
+                             (Kraus(unitary2), [0, 1])]:
+            self.assertBatchEqual(self.batch.evolve(other, qargs=qargs),
+                                  [state.evolve(other, qargs=qargs) for state in self.states])
+        self.assertRaises(QiskitError, self.batch.evolve, unitary2)
+
+    def test_evolve_circuit(self):
+        """Test evolve method for circuits."""
+        circ = QuantumCircuit(3)
+        circ.h(0)
+        circ.cx(0, 2)
+        circ.rz(0.3, 1)
+        self.assertBatchEqual(self.batch.evolve(circ),
+                              [state.evolve(circ) for state in self.states])
+        circ.reset(1)
+        circ.cx(0, 1)
+        self.assertBatchEqual(self.batch.evolve(circ),
+                              [state.evolve(circ) for state in self.states])
+
+    def test_tensor(self):
+        """Test tensor and expand methods."""
+        self.assertBatchEqual(self.batch.tensor(self.states[0]),
+                              [state.tensor(self.states[0]) for state in self.states])
+        self.assertBatchEqual(self.batch.expand(self.batch),
+                              [state.expand(state) for state in self.states])
+
+    def test_linear_combinations(self):
+        """Test add, subtract and multiply methods."""
+        self.assertBatchEqual(self.batch + self.batch[::-1],
+                              [s1 + s2 for s1, s2 in zip(self.states, self.states[::-1])])
+        self.assertBatchEqual(self.batch - self.states[0],
+                              [state - self.states[0] for state in self.states])
+        assert_allclose(self.batch.trace(), 1)
+        assert_allclose(self.batch.purity(), [state.purity() for state in self.states])
+        self.assertTrue(self.batch.is_valid())
+        self.assertFalse((2 * self.batch).is_valid())
+
+    def test_probabilities(self):
+        """Test probabilities and to_counts methods."""
+        for qargs in [None, [1], [2, 0]]:
+            probs = self.batch.probabilities(qargs)
+            for i, state in enumerate(self.states):
+                assert_allclose(probs[i], state.probabilities(qargs))
+        for counts, state in zip(self.batch.to_counts(), self.states):
+            target = state.to_counts()
+            self.assertEqual(list(counts), list(target))
+            assert_allclose(list(counts.values()), np.real(list(target.values())))
+
+    def test_state_fidelity(self):
+        """Test state_fidelity of batches."""
+        fidelities = state_fidelity(self.batch, self.batch[::-1])
+        targets = [state_fidelity(s1.data, s2.data)
+                   for s1, s2 in zip(self.states, self.states[::-1])]
+        assert_allclose(fidelities, targets)
+        vecs = StatevectorBatch([Statevector(random_state(8, seed=i)) for i in range(5)])
+        fidelities = state_fidelity(vecs, self.batch)
+        targets = [state_fidelity(vec.data, state.data)
+                   for vec, state in zip(vecs, self.states)]
+        assert_allclose(fidelities, targets)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -340,6 +340,13 @@ class TestStatevector(QiskitTestCase):
         self.assertTrue(statevec.equiv(Statevector(phase * vec)))
         self.assertFalse(statevec.equiv(2 * vec))
 
+    def test_probabilities(self):
+        """Test probabilities method"""
+        state = Statevector(np.array([1, 0, 0, 1j, 0, 1, 0, 1]) / 2)
+        assert_allclose(state.probabilities(), [0.25, 0, 0, 0.25, 0, 0.25, 0, 0.25])
+        assert_allclose(state.probabilities([0]), [0.25, 0.75])
+        assert_allclose(state.probabilities([2, 1]), [0.25, 0.25, 0.25, 0.25])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for StatevectorBatch quantum state class."""
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from qiskit.test import QiskitTestCase
+from qiskit import QiskitError
+from qiskit import QuantumCircuit
+
+from qiskit.quantum_info.random import random_unitary, random_state
+from qiskit.quantum_info.states import Statevector, StatevectorBatch
+from qiskit.quantum_info.states.measures import state_fidelity
+
+
+class TestStatevectorBatch(QiskitTestCase):
+    """Tests for StatevectorBatch class."""
+
+    def setUp(self):
+        super().setUp()
+        self.states = [Statevector(random_state(8, seed=i)) for i in range(5)]
+        self.batch = StatevectorBatch(self.states)
+
+    def assertBatchEqual(self, batch, states):
+        """Assert the states of a batch are equal to a list of states."""
+        self.assertEqual(len(batch), len(states))
+        for state, target in zip(batch, states):
+            self.assertEqual(state, target)
+
+    def test_init(self):
+        """Test initialization and indexing."""
+        self.assertEqual(len(self.batch), 5)
+        self.assertEqual(self.batch.dims(), (2, 2, 2))
+        self.assertEqual(self.batch[2], self.states[2])
+        self.assertBatchEqual(self.batch[1:3], self.states[1:3])
+        self.assertBatchEqual(StatevectorBatch(self.batch.data), self.states)
+        self.assertBatchEqual(StatevectorBatch(self.states[0]), self.states[:1])
+        self.assertRaises(QiskitError, StatevectorBatch, self.states[0].data)
+        self.assertRaises(QiskitError, StatevectorBatch,
+                          [self.states[0], Statevector([1, 0])])
+
+    def test_from_labels(self):
+        """Test from_labels method."""
+        labels = ['01', '+l', 'r1']
+        self.assertBatchEqual(StatevectorBatch.from_labels(labels),
+                              [Statevector.from_label(label) for label in labels])
+
+    def test_evolve(self):
+        """Test evolve method."""
+        unitary = random_unitary(8, seed=10)
+        self.assertBatchEqual(self.batch.evolve(unitary),
+                              [state.evolve(unitary) for state in self.states])
+        unitary = random_unitary(4, seed=11)
+        self.assertBatchEqual(self.batch.evolve(unitary, qargs=[2, 0]),
+                              [state.evolve(unitary, qargs=[2, 0]) for state in self.states])
+        self.assertRaises(QiskitError, self.batch.evolve, unitary)
+
+    def test_evolve_circuit(self):
+        """Test evolve method for circuits."""
+        circ = QuantumCircuit(3)
+        circ.h(0)
+        circ.cx(0, 2)
+        circ.rz(0.3, 1)
+        circ.cu1(0.7, 1, 2)
+        self.assertBatchEqual(self.batch.evolve(circ),
+                              [state.evolve(circ) for state in self.states])
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.cx(0, 1)
+        self.assertBatchEqual(self.batch.evolve(circ, qargs=[1, 2]),
+                              [state.evolve(circ, qargs=[1, 2]) for state in self.states])
+
+    def test_tensor(self):
+        """Test tensor and expand methods."""
+        self.assertBatchEqual(self.batch.tensor(self.batch),
+                              [state.tensor(state) for state in self.states])
+        self.assertBatchEqual(self.batch.expand(self.states[0]),
+                              [state.expand(self.states[0]) for state in self.states])
+        self.assertRaises(QiskitError, self.batch.tensor, self.batch[:2])
+
+    def test_linear_combinations(self):
+        """Test add, subtract and multiply methods."""
+        self.assertBatchEqual(self.batch + self.batch[::-1],
+                              [s1 + s2 for s1, s2 in zip(self.states, self.states[::-1])])
+        self.assertBatchEqual(self.batch - self.states[0],
+                              [state - self.states[0] for state in self.states])
+        self.assertBatchEqual(2j * self.batch, [2j * state for state in self.states])
+        assert_allclose(self.batch.trace(), 1)
+        self.assertTrue(self.batch.is_valid())
+        self.assertFalse((2 * self.batch).is_valid())
+
+    def test_equiv(self):
+        """Test equiv method."""
+        phases = np.exp(1j * np.arange(5))
+        batch = StatevectorBatch(phases[:, None] * self.batch.data)
+        self.assertTrue(np.all(self.batch.equiv(batch)))
+        self.assertEqual(list(self.batch.equiv(self.states[1])),
+                         [False, True, False, False, False])
+        self.assertFalse(np.any(self.batch.equiv(Statevector([1, 0]))))
+
+    def test_probabilities(self):
+        """Test probabilities and to_counts methods."""
+        for qargs in [None, [1], [2, 0]]:
+            probs = self.batch.probabilities(qargs)
+            for i, state in enumerate(self.states):
+                assert_allclose(probs[i], state.probabilities(qargs))
+        counts = self.batch.to_counts()
+        self.assertEqual(counts, [state.to_counts() for state in self.states])
+
+    def test_state_fidelity(self):
+        """Test state_fidelity of batches."""
+        fidelities = state_fidelity(self.batch, self.batch[::-1])
+        targets = [state_fidelity(s1.data, s2.data)
+                   for s1, s2 in zip(self.states, self.states[::-1])]
+        assert_allclose(fidelities, targets)
+        fidelities = state_fidelity(self.states[0], self.batch)
+        assert_allclose(fidelities, [state_fidelity(self.states[0].data, state.data)
+                                     for state in self.states])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,7 @@ from qiskit.result import models
 from qiskit.result import marginal_counts
 from qiskit.validation import base
 from qiskit.result import Result
+from qiskit.result import postprocess
 from qiskit.test import QiskitTestCase
 
 
@@ -96,6 +97,27 @@ class TestResultOperations(QiskitTestCase):
         self.assertEqual(marginal_counts(result, [0]).get_counts(1),
                          expected_marginal_counts_2)
 
+    def test_marginal_counts_bits(self):
+        """Test that counts are marginalized over non-adjacent bits of several registers."""
+        counts = {'101 0110': 3, '001 1110': 5, '111 0000': 2, '000 0011': 7}
+        # Bits 1, 2 and 6, with bit 1 the least significant
+        expected_marginal_counts = {'011': 5, '111': 3, '100': 2, '001': 7}
+
+        marginal = marginal_counts(counts, [6, 1, 2])
+        self.assertEqual(marginal, expected_marginal_counts)
+        self.assertEqual(list(marginal), sorted(expected_marginal_counts))
+
+        raw_counts = {hex(int(key.replace(' ', ''), 2)): val for key, val in counts.items()}
+        data = models.ExperimentResultData(counts=base.Obj(**raw_counts))
+        exp_result_header = base.Obj(creg_sizes=[['c0', 4], ['c1', 3]], memory_slots=7)
+        exp_result = models.ExperimentResult(shots=17, success=True, data=data,
+                                             header=exp_result_header)
+        result = marginal_counts(Result(results=[exp_result], **self.base_result_args),
+                                 [6, 1, 2])
+        self.assertEqual(result.results[0].data.counts.to_dict(),
+                         {'0x3': 5, '0x7': 3, '0x4': 2, '0x1': 7})
+        self.assertEqual(result.results[0].header.memory_slots, 3)
+
     def test_memory_counts_no_header(self):
         """Test that memory bitstrings are extracted properly without header."""
         raw_memory = ['0x0', '0x0', '0x2', '0x2', '0x2', '0x2', '0x2']
@@ -191,3 +213,38 @@ class TestResultOperations(QiskitTestCase):
         self.assertEqual(memory.shape, (2, 2, 3))
         self.assertEqual(memory.dtype, np.complex_)
         np.testing.assert_almost_equal(memory, processed_memory)
+
+    def test_statevector(self):
+        """Test the statevector is decoded from [re, im] pairs or arrays."""
+        raw_statevector = [[0.5, 0.], [0., -0.5], [0.123456, 0.654321], [0., 0.]]
+        processed_statevector = np.array([0.5, -0.5j, 0.123456 + 0.654321j, 0.])
+        data = models.ExperimentResultData(statevector=processed_statevector.tolist())
+        exp_result = models.ExperimentResult(shots=1, success=True, data=data)
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        statevector = result.get_statevector(0)
+        self.assertEqual(statevector.dtype, np.complex_)
+        np.testing.assert_array_equal(statevector, processed_statevector)
+        np.testing.assert_array_equal(result.get_statevector(0, decimals=2),
+                                      np.around(processed_statevector, 2))
+        for vec in [np.array(raw_statevector), processed_statevector]:
+            np.testing.assert_array_equal(postprocess.format_statevector(vec),
+                                          processed_statevector)
+
+    def test_unitary(self):
+        """Test the unitary is decoded from [re, im] pairs or arrays."""
+        raw_unitary = [[[0., 1.], [0.5, 0.]],
+                       [[1., 0.], [0., -0.25]]]
+        processed_unitary = np.array([[1.j, 0.5],
+                                      [1., -0.25j]])
+        data = models.ExperimentResultData(unitary=processed_unitary.tolist())
+        exp_result = models.ExperimentResult(shots=1, success=True, data=data)
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        unitary = result.get_unitary(0)
+        self.assertEqual(unitary.shape, (2, 2))
+        self.assertEqual(unitary.dtype, np.complex_)
+        np.testing.assert_array_equal(unitary, processed_unitary)
+        for mat in [np.array(raw_unitary), processed_unitary]:
+            np.testing.assert_array_equal(postprocess.format_unitary(mat),
+                                          processed_unitary)
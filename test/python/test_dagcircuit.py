@@ -14,6 +14,7 @@
 
 """Test for the DAGCircuit object"""
 
+import copy
 import unittest
 
 from ddt import ddt, data
@@ -49,12 +50,14 @@ def raise_if_dagcircuit_invalid(dag):
 
     multi_graph = dag._multi_graph
 
-    if not nx.is_directed_acyclic_graph(multi_graph):
+    if not nx.is_directed_acyclic_graph(dag.to_networkx()):
         raise DAGCircuitError('multi_graph is not a DAG.')
 
     # Every node should be of type in, out, or op.
     # All input/output nodes should be present in input_map/output_map.
-    for node in multi_graph.nodes():
+    for node_id in multi_graph.node_ids():
+        node = multi_graph[node_id]
+        assert node._node_id == node_id
         if node.type == 'in':
             assert node is dag.input_map[node.wire]
         elif node.type == 'out':
@@ -71,15 +74,19 @@ def raise_if_dagcircuit_invalid(dag):
         assert len(node.cargs) == node.op.num_clbits
 
     # Every edge should be labled with a known wire.
-    edges_outside_wires = [edge_data['wire']
-                           for source, dest, edge_data
-                           in multi_graph.edges(data=True)
-                           if edge_data['wire'] not in dag.wires]
+    edges_outside_wires = [wire
+                           for source, dest, wire
+                           in multi_graph.edges()
+                           if wire not in dag.wires]
     if edges_outside_wires:
         raise DAGCircuitError('multi_graph contains one or more edges ({}) '
                               'not found in DAGCircuit.wires ({}).'.format(edges_outside_wires,
                                                                            dag.wires))
 
+    # Every edge should be recorded at both of its ends.
+    for source, dest, wire in multi_graph.edges():
+        assert multi_graph.predecessor(dest, wire) == source
+
     # Every wire should have exactly one input node and one output node.
     for wire in dag.wires:
         in_node = dag.input_map[wire]
@@ -92,28 +99,28 @@ def raise_if_dagcircuit_invalid(dag):
 
     # Every wire should be propagated by exactly one edge between nodes.
     for wire in dag.wires:
-        cur_node = dag.input_map[wire]
-        out_node = dag.output_map[wire]
+        cur_node_id = dag.input_map[wire]._node_id
+        out_node_id = dag.output_map[wire]._node_id
 
-        while cur_node != out_node:
-            out_edges = multi_graph.out_edges(cur_node, data=True)
-            edges_to_follow = [(src, dest, data) for (src, dest, data) in out_edges
-                               if data['wire'] == wire]
+        while cur_node_id != out_node_id:
+            out_edges = multi_graph.out_edges(cur_node_id)
+            edges_to_follow = [(src, dest, edge_wire) for (src, dest, edge_wire) in out_edges
+                               if edge_wire == wire]
 
             assert len(edges_to_follow) == 1
-            cur_node = edges_to_follow[0][1]
+            cur_node_id = edges_to_follow[0][1]
 
     # Wires can only terminate at input/output nodes.
     for op_node in dag.op_nodes():
-        assert multi_graph.in_degree(op_node) == multi_graph.out_degree(op_node)
+        assert multi_graph.in_degree(op_node._node_id) == multi_graph.out_degree(op_node._node_id)
 
     # Node input/output edges should match node qarg/carg/condition.
     for node in dag.op_nodes():
-        in_edges = multi_graph.in_edges(node, data=True)
-        out_edges = multi_graph.out_edges(node, data=True)
+        in_edges = multi_graph.in_edges(node._node_id)
+        out_edges = multi_graph.out_edges(node._node_id)
 
-        in_wires = {data['wire'] for src, dest, data in in_edges}
-        out_wires = {data['wire'] for src, dest, data in out_edges}
+        in_wires = {wire for src, dest, wire in in_edges}
+        out_wires = {wire for src, dest, wire in out_edges}
 
         node_cond_bits = set(node.condition[0][:] if node.condition is not None else [])
         node_qubits = set(node.qargs)
@@ -204,6 +211,23 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual(len(list(self.dag.nodes())), 16)
         self.assertEqual(len(list(self.dag.edges())), 17)
 
+    def test_to_networkx(self):
+        """The to_networkx() method exports nodes and wire-labelled edges."""
+        self.dag.apply_operation_back(HGate(), [self.qubit0], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qubit0, self.qubit1], [])
+        self.dag.apply_operation_back(Measure(), [self.qubit1], [self.clbit1])
+
+        graph = self.dag.to_networkx()
+
+        self.assertIsInstance(graph, nx.MultiDiGraph)
+        self.assertTrue(nx.is_directed_acyclic_graph(graph))
+        self.assertEqual(graph.number_of_nodes(), 13)
+        self.assertEqual(graph.number_of_edges(), 10)
+        self.assertEqual(
+            sorted(data['name'] for _, _, data in graph.edges(data=True)),
+            sorted(data['name'] for _, _, data in self.dag.edges()))
+        self.assertEqual(nx.dag_longest_path_length(graph) - 1, self.dag.depth())
+
     def test_apply_operation_back_conditional(self):
         """Test consistency of apply_operation_back with condition set."""
 
@@ -219,28 +243,28 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual(h_node.condition, h_gate.condition)
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.in_edges(h_node, data=True)),
-            sorted([
-                (self.dag.input_map[self.qubit2], h_node,
-                 {'wire': self.qubit2, 'name': 'qr[2]'}),
-                (self.dag.input_map[self.clbit0], h_node,
-                 {'wire': self.clbit0, 'name': 'cr[0]'}),
-                (self.dag.input_map[self.clbit1], h_node,
-                 {'wire': self.clbit1, 'name': 'cr[1]'}),
-            ]))
+            set(self.dag._multi_graph.in_edges(h_node._node_id)),
+            {
+                (self.dag.input_map[self.qubit2]._node_id, h_node._node_id,
+                 self.qubit2),
+                (self.dag.input_map[self.clbit0]._node_id, h_node._node_id,
+                 self.clbit0),
+                (self.dag.input_map[self.clbit1]._node_id, h_node._node_id,
+                 self.clbit1),
+            })
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.out_edges(h_node, data=True)),
-            sorted([
-                (h_node, self.dag.output_map[self.qubit2],
-                 {'wire': self.qubit2, 'name': 'qr[2]'}),
-                (h_node, self.dag.output_map[self.clbit0],
-                 {'wire': self.clbit0, 'name': 'cr[0]'}),
-                (h_node, self.dag.output_map[self.clbit1],
-                 {'wire': self.clbit1, 'name': 'cr[1]'}),
-            ]))
-
-        self.assertTrue(nx.is_directed_acyclic_graph(self.dag._multi_graph))
+            set(self.dag._multi_graph.out_edges(h_node._node_id)),
+            {
+                (h_node._node_id, self.dag.output_map[self.qubit2]._node_id,
+                 self.qubit2),
+                (h_node._node_id, self.dag.output_map[self.clbit0]._node_id,
+                 self.clbit0),
+                (h_node._node_id, self.dag.output_map[self.clbit1]._node_id,
+                 self.clbit1),
+            })
+
+        self.assertTrue(nx.is_directed_acyclic_graph(self.dag.to_networkx()))
 
     def test_apply_operation_back_conditional_measure(self):
         """Test consistency of apply_operation_back for conditional measure."""
@@ -261,28 +285,28 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual(meas_node.condition, meas_gate.condition)
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.in_edges(meas_node, data=True)),
-            sorted([
-                (self.dag.input_map[self.qubit0], meas_node,
-                 {'wire': self.qubit0, 'name': 'qr[0]'}),
-                (self.dag.input_map[self.clbit0], meas_node,
-                 {'wire': self.clbit0, 'name': 'cr[0]'}),
-                (self.dag.input_map[new_creg[0]], meas_node,
-                 {'wire': Clbit(new_creg, 0), 'name': 'cr2[0]'}),
-            ]))
+            set(self.dag._multi_graph.in_edges(meas_node._node_id)),
+            {
+                (self.dag.input_map[self.qubit0]._node_id, meas_node._node_id,
+                 self.qubit0),
+                (self.dag.input_map[self.clbit0]._node_id, meas_node._node_id,
+                 self.clbit0),
+                (self.dag.input_map[new_creg[0]]._node_id, meas_node._node_id,
+                 Clbit(new_creg, 0)),
+            })
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.out_edges(meas_node, data=True)),
-            sorted([
-                (meas_node, self.dag.output_map[self.qubit0],
-                 {'wire': self.qubit0, 'name': 'qr[0]'}),
-                (meas_node, self.dag.output_map[self.clbit0],
-                 {'wire': self.clbit0, 'name': 'cr[0]'}),
-                (meas_node, self.dag.output_map[new_creg[0]],
-                 {'wire': Clbit(new_creg, 0), 'name': 'cr2[0]'}),
-            ]))
-
-        self.assertTrue(nx.is_directed_acyclic_graph(self.dag._multi_graph))
+            set(self.dag._multi_graph.out_edges(meas_node._node_id)),
+            {
+                (meas_node._node_id, self.dag.output_map[self.qubit0]._node_id,
+                 self.qubit0),
+                (meas_node._node_id, self.dag.output_map[self.clbit0]._node_id,
+                 self.clbit0),
+                (meas_node._node_id, self.dag.output_map[new_creg[0]]._node_id,
+                 Clbit(new_creg, 0)),
+            })
+
+        self.assertTrue(nx.is_directed_acyclic_graph(self.dag.to_networkx()))
 
     def test_apply_operation_back_conditional_measure_to_self(self):
         """Test consistency of apply_operation_back for measure onto conditioning bit."""
@@ -300,28 +324,28 @@ class TestDagOperations(QiskitTestCase):
         self.assertEqual(meas_node.condition, meas_gate.condition)
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.in_edges(meas_node, data=True)),
-            sorted([
-                (self.dag.input_map[self.qubit1], meas_node,
-                 {'wire': self.qubit1, 'name': 'qr[1]'}),
-                (self.dag.input_map[self.clbit0], meas_node,
-                 {'wire': self.clbit0, 'name': 'cr[0]'}),
-                (self.dag.input_map[self.clbit1], meas_node,
-                 {'wire': self.clbit1, 'name': 'cr[1]'}),
-            ]))
+            set(self.dag._multi_graph.in_edges(meas_node._node_id)),
+            {
+                (self.dag.input_map[self.qubit1]._node_id, meas_node._node_id,
+                 self.qubit1),
+                (self.dag.input_map[self.clbit0]._node_id, meas_node._node_id,
+                 self.clbit0),
+                (self.dag.input_map[self.clbit1]._node_id, meas_node._node_id,
+                 self.clbit1),
+            })
 
         self.assertEqual(
-            sorted(self.dag._multi_graph.out_edges(meas_node, data=True)),
-            sorted([
-                (meas_node, self.dag.output_map[self.qubit1],
-                 {'wire': self.qubit1, 'name': 'qr[1]'}),
-                (meas_node, self.dag.output_map[self.clbit0],
-                 {'wire': self.clbit0, 'name': 'cr[0]'}),
-                (meas_node, self.dag.output_map[self.clbit1],
-                 {'wire': self.clbit1, 'name': 'cr[1]'}),
-            ]))
-
-        self.assertTrue(nx.is_directed_acyclic_graph(self.dag._multi_graph))
+            set(self.dag._multi_graph.out_edges(meas_node._node_id)),
+            {
+                (meas_node._node_id, self.dag.output_map[self.qubit1]._node_id,
+                 self.qubit1),
+                (meas_node._node_id, self.dag.output_map[self.clbit0]._node_id,
+                 self.clbit0),
+                (meas_node._node_id, self.dag.output_map[self.clbit1]._node_id,
+                 self.clbit1),
+            })
+
+        self.assertTrue(nx.is_directed_acyclic_graph(self.dag.to_networkx()))
 
     def test_apply_operation_front(self):
         """The apply_operation_front() method"""
@@ -685,6 +709,99 @@ class TestDagLayers(QiskitTestCase):
             comp = [(nd.type, nd.name, nd._node_id) for nd in dag1.topological_nodes()]
             self.assertEqual(comp, truth)
 
+    def test_layers_are_views(self):
+        """The layers share the op nodes of the DAG and only build a graph on request."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.x(qr[2])
+        circuit.cx(qr[0], qr[1])
+        circuit.barrier(qr)
+        circuit.measure(qr[1], cr[0])
+        dag = circuit_to_dag(circuit)
+        op_nodes = dag.op_nodes()
+
+        layers = list(dag.layers())
+        self.assertEqual([layer.op_nodes() for layer in layers],
+                         [op_nodes[:2], [op_nodes[2]], [op_nodes[3]], [op_nodes[4]]])
+        self.assertEqual(layers[0].partition, [[qr[0]], [qr[2]]])
+        self.assertEqual(layers[2]["partition"], [])
+        self.assertIsNone(layers[0]._graph)
+
+        graph = layers[0]["graph"]
+        self.assertIsInstance(graph, DAGCircuit)
+        self.assertIs(layers[0]["graph"], graph)
+        self.assertEqual(set(layers[0].keys()), {"graph", "partition"})
+        self.assertEqual(graph.size(), 2)
+        self.assertEqual(graph.depth(), 1)
+        self.assertFalse(set(graph.op_nodes()) & set(op_nodes))
+
+    def test_compose_layer_view(self):
+        """Composing a layer view is the same as composing its graph."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.x(qr[1]).c_if(cr, 1)
+        circuit.measure(qr, cr)
+        dag = circuit_to_dag(circuit)
+        edge_map = {qr[0]: qr[1], qr[1]: qr[0], cr[0]: cr[0], cr[1]: cr[1]}
+
+        from_views = DAGCircuit()
+        from_graphs = DAGCircuit()
+        for target in (from_views, from_graphs):
+            target.add_qreg(qr)
+            target.add_creg(cr)
+        for layer in dag.layers():
+            from_views.compose_back(layer, edge_map)
+            from_graphs.compose_back(layer["graph"], edge_map)
+
+        self.assertEqual(from_views, from_graphs)
+        self.assertEqual(from_views.depth(), dag.depth())
+
+    def test_serial_layers(self):
+        """Each serial layer is a view on a single op node in topological order."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.x(qr[1])
+        circuit.barrier(qr)
+        circuit.cx(qr[0], qr[1])
+        dag = circuit_to_dag(circuit)
+
+        serial = list(dag.serial_layers())
+        self.assertEqual([layer.op_nodes() for layer in serial],
+                         [[node] for node in dag.topological_op_nodes()])
+        self.assertEqual([layer["partition"] for layer in serial],
+                         [[[qr[0]]], [[qr[1]]], [], [[qr[0], qr[1]]]])
+
+        first_layer = next(dag.layers())
+        self.assertEqual([layer.op_nodes() for layer in first_layer.serial_layers()],
+                         [[node] for node in first_layer.topological_op_nodes()])
+
+    def test_layer_topological_order_matches_graph(self):
+        """The view orders its nodes like the DAG built from it."""
+        qr = QuantumRegister(6, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[5])
+        circuit.cx(qr[4], qr[0])
+        circuit.x(qr[3]).c_if(cr, 2)
+        circuit.cx(qr[1], qr[2])
+        circuit.measure(qr[0], cr[0])
+        circuit.cx(qr[5], qr[3])
+        circuit.barrier(qr[1], qr[2])
+        circuit.cx(qr[2], qr[1])
+        dag = circuit_to_dag(circuit)
+
+        for layer in dag.layers():
+            from_view = [(node.name, node.qargs) for node in layer.topological_op_nodes()]
+            from_graph = [(node.name, node.qargs)
+                          for node in layer["graph"].topological_op_nodes()]
+            self.assertEqual(from_view, from_graph)
+
 
 class TestCircuitProperties(QiskitTestCase):
     """DAGCircuit properties test."""
@@ -851,7 +968,9 @@ class TestDagSubstitute(QiskitTestCase):
 
         self.dag.substitute_node_with_dag(cx_node, flipped_cx_circuit, wires=[v[0], v[1]])
 
+        raise_if_dagcircuit_invalid(self.dag)
         self.assertEqual(self.dag.count_ops()['h'], 5)
+        self.assertEqual(self.dag.depth(), 5)
 
     def test_substitute_circuit_one_front(self):
         """The method substitute_node_with_dag() replaces a leaf-in-the-front node with a DAG."""
@@ -1036,5 +1155,79 @@ class TestDagProperties(QiskitTestCase):
         self.assertEqual(dag.depth(), 6)
 
 
+class TestDagIncrementalOrder(QiskitTestCase):
+    """Test the topological order and depth kept up to date by DAG edits."""
+
+    def setUp(self):
+        qc = QuantumCircuit(4, 2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.cx(2, 3)
+        qc.h(2)
+        qc.cx(1, 2)
+        qc.x(3)
+        qc.measure(1, 0)
+        qc.cx(0, 3)
+        qc.h(1)
+        self.dag = circuit_to_dag(qc)
+        # Populate the caches before editing.
+        self.dag.depth()
+
+    def assertCachesMatchRecompute(self, dag):
+        """Compare the cached order and depth with a recomputation from scratch."""
+        fresh = copy.deepcopy(dag)
+        fresh._invalidate_caches()
+        self.assertEqual([node._node_id for node in dag.topological_nodes()],
+                         [node._node_id for node in fresh.topological_nodes()])
+        self.assertEqual(dag.depth(), fresh.depth())
+        self.assertEqual([node._node_id for node in dag.longest_path()],
+                         [node._node_id for node in fresh.longest_path()])
+        expected = nx.lexicographical_topological_sort(dag.to_networkx(),
+                                                       key=lambda x: str(x.qargs))
+        self.assertEqual([node._node_id for node in dag.topological_nodes()],
+                         [node._node_id for node in expected])
+
+    def test_apply_operation_back(self):
+        """Appending ops keeps the caches valid."""
+        qr = self.dag.qregs['q']
+        self.dag.apply_operation_back(CnotGate(), [qr[3], qr[0]])
+        self.assertCachesMatchRecompute(self.dag)
+        self.dag.apply_operation_back(HGate(), [qr[2]])
+        self.dag.apply_operation_front(XGate(), [qr[1]], [])
+        self.assertCachesMatchRecompute(self.dag)
+
+    def test_remove_op_node(self):
+        """Removing ops keeps the caches valid and lowers the depth."""
+        depth = self.dag.depth()
+        for node in self.dag.named_nodes('cx'):
+            self.dag.remove_op_node(node)
+            self.assertCachesMatchRecompute(self.dag)
+        self.assertLess(self.dag.depth(), depth)
+
+    def test_substitute_node(self):
+        """Substituting ops keeps the caches valid."""
+        for node in self.dag.named_nodes('cx'):
+            self.dag.substitute_node(node, CzGate())
+        self.assertCachesMatchRecompute(self.dag)
+
+    def test_substitute_node_with_dag(self):
+        """Substituting ops by sub-DAGs keeps the caches valid."""
+        flipped_cx = DAGCircuit()
+        v = QuantumRegister(2, 'v')
+        flipped_cx.add_qreg(v)
+        flipped_cx.apply_operation_back(HGate(), [v[0]], [])
+        flipped_cx.apply_operation_back(HGate(), [v[1]], [])
+        flipped_cx.apply_operation_back(CnotGate(), [v[1], v[0]], [])
+        flipped_cx.apply_operation_back(HGate(), [v[0]], [])
+        flipped_cx.apply_operation_back(HGate(), [v[1]], [])
+        depth = self.dag.depth()
+
+        self.dag.substitute_node_with_dag(self.dag.named_nodes('cx')[1], flipped_cx,
+                                          wires=[v[0], v[1]])
+
+        self.assertCachesMatchRecompute(self.dag)
+        self.assertEqual(self.dag.depth(), depth + 2)
+
+
 if __name__ == '__main__':
     unittest.main()
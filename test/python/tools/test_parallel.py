@@ -14,9 +14,14 @@
 
 """Tests for qiskit/tools/parallel"""
 import os
+import pickle
 import time
+from unittest.mock import patch
 
+from qiskit.tools import parallel
 from qiskit.tools.parallel import parallel_map
+from qiskit.tools.events.pubsub import Subscriber
+from qiskit.exceptions import QiskitError
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.test import QiskitTestCase
 
@@ -53,3 +58,138 @@ class TestParallel(QiskitTestCase):
         out_circs = parallel_map(_build_simple, list(range(10)))
         names = [circ.name for circ in out_circs]
         self.assertEqual(len(names), len(set(names)))
+
+
+def _sleep_pid(x, delay=0.2):
+    """Return the value and the pid of the process that handled it."""
+    time.sleep(delay)
+    return x, os.getpid()
+
+
+def _add(x, y, z=0):
+    """Function for testing task arguments."""
+    return x + y + z
+
+
+def _kwarg_id(x, data=None):
+    """Return the pid and the id of the data received by the worker."""
+    time.sleep(0.1)
+    return os.getpid(), id(data)
+
+
+_POOL_IS_FASTER = parallel._pool_is_faster
+
+
+class TestParallelPool(QiskitTestCase):
+    """Tests for the persistent worker pool of parallel_map."""
+
+    def setUp(self):
+        super().setUp()
+        parallel.shutdown_parallel_pool()
+        self.addCleanup(parallel.shutdown_parallel_pool)
+        self.addCleanup(parallel.configure_parallel_pool)
+        # Use the pool whatever the cost model says, except where tested.
+        patcher = patch.object(parallel, '_pool_is_faster', return_value=True)
+        self.pool_is_faster = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_pool_is_reused(self):
+        """The worker processes are kept alive across calls."""
+        first = parallel_map(_sleep_pid, list(range(6)), num_processes=2)
+        pool = parallel._POOL
+        second = parallel_map(_sleep_pid, list(range(6)), num_processes=2)
+
+        self.assertIsNotNone(pool)
+        self.assertIs(parallel._POOL, pool)
+        self.assertEqual([x for x, _ in first], list(range(6)))
+        self.assertEqual([x for x, _ in second], list(range(6)))
+        workers = {pid for _, pid in first[1:] + second[1:]}
+        self.assertNotIn(os.getpid(), workers)
+        self.assertLessEqual(len(workers), 2)
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL'), 'FALSE')
+
+    def test_shutdown(self):
+        """shutdown_parallel_pool stops the workers and a new pool is started on demand."""
+        parallel_map(_sleep_pid, list(range(4)), num_processes=2)
+        pool = parallel._POOL
+        parallel.shutdown_parallel_pool()
+        self.assertIsNone(parallel._POOL)
+
+        parallel_map(_sleep_pid, list(range(4)), num_processes=2)
+        self.assertIsNotNone(parallel._POOL)
+        self.assertIsNot(parallel._POOL, pool)
+
+    def test_chunks_keep_order_and_arguments(self):
+        """The results come back in order with small chunks and task arguments."""
+        values = list(range(11))
+        parallel.configure_parallel_pool(num_processes=2, chunksize=3)
+        out = parallel_map(_sleep_pid, values, task_kwargs={'delay': 0.05})
+        self.assertEqual([x for x, _ in out], values)
+        self.assertEqual(parallel._POOL_SIZE, 2)
+
+        out = parallel_map(_add, values, task_args=(1,), task_kwargs={'z': 2}, chunksize=4)
+        self.assertEqual(out, [x + 3 for x in values])
+
+    def test_short_tasks_run_serially(self):
+        """Tasks that are faster than starting the pool do not start it."""
+        self.pool_is_faster.side_effect = _POOL_IS_FASTER
+        out = parallel_map(_add, list(range(20)), task_args=(1,), num_processes=2)
+        self.assertEqual(out, list(range(1, 21)))
+        self.assertIsNone(parallel._POOL)
+
+    def test_cost_model(self):
+        """The pool is used when the tasks outweigh starting it and sending chunks."""
+        with patch.object(parallel, '_START_COST', 0.5):
+            self.assertFalse(_POOL_IS_FASTER(1e-4, 100, 4, 25))
+            self.assertFalse(_POOL_IS_FASTER(0.1, 4, 4, 1))
+            self.assertTrue(_POOL_IS_FASTER(0.1, 40, 4, 10))
+            self.assertTrue(_POOL_IS_FASTER(1.0, 2, 2, 1))
+
+    def test_task_timing_events(self):
+        """Every task publishes its wall time."""
+        times = {}
+
+        def _record(index, elapsed):
+            times[index] = elapsed
+
+        subscriber = Subscriber()
+        subscriber.subscribe("terra.parallel.task_done", _record)
+        self.addCleanup(subscriber.unsubscribe, "terra.parallel.task_done", _record)
+
+        parallel_map(_sleep_pid, list(range(5)), num_processes=2)
+        self.assertEqual(sorted(times), list(range(5)))
+        for elapsed in times.values():
+            self.assertGreaterEqual(elapsed, 0.15)
+
+    def test_arguments_sent_once_per_worker(self):
+        """Workers keep the task arguments across chunks and calls."""
+        data = list(range(10000))
+        seen = {}
+        for _ in range(2):
+            out = parallel_map(_kwarg_id, list(range(9)), task_kwargs={'data': data},
+                               num_processes=2, chunksize=1)
+            for pid, data_id in out[1:]:
+                seen.setdefault(pid, set()).add(data_id)
+        self.assertTrue(seen)
+        for data_ids in seen.values():
+            self.assertEqual(len(data_ids), 1)
+
+    def test_run_chunk_registry(self):
+        """A worker asks for the task when it does not hold it."""
+        self.addCleanup(parallel._WORKER_TASKS.clear)
+        # _run_chunk marks the process as a worker.
+        self.addCleanup(os.environ.__setitem__, 'QISKIT_IN_PARALLEL', 'FALSE')
+        payload = pickle.dumps((_add, (1,), {'z': 2}))
+        self.assertEqual(parallel._run_chunk('key', [1, 2]), (os.getpid(), None))
+
+        pid, results = parallel._run_chunk('key', [1, 2], payload)
+        self.assertEqual(pid, os.getpid())
+        self.assertEqual([result for result, _ in results], [4, 5])
+
+        _, results = parallel._run_chunk('key', [3])
+        self.assertEqual([result for result, _ in results], [6])
+
+    def test_invalid_options(self):
+        """Invalid pool options raise."""
+        self.assertRaises(QiskitError, parallel.configure_parallel_pool, num_processes=0)
+        self.assertRaises(QiskitError, parallel.configure_parallel_pool, chunksize=1.5)
@@ -15,11 +15,14 @@
 
 """Commutation analysis and transformation pass testing"""
 
+import itertools
 import unittest
 
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.extensions import standard
 from qiskit.transpiler import PropertySet
 from qiskit.transpiler.passes import CommutationAnalysis
+from qiskit.transpiler.passes import commutation_analysis
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 
@@ -286,6 +289,53 @@ class TestCommutationAnalysis(QiskitTestCase):
                     'qr[4]': [[9], [13, 16, 19], [10]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
+    def test_rules_agree_with_matrices(self):
+        """The commutation rules give the same answer as the matrices"""
+        # pylint: disable=protected-access
+        gates = []
+        for gate_type in commutation_analysis._GATE_BASES:
+            num_params = {standard.U1Gate: 1, standard.RXGate: 1, standard.RYGate: 1,
+                          standard.RZGate: 1, standard.CrzGate: 1, standard.Cu1Gate: 1,
+                          standard.RZZGate: 1, standard.RXXGate: 1,
+                          standard.Cu3Gate: 3}.get(gate_type, 0)
+            gates.append(gate_type(*[0.3 + 0.2 * i for i in range(num_params)]))
+        gates.append(standard.HGate())
+        gates.append(standard.U3Gate(0.1, 0.2, 0.3))
+
+        for gate1, gate2 in itertools.product(gates, repeat=2):
+            qargs1 = tuple(range(gate1.num_qubits))
+            for qargs2 in itertools.permutations(range(3), gate2.num_qubits):
+                # Number the qubits 0..n-1, as for the matrix check in the pass
+                qubits = sorted(set(qargs1 + qargs2))
+                qargs2 = tuple(qubits.index(qubit) for qubit in qargs2)
+                num_qubits = len(qubits)
+                by_rules = commutation_analysis._commute_by_rules(gate1, qargs1,
+                                                                  gate2, qargs2)
+                by_matrix = commutation_analysis._commute_by_matrix(gate1, qargs1,
+                                                                    gate2, qargs2, num_qubits)
+                if by_rules is not None:
+                    self.assertEqual(by_rules, by_matrix,
+                                     msg='%s%s, %s%s' % (gate1.name, qargs1,
+                                                         gate2.name, qargs2))
+
+    def test_matrix_results_are_cached(self):
+        """The matrix check is cached by gates and relative qubits"""
+        # pylint: disable=protected-access
+        commutation_analysis._COMMUTATION_CACHE.clear()
+        qr = QuantumRegister(4, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.h(qr[2])
+        circuit.cx(qr[2], qr[3])
+        circuit.u3(0.1, 0.2, 0.3, qr[3])
+        circuit.cx(qr[2], qr[3])
+        self.pass_.run(circuit_to_dag(circuit))
+
+        # (h, cx) is checked twice on other qubits, (cx, u3) and (u3, cx) once.
+        self.assertEqual(len(commutation_analysis._COMMUTATION_CACHE), 3)
+        self.assertFalse(any(commutation_analysis._COMMUTATION_CACHE.values()))
+
 
 if __name__ == '__main__':
     unittest.main()
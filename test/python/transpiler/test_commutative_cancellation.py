@@ -21,6 +21,7 @@ from qiskit.test import QiskitTestCase
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.transpiler import PassManager, PropertySet
 from qiskit.compiler import transpile
+from qiskit.quantum_info import Operator
 from qiskit.transpiler.passes import CommutationAnalysis, CommutativeCancellation, FixedPoint, Size
 
 
@@ -528,6 +529,20 @@ class TestCommutativeCancellation(QiskitTestCase):
 
         self.assertEqual(circuit, new_circuit)
 
+    def test_controlled_custom_gates_same_name(self):
+        """Controlled custom gates with the same name do not share commutation results"""
+        for basis in ['x', 'z']:
+            sub = QuantumCircuit(1, name='cg')
+            getattr(sub, basis)(0)
+            circuit = QuantumCircuit(2)
+            circuit.x(1)
+            circuit.append(sub.to_gate().control(), [0, 1])
+            circuit.x(1)
+
+            new_circuit = PassManager(CommutativeCancellation()).run(circuit)
+
+            self.assertTrue(Operator(new_circuit).equiv(Operator(circuit)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,6 +14,11 @@
 
 # pylint: disable=missing-docstring
 
+import pickle
+
+import networkx as nx
+import numpy as np
+
 from qiskit.transpiler import CouplingMap
 from qiskit.transpiler.exceptions import CouplingError
 from qiskit.test.mock import FakeRueschlikon
@@ -45,6 +50,75 @@ class CouplingTest(QiskitTestCase):
         self.assertIsInstance(result, int)
         self.assertEqual(1, result)
 
+    def test_distance_matrix(self):
+        """The distance matrix matches networkx on a directed device."""
+        coupling = CouplingMap(FakeRueschlikon().configuration().coupling_map)
+        undirected = coupling.graph.to_undirected()
+        expected = np.zeros((coupling.size(), coupling.size()))
+        for source, lengths in nx.all_pairs_shortest_path_length(undirected):
+            for target, length in lengths.items():
+                expected[source, target] = length
+        np.testing.assert_array_equal(coupling.distance_matrix, expected)
+        self.assertEqual(coupling.distance(1, 12), expected[1, 12])
+
+    def test_shortest_undirected_path(self):
+        """Shortest paths are valid paths of the shortest length."""
+        coupling = CouplingMap(FakeRueschlikon().configuration().coupling_map)
+        undirected = coupling.graph.to_undirected()
+        for source in coupling.physical_qubits:
+            for target in coupling.physical_qubits:
+                path = coupling.shortest_undirected_path(source, target)
+                self.assertEqual(path[0], source)
+                self.assertEqual(path[-1], target)
+                self.assertEqual(len(path) - 1, coupling.distance(source, target))
+                for edge in zip(path, path[1:]):
+                    self.assertTrue(undirected.has_edge(*edge))
+
+    def test_shortest_undirected_path_error(self):
+        """Shortest paths between disconnected qubits raise."""
+        coupling = CouplingMap([[0, 1], [2, 3]])
+        self.assertEqual(coupling.shortest_undirected_path(1, 0), [1, 0])
+        self.assertRaises(CouplingError, coupling.shortest_undirected_path, 0, 3)
+        self.assertRaises(CouplingError, coupling.shortest_undirected_path, 0, 4)
+
+    def test_distance_disconnected_after_shortest_path(self):
+        """Distances of a disconnected graph raise once shortest paths are cached."""
+        coupling = CouplingMap([[0, 1], [2, 3]])
+        self.assertRaises(CouplingError, coupling.shortest_undirected_path, 0, 3)
+        self.assertRaises(CouplingError, coupling.distance, 0, 3)
+        with self.assertRaises(CouplingError):
+            _ = coupling.distance_matrix
+        coupling.add_edge(1, 2)
+        self.assertEqual(coupling.distance(0, 3), 3)
+
+    def test_distance_matrix_read_only(self):
+        """The cached distance matrix can not be modified in place."""
+        coupling = CouplingMap([[0, 1], [1, 2]])
+        with self.assertRaises(ValueError):
+            coupling.distance_matrix[0, 2] = 0
+        self.assertEqual(coupling.distance(0, 2), 2)
+
+    def test_shortest_paths_invalidated(self):
+        """Adding edges and qubits updates the distances."""
+        coupling = CouplingMap([[0, 1], [1, 2], [2, 3]])
+        self.assertEqual(coupling.distance(0, 3), 3)
+        self.assertEqual(coupling.shortest_undirected_path(0, 3), [0, 1, 2, 3])
+        coupling.add_edge(3, 0)
+        self.assertEqual(coupling.distance(0, 3), 1)
+        self.assertEqual(coupling.shortest_undirected_path(0, 3), [0, 3])
+        coupling.add_physical_qubit(4)
+        self.assertRaises(CouplingError, coupling.distance, 0, 4)
+        coupling.add_edge(4, 2)
+        self.assertEqual(coupling.distance(0, 4), 3)
+
+    def test_pickle_without_shortest_paths(self):
+        """Pickled coupling maps recompute their distances."""
+        coupling = CouplingMap([[0, 1], [1, 2]])
+        distances = coupling.distance_matrix.copy()
+        copied = pickle.loads(pickle.dumps(coupling))
+        self.assertIsNone(copied._dist_matrix)  # pylint: disable=protected-access
+        np.testing.assert_array_equal(copied.distance_matrix, distances)
+
     def test_add_physical_qubits(self):
         coupling = CouplingMap()
         self.assertEqual("", str(coupling))
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the profiling of pass managers"""
+
+import json
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.compiler import transpile
+from qiskit.transpiler import PassManager, PassProfile
+from qiskit.transpiler.passes import Unroller, Optimize1qGates, Depth, FixedPoint
+from qiskit.test.mock import FakeRueschlikon
+from qiskit.test import QiskitTestCase
+
+
+class TestPassProfile(QiskitTestCase):
+    """Test PassProfile."""
+
+    def setUp(self):
+        super().setUp()
+        qr = QuantumRegister(2, 'qr')
+        self.circuit = QuantumCircuit(qr, name='MyCircuit')
+        self.circuit.h(qr[0])
+        self.circuit.h(qr[0])
+        self.circuit.h(qr[0])
+        self.circuit.cx(qr[0], qr[1])
+
+    def test_pass_statistics(self):
+        """Each pass is counted with the size and depth of the DAG around it."""
+        profile = PassProfile()
+        passmanager = PassManager(profile=profile)
+        passmanager.append(Unroller(['u2', 'cx']))
+        passmanager.append(Optimize1qGates())
+        passmanager.run(self.circuit)
+
+        self.assertEqual(profile.circuits, 1)
+        self.assertEqual(profile.processes, 1)
+        self.assertEqual(list(profile.passes), ['Unroller', 'Optimize1qGates'])
+        unroller = profile.passes['Unroller']
+        self.assertEqual(unroller['calls'], 1)
+        self.assertEqual((unroller['size_in'], unroller['size_out']), (4, 4))
+        self.assertEqual((unroller['depth_in'], unroller['depth_out']), (4, 4))
+        optimize = profile.passes['Optimize1qGates']
+        self.assertEqual((optimize['size_in'], optimize['size_out']), (4, 2))
+        self.assertEqual((optimize['depth_in'], optimize['depth_out']), (4, 2))
+        self.assertGreaterEqual(optimize['time'], optimize['max_time'])
+        self.assertGreaterEqual(profile.time, unroller['time'] + optimize['time'])
+
+    def test_loop_iterations(self):
+        """The iterations of do_while loops are counted."""
+        profile = PassProfile()
+        passmanager = PassManager(profile=profile)
+        passmanager.append(Unroller(['u2', 'cx']))
+
+        def fixed_point(property_set):
+            return not property_set['depth_fixed_point']
+
+        passmanager.append([Depth(), FixedPoint('depth'), Optimize1qGates()],
+                           do_while=fixed_point)
+        passmanager.run(self.circuit)
+        passmanager.run(self.circuit)
+
+        loop = ('Depth', 'FixedPoint', 'Optimize1qGates')
+        self.assertEqual(list(profile.loops), [loop])
+        self.assertEqual(dict(profile.loops[loop]),
+                         {'runs': 2, 'iterations': 6, 'max_iterations': 3})
+        self.assertEqual(profile.passes['Optimize1qGates']['calls'], 6)
+
+    def test_several_circuits(self):
+        """Circuits run through parallel_map are added to the profile."""
+        profile = PassProfile()
+        passmanager = PassManager(Unroller(['u2', 'cx']), profile=profile)
+        result = passmanager.run([self.circuit, self.circuit, self.circuit])
+
+        self.assertEqual(len(result), 3)
+        self.assertIsInstance(result[0], QuantumCircuit)
+        self.assertEqual(profile.circuits, 3)
+        self.assertEqual(profile.passes['Unroller']['calls'], 3)
+
+    def test_transpile(self):
+        """Profiles add up over several calls to transpile."""
+        profile = PassProfile()
+        result = transpile([self.circuit, self.circuit], FakeRueschlikon(), profile=profile)
+        transpile(self.circuit, FakeRueschlikon(), optimization_level=2, profile=profile)
+
+        self.assertEqual(len(result), 2)
+        self.assertIsInstance(result[0], QuantumCircuit)
+        self.assertEqual(profile.circuits, 3)
+        self.assertEqual(profile.passes['Optimize1qGates']['calls'] % 3, 0)
+        self.assertIn('CommutativeCancellation', profile.passes)
+        self.assertEqual(len(profile.loops), 2)
+
+    def test_transpile_pass_manager(self):
+        """Profiling a transpile call does not change the profile of its pass manager."""
+        own_profile, profile = PassProfile(), PassProfile()
+        pass_manager = PassManager(Unroller(['u2', 'cx']), profile=own_profile)
+        transpile(self.circuit, pass_manager=pass_manager, profile=profile)
+        pass_manager.run(self.circuit)
+
+        self.assertIs(pass_manager.profile, own_profile)
+        self.assertEqual(profile.circuits, 1)
+        self.assertEqual(own_profile.circuits, 1)
+
+        pass_manager = PassManager(Unroller(['u2', 'cx']))
+        transpile(self.circuit, pass_manager=pass_manager, profile=profile)
+        pass_manager.run(self.circuit)
+
+        self.assertIsNone(pass_manager.profile)
+        self.assertEqual(profile.circuits, 2)
+
+    def test_merge(self):
+        """Merging adds counts and times, and keeps the maximums."""
+        first, second = PassProfile(), PassProfile()
+        PassManager(Unroller(['u2', 'cx']), profile=first).run(self.circuit)
+        PassManager([Unroller(['u2', 'cx']), Optimize1qGates()],
+                    profile=second).run(self.circuit)
+        max_time = max(first.passes['Unroller']['max_time'],
+                       second.passes['Unroller']['max_time'])
+
+        first.merge(second)
+        self.assertEqual(first.circuits, 2)
+        self.assertEqual(list(first.passes), ['Unroller', 'Optimize1qGates'])
+        self.assertEqual(first.passes['Unroller']['calls'], 2)
+        self.assertEqual(first.passes['Unroller']['size_in'], 8)
+        self.assertEqual(first.passes['Unroller']['max_time'], max_time)
+
+    def test_export(self):
+        """The profile exports to JSON and to a table."""
+        profile = PassProfile()
+        PassManager([Unroller(['u2', 'cx']), Optimize1qGates()],
+                    profile=profile).run(self.circuit)
+
+        exported = json.loads(profile.to_json())
+        self.assertEqual(exported, profile.to_dict())
+        self.assertEqual(exported['circuits'], 1)
+        self.assertEqual(sorted(stats['name'] for stats in exported['passes']),
+                         ['Optimize1qGates', 'Unroller'])
+        self.assertEqual(exported['loops'], [])
+
+        table = profile.table()
+        self.assertEqual(str(profile), table)
+        self.assertIn('Unroller', table)
+        self.assertIn('Optimize1qGates', table)
@@ -15,7 +15,13 @@
 """Test the Stochastic Swap pass"""
 
 import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from qiskit.tools import parallel
 from qiskit.transpiler.passes import StochasticSwap
+from qiskit.transpiler.passes.mapping import stochastic_swap
 from qiskit.transpiler import CouplingMap, PassManager
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag
@@ -536,6 +542,49 @@ class TestStochasticSwap(QiskitTestCase):
         after = circuit_to_dag(after)
         self.assertEqual(expected_dag, after)
 
+    def _random_cx_circuit(self):
+        """A circuit of 30 long-range CNOTs on a 6-qubit line."""
+        coupling = CouplingMap([[0, 1], [1, 2], [2, 3], [3, 4], [4, 5]])
+        qr = QuantumRegister(6, 'q')
+        circuit = QuantumCircuit(qr)
+        pairs = [(0, 5), (1, 4), (2, 0), (5, 3), (4, 0), (3, 1), (2, 5), (0, 3), (4, 1), (5, 2)]
+        for control, target in pairs * 3:
+            circuit.cx(qr[control], qr[target])
+        return coupling, circuit_to_dag(circuit)
+
+    def test_seed_trials_deterministic(self):
+        """Seed trials give the same result for the same seed, in a pool or not."""
+        coupling, dag = self._random_cx_circuit()
+        serial = StochasticSwap(coupling, seed=7, seed_trials=4).run(dag)
+        self.assertEqual(serial, StochasticSwap(coupling, seed=7, seed_trials=4).run(dag))
+
+        self.addCleanup(parallel.shutdown_parallel_pool)
+        with patch.object(parallel, '_pool_is_faster', return_value=True):
+            pooled = StochasticSwap(coupling, seed=7, seed_trials=4).run(dag)
+        self.assertEqual(serial, pooled)
+
+    def test_seed_trials_keep_best(self):
+        """The kept result has the fewest swaps of all the seeds."""
+        coupling, dag = self._random_cx_circuit()
+        seeds = [7] + list(np.random.RandomState(7).randint(0, np.iinfo(np.int32).max, size=3))
+        swaps = [StochasticSwap(coupling, seed=int(seed)).run(dag).count_ops()['swap']
+                 for seed in seeds]
+        best = StochasticSwap(coupling, seed=7, seed_trials=4).run(dag)
+        self.assertEqual(best.count_ops()['swap'], min(swaps))
+
+    def test_seed_trials_stop_without_swaps(self):
+        """If no swaps are needed, the other seeds are not tried."""
+        coupling = CouplingMap([[0, 1], [1, 2]])
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[2], qr[1])
+        dag = circuit_to_dag(circuit)
+        with patch.object(stochastic_swap, 'parallel_map') as mock_map:
+            after = StochasticSwap(coupling, seed=7, seed_trials=4).run(dag)
+        mock_map.assert_not_called()
+        self.assertEqual(after, dag)
+
 
 if __name__ == '__main__':
     unittest.main()